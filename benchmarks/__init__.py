@@ -0,0 +1 @@
+"""Micro-benchmarks for the persistence, rendering and dispatch hot paths."""
@@ -0,0 +1,61 @@
+"""Run the benchmarks and compare them with the stored baseline.
+
+Usage: ``python -m benchmarks [-k PATTERN] [--quick] [--save-baseline] [--tolerance 0.25]``
+
+Benchmarks run against a temporary data directory. The exit code is 1 if any
+benchmark's median is slower than its baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark command line."""
+    parser = ArgumentParser(prog="python -m benchmarks", description="Run the parllama micro-benchmarks.")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="Run one round of each benchmark as a smoke test")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline file to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown before a regression is reported"
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="parllama-bench-") as tmp:
+        # Settings are read on first use, so point them at scratch data before importing parllama.
+        os.environ["PARLLAMA_DATA_DIR"] = str(Path(tmp) / "data")
+        from parllama.settings_manager import initialize_settings
+        from parllama.utils import get_args
+
+        initialize_settings(get_args(["--no-save"]))
+
+        from benchmarks import suite  # noqa: F401  # registers the benchmarks
+        from benchmarks.harness import REGISTRY, compare, format_report, load_baseline, run_benchmarks, save_baseline
+
+        selected = [bench for name, bench in REGISTRY.items() if args.filter in name]
+        if args.list:
+            for bench in selected:
+                print(f"{bench.name:<44} {bench.description}")
+            return 0
+        results = run_benchmarks(selected, Path(tmp) / "work", quick=args.quick)
+
+    comparisons = compare(results, load_baseline(args.baseline), args.tolerance)
+    print(format_report(comparisons))
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    return 1 if any(c.regressed for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
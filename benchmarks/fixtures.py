@@ -0,0 +1,93 @@
+"""Generated, deterministic fixtures for the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.execution.execution_template import ExecutionTemplate
+
+WORDS = (
+    "model context token stream session prompt reply latency cache index provider request "
+    "the a of to and in is that for with on as it be this by are from or an at which"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    """Return a sentence of random words."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_messages(count: int, seed: int = 0) -> list[ParllamaChatMessage]:
+    """Return an alternating user/assistant conversation of ``count`` messages after a system prompt."""
+    rng = random.Random(seed)
+    messages = [ParllamaChatMessage(role="system", content="You are a helpful assistant.")]
+    for index in range(count - 1):
+        if index % 2 == 0:
+            messages.append(ParllamaChatMessage(role="user", content=sentence(rng, 15)))
+        else:
+            content = " ".join(sentence(rng, 12) for _ in range(8))
+            messages.append(ParllamaChatMessage(role="assistant", content=content))
+    return messages[:count]
+
+
+def llm_config() -> LlmConfig:
+    """Return the configuration used by generated sessions."""
+    return LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5)
+
+
+def make_session(count: int, seed: int = 0) -> ChatSession:
+    """Return an unsaved session with ``count`` messages."""
+    return ChatSession(name=f"Bench {count}", llm_config=llm_config(), messages=make_messages(count, seed))
+
+
+def write_chat_dir(chat_dir: Path, sessions: int, messages_per_session: int) -> None:
+    """Write ``sessions`` session snapshot files to ``chat_dir``."""
+    chat_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(sessions):
+        session = make_session(messages_per_session, seed=index)
+        (chat_dir / f"{session.id}.json").write_text(session.to_json(), encoding="utf-8")
+
+
+def long_answer(sections: int = 12, seed: int = 0) -> str:
+    """Return a long Markdown reply mixing paragraphs, lists, code fences and tables."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    for index in range(sections):
+        parts.append(f"## Section {index + 1}")
+        parts.append(" ".join(sentence(rng, 14) for _ in range(5)))
+        parts.append("\n".join(f"- **{rng.choice(WORDS)}**: {sentence(rng, 8)}" for _ in range(5)))
+        code = "\n".join(f"    total += value_{line} * {line}" for line in range(8))
+        parts.append(f"```python\ndef compute_{index}(values):\n    total = 0\n{code}\n    return total\n```")
+        rows = "\n".join(f"| {rng.choice(WORDS)} | {rng.randint(1, 999)} | {sentence(rng, 4)} |" for _ in range(4))
+        parts.append(f"| name | value | note |\n|---|---|---|\n{rows}")
+    return "\n\n".join(parts) + "\n"
+
+
+def stream_chunks(text: str, chunk_size: int = 24) -> list[str]:
+    """Split ``text`` into chunks the size of streamed tokens."""
+    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+def make_templates(count: int) -> list[ExecutionTemplate]:
+    """Return execution templates for a spread of languages and file types."""
+    kinds = (
+        ("Python", "python {file}", [".py"]),
+        ("Node", "node {file}", [".js", ".mjs"]),
+        ("Bash", "bash {file}", [".sh"]),
+        ("SQLite", "sqlite3 :memory: < {file}", [".sql"]),
+    )
+    return [
+        ExecutionTemplate(
+            name=f"{kinds[index % len(kinds)][0]} {index}",
+            description="Generated template",
+            command_template=kinds[index % len(kinds)][1],
+            file_extensions=kinds[index % len(kinds)][2],
+        )
+        for index in range(count)
+    ]
@@ -0,0 +1,193 @@
+"""Benchmark registry, timing and baseline comparison.
+
+A benchmark is a function taking a scratch directory and a round count and
+returning the duration of each round in seconds, so it can prepare its
+fixtures once and exclude per-round setup from the timings. Benchmarks are
+registered with the ``benchmark`` decorator; ``time_rounds`` covers the
+common case of timing a synchronous callable.
+
+Results are summarized by their median, which is compared against a stored
+baseline: a benchmark whose median exceeds the baseline median by more than
+the tolerance is reported as a regression.
+"""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import orjson as json
+
+BenchmarkFn = Callable[[Path, int], list[float]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    description: str
+    fn: BenchmarkFn
+    rounds: int
+    """Number of timed rounds in a full run."""
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings of one benchmark run, in seconds."""
+
+    name: str
+    rounds: int
+    median: float
+    minimum: float
+    maximum: float
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A result compared with its baseline."""
+
+    name: str
+    baseline: float | None
+    """Baseline median in seconds, None if the benchmark has no baseline."""
+    current: float
+    """Current median in seconds."""
+    regressed: bool
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the median from the baseline, e.g. 0.25 for 25% slower."""
+        if not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, description: str, rounds: int = 5) -> Callable[[BenchmarkFn], BenchmarkFn]:
+    """Register a benchmark function under ``name``."""
+
+    def register(fn: BenchmarkFn) -> BenchmarkFn:
+        if name in REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        REGISTRY[name] = Benchmark(name=name, description=description, fn=fn, rounds=rounds)
+        return fn
+
+    return register
+
+
+def time_rounds(
+    fn: Callable[[], object], rounds: int, setup: Callable[[], object] | None = None, warmup: int = 1
+) -> list[float]:
+    """Time ``fn`` over a number of rounds.
+
+    Args:
+        fn: The operation to time.
+        rounds: Number of timed rounds.
+        setup: Untimed preparation run before every round, including warm-up rounds.
+        warmup: Untimed rounds run first to fill caches.
+
+    Returns:
+        The duration of each timed round in seconds.
+    """
+    durations: list[float] = []
+    for index in range(warmup + rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            durations.append(elapsed)
+    return durations
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], work_dir: Path, quick: bool = False) -> list[BenchmarkResult]:
+    """Run benchmarks, each in its own subdirectory of ``work_dir``.
+
+    Args:
+        benchmarks: The benchmarks to run.
+        work_dir: Scratch directory for generated fixtures.
+        quick: Run a single round of each benchmark, as a smoke test.
+
+    Returns:
+        One result per benchmark, in the order given.
+    """
+    results: list[BenchmarkResult] = []
+    for bench in benchmarks:
+        bench_dir = work_dir / bench.name
+        bench_dir.mkdir(parents=True, exist_ok=True)
+        durations = bench.fn(bench_dir, 1 if quick else bench.rounds)
+        results.append(
+            BenchmarkResult(
+                name=bench.name,
+                rounds=len(durations),
+                median=statistics.median(durations),
+                minimum=min(durations),
+                maximum=max(durations),
+            )
+        )
+    return results
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Return the baseline median of each benchmark, or an empty dict if there is no baseline file."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_bytes())
+    return {name: entry["median"] for name, entry in data.get("benchmarks", {}).items()}
+
+
+def save_baseline(path: Path, results: Iterable[BenchmarkResult]) -> None:
+    """Write results as the new baseline, keeping entries of benchmarks that were not run."""
+    data = json.loads(path.read_bytes()) if path.exists() else {}
+    entries: dict[str, dict[str, float]] = data.get("benchmarks", {})
+    for result in results:
+        entries[result.name] = {"median": result.median, "min": result.minimum, "max": result.maximum}
+    data = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "benchmarks": dict(sorted(entries.items())),
+    }
+    path.write_bytes(json.dumps(data, option=json.OPT_INDENT_2) + b"\n")
+
+
+def compare(results: Iterable[BenchmarkResult], baseline: dict[str, float], tolerance: float) -> list[Comparison]:
+    """Compare results with a baseline.
+
+    Args:
+        results: Current results.
+        baseline: Baseline median of each benchmark, in seconds.
+        tolerance: Allowed relative slowdown before a result counts as a regression, e.g. 0.25.
+
+    Returns:
+        One comparison per result.
+    """
+    comparisons: list[Comparison] = []
+    for result in results:
+        base = baseline.get(result.name)
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline=base,
+                current=result.median,
+                regressed=base is not None and result.median > base * (1 + tolerance),
+            )
+        )
+    return comparisons
+
+
+def format_report(comparisons: Iterable[Comparison]) -> str:
+    """Return a table of current and baseline medians."""
+    lines = [f"{'benchmark':<44} {'median':>11} {'baseline':>11} {'change':>8}"]
+    for c in comparisons:
+        baseline = f"{c.baseline * 1000:9.2f}ms" if c.baseline else f"{'-':>11}"
+        change = f"{c.change:+8.0%}" if c.change is not None else f"{'':>8}"
+        flag = "  REGRESSION" if c.regressed else ""
+        lines.append(f"{c.name:<44} {c.current * 1000:9.2f}ms {baseline} {change}{flag}")
+    return "\n".join(lines)
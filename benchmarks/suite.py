@@ -0,0 +1,263 @@
+"""The benchmarks.
+
+Each benchmark generates its fixtures under its scratch directory and points
+``settings.chat_dir`` there while it runs, so no user data is read or written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from textual.app import App, ComposeResult
+
+from benchmarks.fixtures import (
+    long_answer,
+    make_messages,
+    make_session,
+    make_templates,
+    stream_chunks,
+    write_chat_dir,
+)
+from benchmarks.harness import benchmark, time_rounds
+from parllama.chat_manager import ChatManager
+from parllama.chat_session import ChatSession
+from parllama.event_bus import EventBus
+from parllama.execution.template_matcher import TemplateMatcher
+from parllama.messages.messages import ChatMessage, SessionUpdated
+from parllama.save_scheduler import save_scheduler
+from parllama.secure_file_ops import SecureFileOperations
+from parllama.session_index import SESSION_INDEX_FILE
+from parllama.settings_manager import settings
+from parllama.widgets.par_markdown import ParMarkdown
+
+SIZES = {"10": 10, "1k": 1_000, "10k": 10_000}
+
+
+@contextmanager
+def overridden(**values: Any) -> Iterator[None]:
+    """Temporarily override settings."""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+def _register_session_benchmarks(label: str, count: int) -> None:
+    """Register the save and load benchmarks for sessions of ``count`` messages."""
+
+    @benchmark(f"session_save_snapshot_{label}", f"First save of a {count} message session, flushed to disk")
+    def save_snapshot(work_dir: Path, rounds: int) -> list[float]:
+        messages = make_messages(count)
+        sessions: list[ChatSession] = []
+
+        def setup() -> None:
+            session = make_session(0)
+            session.messages = [m.clone(new_id=True) for m in messages]
+            session.is_dirty = True
+            sessions.append(session)
+
+        def save() -> None:
+            sessions[-1].save()
+            save_scheduler.flush()
+
+        with overridden(chat_dir=work_dir, no_save_chat=False):
+            return time_rounds(save, rounds, setup=setup)
+
+    @benchmark(f"session_save_append_{label}", f"Save after adding a message to a saved {count} message session")
+    def save_append(work_dir: Path, rounds: int) -> list[float]:
+        session = make_session(count)
+        extra = make_messages(2 * (rounds + 1), seed=1)[1:]
+
+        def save() -> None:
+            session.add_message(extra.pop().clone(new_id=True))
+            save_scheduler.flush()
+
+        with overridden(chat_dir=work_dir, no_save_chat=False, session_journal_max_records=10_000):
+            session.is_dirty = True
+            session.save()
+            save_scheduler.flush()
+            return time_rounds(save, rounds)
+
+    @benchmark(f"session_from_json_{label}", f"Parse a {count} message session snapshot with its messages")
+    def from_json(work_dir: Path, rounds: int) -> list[float]:
+        data = make_session(count).to_json()
+        return time_rounds(lambda: ChatSession.from_json(data, load_messages=True), rounds)
+
+
+for _label, _count in SIZES.items():
+    _register_session_benchmarks(_label, _count)
+
+
+def _load_sessions(work_dir: Path, rounds: int, indexed: bool) -> list[float]:
+    """Time ``ChatManager.load_sessions`` over 500 saved sessions, with or without a session index."""
+    write_chat_dir(work_dir, sessions=500, messages_per_session=20)
+    with overridden(chat_dir=work_dir):
+        ChatManager().load_sessions()
+
+        def setup() -> None:
+            if not indexed:
+                (work_dir / SESSION_INDEX_FILE).unlink(missing_ok=True)
+
+        return time_rounds(lambda: ChatManager().load_sessions(), rounds, setup=setup)
+
+
+@benchmark("chat_manager_load_sessions_cold_500", "List 500 sessions with no session index")
+def load_sessions_cold(work_dir: Path, rounds: int) -> list[float]:
+    return _load_sessions(work_dir, rounds, indexed=False)
+
+
+@benchmark("chat_manager_load_sessions_indexed_500", "List 500 sessions from an up to date session index")
+def load_sessions_indexed(work_dir: Path, rounds: int) -> list[float]:
+    return _load_sessions(work_dir, rounds, indexed=True)
+
+
+class MarkdownApp(App[None]):
+    """Bare app hosting the markdown under test."""
+
+    def compose(self) -> ComposeResult:
+        yield from ()
+
+
+async def _time_markdown(rounds: int, chunks: list[str], stream: bool) -> list[float]:
+    """Time rendering a long answer, streamed chunk by chunk or as one update."""
+    durations: list[float] = []
+    app = MarkdownApp()
+    async with app.run_test(size=(120, 50)):
+        for index in range(rounds + 1):
+            markdown = ParMarkdown()
+            await app.mount(markdown)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            if stream:
+                for chunk in chunks:
+                    await markdown.append(chunk)
+            else:
+                await markdown.update("".join(chunks))
+            if index:
+                durations.append(loop.time() - start)
+            await markdown.remove()
+    return durations
+
+
+@benchmark("par_markdown_stream_long_answer", "Stream a long Markdown answer into ParMarkdown in small chunks", 3)
+def markdown_stream(work_dir: Path, rounds: int) -> list[float]:
+    return asyncio.run(_time_markdown(rounds, stream_chunks(long_answer(), 80), stream=True))
+
+
+@benchmark("par_markdown_update_long_answer", "Render a long Markdown answer into ParMarkdown in one update")
+def markdown_update(work_dir: Path, rounds: int) -> list[float]:
+    return asyncio.run(_time_markdown(rounds, [long_answer()], stream=False))
+
+
+class Subscriber:
+    """Message pump stand-in counting posted messages."""
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    def post_message(self, message: Any) -> bool:
+        self.received += 1
+        return True
+
+
+def _broadcast(rounds: int, event: Any) -> list[float]:
+    """Time 1,000 broadcasts of ``event`` to 100 subscribers."""
+    bus = EventBus()
+    subscribers = [Subscriber() for _ in range(100)]
+    for subscriber in subscribers:
+        bus.subscribe(subscriber, [type(event)])  # type: ignore[arg-type]
+
+    def broadcast() -> None:
+        for _ in range(1_000):
+            bus.broadcast(event)
+
+    return time_rounds(broadcast, rounds)
+
+
+@benchmark("event_bus_broadcast_copied", "1,000 broadcasts to 100 subscribers, copied per recipient")
+def broadcast_copied(work_dir: Path, rounds: int) -> list[float]:
+    return _broadcast(rounds, SessionUpdated(session_id="s", changed={"messages"}))
+
+
+@benchmark("event_bus_broadcast_chat_message", "1,000 streamed ChatMessage broadcasts to 100 subscribers")
+def broadcast_chat_message(work_dir: Path, rounds: int) -> list[float]:
+    return _broadcast(rounds, ChatMessage(parent_id="s", message_id="m"))
+
+
+@benchmark("template_matcher_find_matching", "Match 40 execution templates against 50 long answers")
+def template_matching(work_dir: Path, rounds: int) -> list[float]:
+    matcher = TemplateMatcher()
+    templates = make_templates(40)
+    answers = [long_answer(sections=3, seed=seed) for seed in range(50)]
+
+    def match() -> None:
+        for answer in answers:
+            matcher.find_matching_templates(answer, templates)
+
+    return time_rounds(match, rounds)
+
+
+def _secure_ops_payload() -> dict[str, Any]:
+    """Return a session-sized JSON payload of about 1 MB."""
+    return {"messages": [m.to_dict() for m in make_messages(2_000)]}
+
+
+@benchmark("secure_file_ops_write_json", "Atomically write a 1 MB JSON file")
+def secure_write(work_dir: Path, rounds: int) -> list[float]:
+    ops = SecureFileOperations(allowed_extensions=[".json"])
+    payload = _secure_ops_payload()
+    return time_rounds(lambda: ops.write_json_file(work_dir / "data.json", payload), rounds)
+
+
+@benchmark("secure_file_ops_read_json", "Validate and read a 1 MB JSON file")
+def secure_read(work_dir: Path, rounds: int) -> list[float]:
+    ops = SecureFileOperations(allowed_extensions=[".json"])
+    ops.write_json_file(work_dir / "data.json", _secure_ops_payload())
+    return time_rounds(lambda: ops.read_json_file(work_dir / "data.json"), rounds)
+
+
+class FakeChatModel:
+    """Local chat model streaming a canned reply without any network I/O."""
+
+    name = "fake"
+
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        for chunk in self.chunks:
+            yield AIMessageChunk(content=chunk)
+
+
+@benchmark("chat_session_stream_fake_model", "Stream a 1,000 chunk reply from a local fake model through send_chat")
+def stream_reply(work_dir: Path, rounds: int) -> list[float]:
+    chunks = stream_chunks(long_answer(), 8)[:1_000]
+    original = LlmConfig.build_chat_model
+    LlmConfig.build_chat_model = lambda self: FakeChatModel(chunks)  # type: ignore[assignment, method-assign]
+    sessions: list[ChatSession] = []
+    try:
+        with overridden(
+            chat_dir=work_dir,
+            no_save_chat=True,
+            telemetry_enabled=False,
+            response_cache_enabled=False,
+            ollama_native_chat=False,
+            context_budget_tokens=100_000,
+        ):
+            return time_rounds(
+                lambda: asyncio.run(sessions[-1].send_chat("Explain the code")),
+                rounds,
+                setup=lambda: sessions.append(make_session(20)),
+            )
+    finally:
+        LlmConfig.build_chat_model = original  # type: ignore[method-assign]
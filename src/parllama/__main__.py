@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from parllama.settings_manager import initialize_settings
+import sys
+
+from parllama.startup_profiler import startup_profiler
 from parllama.utils import get_args
 
 # if os.environ.get("DEBUG"):
@@ -15,15 +17,29 @@ from parllama.utils import get_args
 
 def run() -> None:
     """Run the application."""
+    startup_profiler.mark("entry point imports")
+    from parllama.settings_manager import initialize_settings
+
     # Parse real CLI args and initialize the Settings singleton BEFORE importing
     # parllama.app: importing the app eagerly triggers the lazy `settings`
     # singleton, so the explicit args must be applied first or CLI flags are lost.
-    settings = initialize_settings(get_args())
+    args = get_args()
+    settings = initialize_settings(args)
+    startup_profiler.mark("settings")
+    if args.command == "batch":
+        from parllama.batch_runner import run_batch
+
+        sys.exit(run_batch(args))
     print(f"Settings folder {settings.data_dir}")
 
     from parllama.app import ParLlamaApp
 
-    ParLlamaApp().run()
+    startup_profiler.mark("import app")
+    app = ParLlamaApp()
+    startup_profiler.mark("app init")
+    app.run()
+    if args.profile_startup:
+        print(startup_profiler.report())
 
 
 if __name__ == "__main__":
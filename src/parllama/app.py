@@ -25,10 +25,9 @@ from parllama.coordinators.execution_coordinator import ExecutionCoordinator
 from parllama.coordinators.model_job_processor import ModelJobProcessor
 from parllama.coordinators.ps_status_poller import PsStatusPoller
 from parllama.coordinators.session_event_router import SessionEventRouter
-from parllama.dialogs.help_dialog import HelpDialog
-from parllama.dialogs.information import InformationDialog
-from parllama.dialogs.theme_dialog import ThemeDialog
 from parllama.event_bus import EventBus
+from parllama.generation_telemetry import generation_telemetry
+from parllama.http_clients import http_clients
 from parllama.messages.messages import (
     ChangeTab,
     ChatGenerationAborted,
@@ -80,8 +79,10 @@ from parllama.ollama_data_manager import ollama_dm
 from parllama.prompt_utils.import_fabric import import_fabric_manager
 from parllama.provider_manager import provider_manager
 from parllama.screens.main_screen import MainScreen
+from parllama.search_index import search_index
 from parllama.secrets_manager import secrets_manager
 from parllama.settings_manager import settings
+from parllama.startup_profiler import startup_profiler
 from parllama.state_manager import initialize_state_manager
 from parllama.theme_manager import theme_manager
 from parllama.update_manager import update_manager
@@ -183,6 +184,8 @@ class ParLlamaApp(App[None]):
         await self.execution_coordinator.initialize()
 
         await self.push_screen(self.main_screen)
+        startup_profiler.mark("main screen")
+        self.call_after_refresh(startup_profiler.finish, "first paint")
         if settings.check_for_updates:
             await update_manager.check_for_updates()
 
@@ -198,6 +201,7 @@ class ParLlamaApp(App[None]):
                 ],
             )
         )
+        self.session_event_router.sync_search_index()
         self.job_timer = self.set_timer(settings.job_timer_interval, self.do_jobs)
         if settings.ollama_ps_poll_interval > 0:
             self.ps_timer = self.set_timer(settings.ps_timer_interval, self.update_ps)
@@ -209,6 +213,8 @@ class ParLlamaApp(App[None]):
 
     async def show_first_run(self) -> None:
         """Show first run screen"""
+        from parllama.dialogs.information import InformationDialog
+
         await self.app.push_screen(
             InformationDialog(
                 title="Welcome",
@@ -230,6 +236,8 @@ Some functions are only available via slash / commands on that chat tab. You can
 
     def action_help(self) -> None:
         """Show help screen"""
+        from parllama.dialogs.help_dialog import HelpDialog
+
         self.app.push_screen(HelpDialog())
 
     def action_clear_field(self) -> None:
@@ -416,8 +424,9 @@ Some functions are only available via slash / commands on that chat tab. You can
             self.post_message_all(StatusMessage("Local model list refreshing..."))
             ollama_dm.refresh_models()
             self.post_message_all(StatusMessage("Local model list refreshed"))
-            self.post_message_all(LocalModelListLoaded())
+            self.post_message_all(LocalModelListLoaded(changes=ollama_dm.model_changes))
             self.post_message_all(ProviderModelsChanged(provider=LlmProvider.OLLAMA))
+            await ollama_dm.enrich_all_models()
         except ConnectError as e:
             self.post_message(
                 LogIt(
@@ -458,8 +467,11 @@ Some functions are only available via slash / commands on that chat tab. You can
             self.post_message_all(
                 StatusMessage(f"Site models for {msg.ollama_namespace or 'models'} refreshing... force={msg.force}")
             )
-            ollama_dm.refresh_site_models(msg.ollama_namespace, None, msg.force)
-            self.main_screen.site_view.post_message(SiteModelsLoaded(ollama_namespace=msg.ollama_namespace))
+
+            def on_loaded() -> None:
+                self.main_screen.site_view.post_message(SiteModelsLoaded(ollama_namespace=msg.ollama_namespace))
+
+            await ollama_dm.load_site_models(msg.ollama_namespace, msg.force, on_loaded)
             self.post_message_all(
                 StatusMessage(f"Site models for {msg.ollama_namespace or 'models'} loaded. force={msg.force}")
             )
@@ -662,18 +674,22 @@ Some functions are only available via slash / commands on that chat tab. You can
         """Quit the application"""
         settings.shutting_down = True
         self.state_manager.shutdown()
+        chat_manager.save_session_index()
+        search_index.close()
+        generation_telemetry.close()
+        http_clients.close()
         await self.action_quit()
 
     @work(exclusive=True, thread=True)
-    async def refresh_provider_models(self) -> None:
+    async def refresh_provider_models(self, providers: list[LlmProvider] | None = None) -> None:
         """Refresh provider models"""
-        provider_manager.refresh_models()
+        await provider_manager.refresh_models(providers)
 
     @on(RefreshProviderModelsRequested)
     def on_refresh_provider_models(self, event: RefreshProviderModelsRequested) -> None:
         """Refresh provider models event"""
         event.stop()
-        self.refresh_provider_models()
+        self.refresh_provider_models(event.providers)
 
     @on(ProviderModelsChanged)
     def on_provider_models_refreshed(self, event: ProviderModelsChanged) -> None:
@@ -684,5 +700,7 @@ Some functions are only available via slash / commands on that chat tab. You can
     @work
     async def action_change_theme(self) -> None:
         """An action to change the theme."""
+        from parllama.dialogs.theme_dialog import ThemeDialog
+
         theme = await self.push_screen_wait(ThemeDialog())
         settings.theme_name = theme
@@ -0,0 +1,299 @@
+"""Headless batch runs of prompts against one or more models.
+
+``parllama batch PROMPTS.jsonl`` reads one prompt per line and generates a
+reply for every prompt with every configured model, without starting the UI.
+Each line is a JSON object with either a ``prompt`` (the user message, with an
+optional ``system`` message) or a ``prompt_id`` naming a saved custom prompt,
+whose messages are sent as they are, followed by ``prompt`` if it is also
+given. An optional ``id`` labels the line in the results.
+
+Models are given as ``provider:model`` and default to the last model used in
+the app. Replies are generated by scratch chat sessions that are never saved,
+so settings, API keys, the secrets vault, the generation scheduler, the
+response cache and telemetry all apply as they do in a chat tab. At most
+``workers`` requests are in flight at once. Each finished reply is written as
+a JSON line as soon as it completes, and a throughput summary is printed to
+stderr at the end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from argparse import Namespace
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TextIO
+
+import orjson as json
+from dotenv import load_dotenv
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import get_provider_name_fuzzy, provider_name_to_enum
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_prompt import ChatPrompt
+from parllama.generation_telemetry import percentile
+from parllama.model_comparison import ModelComparison
+from parllama.settings_manager import settings
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One prompt to run."""
+
+    id: str
+    messages: tuple[ParllamaChatMessage, ...]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The reply of one model to one prompt."""
+
+    id: str
+    provider: str
+    model: str
+    state: str
+    """``done``, ``failed`` or ``aborted``."""
+    content: str
+    thinking: str
+    cached: bool
+    ttft: float
+    tokens_per_second: float
+    latency: float
+    output_tokens: int
+    cost: float
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """Aggregate figures of a batch run."""
+
+    requests: int
+    failed: int
+    elapsed: float
+    """Wall-clock seconds for the whole run."""
+    output_tokens: int
+    tokens_per_second: float
+    """Output tokens of all replies per wall-clock second."""
+    requests_per_second: float
+    latency_p50: float
+    latency_p95: float
+
+    def format(self) -> str:
+        """Return the summary as a short report."""
+        return (
+            f"{self.requests} requests ({self.failed} failed) in {self.elapsed:.1f}s: "
+            f"{self.requests_per_second:.2f} req/s, {self.output_tokens} output tokens, "
+            f"{self.tokens_per_second:.1f} tok/s, latency p50 {self.latency_p50:.2f}s p95 {self.latency_p95:.2f}s"
+        )
+
+
+def load_batch_items(path: Path) -> list[BatchItem]:
+    """Read the prompts of a batch file.
+
+    Args:
+        path: JSONL file with one prompt object per line. Blank lines are skipped.
+
+    Returns:
+        The prompts in file order.
+
+    Raises:
+        ValueError: If a line is not a JSON object, names an unknown custom prompt, or has nothing to send.
+    """
+    items: list[BatchItem] = []
+    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}:{line_no}: invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}:{line_no}: expected a JSON object")
+        messages: list[ParllamaChatMessage] = []
+        if data.get("prompt_id"):
+            prompt = ChatPrompt.load_from_file(f"{data['prompt_id']}.json")
+            if prompt is None:
+                raise ValueError(f"{path}:{line_no}: custom prompt {data['prompt_id']} not found")
+            prompt.load()
+            messages += [m.clone(new_id=True) for m in prompt.messages]
+        elif data.get("system"):
+            messages.append(ParllamaChatMessage(role="system", content=str(data["system"])))
+        if data.get("prompt"):
+            messages.append(ParllamaChatMessage(role="user", content=str(data["prompt"])))
+        if not any(m.role == "user" for m in messages):
+            raise ValueError(f"{path}:{line_no}: no user message to send")
+        items.append(BatchItem(id=str(data.get("id") or line_no), messages=tuple(messages)))
+    return items
+
+
+def parse_model_spec(spec: str, temperature: float | None = None) -> LlmConfig:
+    """Build the configuration for a ``provider:model`` argument.
+
+    Args:
+        spec: Provider and model name, e.g. ``ollama:llama3.2``.
+        temperature: Sampling temperature. Defaults to the last temperature used in the app.
+
+    Returns:
+        A configuration using the provider's configured base URL.
+
+    Raises:
+        ValueError: If the provider is unknown or the model is missing.
+    """
+    provider_part, _, model_name = spec.partition(":")
+    provider_name = get_provider_name_fuzzy(provider_part.strip())
+    if not provider_name or not model_name.strip():
+        raise ValueError(f"Expected provider:model, got '{spec}'")
+    provider = provider_name_to_enum(provider_name)
+    return LlmConfig(
+        provider=provider,
+        model_name=model_name.strip(),
+        base_url=settings.provider_base_urls[provider],
+        temperature=settings.last_llm_config.temperature if temperature is None else temperature,
+        num_ctx=settings.last_llm_config.num_ctx,
+    )
+
+
+def default_llm_config(temperature: float | None = None) -> LlmConfig:
+    """Return the configuration of the last model used in the app."""
+    last = settings.last_llm_config
+    return LlmConfig(
+        provider=last.provider,
+        model_name=last.model_name,
+        base_url=settings.provider_base_urls[last.provider],
+        temperature=last.temperature if temperature is None else temperature,
+        num_ctx=last.num_ctx,
+        reasoning_effort=last.reasoning_effort,
+        reasoning_budget=last.reasoning_budget,
+    )
+
+
+class BatchRunner:
+    """Generates replies for every prompt and model pair with a bounded number in flight."""
+
+    def __init__(self, items: Sequence[BatchItem], llm_configs: Sequence[LlmConfig], workers: int = 4) -> None:
+        """Initialize the runner.
+
+        Args:
+            items: The prompts to run.
+            llm_configs: The models to run each prompt against.
+            workers: Maximum number of requests in flight.
+        """
+        self.items = list(items)
+        self.llm_configs = list(llm_configs)
+        self.workers = max(1, workers)
+
+    async def run(
+        self, on_result: Callable[[BatchResult], None] | None = None
+    ) -> tuple[list[BatchResult], BatchSummary]:
+        """Run the batch.
+
+        Args:
+            on_result: Called with each result as soon as it completes.
+
+        Returns:
+            The results in completion order and the run's summary.
+        """
+        semaphore = asyncio.Semaphore(self.workers)
+        results: list[BatchResult] = []
+        start = time.monotonic()
+
+        async def run_one(item: BatchItem, llm_config: LlmConfig) -> None:
+            async with semaphore:
+                result = await self._generate(item, llm_config)
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        await asyncio.gather(*(run_one(item, config) for item in self.items for config in self.llm_configs))
+        return results, self.summarize(results, time.monotonic() - start)
+
+    @staticmethod
+    async def _generate(item: BatchItem, llm_config: LlmConfig) -> BatchResult:
+        """Generate one reply in a scratch session."""
+        comparison = ModelComparison(item.messages, [llm_config.clone()])
+        (metrics,) = await comparison.run()
+        reply = comparison.runs[0].reply
+        return BatchResult(
+            id=item.id,
+            provider=metrics.provider,
+            model=metrics.model,
+            state=metrics.state,
+            content=reply.content if reply else "",
+            thinking=reply.thinking if reply else "",
+            cached=reply.cached if reply else False,
+            ttft=metrics.ttft,
+            tokens_per_second=metrics.tokens_per_second,
+            latency=metrics.latency,
+            output_tokens=metrics.output_tokens,
+            cost=metrics.cost,
+        )
+
+    @staticmethod
+    def summarize(results: Sequence[BatchResult], elapsed: float) -> BatchSummary:
+        """Compute aggregate throughput and latency of a set of results."""
+        output_tokens = sum(r.output_tokens for r in results)
+        latencies = [r.latency for r in results if r.state == "done"]
+        return BatchSummary(
+            requests=len(results),
+            failed=sum(1 for r in results if r.state != "done"),
+            elapsed=elapsed,
+            output_tokens=output_tokens,
+            tokens_per_second=output_tokens / elapsed if elapsed > 0 else 0.0,
+            requests_per_second=len(results) / elapsed if elapsed > 0 else 0.0,
+            latency_p50=percentile(latencies, 50),
+            latency_p95=percentile(latencies, 95),
+        )
+
+
+def _load_environment() -> None:
+    """Load API keys from the data directory's .env file and the secrets vault, as the app does."""
+    load_dotenv(Path(settings.data_dir) / ".env")
+    from parllama.secrets_manager import secrets_manager
+
+    secrets_manager.set_app(None)
+    secrets_manager.import_to_env(no_raise=True)
+
+
+def _write_result(out: TextIO, result: BatchResult) -> None:
+    """Write one result as a JSON line."""
+    out.write(json.dumps(asdict(result)).decode("utf-8") + "\n")
+    out.flush()
+
+
+def run_batch(args: Namespace) -> int:
+    """Run the ``batch`` command.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        The process exit code: 0 if every reply completed, 1 if any failed, 2 for invalid input.
+    """
+    try:
+        items = load_batch_items(Path(args.input))
+        llm_configs = [parse_model_spec(spec, args.temperature) for spec in args.batch_models or []]
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not llm_configs:
+        llm_configs = [default_llm_config(args.temperature)]
+    if not all(config.model_name for config in llm_configs):
+        print("Error: no model given and no last used model to default to", file=sys.stderr)
+        return 2
+
+    _load_environment()
+    runner = BatchRunner(items, llm_configs, args.workers)
+    out: TextIO = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout  # noqa: SIM115
+    try:
+        _, summary = asyncio.run(runner.run(lambda result: _write_result(out, result)))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        from parllama.generation_telemetry import generation_telemetry
+
+        generation_telemetry.close()
+    print(summary.format(), file=sys.stderr)
+    return 1 if summary.failed else 0
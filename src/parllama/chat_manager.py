@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import Collection
+from pathlib import Path
 from typing import Any
 
 import orjson as json
@@ -17,6 +18,9 @@ from parllama.chat_session import ChatSession
 from parllama.llm_session_helpers import llm_session_name
 from parllama.message_sink import MessageSink
 from parllama.messages.messages import ChangeTab, PromptListChanged, PromptListLoaded, SessionListChanged
+from parllama.save_scheduler import save_scheduler
+from parllama.session_index import SESSION_INDEX_FILE, SessionIndex
+from parllama.session_journal import JOURNAL_SUFFIX, flush_compactions
 from parllama.settings_manager import settings
 
 
@@ -25,6 +29,7 @@ class ChatManager(MessageSink):
 
     _id_to_session: dict[str, ChatSession]
     _id_to_prompt: dict[str, ChatPrompt]
+    _session_index: SessionIndex
 
     options: OllamaOptions
     prompt_temperature: float
@@ -35,6 +40,7 @@ class ChatManager(MessageSink):
         super().__init__(id="chat_manager")
         self._id_to_session = {}
         self._id_to_prompt = {}
+        self._session_index = SessionIndex()
         self.options = OllamaOptions()
         self.prompt_temperature = 0.5
         self.prompt_llm_name = None
@@ -146,9 +152,15 @@ class ChatManager(MessageSink):
         if session is None:
             return
         del self._id_to_session[session_id]
-        p = os.path.join(settings.chat_dir, f"{session_id}.json")
-        if os.path.exists(p):
-            os.remove(p)
+        # Make sure no pending write or compaction recreates the files after they are removed.
+        save_scheduler.cancel(session_id)
+        flush_compactions()
+        for suffix in (".json", JOURNAL_SUFFIX):
+            p = os.path.join(settings.chat_dir, f"{session_id}{suffix}")
+            if os.path.exists(p):
+                os.remove(p)
+        self._session_index.remove(session_id)
+        self._session_index.save()
         self.notify_sessions_changed()
         # self.log_it(f"CM Session {session_id} deleted")
 
@@ -180,25 +192,55 @@ class ChatManager(MessageSink):
         return session
 
     def load_sessions(self) -> None:
-        """Load chat sessions from files"""
+        """Load chat session metadata, from the session index where it is up to date.
+
+        Only sessions whose files changed since the index was written are parsed;
+        their index entries are refreshed and the index is saved if anything changed.
+        Messages are not loaded until a session is opened.
+        """
+        self._session_index.load()
         for f in os.listdir(settings.chat_dir):
             f = f.lower()
-            if not f.endswith(".json"):
+            if not f.endswith(".json") or f == SESSION_INDEX_FILE:
                 continue
             try:
-                with open(os.path.join(settings.chat_dir, f), encoding="utf-8") as fh:
-                    data = fh.read()
-                    # self.log_it(data)
-                    session = ChatSession.from_json(data, load_messages=False)
-                    session.name_generated = True
-                    self._id_to_session[session.id] = session
-                    self.mount(session)
-                    session.set_app(self.app)
+                entry = self._session_index.get(f.removesuffix(".json"))
+                if entry is not None:
+                    session = ChatSession.from_index_entry(entry)
+                else:
+                    with open(os.path.join(settings.chat_dir, f), encoding="utf-8") as fh:
+                        data = fh.read()
+                        # self.log_it(data)
+                        session = ChatSession.from_json(data, load_messages=False)
+                        session.apply_journal_meta()
+                        session.name_generated = True
+                    self._session_index.update(session)
+                self._id_to_session[session.id] = session
+                self.mount(session)
+                session.set_app(self.app)
             except (json.JSONDecodeError, ValueError, OSError, KeyError) as e:
                 self.log_it(f"Error loading session {e}", notify=True, severity="error")
             except Exception as e:  # noqa: BLE001
                 self.log_it(f"Unexpected error loading session: {type(e).__name__}: {e}", notify=True, severity="error")
 
+        self._session_index.retain(set(self._id_to_session))
+        self._session_index.save()
+
+    def save_session_index(self) -> None:
+        """Refresh the session index from the sessions in memory and write it.
+
+        Called on shutdown so the next startup can build the session list without
+        parsing the sessions that were saved during this run.
+        """
+        save_scheduler.flush()
+        flush_compactions()
+        if not settings.no_save_chat:
+            for session in self._id_to_session.values():
+                if session.is_valid and (Path(settings.chat_dir) / f"{session.id}.json").exists():
+                    self._session_index.update(session)
+        self._session_index.retain(set(self._id_to_session))
+        self._session_index.save()
+
     def maybe_notify_session_updated(self, changed: Collection[str]) -> None:
         """Notify session-list observers when list-visible fields changed."""
         if "name" in changed or "model" in changed or "temperature" in changed:
@@ -313,6 +355,7 @@ class ChatManager(MessageSink):
         if prompt is None:
             return
         del self._id_to_prompt[prompt_id]
+        save_scheduler.cancel(prompt_id)
         p = os.path.join(settings.prompt_dir, f"{prompt_id}.json")
         if os.path.exists(p):
             os.remove(p)
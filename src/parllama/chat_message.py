@@ -12,7 +12,6 @@ from par_ai_core.llm_image_utils import b64_encode_image
 
 from parllama.message_sink import MessageSink
 from parllama.models.ollama_data import MessageRoles, ToolCall
-from parllama.settings_manager import fetch_and_cache_image
 
 
 def try_get_image_type(image_path: str) -> Literal["jpeg", "png", "gif"]:
@@ -71,6 +70,9 @@ class ParllamaChatMessage(MessageSink):
     tool_calls: Sequence[ToolCall] | None = None
     """Tools calls to be made by the model."""
 
+    cached: bool = False
+    """True if the reply was replayed from the response cache instead of generated."""
+
     def __init__(
         self,
         *,
@@ -80,6 +82,7 @@ class ParllamaChatMessage(MessageSink):
         thinking: str = "",
         images: list[str] | None = None,
         tool_calls: Sequence[ToolCall] | None = None,
+        cached: bool = False,
     ) -> None:
         """Initialize the chat message"""
         super().__init__(id=id)
@@ -89,13 +92,14 @@ class ParllamaChatMessage(MessageSink):
         self.thinking = thinking
         self.images = images
         self.tool_calls = tool_calls
+        self.cached = cached
 
         if self.images:
             image = self.images[0]
             if not image.startswith("data:"):
-                image_type = try_get_image_type(image)
-                image = image_to_base64(fetch_and_cache_image(image)[1], image_type)
-                self.images[0] = image
+                from parllama.image_cache import image_cache
+
+                self.images[0] = image_cache.encode(image)
 
     def __str__(self) -> str:
         """Ollama message representation"""
@@ -114,6 +118,7 @@ class ParllamaChatMessage(MessageSink):
             "thinking": self.thinking,
             "images": self.images,
             "tool_calls": self.tool_calls,
+            "cached": self.cached,
         }
 
     def to_ollama_native(self) -> OMessage:
@@ -126,9 +131,11 @@ class ParllamaChatMessage(MessageSink):
         if self.images:
             image = self.images[0]
             try:
+                from parllama.image_cache import image_cache
+
                 content = [
                     {"type": "text", "text": self.content},
-                    image_to_chat_message(image),
+                    image_to_chat_message(image_cache.encode(image)),
                 ]
             except (ValueError, OSError, KeyError) as e:
                 content = str(e)
@@ -153,4 +160,5 @@ class ParllamaChatMessage(MessageSink):
             thinking=self.thinking,
             images=[*self.images] if self.images else None,
             tool_calls=self.tool_calls,
+            cached=self.cached,
         )
@@ -6,6 +6,7 @@ import os
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 
 import orjson as json
@@ -16,6 +17,7 @@ from parllama.chat_message import ParllamaChatMessage
 from parllama.chat_message_container import ChatMessageContainer
 from parllama.messages.messages import DeletePrompt, PromptUpdated
 from parllama.messages.shared import PromptChanges, prompt_change_list
+from parllama.save_scheduler import save_scheduler
 from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
 from parllama.settings_manager import settings
 
@@ -194,7 +196,7 @@ class ChatPrompt(ChatMessageContainer):
         return len(self.name) > 0
 
     def save(self) -> bool:
-        """Save the chat prompt to a file"""
+        """Schedule the chat prompt to be written to its file by the save scheduler"""
         if self._batching:
             # self.log_it(f"CP is batching, not notifying: {self.name}")
             return False
@@ -216,21 +218,25 @@ class ChatPrompt(ChatMessageContainer):
             # self.log_it(f"CP not valid, not saving: {self.id}")
             return False  # Cannot save without name
 
+        # Convert prompt to dictionary for secure JSON writing
+        prompt_data = {
+            "id": self.id,
+            "name": self.name,
+            "last_updated": self.last_updated.isoformat(),
+            "description": self._description,
+            "submit_on_load": self._submit_on_load,
+            "messages": [m.to_dict() for m in self.messages],
+            "source": self.source,
+        }
+        save_scheduler.schedule(self.id, partial(self._write, prompt_data))
+        return True
+
+    def _write(self, prompt_data: dict) -> bool:
+        """Write captured prompt data to the prompt file"""
         file_name = f"{self.id}.json"  # Use prompt ID as filename
         file_path = Path(settings.prompt_dir) / file_name
 
         try:
-            # Convert prompt to dictionary for secure JSON writing
-            prompt_data = {
-                "id": self.id,
-                "name": self.name,
-                "last_updated": self.last_updated.isoformat(),
-                "description": self._description,
-                "submit_on_load": self._submit_on_load,
-                "messages": [m.to_dict() for m in self.messages],
-                "source": self.source,
-            }
-
             # Use secure file operations with atomic write and backup
             with self._secure_ops.backup_file(file_path):
                 self._secure_ops.write_json_file(
@@ -242,7 +248,7 @@ class ChatPrompt(ChatMessageContainer):
                 )
             return True
         except (OSError, SecureFileOpsError) as e:
-            self.log_it(f"Error saving prompt: {e}", notify=True, severity="error")
+            self.log_it_from_thread(f"Error saving prompt: {e}", notify=True, severity="error")
             return False
 
     def replace_messages(self, new_messages: list[ParllamaChatMessage]) -> None:
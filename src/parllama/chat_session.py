@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import re
+import time
 import uuid
-from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import orjson as json
 import pytz
 import rich.repr
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessageChunk
 from par_ai_core.llm_config import LlmConfig, ReasoningEffort, llm_run_manager
 from par_ai_core.llm_providers import LlmProvider
@@ -20,6 +25,9 @@ from textual.message import Message
 
 from parllama.chat_message import ParllamaChatMessage
 from parllama.chat_message_container import ChatMessageContainer
+from parllama.context_window import ContextWindow, ContextWindowStats
+from parllama.generation_scheduler import generation_scheduler
+from parllama.generation_telemetry import GenerationRecord, generation_telemetry
 from parllama.messages.messages import (
     ChatGenerationAborted,
     ChatMessage,
@@ -30,9 +38,15 @@ from parllama.messages.messages import (
     SessionUpdated,
 )
 from parllama.messages.shared import session_change_list
+from parllama.model_warmer import apply_keep_alive
 from parllama.models.ollama_data import MessageRoles
-from parllama.models.token_stats import TokenStats
+from parllama.models.token_stats import GenerationTiming, TokenStats
+from parllama.ollama_data_manager import ollama_dm
+from parllama.ollama_native_chat import ollama_host, ollama_options, to_ollama_messages, token_stats, uses_native_chat
+from parllama.response_cache import CachedResponse, response_cache, response_cache_key
+from parllama.save_scheduler import save_scheduler
 from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
+from parllama.session_journal import SessionJournal
 from parllama.settings_manager import settings
 
 
@@ -42,6 +56,10 @@ class ChatSession(ChatMessageContainer):
     """Chat session class"""
 
     ABORT_SUFFIX = "\n\nAborted..."
+    RESPONSE_REPLAY_DURATION = 0.5
+    """Seconds over which a cached reply is replayed."""
+    RESPONSE_REPLAY_FRAMES = 30
+    """Maximum number of updates a cached reply is replayed in."""
 
     name_generated: bool
     """Set to True if the session name has been generated by LLM"""
@@ -65,6 +83,22 @@ class ChatSession(ChatMessageContainer):
     """Decryption key derived from the password."""
     _salt: bytes | None
     """Used with password to derive the en/decryption key."""
+    _journal: SessionJournal
+    """Append-only change journal backing the session file."""
+    _message_count: int
+    """Number of persisted messages, known before the messages themselves are loaded."""
+    _context_window: ContextWindow
+    """Fits the history sent to the LLM into the context budget."""
+    _context_stats: ContextWindowStats | None
+    """What was sent to the LLM for the latest generation."""
+    _stream_task: asyncio.Future[None] | None
+    """Task streaming the current reply, cancelled by stop_generation."""
+    _stream_loop: asyncio.AbstractEventLoop | None
+    """Event loop running ``_stream_task``."""
+    _generation_timing: GenerationTiming | None
+    """Wall-clock timing of the latest generation."""
+    persist: bool
+    """False for scratch sessions that are never written to disk, such as model comparisons."""
 
     def __init__(
         self,
@@ -74,6 +108,7 @@ class ChatSession(ChatMessageContainer):
         llm_config: LlmConfig,
         messages: list[ParllamaChatMessage] | list[dict] | None = None,
         last_updated: datetime | None = None,
+        persist: bool = True,
     ):
         """Initialize the chat session"""
         super().__init__(id=id, name=name, messages=messages, last_updated=last_updated)
@@ -92,6 +127,13 @@ class ChatSession(ChatMessageContainer):
             "total_tokens": 0,
         }
         self._llm_config = llm_config
+        self._message_count = 0
+        self._context_window = ContextWindow()
+        self._context_stats = None
+        self._stream_task = None
+        self._stream_loop = None
+        self._generation_timing = None
+        self.persist = persist
 
         # Initialize secure file operations for chat sessions
         from parllama.settings_manager import settings
@@ -102,6 +144,7 @@ class ChatSession(ChatMessageContainer):
             validate_content=settings.validate_file_content,
             sanitize_filenames=settings.sanitize_filenames,
         )
+        self._journal = SessionJournal(self.id)
 
     @property
     def llm_config(self) -> LlmConfig:
@@ -123,6 +166,13 @@ class ChatSession(ChatMessageContainer):
 
             # Use secure file operations to load session JSON
             data: dict = self._secure_ops.read_json_file(file_path)
+            for m in data.get("messages") or []:
+                if "message_id" in m:
+                    m["id"] = "message_id"
+                    del m["message_id"]
+
+            # Apply changes journaled since the snapshot was written
+            data = self._journal.replay(data)
 
             # Update session properties from loaded data
             if "name" in data:
@@ -136,12 +186,7 @@ class ChatSession(ChatMessageContainer):
 
             # Update llm_config from loaded data
             if "llm_config" in data:
-                lc = data["llm_config"]
-                if isinstance(lc, str):
-                    lc_dict = json.loads(lc)
-                    self._llm_config = LlmConfig.from_json(lc_dict)
-                elif isinstance(lc, dict):
-                    self._llm_config = LlmConfig.from_json(lc)
+                self._llm_config = self._parse_llm_config(data["llm_config"])
 
             # Restore cost and usage tracking
             self._total_cost = data.get("total_cost", 0.0)
@@ -149,12 +194,9 @@ class ChatSession(ChatMessageContainer):
 
             # Load messages
             msgs = data["messages"] or []
-            for m in msgs:
-                if "message_id" in m:
-                    m["id"] = "message_id"
-                    del m["message_id"]
             for m in msgs:
                 self.add_message(ParllamaChatMessage(**m))
+            self._journal.reset(self.messages)
             self._loaded = True
         except (Exception, SecureFileOpsError) as e:  # noqa: BLE001
             self.log_it(f"Error loading session {e}", notify=True, severity="error")
@@ -162,6 +204,68 @@ class ChatSession(ChatMessageContainer):
             self._batching = False
             self.clear_changes()
 
+    @staticmethod
+    def _parse_llm_config(lc: str | dict) -> LlmConfig:
+        """Build an LlmConfig from its persisted form, which is either a dict or a JSON string."""
+        if isinstance(lc, str):
+            lc = json.loads(lc)
+        return LlmConfig.from_json(lc)  # type: ignore[arg-type]
+
+    def apply_journal_meta(self) -> None:
+        """Apply the newest metadata record from the session journal, if any.
+
+        Used when only session metadata is loaded (e.g. for the session list) so
+        that renames, model changes and cost updates saved to the journal since
+        the last snapshot are reflected without replaying any messages.
+        """
+        meta = self._journal.latest_meta()
+        if not meta:
+            return
+        self._name = meta.get("name") or self._name
+        if "last_updated" in meta:
+            self.last_updated = datetime.fromisoformat(meta["last_updated"]).replace(tzinfo=pytz.UTC)
+        if meta.get("llm_config"):
+            self._llm_config = self._parse_llm_config(meta["llm_config"])
+        self._total_cost = meta.get("total_cost", self._total_cost)
+        self._total_usage = meta.get("total_usage", self._total_usage)
+        self._message_count = meta.get("message_count", self._message_count)
+
+    @property
+    def message_count(self) -> int:
+        """Return the number of messages, without loading them if the session is not loaded yet"""
+        return len(self.messages) if self._loaded else self._message_count
+
+    def index_entry(self) -> dict[str, Any]:
+        """Return the session metadata stored in the session index."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "last_updated": self.last_updated.isoformat(),
+            "llm_config": self._llm_config.to_json(),
+            "total_cost": self._total_cost,
+            "total_usage": self._total_usage,
+            "message_count": self.message_count,
+        }
+
+    @staticmethod
+    def from_index_entry(entry: dict[str, Any]) -> ChatSession:
+        """Build an unloaded ChatSession from a session index entry.
+
+        Messages and encryption fields are read from the session file when the
+        session is loaded, exactly as for sessions built by :meth:`from_json`.
+        """
+        session = ChatSession(
+            id=entry["id"],
+            name=entry["name"] or "Session",
+            last_updated=datetime.fromisoformat(entry["last_updated"]).replace(tzinfo=pytz.UTC),
+            llm_config=ChatSession._parse_llm_config(entry["llm_config"]),
+        )
+        session.name_generated = True
+        session._total_cost = entry.get("total_cost", 0.0)
+        session._total_usage = entry.get("total_usage", session._total_usage)
+        session._message_count = entry.get("message_count", 0)
+        return session
+
     def _emit(self, event: Message) -> None:
         """Emit a Textual message through the owning app."""
         app = self.app or (self.parent.app if self.parent else None)
@@ -181,6 +285,16 @@ class ChatSession(ChatMessageContainer):
         """Get the chat session stats"""
         return self._stream_stats
 
+    @property
+    def context_stats(self) -> ContextWindowStats | None:
+        """Get what was sent to the LLM for the latest generation, including trimmed history"""
+        return self._context_stats
+
+    @property
+    def generation_timing(self) -> GenerationTiming | None:
+        """Get the wall-clock timing of the latest generation"""
+        return self._generation_timing
+
     @property
     def total_cost(self) -> float:
         """Get cumulative session cost in USD"""
@@ -458,6 +572,7 @@ class ChatSession(ChatMessageContainer):
                     output_tokens=0,
                     total_tokens=0,
                     time_til_first_token=int(ttft),
+                    eval_duration_ns=chunk.response_metadata.get("eval_duration") or 0,
                 )
 
     def _handle_stream_error(self, e: Exception, msg: ParllamaChatMessage) -> str | None:
@@ -488,6 +603,259 @@ class ChatSession(ChatMessageContainer):
         self.log_it("Error generating message", notify=True, severity="error")
         return self._parse_llm_error(err_msg)
 
+    async def _consume_stream(
+        self, chat_model: BaseChatModel | None, msg: ParllamaChatMessage, continuing: bool
+    ) -> None:
+        """Wait for a generation slot, then stream the model's reply onto ``msg``, emitting a ChatMessage per chunk.
+
+        The history is fitted into the context budget first, so a summary of
+        trimmed messages is written within this task and can be cancelled with it.
+        A completed reply is recorded in the generation telemetry store and, for
+        cacheable configurations, in the response cache. A request found in the
+        response cache is replayed from it without contacting the provider.
+
+        Args:
+            chat_model: The chat model to stream from, or None to stream with the native Ollama client.
+            msg: The assistant message receiving the reply.
+            continuing: Whether ``msg`` is an existing reply being continued, which is sent
+                with the history, rather than a new empty one.
+        """
+        chat_history = await self._build_chat_history(exclude=None if continuing else msg)
+        cache_key: str | None = None
+        if response_cache.is_cacheable(self._llm_config):
+            cache_key = response_cache_key(self._llm_config, chat_history)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                await self._replay_cached_response(cached, msg)
+                return
+        async with generation_scheduler.slot(self.id, self._llm_config):
+            msg.cached = False
+            content_start = len(msg.content)
+            thinking_start = len(msg.thinking)
+            start_time = datetime.now(UTC)
+            self._generation_timing = None
+            previous_stats = self._stream_stats
+            if chat_model is None:
+                num_tokens, ttft = await self._stream_ollama_native(chat_history, msg, start_time)
+            else:
+                num_tokens, ttft = await self._stream_langchain(chat_model, chat_history, msg, start_time)
+            self._generation_timing = GenerationTiming(
+                ttft=ttft, latency=(datetime.now(UTC) - start_time).total_seconds(), chunks=num_tokens
+            )
+            if settings.telemetry_enabled and num_tokens:
+                stats = self._stream_stats if self._stream_stats is not previous_stats else None
+                generation_telemetry.queue_record(
+                    GenerationRecord.from_generation(self._llm_config, self._generation_timing, stats)
+                )
+            if cache_key and num_tokens:
+                response_cache.put(cache_key, msg.content[content_start:], msg.thinking[thinking_start:])
+
+    async def _stream_langchain(
+        self, chat_model: BaseChatModel, chat_history: list[Any], msg: ParllamaChatMessage, start_time: datetime
+    ) -> tuple[int, float]:
+        """Stream a reply through a LangChain chat model.
+
+        Returns:
+            The number of content chunks received and the time to first token in seconds.
+        """
+        num_tokens: int = 0
+        ttft: float = 0.0  # time to first token
+        async for chunk in chat_model.astream(
+            chat_history,
+            config=llm_run_manager.get_runnable_config(chat_model.name or ""),
+        ):
+            elapsed_time = datetime.now(UTC) - start_time
+            if chunk.content:
+                if num_tokens == 0:
+                    ttft = elapsed_time.total_seconds()
+                num_tokens += 1
+                self._append_chunk_content(msg, chunk.content)
+
+            self._update_stream_stats_from_chunk(chunk, elapsed_time, ttft)
+            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=not chunk.content))
+        return num_tokens, ttft
+
+    async def _stream_ollama_native(
+        self, chat_history: list[Any], msg: ParllamaChatMessage, start_time: datetime
+    ) -> tuple[int, float]:
+        """Stream a reply with the Ollama client directly, bypassing LangChain.
+
+        Returns:
+            The number of content chunks received and the time to first token in seconds.
+        """
+        num_tokens: int = 0
+        ttft: float = 0.0  # time to first token
+        client = ollama_dm.chat_client(ollama_host(self._llm_config))
+        stream = await client.chat(
+            model=self._llm_config.model_name,
+            messages=to_ollama_messages(chat_history),
+            stream=True,
+            format=self._llm_config.format or None,
+            options=ollama_options(self._llm_config),
+            keep_alive=settings.ollama_keep_alive or None,
+        )
+        async for part in stream:
+            if part.message.thinking:
+                msg.thinking += part.message.thinking
+            if part.message.content:
+                if num_tokens == 0:
+                    ttft = (datetime.now(UTC) - start_time).total_seconds()
+                num_tokens += 1
+                msg.content += part.message.content
+            if part.done:
+                self._stream_stats = token_stats(part, ttft)
+            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=part.done or False))
+        return num_tokens, ttft
+
+    async def _replay_cached_response(self, cached: CachedResponse, msg: ParllamaChatMessage) -> None:
+        """Stream a cached reply onto ``msg`` in a few quick updates and mark it as cached.
+
+        The replay carries no token stats, so no cost is accumulated for it.
+        """
+        start = time.monotonic()
+        self._stream_stats = None
+        msg.cached = True
+        msg.thinking += cached.thinking
+        base = msg.content
+        content = cached.content
+        word_ends = [m.end() for m in re.finditer(r"\S+", content)]
+        frames = min(len(word_ends), self.RESPONSE_REPLAY_FRAMES)
+        for frame in range(1, frames + 1):
+            msg.content = base + content[: word_ends[len(word_ends) * frame // frames - 1]]
+            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id))
+            await asyncio.sleep(self.RESPONSE_REPLAY_DURATION / frames)
+        msg.content = base + content
+        self._generation_timing = GenerationTiming(ttft=0.0, latency=time.monotonic() - start, chunks=frames)
+        self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
+
+    async def _stream_reply(
+        self, chat_model: BaseChatModel | None, msg: ParllamaChatMessage, continuing: bool = False
+    ) -> bool:
+        """Stream the model's reply onto ``msg`` as a task that ``stop_generation`` can cancel.
+
+        Stream errors are appended to ``msg``. On abort the abort suffix is appended and
+        ChatGenerationAborted is emitted.
+
+        Args:
+            chat_model: The chat model to stream from, or None to stream with the native Ollama client.
+            msg: The assistant message receiving the reply.
+            continuing: Whether ``msg`` is an existing reply being continued.
+
+        Returns:
+            True if the generation was aborted by the user.
+        """
+        is_aborted = False
+        self._stream_loop = asyncio.get_running_loop()
+        self._stream_task = asyncio.ensure_future(self._consume_stream(chat_model, msg, continuing))
+        if self._abort:
+            self._stream_task.cancel()
+        try:
+            await self._stream_task
+        except asyncio.CancelledError:
+            if not self._abort:
+                raise
+            is_aborted = True
+        except Exception as e:  # noqa: BLE001
+            err_msg = self._handle_stream_error(e, msg)
+            if err_msg is not None:
+                msg.content += f"\n\n{err_msg}"
+                msg.content = msg.content.strip()
+                self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
+        finally:
+            self._stream_task = None
+            self._stream_loop = None
+            self._abort = False
+
+        if is_aborted:
+            msg.content += self.ABORT_SUFFIX
+            self._emit(ChatGenerationAborted(self.id))
+            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
+        return is_aborted
+
+    def _context_budget(self) -> int:
+        """Return the prompt token budget, or 0 if no limit is known.
+
+        Uses ``settings.context_budget_tokens`` when set, otherwise the session's
+        ``num_ctx`` or the model's context length, less ``settings.context_reserve_tokens``
+        held back for the response.
+        """
+        if settings.context_budget_tokens > 0:
+            return settings.context_budget_tokens
+        from parllama.provider_manager import provider_manager
+
+        limit = self._llm_config.num_ctx or provider_manager.get_model_context_length(
+            self._llm_config.provider, self._llm_config.model_name
+        )
+        if limit <= 0:
+            return 0
+        return max(limit - settings.context_reserve_tokens, limit // 2)
+
+    def _build_chat_model(self) -> BaseChatModel:
+        """Build the session's chat model with the configured Ollama keep-alive."""
+        if self._llm_config.provider == LlmProvider.LITELLM:
+            from parllama.provider_manager import quiet_litellm
+
+            quiet_litellm()
+        return apply_keep_alive(self._llm_config.build_chat_model(), self._llm_config)
+
+    def _build_stream_model(self) -> BaseChatModel | None:
+        """Build the chat model to stream replies from, or None when the native Ollama client is used."""
+        return None if uses_native_chat(self._llm_config) else self._build_chat_model()
+
+    async def _summarize_messages(self, previous: str, messages: Sequence[ParllamaChatMessage]) -> str:
+        """Summarize messages trimmed from the context window with the session's LLM.
+
+        The summary request waits for a generation slot like any other generation.
+
+        Args:
+            previous: Summary of even older messages to extend, or "".
+            messages: Messages to fold into the summary, oldest first.
+
+        Returns:
+            The updated summary text.
+        """
+        transcript = "\n\n".join(f"#{m.role.upper()}\n{m.content[:4000]}" for m in messages)
+        if previous:
+            transcript = f"#EARLIER SUMMARY\n{previous}\n\n{transcript}"
+        chat_model = self._build_chat_model()
+        async with generation_scheduler.slot(self.id, self._llm_config):
+            result = await chat_model.ainvoke(
+                [
+                    (
+                        "system",
+                        "Summarize the conversation below in a few short paragraphs. Keep facts, decisions, "
+                        "names and open questions needed to continue it. Reply with the summary only.",
+                    ),
+                    ("user", transcript),
+                ],
+                config=llm_run_manager.get_runnable_config(chat_model.name or ""),
+            )
+        return result.content if isinstance(result.content, str) else str(result.content)
+
+    async def _build_chat_history(
+        self, exclude: ParllamaChatMessage | None = None
+    ) -> list[tuple[str, str | list[dict[str, Any]]]]:
+        """Fit the session history into the context budget and convert it for LangChain.
+
+        Records what was sent and trimmed in ``context_stats``.
+
+        Args:
+            exclude: A new, still empty assistant message to leave out of the history.
+        """
+        result = await self._context_window.fit(
+            [m for m in self.messages if m is not exclude],
+            self._context_budget() if settings.context_trim_policy != "none" else 0,
+            settings.context_trim_policy,
+            self._summarize_messages,
+        )
+        self._context_stats = result.stats
+        if result.stats.trimmed_messages:
+            self.log_it(
+                f"Context window: trimmed {result.stats.trimmed_messages} messages "
+                f"(~{result.stats.trimmed_tokens} tokens) to fit {result.stats.budget} tokens"
+            )
+        return [m.to_langchain_native() for m in result.messages]
+
     def _maybe_trigger_auto_naming(self, is_aborted: bool) -> None:
         """Request an LLM-generated session name if auto-naming is enabled and due.
 
@@ -546,55 +914,14 @@ class ChatSession(ChatMessageContainer):
                 self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
                 self.save()
 
-            num_tokens: int = 0
-            start_time = datetime.now(UTC)
-            ttft: float = 0.0  # time to first token
-
-            # self.log_it(self._llm_config)
-            chat_history = [m.to_langchain_native() for m in self.messages]
-            # self.log_it(chat_history)
-            chat_model = self._llm_config.build_chat_model()
-
             # self.log_it(self._llm_config)
+            chat_model = self._build_stream_model()
 
-            stream: Iterator[BaseMessageChunk] = chat_model.stream(
-                chat_history,  # type: ignore
-                config=llm_run_manager.get_runnable_config(chat_model.name or ""),
-            )
             # self.log_it("CM adding assistant message")
             msg = ParllamaChatMessage(role="assistant")
             self.add_message(msg)
             self._emit(ChatMessage(parent_id=self.id, message_id=msg.id))
-            try:
-                for chunk in stream:
-                    # self.log_it(chunk)
-                    elapsed_time = datetime.now(UTC) - start_time
-                    if chunk.content:
-                        if num_tokens == 0:
-                            ttft = elapsed_time.total_seconds()
-                        num_tokens += 1
-                        self._append_chunk_content(msg, chunk.content)
-
-                    if self._abort:
-                        is_aborted = True
-                        try:
-                            msg.content += self.ABORT_SUFFIX
-                            self._emit(ChatGenerationAborted(self.id))
-                            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
-                            stream.close()  # type: ignore
-                        except (OSError, ValueError):
-                            pass
-                        finally:
-                            self._abort = False
-                        break
-
-                    self._update_stream_stats_from_chunk(chunk, elapsed_time, ttft)
-                    self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=not chunk.content))
-            except Exception as e:  # noqa: BLE001
-                err_msg = self._handle_stream_error(e, msg)
-                if err_msg is not None:
-                    msg.content += f"\n\n{err_msg}"
-                    msg.content = msg.content.strip()
+            is_aborted = await self._stream_reply(chat_model, msg)
 
             self._accumulate_cost()
             self._changes.add("messages")
@@ -622,6 +949,7 @@ class ChatSession(ChatMessageContainer):
         """Start new session"""
         self._batching = True
         self.id = uuid.uuid4().hex
+        self._journal = SessionJournal(self.id)
         self.name = name
         self.name_generated = False
         self.messages.clear()
@@ -629,6 +957,8 @@ class ChatSession(ChatMessageContainer):
         self.clear_changes()
         self._loaded = False
         self._stream_stats = None
+        self._context_window = ContextWindow()
+        self._context_stats = None
         self._batching = False
 
     def __eq__(self, other: object) -> bool:
@@ -651,22 +981,26 @@ class ChatSession(ChatMessageContainer):
             fields (if a password is set), cost/usage tracking, and all
             messages. Suitable for round-tripping through :meth:`from_json`.
         """
-        return json.dumps(
-            {
-                "id": self.id,
-                "_salt": (base64.b64encode(self._salt).decode("utf-8") if self._salt else None),
-                "__key__": self._key_secure,
-                "name": self.name,
-                "name_generated": self.name_generated,
-                "last_updated": self.last_updated.isoformat(),
-                "llm_config": self._llm_config.to_json(),
-                "total_cost": self._total_cost,
-                "total_usage": self._total_usage,
-                "messages": [m.to_dict() for m in self.messages],
-            },
-            str,
-            json.OPT_INDENT_2,
-        ).decode("utf-8")
+        return json.dumps(self._snapshot_data(), str, json.OPT_INDENT_2).decode("utf-8")
+
+    def _meta_data(self) -> dict[str, Any]:
+        """Return the persisted session fields other than the messages."""
+        return {
+            "id": self.id,
+            "_salt": (base64.b64encode(self._salt).decode("utf-8") if self._salt else None),
+            "__key__": self._key_secure,
+            "name": self.name,
+            "name_generated": self.name_generated,
+            "last_updated": self.last_updated.isoformat(),
+            "llm_config": self._llm_config.to_json(),
+            "total_cost": self._total_cost,
+            "total_usage": self._total_usage,
+            "message_count": len(self.messages),
+        }
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the full session data written to the snapshot file."""
+        return {**self._meta_data(), "messages": [m.to_dict() for m in self.messages]}
 
     @staticmethod
     def from_json(json_data: str, load_messages: bool = False) -> ChatSession:
@@ -689,6 +1023,7 @@ class ChatSession(ChatMessageContainer):
             KeyError: If required fields (e.g. ``last_updated``) are missing.
         """
         data: dict = json.loads(json_data)
+        message_count = len(data.get("messages") or [])
         if load_messages:
             messages = data["messages"]
             for m in messages:
@@ -725,6 +1060,7 @@ class ChatSession(ChatMessageContainer):
 
         session._total_cost = data.get("total_cost", 0.0)
         session._total_usage = data.get("total_usage", {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0})
+        session._message_count = message_count
 
         return session
 
@@ -753,7 +1089,9 @@ class ChatSession(ChatMessageContainer):
 
             file_path = Path(settings.chat_dir) / filename
             json_data = secure_ops.read_text_file(file_path)
-            return ChatSession.from_json(json_data)
+            session = ChatSession.from_json(json_data)
+            session.apply_journal_meta()
+            return session
         except (OSError, SecureFileOpsError):
             return None
 
@@ -766,16 +1104,18 @@ class ChatSession(ChatMessageContainer):
         )
 
     def save(self) -> bool:
-        """Persist the chat session to disk, if there are unsaved changes to save.
+        """Schedule the chat session to be persisted, if there are unsaved changes to save.
 
-        Notifies listeners of what changed, then atomically writes the
-        session to its JSON file. Saving is skipped while batching, when
+        Notifies listeners of what changed, then hands the current messages and
+        metadata to the save scheduler, which writes them in the background
+        (see :meth:`_write`). Saving is skipped while batching, when
         there are no pending changes, when ``settings.no_save_chat`` is set,
-        or when the session is not yet valid (missing name/model or empty).
+        for scratch sessions created with ``persist=False``, or when the
+        session is not yet valid (missing name/model or empty).
 
         Returns:
-            True if the session was written to disk; False if saving was
-            skipped or failed.
+            True if the session was scheduled to be written; False if saving
+            was skipped.
         """
         if self._batching:
             # self.log_it(f"CS is batching, not notifying: {self.name}")
@@ -799,7 +1139,7 @@ class ChatSession(ChatMessageContainer):
         self._notify_changed(nc)
         self.clear_changes()
 
-        if settings.no_save_chat:
+        if settings.no_save_chat or not self.persist:
             return False  # Do not save if no_save_chat is set in settings
         if not self.is_valid or len(self.messages) == 0:
             # self.log_it(f"CS not valid, not saving: {self.id}")
@@ -807,41 +1147,49 @@ class ChatSession(ChatMessageContainer):
 
         # self.log_it(f"CS saving: {self.name}")
 
-        file_name = f"{self.id}.json"  # Use session ID as filename to avoid over
-        file_path = Path(settings.chat_dir) / file_name
+        # Capture the state now; the write itself happens on the save scheduler's thread.
+        save_scheduler.schedule(self.id, partial(self._write, list(self.messages), self._meta_data()))
+        return True
+
+    def _write(self, messages: list[ParllamaChatMessage], meta: dict[str, Any]) -> bool:
+        """Write captured session state to the snapshot and journal files.
 
+        The first write of a session writes a full snapshot; later writes append
+        only the changed messages and the metadata to the session journal, which
+        is compacted back into the snapshot in the background once it grows
+        large enough.
+
+        Args:
+            messages: The session's messages at the time of the save.
+            meta: The session's metadata at the time of the save.
+
+        Returns:
+            True if the session was written; False if the write failed.
+        """
         try:
-            # Convert session to dictionary for secure JSON writing
-            session_data = {
-                "id": self.id,
-                "_salt": (base64.b64encode(self._salt).decode("utf-8") if self._salt else None),
-                "__key__": self._key_secure,
-                "name": self.name,
-                "name_generated": self.name_generated,
-                "last_updated": self.last_updated.isoformat(),
-                "llm_config": self._llm_config.to_json(),
-                "total_cost": self._total_cost,
-                "total_usage": self._total_usage,
-                "messages": [m.to_dict() for m in self.messages],
-            }
-
-            # Use secure file operations with atomic write and backup
-            with self._secure_ops.backup_file(file_path):
-                self._secure_ops.write_json_file(
-                    file_path,
-                    session_data,
-                    atomic=True,
-                    create_dirs=True,
-                    indent=2,
-                )
+            if not self._journal.has_snapshot:
+                self._journal.write_snapshot({**meta, "messages": [m.to_dict() for m in messages]}, self._secure_ops)
+                self._journal.reset(messages)
+            elif self._journal.append_changes(messages, meta):
+                self._journal.compact({**meta, "messages": [m.to_dict() for m in messages]}, self._secure_ops)
             return True
         except (OSError, SecureFileOpsError) as e:
-            self.log_it(f"Error saving session: {e}", notify=True, severity="error")
+            self.log_it_from_thread(f"Error saving session: {e}", notify=True, severity="error")
             return False
 
     def stop_generation(self) -> None:
-        """Stop LLM model generation"""
+        """Stop LLM model generation.
+
+        Safe to call from any thread. The in-flight request is cancelled on its
+        event loop right away, so generation stops even while the model is still
+        evaluating the prompt. Does nothing if no generation is in progress.
+        """
+        if not self._generating:
+            return
         self._abort = True
+        task, loop = self._stream_task, self._stream_loop
+        if task is not None and loop is not None and not task.done():
+            loop.call_soon_threadsafe(task.cancel)
 
     async def continue_generation(self, message_id: str) -> bool:
         """Continue generation from an edited assistant message.
@@ -888,48 +1236,10 @@ class ChatSession(ChatMessageContainer):
         try:
             self._ensure_memory_injection()
 
-            num_tokens: int = 0
-            start_time = datetime.now(UTC)
-            ttft: float = 0.0
-
-            chat_history = [m.to_langchain_native() for m in self.messages]
-            chat_model = self._llm_config.build_chat_model()
+            chat_model = self._build_stream_model()
 
-            stream: Iterator[BaseMessageChunk] = chat_model.stream(
-                chat_history,  # type: ignore
-                config=llm_run_manager.get_runnable_config(chat_model.name or ""),
-            )
             self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=False))
-            try:
-                for chunk in stream:
-                    elapsed_time = datetime.now(UTC) - start_time
-                    if chunk.content:
-                        if num_tokens == 0:
-                            ttft = elapsed_time.total_seconds()
-                        num_tokens += 1
-                        self._append_chunk_content(msg, chunk.content)
-
-                    if self._abort:
-                        is_aborted = True
-                        try:
-                            msg.content += self.ABORT_SUFFIX
-                            self._emit(ChatGenerationAborted(self.id))
-                            self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
-                            stream.close()  # type: ignore
-                        except (OSError, ValueError):
-                            pass
-                        finally:
-                            self._abort = False
-                        break
-
-                    self._update_stream_stats_from_chunk(chunk, elapsed_time, ttft)
-                    self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=not chunk.content))
-            except Exception as e:  # noqa: BLE001
-                err_msg = self._handle_stream_error(e, msg)
-                if err_msg is not None:
-                    msg.content += f"\n\n{err_msg}"
-                    msg.content = msg.content.strip()
-                    self._emit(ChatMessage(parent_id=self.id, message_id=msg.id, is_final=True))
+            is_aborted = await self._stream_reply(chat_model, msg, continuing=True)
 
             self._accumulate_cost()
             self._changes.add("messages")
@@ -0,0 +1,247 @@
+"""Token-budgeted context assembly for chat generation.
+
+A chat session used to send its entire history on every turn. ``ContextWindow``
+counts the tokens of each message (cached per message until its content
+changes), keeps system messages (the system prompt and injected user memory)
+pinned, and fits the remaining history into a token budget using one of the
+``CONTEXT_TRIM_POLICIES``:
+
+- ``none``: send everything.
+- ``drop_oldest``: drop the oldest non-system messages until the rest fits.
+- ``summarize_oldest``: like ``drop_oldest``, but replace the dropped messages
+  with a system message summarizing them. Summaries are cached and extended
+  incrementally as more history falls out of the window.
+
+The newest message is always sent, even if it alone exceeds the budget.
+
+Tokens are counted with tiktoken when the optional ``tokens`` extra is
+installed, and estimated at 4 characters per token otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+from parllama.chat_message import ParllamaChatMessage
+
+CONTEXT_TRIM_POLICIES = ("none", "drop_oldest", "summarize_oldest")
+
+MESSAGE_OVERHEAD_TOKENS = 4
+"""Tokens added per message for role and separators by chat templates."""
+IMAGE_TOKEN_ESTIMATE = 768
+"""Rough token cost of one attached image."""
+SUMMARY_TOKEN_RESERVE = 512
+"""Budget held back for the summary message under the summarize_oldest policy."""
+SUMMARY_PREFIX = "Summary of earlier conversation:\n\n"
+
+Summarizer = Callable[[str, Sequence[ParllamaChatMessage]], Awaitable[str]]
+"""Summarizes messages, given the previous summary (or "") to extend."""
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once; None if it is unavailable (e.g. offline)."""
+    global _encoding, _encoding_loaded
+    with _encoding_lock:
+        if not _encoding_loaded:
+            _encoding_loaded = True
+            try:
+                import tiktoken
+
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:  # noqa: BLE001
+                _encoding = None
+    return _encoding
+
+
+def count_text_tokens(text: str) -> int:
+    """Count the tokens in ``text``, falling back to 4 characters per token."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@dataclass(frozen=True)
+class ContextWindowStats:
+    """What was sent to the model for the latest generation."""
+
+    policy: str
+    """Trim policy that was applied."""
+    budget: int
+    """Token budget for the prompt; 0 if no limit was known."""
+    prompt_tokens: int
+    """Estimated tokens of the messages sent."""
+    sent_messages: int
+    """Number of messages sent, including any summary message."""
+    trimmed_messages: int
+    """Number of history messages left out of the prompt."""
+    trimmed_tokens: int
+    """Estimated tokens of the messages left out."""
+    summarized: bool
+    """True if the trimmed messages were replaced by a summary."""
+
+
+@dataclass(frozen=True)
+class ContextWindowResult:
+    """Messages to send and the stats describing them."""
+
+    messages: list[ParllamaChatMessage]
+    stats: ContextWindowStats
+
+
+class ContextWindow:
+    """Fits a session's messages into a token budget."""
+
+    def __init__(self) -> None:
+        """Initialize empty token and summary caches."""
+        self._token_cache: dict[str, tuple[int, int, int]] = {}
+        self._summary: tuple[list[str], str] | None = None
+
+    def message_tokens(self, msg: ParllamaChatMessage) -> int:
+        """Return the token count of ``msg``, using the cached count if its content is unchanged."""
+        fingerprint = (len(msg.content), hash(msg.content))
+        cached = self._token_cache.get(msg.id)
+        if cached is not None and cached[:2] == fingerprint:
+            tokens = cached[2]
+        else:
+            tokens = count_text_tokens(msg.content)
+            self._token_cache[msg.id] = (*fingerprint, tokens)
+        return MESSAGE_OVERHEAD_TOKENS + tokens + (IMAGE_TOKEN_ESTIMATE if msg.images else 0)
+
+    async def fit(
+        self,
+        messages: Sequence[ParllamaChatMessage],
+        budget: int,
+        policy: str = "drop_oldest",
+        summarizer: Summarizer | None = None,
+    ) -> ContextWindowResult:
+        """Select the messages to send within ``budget`` tokens.
+
+        The first call loads the tiktoken encoding in a worker thread, and the
+        ``summarize_oldest`` policy awaits ``summarizer``.
+
+        Args:
+            messages: The full session history, oldest first.
+            budget: Maximum prompt tokens; 0 or less means unlimited.
+            policy: One of ``CONTEXT_TRIM_POLICIES``.
+            summarizer: Used by the ``summarize_oldest`` policy. If it is missing
+                or fails, trimmed messages are dropped instead.
+
+        Returns:
+            The messages to send, oldest first, and stats about the selection.
+        """
+        if not _encoding_loaded:
+            await asyncio.to_thread(_get_encoding)
+        live_ids = {m.id for m in messages}
+        for stale in self._token_cache.keys() - live_ids:
+            del self._token_cache[stale]
+
+        tokens = {m.id: self.message_tokens(m) for m in messages}
+        total = sum(tokens.values())
+        if policy not in CONTEXT_TRIM_POLICIES:
+            policy = "drop_oldest"
+        if policy == "none" or budget <= 0 or total <= budget:
+            return self._result(policy, budget, list(messages), tokens, [], False)
+
+        pinned = [m for m in messages if m.role == "system"]
+        history = [m for m in messages if m.role != "system"]
+        summarize = policy == "summarize_oldest" and summarizer is not None
+        available = budget - sum(tokens[m.id] for m in pinned)
+        if summarize:
+            available -= SUMMARY_TOKEN_RESERVE
+
+        kept = self._fit_history(history, tokens, available)
+        trimmed = history[: len(history) - len(kept)]
+
+        summary_msg: ParllamaChatMessage | None = None
+        if summarize and trimmed:
+            summary_msg = await self._summarize(trimmed, summarizer)  # type: ignore[arg-type]
+            if summary_msg is not None:
+                tokens[summary_msg.id] = self.message_tokens(summary_msg)
+                # A long summary can still push the newest history over the budget.
+                kept = self._fit_history(kept, tokens, available + SUMMARY_TOKEN_RESERVE - tokens[summary_msg.id])
+            else:
+                # No summary after all, so the reserved space can hold history instead.
+                kept = self._fit_history(history, tokens, available + SUMMARY_TOKEN_RESERVE)
+            trimmed = history[: len(history) - len(kept)]
+
+        kept_ids = {m.id for m in kept}
+        selected = [m for m in messages if m.role == "system" or m.id in kept_ids]
+        if summary_msg is not None:
+            selected.insert(len(pinned), summary_msg)
+        return self._result(policy, budget, selected, tokens, trimmed, summary_msg is not None)
+
+    @staticmethod
+    def _fit_history(
+        history: list[ParllamaChatMessage], tokens: dict[str, int], available: int
+    ) -> list[ParllamaChatMessage]:
+        """Return the newest suffix of ``history`` that fits in ``available`` tokens.
+
+        The newest message is always kept, and the kept history never starts with
+        an assistant reply or tool result whose prompting message was dropped.
+        """
+        if not history:
+            return []
+        start = len(history) - 1
+        used = tokens[history[start].id]
+        while start > 0 and used + tokens[history[start - 1].id] <= available:
+            start -= 1
+            used += tokens[history[start].id]
+        while start < len(history) - 1 and start > 0 and history[start].role in ("assistant", "tool"):
+            start += 1
+        return history[start:]
+
+    async def _summarize(
+        self, trimmed: list[ParllamaChatMessage], summarizer: Summarizer
+    ) -> ParllamaChatMessage | None:
+        """Return a summary message for ``trimmed``, extending the cached summary if possible."""
+        trimmed_ids = [m.id for m in trimmed]
+        previous = ""
+        new_messages: list[ParllamaChatMessage] = trimmed
+        if self._summary is not None:
+            cached_ids, cached_text = self._summary
+            if trimmed_ids == cached_ids:
+                return ParllamaChatMessage(id="context-summary", role="system", content=SUMMARY_PREFIX + cached_text)
+            if trimmed_ids[: len(cached_ids)] == cached_ids:
+                previous = cached_text
+                new_messages = trimmed[len(cached_ids) :]
+        try:
+            text = (await summarizer(previous, new_messages)).strip()
+        except Exception:  # noqa: BLE001
+            return None
+        if not text:
+            return None
+        self._summary = (trimmed_ids, text)
+        return ParllamaChatMessage(id="context-summary", role="system", content=SUMMARY_PREFIX + text)
+
+    @staticmethod
+    def _result(
+        policy: str,
+        budget: int,
+        selected: list[ParllamaChatMessage],
+        tokens: dict[str, int],
+        trimmed: list[ParllamaChatMessage],
+        summarized: bool,
+    ) -> ContextWindowResult:
+        """Build the result for a selection."""
+        return ContextWindowResult(
+            messages=selected,
+            stats=ContextWindowStats(
+                policy=policy,
+                budget=max(budget, 0),
+                prompt_tokens=sum(tokens[m.id] for m in selected),
+                sent_messages=len(selected),
+                trimmed_messages=len(trimmed),
+                trimmed_tokens=sum(tokens[m.id] for m in trimmed),
+                summarized=summarized,
+            ),
+        )
@@ -14,6 +14,7 @@ import humanize
 from rich.text import Text
 
 from parllama.messages.messages import PsMessage
+from parllama.model_warmer import model_warmer
 from parllama.ollama_data_manager import ollama_dm
 from parllama.settings_manager import settings
 
@@ -45,6 +46,7 @@ class PsStatusPoller:
                 break
             await asyncio.sleep(settings.ollama_ps_poll_interval)
             ret = ollama_dm.model_ps()
+            model_warmer.update_running(ret)
             if len(ret.models) < 1:
                 if not was_blank:
                     self._app.post_message_all(PsMessage(msg=""))
@@ -2,7 +2,9 @@
 
 Centralizes what happens when a session- or prompt-related message reaches the
 App: fanning the event out to registered widgets via ``post_message_all``,
-forwarding chat messages to the chat view, and coordinating the chat manager.
+forwarding chat messages to the chat view (coalescing streamed chunk updates
+per frame), coordinating the chat manager and keeping the message search
+index in step with session and prompt changes.
 The App keeps the thin ``@on`` handlers Textual requires and delegates here.
 """
 
@@ -10,6 +12,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from textual.timer import Timer
+
 from parllama.chat_manager import chat_manager
 from parllama.messages.messages import (
     ChatGenerationAborted,
@@ -27,9 +31,12 @@ from parllama.messages.messages import (
     SessionToPrompt,
     SessionUpdated,
 )
+from parllama.search_index import search_index
+from parllama.settings_manager import settings
 
 if TYPE_CHECKING:
     from parllama.app import ParLlamaApp
+    from parllama.search_index import ContainerKind
 
 
 class SessionEventRouter:
@@ -47,15 +54,42 @@ class SessionEventRouter:
                 screen's chat view.
         """
         self._app = app
+        self._pending_chunks: dict[tuple[str, str], None] = {}
+        self._chunk_flush_timer: Timer | None = None
 
     def session_list_changed(self, event: SessionListChanged) -> None:
         """Fan out a session-list-changed event to registered widgets."""
         self._app.post_message_all(event)
 
     def chat_message(self, event: ChatMessage) -> None:
-        """Forward a chat message to the chat view."""
+        """Forward a chat message to the chat view.
+
+        Intermediate streamed updates are coalesced so each message is forwarded at
+        most once per ``settings.chat_stream_frame_interval``; final updates are
+        forwarded immediately.
+        """
+        key = (event.parent_id, event.message_id)
+        if event.is_final or settings.chat_stream_frame_interval <= 0:
+            self._pending_chunks.pop(key, None)
+            self._forward_chat_message(event.parent_id, event.message_id, event.is_final)
+            return
+        self._pending_chunks[key] = None
+        if self._chunk_flush_timer is None:
+            self._chunk_flush_timer = self._app.set_timer(
+                settings.chat_stream_frame_interval, self._flush_chat_chunks, name="chat-chunk-flush"
+            )
+
+    def _flush_chat_chunks(self) -> None:
+        """Forward one update for every message that streamed chunks during the last frame."""
+        self._chunk_flush_timer = None
+        pending, self._pending_chunks = self._pending_chunks, {}
+        for parent_id, message_id in pending:
+            self._forward_chat_message(parent_id, message_id, False)
+
+    def _forward_chat_message(self, parent_id: str, message_id: str, is_final: bool) -> None:
+        """Post a chat message update to the chat view."""
         self._app.main_screen.chat_view.post_message(
-            ChatMessage(parent_id=event.parent_id, message_id=event.message_id, is_final=event.is_final)
+            ChatMessage(parent_id=parent_id, message_id=message_id, is_final=is_final)
         )
 
     def chat_message_deleted(self, event: ChatMessageDeleted) -> None:
@@ -77,8 +111,13 @@ class SessionEventRouter:
         self._app.post_message_all(event)
 
     def session_updated(self, event: SessionUpdated) -> None:
-        """Notify the chat manager and fan out a session-updated event."""
+        """Notify the chat manager, re-index the session and fan out a session-updated event."""
         chat_manager.maybe_notify_session_updated(event.changed)
+        if "messages" in event.changed or "name" in event.changed:
+            session = chat_manager.get_session(event.session_id)
+            # Unloaded sessions have no messages in memory; startup sync indexes them from disk.
+            if session is not None and session.is_loaded:
+                search_index.queue_container("session", session)
         self._app.post_message_all(event)
 
     def prompt_selected(self, event: PromptSelected) -> None:
@@ -88,6 +127,7 @@ class SessionEventRouter:
     def delete_session(self, event: DeleteSession) -> None:
         """Delete the session via the chat manager and fan out the event."""
         chat_manager.delete_session(event.session_id)
+        search_index.queue_remove(event.session_id)
         self._app.post_message_all(event)
 
     def session_auto_name_requested(self, event: SessionAutoNameRequested) -> None:
@@ -95,12 +135,17 @@ class SessionEventRouter:
         chat_manager.auto_name_session(event.session_id, event.llm_config, event.context)
 
     def prompt_updated(self, event: PromptUpdated) -> None:
-        """Notify the chat manager that prompts changed."""
+        """Notify the chat manager that prompts changed and re-index the prompt."""
         chat_manager.notify_prompts_changed()
+        if "messages" in event.changed or "name" in event.changed:
+            prompt = chat_manager.get_prompt(event.prompt_id)
+            if prompt is not None and prompt.is_loaded:
+                search_index.queue_container("prompt", prompt)
 
     def delete_prompt(self, event: DeletePrompt) -> None:
         """Delete the prompt via the chat manager and fan out the event."""
         chat_manager.delete_prompt(event.prompt_id)
+        search_index.queue_remove(event.prompt_id)
         self._app.post_message_all(event)
 
     def session_to_prompt(self, event: SessionToPrompt) -> None:
@@ -110,3 +155,11 @@ class SessionEventRouter:
     def prompt_list_loaded(self, event: PromptListLoaded) -> None:
         """Fan out a prompt-list-loaded event to registered widgets."""
         self._app.post_message_all(event)
+
+    def sync_search_index(self) -> None:
+        """Reconcile the search index with every saved session and prompt in the background."""
+        containers: list[tuple[ContainerKind, str, str, str]] = [
+            ("session", s.id, s.name, s.last_updated.isoformat()) for s in chat_manager.sessions
+        ]
+        containers.extend(("prompt", p.id, p.name, p.last_updated.isoformat()) for p in chat_manager.prompts)
+        search_index.queue_sync(containers)
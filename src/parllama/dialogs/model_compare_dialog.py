@@ -0,0 +1,144 @@
+"""Provides the model comparison dialog."""
+
+from __future__ import annotations
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import DataTable
+
+from parllama.generation_scheduler import generation_scheduler
+from parllama.messages.messages import SendToClipboard
+from parllama.model_comparison import ModelComparison
+from parllama.screens.save_session import SaveSession
+from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
+from parllama.settings_manager import settings
+from parllama.widgets.par_markdown import ParMarkdown
+
+
+class ModelCompareDialog(ModalScreen[None]):
+    """Modal dialog that streams a model comparison side by side."""
+
+    DEFAULT_CSS = """
+    ModelCompareDialog {
+        background: black 75%;
+        align: center middle;
+        &> Vertical {
+            background: $surface;
+            width: 95%;
+            height: 95%;
+            border: thick $accent;
+            border-title-color: $primary;
+        }
+        #columns {
+            height: 1fr;
+        }
+        .column {
+            width: 1fr;
+            height: 1fr;
+            border: solid $primary;
+            border-title-color: $primary;
+            border-subtitle-color: $secondary;
+        }
+        ParMarkdown {
+            margin: 0;
+            padding: 0 1;
+        }
+        #results {
+            height: auto;
+            max-height: 12;
+        }
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", show=True),
+        Binding("ctrl+c", "copy_table", "Copy table", show=True),
+        Binding("ctrl+s", "export_table", "Export table", show=True),
+    ]
+
+    REFRESH_INTERVAL = 0.1
+    """Seconds between refreshes of the streamed replies and the results table."""
+
+    def __init__(self, comparison: ModelComparison) -> None:
+        """Initialise the dialog."""
+        super().__init__()
+        self.comparison = comparison
+        self._markdowns = [ParMarkdown() for _ in comparison.runs]
+        self._columns = [VerticalScroll(classes="column") for _ in comparison.runs]
+        self._rendered = ["" for _ in comparison.runs]
+        self._results = DataTable(id="results", cursor_type="row", zebra_stripes=True)
+        self._secure_ops = SecureFileOperations(
+            max_file_size_mb=settings.max_file_size_mb,
+            allowed_extensions=[*settings.allowed_markdown_extensions, ".csv"],
+            validate_content=settings.validate_file_content,
+            sanitize_filenames=settings.sanitize_filenames,
+        )
+
+    def compose(self) -> ComposeResult:
+        """Compose the content of the dialog."""
+        with Vertical() as container:
+            container.border_title = "Model Comparison"
+            with Horizontal(id="columns"):
+                for run, column, markdown in zip(self.comparison.runs, self._columns, self._markdowns, strict=True):
+                    with column:
+                        column.border_title = run.label
+                        yield markdown
+            yield self._results
+
+    async def on_mount(self) -> None:
+        """Start the comparison once the DOM is ready."""
+        self._results.add_columns(*ModelComparison.TABLE_HEADERS)
+        await self._refresh_runs()
+        self.set_interval(self.REFRESH_INTERVAL, self._refresh_runs)
+        self.run_comparison()
+
+    @work(thread=True, name="model_compare_worker")
+    async def run_comparison(self) -> None:
+        """Generate all replies."""
+        await self.comparison.run()
+
+    async def _refresh_runs(self) -> None:
+        """Render the newest streamed text of each reply and the current metrics."""
+        for index, run in enumerate(self.comparison.runs):
+            status = generation_scheduler.status(run.session.id)
+            self._columns[index].border_subtitle = (
+                f"queued {status.position} of {status.waiting}" if status else run.state
+            )
+            reply = run.reply
+            text = reply.content if reply else ""
+            rendered = self._rendered[index]
+            if text == rendered:
+                continue
+            self._rendered[index] = text
+            if rendered and text.startswith(rendered):
+                await self._markdowns[index].append(text[len(rendered) :])
+            else:
+                await self._markdowns[index].update(text)
+        self._results.clear()
+        self._results.add_rows(ModelComparison.table_row(result) for result in self.comparison.results())
+
+    def action_close(self) -> None:
+        """Abort any replies still generating and close the dialog."""
+        self.comparison.stop()
+        self.dismiss(None)
+
+    def action_copy_table(self) -> None:
+        """Copy the results table to the clipboard as Markdown."""
+        self.app.post_message(SendToClipboard(self.comparison.to_markdown()))
+
+    @work
+    async def action_export_table(self) -> None:
+        """Save the results table as Markdown, or as CSV when the file name ends in .csv."""
+        if (target := await SaveSession.get_filename(self.app)) is None:
+            return
+        if not target.suffix:
+            target = target.with_suffix(".md")
+        content = self.comparison.to_csv() if target.suffix.lower() == ".csv" else self.comparison.to_markdown()
+        try:
+            self._secure_ops.write_text_file(target, content, atomic=True, create_dirs=True)
+            self.notify(str(target), title="Saved")
+        except SecureFileOpsError as e:
+            self.notify(f"Failed to export comparison: {e}", title="Export Error", severity="error")
@@ -0,0 +1,215 @@
+"""Coordinates chat generations across sessions.
+
+Each chat tab generates on its own worker thread, so without coordination
+several long chats aimed at one Ollama host contend for it blindly and nothing
+keeps a rate-limited cloud provider from receiving more concurrent requests
+than it accepts. Sessions acquire a generation slot from the scheduler before
+sending a request. Slots are capped per provider and per host; when a slot
+frees up the waiting requests are considered in priority order: the focused
+session first, then the session that started a generation least recently, then
+arrival order. Requests whose provider or host is saturated do not hold up
+requests for other providers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import provider_base_urls
+
+from parllama.settings_manager import settings
+
+
+def generation_host(llm_config: LlmConfig) -> str:
+    """Return the host a chat model sends its requests to.
+
+    Args:
+        llm_config: The session's LLM configuration.
+
+    Returns:
+        The ``host:port`` of the configured base URL, or the provider name when
+        the provider has no base URL.
+    """
+    base_url = (
+        llm_config.base_url
+        or settings.provider_base_urls.get(llm_config.provider)
+        or provider_base_urls.get(llm_config.provider)
+    )
+    if not base_url:
+        return llm_config.provider.value
+    return urlparse(base_url).netloc or base_url
+
+
+@dataclass
+class _Waiter:
+    """A session waiting for, or holding, a generation slot."""
+
+    session_id: str
+    provider: str
+    host: str
+    seq: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[None]
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+@dataclass(frozen=True)
+class GenerationQueueStatus:
+    """Where a session's generation request stands in the queue."""
+
+    position: int
+    """1-based position among the waiting requests."""
+    waiting: int
+    """Number of requests waiting for a slot."""
+    wait_time: float
+    """Seconds the request has been waiting."""
+
+
+class GenerationScheduler:
+    """Hands out generation slots under per-provider and per-host concurrency caps."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._lock = threading.Lock()
+        self._waiting: list[_Waiter] = []
+        self._running_providers: Counter[str] = Counter()
+        self._running_hosts: Counter[str] = Counter()
+        self._last_started: dict[str, float] = {}
+        self._focused_session_id: str | None = None
+        self._seq = itertools.count()
+
+    def focus(self, session_id: str | None) -> None:
+        """Give the requests of the session shown in the focused tab priority."""
+        with self._lock:
+            self._focused_session_id = session_id
+
+    @asynccontextmanager
+    async def slot(self, session_id: str, llm_config: LlmConfig) -> AsyncIterator[None]:
+        """Wait for a generation slot and hold it for the duration of the block.
+
+        Cancelling the waiting task removes the request from the queue.
+
+        Args:
+            session_id: The session generating.
+            llm_config: The session's LLM configuration, used to pick the caps that apply.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            session_id=session_id,
+            provider=llm_config.provider.value,
+            host=generation_host(llm_config),
+            seq=next(self._seq),
+            loop=loop,
+            future=loop.create_future(),
+        )
+        with self._lock:
+            self._waiting.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter not in self._waiting
+                if not granted:
+                    self._waiting.remove(waiter)
+            if granted:
+                self._release(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release(waiter)
+
+    def status(self, session_id: str) -> GenerationQueueStatus | None:
+        """Return the queue status of a session's waiting request, or None if it is not waiting."""
+        with self._lock:
+            ordered = sorted(self._waiting, key=self._priority)
+        for position, waiter in enumerate(ordered, start=1):
+            if waiter.session_id == session_id:
+                return GenerationQueueStatus(
+                    position=position,
+                    waiting=len(ordered),
+                    wait_time=time.monotonic() - waiter.enqueued,
+                )
+        return None
+
+    @staticmethod
+    def _provider_limit(provider: str) -> int:
+        """Return the concurrency cap for a provider, 0 meaning unlimited."""
+        return settings.generation_provider_limits.get(provider, settings.generation_provider_limit)
+
+    def _priority(self, waiter: _Waiter) -> tuple[int, float, int]:
+        """Sort key for waiting requests: focused session, least recently served, oldest."""
+        return (
+            0 if waiter.session_id == self._focused_session_id else 1,
+            self._last_started.get(waiter.session_id, 0.0),
+            waiter.seq,
+        )
+
+    def _has_capacity(self, waiter: _Waiter) -> bool:
+        """Return True if neither the waiter's provider nor its host is saturated."""
+        provider_limit = self._provider_limit(waiter.provider)
+        host_limit = settings.generation_host_limit
+        return (provider_limit <= 0 or self._running_providers[waiter.provider] < provider_limit) and (
+            host_limit <= 0 or self._running_hosts[waiter.host] < host_limit
+        )
+
+    def _dispatch(self) -> None:
+        """Grant slots to as many waiting requests as the caps allow."""
+        granted: list[_Waiter] = []
+        with self._lock:
+            for waiter in sorted(self._waiting, key=self._priority):
+                if self._has_capacity(waiter):
+                    self._running_providers[waiter.provider] += 1
+                    self._running_hosts[waiter.host] += 1
+                    self._last_started[waiter.session_id] = time.monotonic()
+                    granted.append(waiter)
+            for waiter in granted:
+                self._waiting.remove(waiter)
+        for waiter in granted:
+            try:
+                waiter.loop.call_soon_threadsafe(self._wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop has closed, so nobody will use the slot.
+                self._release(waiter)
+
+    def _wake(self, waiter: _Waiter) -> None:
+        """Resume a granted waiter on its own event loop."""
+        if waiter.future.done():
+            # Cancelled after the slot was granted; the cancellation handler releases it.
+            return
+        waiter.future.set_result(None)
+
+    def _release(self, waiter: _Waiter) -> None:
+        """Free the slot held by ``waiter`` and hand it to the next request."""
+        with self._lock:
+            self._running_providers[waiter.provider] -= 1
+            self._running_hosts[waiter.host] -= 1
+        self._dispatch()
+
+
+_generation_scheduler: GenerationScheduler | None = None
+
+
+def _get_generation_scheduler() -> GenerationScheduler:
+    """Lazily create the GenerationScheduler singleton on first access."""
+    global _generation_scheduler
+    if _generation_scheduler is None:
+        _generation_scheduler = GenerationScheduler()
+    return _generation_scheduler
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "generation_scheduler":
+        return _get_generation_scheduler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
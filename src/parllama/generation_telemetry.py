@@ -0,0 +1,304 @@
+"""Persistent latency and throughput telemetry for chat generations.
+
+Every completed generation is recorded as one row in an SQLite database in
+the cache directory: when it ran, which provider, model and host served it,
+its prompt and output token counts, time to first token, total latency,
+output tokens per second and model load time. Summaries group the records by
+model, host and day or week and report p50/p95 latency and throughput (for
+throughput, p95 is the slow tail), so regressions after a model update or a
+host change stand out.
+
+Writes run on a single background thread so recording never delays the
+generation that produced the record.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import astuple, dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Literal
+
+from par_ai_core.llm_config import LlmConfig
+
+from parllama.generation_scheduler import generation_host
+from parllama.models.token_stats import GenerationTiming, TokenStats
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_FILE = "generation_telemetry.db"
+"""Name of the telemetry database inside ``settings.cache_dir``."""
+
+SummaryPeriod = Literal["day", "week", "all"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    timestamp REAL NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    host TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    ttft REAL NOT NULL,
+    latency REAL NOT NULL,
+    tokens_per_second REAL NOT NULL,
+    load_duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS generations_timestamp ON generations (timestamp);
+"""
+
+
+@dataclass(frozen=True)
+class GenerationRecord:
+    """Latency and throughput of one completed generation."""
+
+    timestamp: float
+    """Unix time the generation finished."""
+    provider: str
+    model: str
+    host: str
+    """``host:port`` the request was sent to, or the provider name."""
+    prompt_tokens: int
+    output_tokens: int
+    ttft: float
+    """Seconds until the first content chunk."""
+    latency: float
+    """Seconds from sending the request to the end of the reply."""
+    tokens_per_second: float
+    """Output tokens per second after the first token."""
+    load_duration: float
+    """Seconds the provider spent loading the model, 0.0 if not reported."""
+
+    @classmethod
+    def from_generation(
+        cls, llm_config: LlmConfig, timing: GenerationTiming, stats: TokenStats | None
+    ) -> GenerationRecord:
+        """Build a record from a finished generation.
+
+        Args:
+            llm_config: Configuration the generation ran with.
+            timing: Wall-clock timing of the generation.
+            stats: Token stats the provider reported for it, if any.
+
+        Returns:
+            The record. Output tokens fall back to the number of streamed chunks
+            when the provider reported no usage.
+        """
+        prompt_tokens = output_tokens = 0
+        load_duration = 0.0
+        if stats:
+            prompt_tokens = stats.prompt_eval_count or stats.input_tokens
+            output_tokens = stats.output_tokens or stats.eval_count
+            # Ollama reports durations in nanoseconds.
+            load_duration = stats.load_duration / 1_000_000_000
+        output_tokens = output_tokens or timing.chunks
+        generating = timing.latency - timing.ttft
+        return cls(
+            timestamp=time.time(),
+            provider=llm_config.provider.value,
+            model=llm_config.model_name,
+            host=generation_host(llm_config),
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+            ttft=timing.ttft,
+            latency=timing.latency,
+            tokens_per_second=output_tokens / generating if generating > 0 else 0.0,
+            load_duration=load_duration,
+        )
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Latency and throughput percentiles of one model on one host over one period."""
+
+    provider: str
+    model: str
+    host: str
+    period: str
+    """Start date of the day or week as ``YYYY-MM-DD``, or ``"all"``."""
+    count: int
+    ttft_p50: float
+    ttft_p95: float
+    latency_p50: float
+    latency_p95: float
+    tokens_per_second_p50: float
+    tokens_per_second_p95: float
+    """Throughput at the slow tail: 95% of generations were at least this fast."""
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` using linear interpolation.
+
+    Args:
+        values: The samples, in any order.
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        The percentile, or 0.0 if there are no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _period_of(timestamp: float, period: SummaryPeriod) -> str:
+    """Return the local day or week start a timestamp falls in."""
+    if period == "all":
+        return "all"
+    day = datetime.fromtimestamp(timestamp).date()
+    if period == "week":
+        day -= timedelta(days=day.weekday())
+    return day.isoformat()
+
+
+class GenerationTelemetry:
+    """Time-series store of per-generation latency and throughput."""
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Initialize the store. The database is opened, and old records pruned, on first use.
+
+        Args:
+            db_path: Database location; defaults to ``TELEMETRY_FILE`` in ``settings.cache_dir``.
+        """
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._available = True
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="generation-telemetry")
+
+    @property
+    def path(self) -> Path:
+        """Location of the telemetry database."""
+        return self._db_path or Path(settings.cache_dir) / TELEMETRY_FILE
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Open the database on first use. Caller must hold the lock."""
+        if self._conn is None and self._available:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                if settings.telemetry_retention_days > 0:
+                    cutoff = time.time() - settings.telemetry_retention_days * 86400
+                    with conn:
+                        conn.execute("DELETE FROM generations WHERE timestamp < ?", (cutoff,))
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.error(f"Generation telemetry unavailable: {e}")
+                self._available = False
+        return self._conn
+
+    def close(self) -> None:
+        """Wait for queued records and close the database."""
+        self._executor.submit(lambda: None).result()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(self, record: GenerationRecord) -> None:
+        """Store one generation's record."""
+        columns = ", ".join(f.name for f in fields(GenerationRecord))
+        placeholders = ", ".join("?" for _ in fields(GenerationRecord))
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(f"INSERT INTO generations ({columns}) VALUES ({placeholders})", astuple(record))
+
+    def queue_record(self, record: GenerationRecord) -> Future[None]:
+        """Store one generation's record on the background thread."""
+        return self._executor.submit(self.record, record)
+
+    def records(self, since: float | None = None) -> list[GenerationRecord]:
+        """Return the stored records, oldest first.
+
+        Args:
+            since: Only return records from this Unix time on.
+        """
+        columns = ", ".join(f.name for f in fields(GenerationRecord))
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            rows = conn.execute(
+                f"SELECT {columns} FROM generations WHERE timestamp >= ? ORDER BY timestamp", (since or 0.0,)
+            ).fetchall()
+        return [GenerationRecord(*row) for row in rows]
+
+    def summary(self, period: SummaryPeriod = "day", since: float | None = None) -> list[LatencySummary]:
+        """Return p50/p95 latency and throughput per model, host and period.
+
+        Args:
+            period: Group records by local day, by week starting Monday, or not at all.
+            since: Only include records from this Unix time on.
+
+        Returns:
+            Summaries ordered by provider, model, host and period.
+        """
+        groups: defaultdict[tuple[str, str, str, str], list[GenerationRecord]] = defaultdict(list)
+        for record in self.records(since):
+            groups[(record.provider, record.model, record.host, _period_of(record.timestamp, period))].append(record)
+        summaries: list[LatencySummary] = []
+        for (provider, model, host, period_start), records in sorted(groups.items()):
+            ttft = [r.ttft for r in records]
+            latency = [r.latency for r in records]
+            throughput = [r.tokens_per_second for r in records]
+            summaries.append(
+                LatencySummary(
+                    provider=provider,
+                    model=model,
+                    host=host,
+                    period=period_start,
+                    count=len(records),
+                    ttft_p50=percentile(ttft, 50),
+                    ttft_p95=percentile(ttft, 95),
+                    latency_p50=percentile(latency, 50),
+                    latency_p95=percentile(latency, 95),
+                    tokens_per_second_p50=percentile(throughput, 50),
+                    tokens_per_second_p95=percentile(throughput, 5),
+                )
+            )
+        return summaries
+
+    def clear(self) -> None:
+        """Delete all records."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute("DELETE FROM generations")
+
+
+_generation_telemetry: GenerationTelemetry | None = None
+
+
+def _get_generation_telemetry() -> GenerationTelemetry:
+    """Lazily create the GenerationTelemetry singleton on first access."""
+    global _generation_telemetry
+    if _generation_telemetry is None:
+        _generation_telemetry = GenerationTelemetry()
+    return _generation_telemetry
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "generation_telemetry":
+        return _get_generation_telemetry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
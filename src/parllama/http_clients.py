@@ -0,0 +1,277 @@
+"""Shared, pooled HTTP clients for outbound requests.
+
+Outbound calls take their client from ``http_clients`` instead of opening a
+connection per request, so connections to each host are kept alive and reused
+and polling or repeated Ollama calls stop paying TCP/TLS setup every time.
+Sync clients are shared by all threads. Async clients are shared too, but an
+httpx connection pool can only be used on the event loop its connections were
+opened on, so they keep one pool per running loop and drop the pools of loops
+that have closed. Every request is counted per host, see ``HttpClients.host_stats``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+import ollama
+from par_ai_core.utils import extract_url_auth
+
+from parllama.settings_manager import settings
+
+
+@dataclass
+class HostStats:
+    """Request metrics of one host."""
+
+    host: str
+    requests: int = 0
+    errors: int = 0
+    """Requests that failed to get a response or got a 5xx response."""
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        """Average time to response headers in seconds."""
+        return self.total_time / self.requests if self.requests else 0.0
+
+
+class _HostMetrics:
+    """Thread-safe per-host request counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostStats] = {}
+
+    def record(self, request: httpx.Request, elapsed: float, error: bool) -> None:
+        host = request.url.host if request.url.port is None else f"{request.url.host}:{request.url.port}"
+        with self._lock:
+            stats = self._hosts.get(host)
+            if stats is None:
+                stats = self._hosts[host] = HostStats(host)
+            stats.requests += 1
+            stats.errors += error
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+
+    def snapshot(self) -> list[HostStats]:
+        with self._lock:
+            return [HostStats(**vars(s)) for s in sorted(self._hosts.values(), key=lambda s: s.host)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """Records the time to response headers of every request sent through a transport."""
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: _HostMetrics) -> None:
+        self._transport = transport
+        self._metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            self._metrics.record(request, time.perf_counter() - start, True)
+            raise
+        self._metrics.record(request, time.perf_counter() - start, response.status_code >= 500)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncMeteredTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``_MeteredTransport``."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: _HostMetrics) -> None:
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self._metrics.record(request, time.perf_counter() - start, True)
+            raise
+        self._metrics.record(request, time.perf_counter() - start, response.status_code >= 500)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _LoopPooledTransport(httpx.AsyncBaseTransport):
+    """Keeps a separate async connection pool for each running event loop.
+
+    Async work runs on short-lived worker loops. Requests on one loop share its
+    pool; the pools of loops that have since closed are dropped on the next request.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._pools: dict[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport] = {}
+
+    def _pool(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for stale in [pool_loop for pool_loop in self._pools if pool_loop.is_closed()]:
+                del self._pools[stale]
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = self._factory()
+            return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the running loop's pool."""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+    def drop(self) -> None:
+        """Forget every pool without awaiting their connections."""
+        with self._lock:
+            self._pools.clear()
+
+
+class HttpClients:
+    """Hands out pooled, metered HTTP and Ollama clients.
+
+    Pool sizes, keep-alive expiry and HTTP/2 come from ``HttpConfig`` when a
+    client is first created. HTTP/2 is only used when ``http2_enabled`` is set
+    and the ``h2`` package is installed; it is negotiated per TLS connection
+    and plain ``http://`` hosts such as a local Ollama stay on HTTP/1.1.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without creating any clients."""
+        self._lock = threading.Lock()
+        self._metrics = _HostMetrics()
+        self._client: httpx.Client | None = None
+        self._ollama_clients: dict[str, ollama.Client] = {}
+        self._async_client: httpx.AsyncClient | None = None
+        self._ollama_async_clients: dict[str, ollama.AsyncClient] = {}
+        self._loop_pools: list[_LoopPooledTransport] = []
+
+    @staticmethod
+    def http2() -> bool:
+        """Return whether new clients negotiate HTTP/2."""
+        return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+    @staticmethod
+    def _pool_options() -> dict:
+        return {
+            "limits": httpx.Limits(
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            "http2": HttpClients.http2(),
+        }
+
+    def _transport(self) -> httpx.BaseTransport:
+        return _MeteredTransport(httpx.HTTPTransport(**self._pool_options()), self._metrics)
+
+    def _async_transport(self) -> httpx.AsyncBaseTransport:
+        options = self._pool_options()
+        pools = _LoopPooledTransport(lambda: httpx.AsyncHTTPTransport(**options))
+        self._loop_pools.append(pools)
+        return _AsyncMeteredTransport(pools, self._metrics)
+
+    def client(self) -> httpx.Client:
+        """Get the shared client for general requests.
+
+        Requests default to ``settings.http_request_timeout`` and follow redirects.
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    transport=self._transport(), timeout=settings.http_request_timeout, follow_redirects=True
+                )
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Get the shared async client for general requests.
+
+        It can be used from any event loop. Requests default to
+        ``settings.http_request_timeout`` and follow redirects.
+        """
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    transport=self._async_transport(), timeout=settings.http_request_timeout, follow_redirects=True
+                )
+            return self._async_client
+
+    def ollama_client(self, host: str | None = None) -> ollama.Client:
+        """Get the shared Ollama client for a host.
+
+        Args:
+            host: Ollama host URL, optionally with credentials. Defaults to ``settings.ollama_host``.
+        """
+        host = host or settings.ollama_host
+        with self._lock:
+            client = self._ollama_clients.get(host)
+            if client is None:
+                clean_host_url, auth = extract_url_auth(host)
+                client = self._ollama_clients[host] = ollama.Client(
+                    host=clean_host_url, auth=auth, transport=self._transport()
+                )
+            return client
+
+    def ollama_async_client(self, host: str | None = None) -> ollama.AsyncClient:
+        """Get the shared async Ollama client for a host, usable from any event loop.
+
+        Args:
+            host: Ollama host URL, optionally with credentials. Defaults to ``settings.ollama_host``.
+        """
+        host = host or settings.ollama_host
+        with self._lock:
+            client = self._ollama_async_clients.get(host)
+            if client is None:
+                clean_host_url, auth = extract_url_auth(host)
+                client = self._ollama_async_clients[host] = ollama.AsyncClient(
+                    host=clean_host_url, auth=auth, transport=self._async_transport()
+                )
+            return client
+
+    def host_stats(self) -> list[HostStats]:
+        """Return a snapshot of the request metrics of every host contacted so far, sorted by host."""
+        return self._metrics.snapshot()
+
+    def reset_stats(self) -> None:
+        """Forget the request metrics."""
+        self._metrics.clear()
+
+    def close(self) -> None:
+        """Close the shared sync clients and their connections, and drop the async clients' pools."""
+        with self._lock:
+            clients: list[httpx.Client | ollama.Client] = [*self._ollama_clients.values()]
+            if self._client is not None:
+                clients.append(self._client)
+            self._client = None
+            self._ollama_clients.clear()
+            self._async_client = None
+            self._ollama_async_clients.clear()
+            for pools in self._loop_pools:
+                pools.drop()
+            self._loop_pools.clear()
+        for client in clients:
+            client.close()
+
+
+http_clients = HttpClients()
@@ -0,0 +1,233 @@
+"""Content-addressed cache of encoded chat images.
+
+Attaching an image to a chat message reads the file (or downloads the URL),
+optionally downscales it and encodes it as a base64 data URL. ``ImageCache``
+does that work once per image version: entries are keyed by a hash of the
+image path plus its modification time and size (or of the URL, or of the data
+URL itself), kept in a bounded in-memory LRU and, when
+``settings.image_cache_persist`` is enabled, stored under the cache directory
+so later runs skip the resize as well. Both are limited to
+``settings.image_cache_max_mb``, evicting the least recently used entries.
+
+Images larger than ``settings.image_max_dimension`` on their longest side are
+downscaled and recompressed before encoding, so oversized screenshots are not
+resent at full size on every turn.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+from parllama.chat_message import image_to_base64, try_get_image_type
+from parllama.settings_manager import fetch_and_cache_image, settings
+
+_PIL_FORMATS = {"jpeg": "JPEG", "png": "PNG", "gif": "GIF"}
+
+
+def shrink_image(data: bytes, image_type: str) -> bytes:
+    """Downscale ``data`` if its longest side exceeds ``settings.image_max_dimension``.
+
+    Animated GIFs and images within the limit are returned unchanged.
+
+    Args:
+        data: Encoded image bytes.
+        image_type: One of "jpeg", "png" or "gif".
+
+    Returns:
+        The original bytes, or the downscaled image recompressed in the same format.
+    """
+    max_dim = settings.image_max_dimension
+    if max_dim <= 0 or image_type == "gif":
+        return data
+    with Image.open(io.BytesIO(data)) as img:
+        if max(img.size) <= max_dim:
+            return data
+        img.thumbnail((max_dim, max_dim))
+        out = io.BytesIO()
+        if image_type == "jpeg":
+            img.convert("RGB").save(out, "JPEG", quality=85, optimize=True)
+        else:
+            img.save(out, _PIL_FORMATS[image_type], optimize=True)
+    return out.getvalue()
+
+
+class ImageCache:
+    """Bounded LRU of image data URLs ready to send to an LLM."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted entries. Defaults to ``encoded_images``
+                under ``settings.cache_dir``.
+        """
+        self._cache_dir = cache_dir
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding persisted entries."""
+        return self._cache_dir or Path(settings.cache_dir) / "encoded_images"
+
+    def encode(self, image: str) -> str:
+        """Return ``image`` as a data URL, downscaled if oversized.
+
+        Args:
+            image: A local image path, an http(s) URL or a data URL.
+
+        Returns:
+            The data URL to send.
+
+        Raises:
+            FileNotFoundError: If the image cannot be read or fails validation.
+            ValueError: If the image type is not supported.
+        """
+        image = image.strip()
+        if image.startswith("data:"):
+            # Python caches a string's hash, so repeat lookups for a message's image are cheap.
+            key = f"data-{len(image)}-{hash(image)}"
+        else:
+            key = self._source_key(image)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        if image.startswith("data:"):
+            data_url = self._shrink_data_url(image)
+        else:
+            data_url = self._load_persisted(key) or self._encode_source(image, key)
+        self._put(key, data_url)
+        return data_url
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _source_key(self, image: str) -> str:
+        """Content-address a path or URL by its location, version and the resize limit."""
+        parts = [image, str(settings.image_max_dimension)]
+        if not image.startswith(("http://", "https://")):
+            path = Path(image).expanduser()
+            try:
+                stat = path.stat()
+                parts += [str(path.resolve()), str(stat.st_mtime_ns), str(stat.st_size)]
+            except OSError:
+                pass
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _encode_source(self, image: str, key: str) -> str:
+        """Read, shrink and encode a path or URL, persisting the result."""
+        image_type = try_get_image_type(image)
+        data = shrink_image(fetch_and_cache_image(image)[1], image_type)
+        if settings.image_cache_persist:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                (self.cache_dir / f"{key}.{image_type}").write_bytes(data)
+            except OSError:
+                pass
+            else:
+                self._evict_persisted()
+        return image_to_base64(data, image_type)
+
+    def _load_persisted(self, key: str) -> str | None:
+        """Return a persisted entry as a data URL, if there is one, marking it recently used."""
+        if not settings.image_cache_persist:
+            return None
+        for image_type in _PIL_FORMATS:
+            file = self.cache_dir / f"{key}.{image_type}"
+            try:
+                data_url = image_to_base64(file.read_bytes(), image_type)  # type: ignore[arg-type]
+                os.utime(file)
+            except OSError:
+                continue
+            return data_url
+        return None
+
+    def _evict_persisted(self) -> None:
+        """Delete the least recently used persisted entries beyond the size limit."""
+        entries: list[tuple[float, int, Path]] = []
+        with self._lock:
+            for file in self.cache_dir.iterdir():
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file))
+            limit = int(settings.image_cache_max_mb * 1024 * 1024)
+            size = sum(entry[1] for entry in entries)
+            for _, file_size, file in sorted(entries):
+                if size <= limit:
+                    break
+                file.unlink(missing_ok=True)
+                size -= file_size
+
+    @staticmethod
+    def _shrink_data_url(data_url: str) -> str:
+        """Downscale an already encoded image if it is oversized."""
+        try:
+            image_type = try_get_image_type(data_url)
+            data = base64.b64decode(data_url.split(",", maxsplit=1)[1])
+            shrunk = shrink_image(data, image_type)
+        except (ValueError, OSError, IndexError):
+            return data_url
+        if shrunk is data:
+            return data_url
+        return image_to_base64(shrunk, image_type)
+
+    def _get(self, key: str) -> str | None:
+        """Look up ``key``, marking it most recently used."""
+        with self._lock:
+            data_url = self._entries.get(key)
+            if data_url is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data_url
+
+    def _put(self, key: str, data_url: str) -> None:
+        """Store ``key``, evicting least recently used entries beyond the size limit."""
+        limit = int(settings.image_cache_max_mb * 1024 * 1024)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            if len(data_url) > limit:
+                return
+            self._entries[key] = data_url
+            self._size += len(data_url)
+            while self._size > limit:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+_image_cache: ImageCache | None = None
+
+
+def _get_image_cache() -> ImageCache:
+    """Lazily create the ImageCache singleton on first access."""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "image_cache":
+        return _get_image_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -66,3 +66,22 @@ class MessageSink:
             calc_timeout = timeout
 
         return self.emit(LogIt(msg=msg, notify=notify, severity=severity, timeout=calc_timeout))
+
+    def log_it_from_thread(
+        self,
+        msg: ConsoleRenderable | RichCast | str | object,
+        notify: bool = False,
+        severity: SeverityLevel = "information",
+        timeout: int | None = None,
+    ) -> bool:
+        """Call :meth:`log_it` on the app's thread from a background thread.
+
+        Falls back to calling it directly when the app is not running (e.g. a
+        save flushed at exit) or this already is the app's thread.
+        """
+        if self.app is not None:
+            try:
+                return self.app.call_from_thread(self.log_it, msg, notify, severity, timeout)
+            except RuntimeError:
+                pass
+        return self.log_it(msg, notify, severity, timeout)
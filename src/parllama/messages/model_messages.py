@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from textual.message import Message
 
 from parllama.messages._base import AppRequest
-from parllama.models.ollama_data import FullModel
+from parllama.models.ollama_data import FullModel, LocalModelChanges
 
 
 @dataclass
@@ -44,7 +44,9 @@ class SiteModelsRefreshRequested(AppRequest):
 
 @dataclass
 class LocalModelListLoaded(Message):
-    """Message to notify that local model list data is loaded."""
+    """Message to notify that local model list data is loaded, with what the refresh changed if known."""
+
+    changes: LocalModelChanges | None = None
 
 
 @dataclass
@@ -14,6 +14,8 @@ from parllama.messages._base import AppRequest
 class RefreshProviderModelsRequested(AppRequest):
     """Refresh provider models."""
 
+    providers: list[LlmProvider] | None = None
+
 
 @dataclass
 class ProviderModelsChanged(Message):
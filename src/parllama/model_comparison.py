@@ -0,0 +1,194 @@
+"""Send one chat history to several provider/model pairs and compare the replies.
+
+A ``ModelComparison`` copies the history into a scratch ``ChatSession`` per
+``LlmConfig`` and generates the reply to its last user message in all of them
+concurrently, through the same generation scheduler and streaming path as a
+chat tab. Each run's reply can be read while it streams; once finished, its
+time to first token, tokens per second, total latency and cost are taken from
+the session's ``TokenStats``, generation timing and accumulated cost, and the
+results can be exported as a Markdown or CSV table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from par_ai_core.llm_config import LlmConfig
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+
+RunState = Literal["waiting", "running", "done", "failed", "aborted"]
+
+
+@dataclass(frozen=True)
+class ComparisonResult:
+    """Metrics for one model's reply."""
+
+    provider: str
+    model: str
+    state: RunState
+    ttft: float
+    """Seconds until the first content chunk."""
+    tokens_per_second: float
+    """Output tokens per second after the first token."""
+    latency: float
+    """Seconds from sending the request to the end of the reply."""
+    output_tokens: int
+    cost: float
+    """Cost in USD, 0.0 for free or unpriced models."""
+
+
+@dataclass
+class ComparisonRun:
+    """One provider/model pair taking part in a comparison."""
+
+    llm_config: LlmConfig
+    session: ChatSession
+    state: RunState = "waiting"
+    reply_index: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.reply_index = len(self.session.messages)
+
+    @property
+    def label(self) -> str:
+        """Provider and model name."""
+        return f"{self.llm_config.provider.value}:{self.llm_config.model_name}"
+
+    @property
+    def reply(self) -> ParllamaChatMessage | None:
+        """The assistant reply, while streaming or once finished."""
+        messages = self.session.messages
+        return messages[self.reply_index] if len(messages) > self.reply_index else None
+
+    def result(self) -> ComparisonResult:
+        """Collect this run's metrics."""
+        stats = self.session.stats
+        timing = self.session.generation_timing
+        output_tokens = 0
+        if stats:
+            output_tokens = stats.output_tokens or stats.eval_count
+        if not output_tokens and timing:
+            output_tokens = timing.chunks
+        ttft = timing.ttft if timing else 0.0
+        latency = timing.latency if timing else 0.0
+        generating = latency - ttft
+        return ComparisonResult(
+            provider=self.llm_config.provider.value,
+            model=self.llm_config.model_name,
+            state=self.state,
+            ttft=ttft,
+            tokens_per_second=output_tokens / generating if generating > 0 else 0.0,
+            latency=latency,
+            output_tokens=output_tokens,
+            cost=self.session.total_cost,
+        )
+
+
+class ModelComparison:
+    """Generates the reply to one chat history with several models concurrently."""
+
+    TABLE_HEADERS = ("Provider", "Model", "State", "TTFT (s)", "Tokens/s", "Latency (s)", "Tokens", "Cost ($)")
+
+    def __init__(self, messages: Sequence[ParllamaChatMessage], llm_configs: Sequence[LlmConfig]) -> None:
+        """Prepare a run per configuration.
+
+        Args:
+            messages: History to send. Messages after the last user message are left out.
+            llm_configs: The provider/model pairs to compare.
+
+        Raises:
+            ValueError: If the history has no user message or no configs were given.
+        """
+        last_user = next((i for i in range(len(messages) - 1, -1, -1) if messages[i].role == "user"), None)
+        if last_user is None:
+            raise ValueError("Comparison needs a user message to answer")
+        if not llm_configs:
+            raise ValueError("Comparison needs at least one model")
+        history = messages[: last_user + 1]
+        self.runs = [
+            ComparisonRun(
+                llm_config=config,
+                session=ChatSession(
+                    name=f"Compare {config.model_name}",
+                    llm_config=config,
+                    messages=[m.clone() for m in history],
+                    persist=False,
+                ),
+            )
+            for config in llm_configs
+        ]
+
+    @property
+    def is_running(self) -> bool:
+        """True while any run has not finished."""
+        return any(run.state in ("waiting", "running") for run in self.runs)
+
+    async def run(self) -> list[ComparisonResult]:
+        """Generate all replies concurrently.
+
+        Returns:
+            The metrics of each run, in the order the configs were given.
+        """
+        await asyncio.gather(*(self._generate(run) for run in self.runs))
+        return self.results()
+
+    def stop(self) -> None:
+        """Abort all runs still generating. Safe to call from any thread."""
+        for run in self.runs:
+            run.session.stop_generation()
+
+    def results(self) -> list[ComparisonResult]:
+        """Return the metrics of each run so far."""
+        return [run.result() for run in self.runs]
+
+    def to_markdown(self) -> str:
+        """Return the results as a Markdown table."""
+        lines = [
+            "| " + " | ".join(self.TABLE_HEADERS) + " |",
+            "|" + "|".join("---" for _ in self.TABLE_HEADERS) + "|",
+        ]
+        lines += ["| " + " | ".join(self.table_row(result)) + " |" for result in self.results()]
+        return "\n".join(lines) + "\n"
+
+    def to_csv(self) -> str:
+        """Return the results as CSV."""
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(self.TABLE_HEADERS)
+        writer.writerows(self.table_row(result) for result in self.results())
+        return out.getvalue()
+
+    @staticmethod
+    def table_row(result: ComparisonResult) -> list[str]:
+        """Format one result as table cells."""
+        return [
+            result.provider,
+            result.model,
+            result.state,
+            f"{result.ttft:.2f}",
+            f"{result.tokens_per_second:.1f}",
+            f"{result.latency:.2f}",
+            str(result.output_tokens),
+            f"{result.cost:.4f}",
+        ]
+
+    @staticmethod
+    async def _generate(run: ComparisonRun) -> None:
+        """Generate one run's reply, recording how it ended."""
+        run.state = "running"
+        ok = await run.session.send_chat("")
+        reply = run.reply
+        if reply is not None and reply.content.endswith(ChatSession.ABORT_SUFFIX):
+            run.state = "aborted"
+        elif ok and run.session.generation_timing is not None:
+            run.state = "done"
+        else:
+            # Stream errors are appended to the reply rather than raised, and leave no timing.
+            run.state = "failed"
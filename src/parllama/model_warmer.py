@@ -0,0 +1,151 @@
+"""Background warm-up of Ollama chat models.
+
+The first request to an Ollama model that is not loaded waits for the model
+to load, which can take several seconds. ``ModelWarmer`` loads a session's
+model in the background when the session becomes active (its tab is shown,
+it is selected, or its model is changed) by sending Ollama an empty generate
+request, which loads the model without generating anything.
+
+Models that ``ollama ps`` reports as loaded, and not about to expire, are not
+warmed again. The ps snapshot taken by the status bar poller is reused while
+it is fresh; otherwise the host is asked directly. ``settings.ollama_keep_alive``
+is sent with warm-up and chat requests so models stay loaded as configured.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import ollama
+from langchain_core.language_models import BaseChatModel
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.http_clients import http_clients
+from parllama.models.ollama_ps import OllamaPsResponse
+from parllama.ollama_data_manager import api_model_ps
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+MIN_REMAINING_KEEP_ALIVE = timedelta(seconds=60)
+"""A loaded model expiring sooner than this is warmed again to extend its keep-alive."""
+
+
+def ollama_model_id(model_name: str) -> str:
+    """Return a model name with its tag, as ``ollama ps`` reports it."""
+    return model_name if ":" in model_name else f"{model_name}:latest"
+
+
+def apply_keep_alive(chat_model: BaseChatModel, llm_config: LlmConfig) -> BaseChatModel:
+    """Send ``settings.ollama_keep_alive`` with an Ollama chat model's requests.
+
+    Args:
+        chat_model: A chat model built from ``llm_config``.
+        llm_config: The configuration the model was built from.
+
+    Returns:
+        The same chat model.
+    """
+    if settings.ollama_keep_alive and llm_config.provider == LlmProvider.OLLAMA and hasattr(chat_model, "keep_alive"):
+        chat_model.keep_alive = settings.ollama_keep_alive  # pyright: ignore [reportAttributeAccessIssue]
+    return chat_model
+
+
+class ModelWarmer:
+    """Preloads Ollama models on a background thread, skipping models that are already loaded."""
+
+    def __init__(self) -> None:
+        """Initialize the warmer."""
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-warmer")
+        self._in_flight: set[tuple[str, str]] = set()
+        self._snapshot: dict[str, datetime] = {}
+        self._snapshot_time = 0.0
+        self.warmups = 0
+        """Number of models loaded by the warmer."""
+
+    def update_running(self, ps: OllamaPsResponse) -> None:
+        """Record the models ``ollama ps`` reports loaded on ``settings.ollama_host``."""
+        with self._lock:
+            self._snapshot = {m.name: m.expires_at for m in ps.models}
+            self._snapshot_time = time.monotonic()
+
+    def warm(self, llm_config: LlmConfig) -> Future[bool] | None:
+        """Load a session's model in the background if it is an Ollama model that is not loaded.
+
+        Args:
+            llm_config: The session's LLM configuration.
+
+        Returns:
+            A future resolving to True if the model was loaded, or None if no
+            warm-up was started (disabled, not an Ollama model, or already in progress).
+        """
+        if not settings.ollama_warmup_enabled or llm_config.provider != LlmProvider.OLLAMA:
+            return None
+        model_name = llm_config.model_name.strip()
+        if not model_name:
+            return None
+        host = llm_config.base_url or settings.ollama_host
+        key = (host, ollama_model_id(model_name))
+        with self._lock:
+            if key in self._in_flight:
+                return None
+            self._in_flight.add(key)
+        return self._executor.submit(self._warm, host, model_name, key)
+
+    def _warm(self, host: str, model_name: str, key: tuple[str, str]) -> bool:
+        """Load the model unless it is loaded already."""
+        try:
+            expires_at = self._running_models(host).get(ollama_model_id(model_name))
+            if expires_at is not None and expires_at - datetime.now(UTC) > MIN_REMAINING_KEEP_ALIVE:
+                return False
+            self._client(host).generate(model=model_name, prompt="", keep_alive=settings.ollama_keep_alive or None)
+            self.warmups += 1
+            return True
+        except (ollama.ResponseError, httpx.HTTPError, ConnectionError, OSError) as e:
+            logger.warning(f"Failed to warm up {model_name} on {host}: {e}")
+            return False
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def _running_models(self, host: str) -> dict[str, datetime]:
+        """Return the loaded models on ``host`` and when they expire."""
+        if host == settings.ollama_host:
+            with self._lock:
+                max_age = max(2 * settings.ollama_ps_poll_interval, 1)
+                if self._snapshot_time and time.monotonic() - self._snapshot_time <= max_age:
+                    return dict(self._snapshot)
+            ps = api_model_ps()
+            self.update_running(ps)
+            return {m.name: m.expires_at for m in ps.models}
+        return {m.model or "": m.expires_at for m in self._client(host).ps().models if m.expires_at}
+
+    @staticmethod
+    def _client(host: str) -> ollama.Client:
+        """Return the shared Ollama client for ``host``."""
+        return http_clients.ollama_client(host)
+
+
+_model_warmer: ModelWarmer | None = None
+
+
+def _get_model_warmer() -> ModelWarmer:
+    """Lazily create the ModelWarmer singleton on first access."""
+    global _model_warmer
+    if _model_warmer is None:
+        _model_warmer = ModelWarmer()
+    return _model_warmer
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "model_warmer":
+        return _get_model_warmer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
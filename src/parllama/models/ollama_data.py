@@ -31,11 +31,20 @@ class SiteModel(BaseModel):
     updated: str
 
 
+class SitePage(BaseModel):
+    """Models listed on one ollama.com catalog page, with the validators for conditional requests."""
+
+    models: list[SiteModel]
+    etag: str = ""
+    last_modified: str = ""
+
+
 class SiteModelData(BaseModel):
     """Ollama Site Model Data."""
 
     models: list[SiteModel]
     last_update: datetime = datetime.now(UTC)
+    pages: dict[str, SitePage] = {}
 
 
 class ModelDetails(BaseModel):
@@ -101,6 +110,14 @@ class Model(BaseModel):
     expires_at: datetime | None = None
 
 
+class LocalModelChanges(BaseModel):
+    """Names of the local models added, removed and updated by a refresh."""
+
+    added: list[str] = []
+    removed: list[str] = []
+    updated: list[str] = []
+
+
 class ModelListPayload(BaseModel):
     """List models response."""
 
@@ -116,7 +133,7 @@ class FullModel(Model):
     parameters: str | None = None
     template: str | None = None
     modelinfo: ModelInfo | None = None
-    _num_ctx: int = 0
+    _num_ctx: tuple[str, int] | None = None
 
     def get_messages(self) -> list[ollama.Message]:
         """Get messages from the model."""
@@ -146,18 +163,16 @@ class FullModel(Model):
         return messages
 
     def num_ctx(self) -> int:
-        """Get number of context tokens from the model or default to Ollama 2k."""
-        if self._num_ctx:
-            return self._num_ctx
-        if not self.modelfile:
-            return 2048
-        context_regex = re.compile(r"parameter\s+num_ctx (\d+)", re.I)
-        match = context_regex.search(self.modelfile)
-        if match:
-            self._num_ctx = int(match.group(1))
-        else:
-            self._num_ctx = 2048
-        return self._num_ctx
+        """Get number of context tokens set by the modelfile, or 0 if it does not set one.
+
+        The result, including 0, is cached until the modelfile changes.
+        """
+        if self._num_ctx is not None and self._num_ctx[0] is self.modelfile:
+            return self._num_ctx[1]
+        match = re.search(r"parameter\s+num_ctx (\d+)", self.modelfile, re.I)
+        num_ctx = int(match.group(1)) if match else 0
+        self._num_ctx = (self.modelfile, num_ctx)
+        return num_ctx
 
 
 class ToolCallFunction(BaseModel):
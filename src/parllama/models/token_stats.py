@@ -22,3 +22,23 @@ class TokenStats(BaseModel):
     output_tokens: int
     total_tokens: int
     time_til_first_token: int
+    eval_duration_ns: int = 0
+    """Exact generation time in nanoseconds, when the provider reports it (Ollama)."""
+
+    @property
+    def eval_rate(self) -> float:
+        """Generated tokens per second, from the exact duration when it is known."""
+        if self.eval_duration_ns:
+            return self.eval_count / (self.eval_duration_ns / 1_000_000_000)
+        return self.eval_count / (self.eval_duration or 1)
+
+
+class GenerationTiming(BaseModel):
+    """Wall-clock timing of a generation, measured from when its request was sent."""
+
+    ttft: float
+    """Seconds until the first content chunk arrived, 0.0 if none did."""
+    latency: float
+    """Seconds until the stream finished."""
+    chunks: int
+    """Number of content chunks received."""
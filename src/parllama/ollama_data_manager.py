@@ -2,37 +2,41 @@
 
 from __future__ import annotations
 
-import functools
+import asyncio
 import os.path
 import re
 import shutil
-from collections.abc import Iterator, Mapping
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import docker.errors
-import docker.types
 import httpx
 import ollama
 import orjson as json
-import requests
-from bs4 import BeautifulSoup
-from docker.models.containers import Container
-from docker.types import CancellableStream
 from httpx import Response
 from ollama import ProgressResponse, StatusResponse
-from par_ai_core.utils import extract_url_auth, run_cmd
+from par_ai_core.utils import run_cmd
 
-from parllama.docker_utils import start_docker_container
+from parllama.http_clients import http_clients
 from parllama.message_sink import MessageSink
-from parllama.models.ollama_data import FullModel, ModelInfo, ModelShowPayload, SiteModel, SiteModelData
+from parllama.models.ollama_data import (
+    FullModel,
+    LocalModelChanges,
+    ModelInfo,
+    ModelShowPayload,
+    SiteModelData,
+)
 from parllama.models.ollama_ps import OllamaPsResponse
 from parllama.retry_utils import create_retry_config, retry_with_backoff
 from parllama.settings_manager import settings
+from parllama.site_catalog import fetch_catalog, is_fresh
 from parllama.widgets.local_model_list_item import LocalModelListItem
 from parllama.widgets.site_model_list_item import SiteModelListItem
 
+if TYPE_CHECKING:
+    from docker.models.containers import Container
+    from docker.types import CancellableStream
+
 ps_pattern = re.compile(
     r"(?P<NAME>\S+)\s+(?P<ID>\S+)\s+(?P<SIZE>\d+\.\d+\s+\S+)\s+(?P<PROCESSOR>\d+%(?:/\d+%)?\s+\S+)\s+(?P<UNTIL>.+)"
 )
@@ -91,7 +95,9 @@ def api_model_ps() -> OllamaPsResponse:
     # fetch data from self.ollama_host as json
 
     try:
-        res: Response = httpx.get(f"{settings.ollama_host}/api/ps", timeout=settings.http_request_timeout)
+        res: Response = http_clients.client().get(
+            f"{settings.ollama_host}/api/ps", timeout=settings.http_request_timeout
+        )
         if res.status_code != 200:
             return OllamaPsResponse()
 
@@ -105,7 +111,6 @@ def api_model_ps() -> OllamaPsResponse:
 class OllamaDataManager(MessageSink):
     """Data manager for Par Llama."""
 
-    ollama_site_categories: list[str] = ["popular", "featured", "newest"]
     models: list[LocalModelListItem]
     site_models: list[SiteModelListItem]
     ollama_bin: str | None
@@ -115,6 +120,8 @@ class OllamaDataManager(MessageSink):
         super().__init__(id="data_manager")
 
         self.models = []
+        self._models_by_name: dict[str, LocalModelListItem] = {}
+        self.model_changes = LocalModelChanges()
         self.site_models = []
         # get location of ollama binary in path
         ollama_bin = shutil.which("ollama") or shutil.which("ollama.exe")
@@ -140,31 +147,42 @@ class OllamaDataManager(MessageSink):
 
     def get_model_by_name(self, name: str) -> FullModel | None:
         """Get a model by name."""
-        for model in self.models:
-            if model.model.name == name:
-                return model.model
-        return None
+        item = self._models_by_name.get(name)
+        return item.model if item else None
 
-    def enrich_model_details(self, model: FullModel) -> None:
-        """Enrich model details."""
+    @staticmethod
+    def _details_cache_file(model: FullModel) -> Path:
+        """Return the details cache file of a model, keyed by its digest so a re-pulled tag misses the cache."""
+        key = re.sub(r"[^\w]", "", model.digest)
+        return Path(settings.ollama_cache_dir) / f"model_details-{key}.json"
+
+    def _read_cached_details(self, model: FullModel) -> dict[str, Any] | None:
+        """Return a model's cached ``show`` output, or None if it is not cached or the cache file is invalid."""
+        cache_file = self._details_cache_file(model)
+        if not cache_file.exists():
+            return None
+        try:
+            model_data = json.loads(cache_file.read_bytes())
+            if not isinstance(model_data, dict):
+                raise ValueError("Bad data")
+            ModelShowPayload(**model_data)
+            return model_data
+        except (json.JSONDecodeError, ValueError, KeyError, OSError) as _:
+            cache_file.unlink(missing_ok=True)
+            return None
+
+    def _store_details(self, model: FullModel, model_data: dict[str, Any]) -> None:
+        """Cache a model's ``show`` output and apply it to the model."""
+        settings.ensure_cache_folder()
+        self._details_cache_file(model).write_bytes(json.dumps(model_data, str, json.OPT_INDENT_2))
+        self._apply_details(model, model_data)
+
+    @staticmethod
+    def _apply_details(model: FullModel, model_data: Mapping[str, Any]) -> None:
+        """Copy ``show`` output onto a model."""
         pattern = r"^(# Modelfile .*)\n(# To build.*)\n# (FROM .*\n)\n(FROM .*)\n(.*)$"
         replacement = r"\3\5"
-        mfn = re.sub(r"[^\w_]", "", model.name)
-        cache_file = Path(settings.ollama_cache_dir) / f"model_details-{mfn}.json"
-
-        model_data: Mapping[str, Any] | None = None
-        if cache_file.exists():
-            try:
-                model_data = json.loads(cache_file.read_bytes())
-                if not isinstance(model_data, dict):
-                    raise ValueError("Bad data")
-                ModelShowPayload(**model_data)
-            except (json.JSONDecodeError, ValueError, KeyError, OSError) as _:
-                cache_file.unlink()
-                model_data = None
-        if not model_data:
-            model_data = self._ollama_show_model(model.name).model_dump()
-            cache_file.write_bytes(json.dumps(model_data, str, json.OPT_INDENT_2))
+        model_data = dict(model_data)
         if "modelinfo" in model_data:
             model_data["modelinfo"] = ModelInfo(**model_data["modelinfo"])
         msp = ModelShowPayload(**model_data)
@@ -175,6 +193,60 @@ class OllamaDataManager(MessageSink):
         model.modelinfo = msp.modelinfo
         model.license = msp.license
 
+    def enrich_model_details(self, model: FullModel) -> None:
+        """Enrich model details from the cache, calling ``show`` on a cache miss."""
+        model_data = self._read_cached_details(model)
+        if model_data is None:
+            self._store_details(model, self._ollama_show_model(model.name).model_dump())
+        else:
+            self._apply_details(model, model_data)
+
+    async def enrich_all_models(self) -> int:
+        """Enrich the details of every local model that is missing them.
+
+        Cached details are applied directly. The rest are fetched concurrently
+        through ``ollama_aclient``, at most ``settings.ollama_details_concurrency``
+        at a time, and cached. Failures are logged and leave that model unenriched.
+
+        Returns:
+            The number of models whose details were fetched from Ollama.
+        """
+        missing: list[FullModel] = []
+        for item in list(self.models):
+            model = item.model
+            if model.modelinfo:
+                continue
+            model_data = self._read_cached_details(model)
+            if model_data is None:
+                missing.append(model)
+            else:
+                self._apply_details(model, model_data)
+        if not missing:
+            return 0
+
+        client = self.ollama_aclient
+        semaphore = asyncio.Semaphore(max(1, settings.ollama_details_concurrency))
+
+        async def fetch(model: FullModel) -> bool:
+            async with semaphore:
+                try:
+                    response = await client.show(model.name)
+                except (ollama.ResponseError, httpx.HTTPError, ConnectionError, OSError) as e:
+                    self.log_it(f"Error loading details of {model.name}: {e}", severity="error")
+                    return False
+            self._store_details(model, response.model_dump())
+            return True
+
+        results = await asyncio.gather(*(fetch(model) for model in missing))
+        return sum(results)
+
+    def prune_details_cache(self) -> None:
+        """Delete cached model details whose digest no longer belongs to a local model."""
+        keep = {self._details_cache_file(item.model).name for item in self.models}
+        for cache_file in Path(settings.ollama_cache_dir).glob("model_details-*.json"):
+            if cache_file.name not in keep:
+                cache_file.unlink(missing_ok=True)
+
     @retry_with_backoff()
     def _ollama_list_models(self):
         """List models with retry logic."""
@@ -185,14 +257,8 @@ class OllamaDataManager(MessageSink):
         """Show model details with retry logic."""
         return self.ollama_client.show(model_name)
 
-    @retry_with_backoff(config=create_retry_config(max_attempts=2, base_delay=1.0))
-    def _fetch_site_models_page(self, url: str):
-        """Fetch site models page with retry logic."""
-        return requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=settings.http_request_timeout)
-
-    def _get_all_model_data(self) -> list[LocalModelListItem]:
+    def _get_all_model_data(self) -> list[FullModel]:
         """Get all model data."""
-        all_models: list[LocalModelListItem] = []
         try:
             res = self._ollama_list_models()
         except (ollama.ResponseError, ConnectionError, OSError) as e:
@@ -202,18 +268,38 @@ class OllamaDataManager(MessageSink):
             self.log_it(f"Unexpected error loading Ollama Models: {type(e).__name__}: {e}")
             return []
 
-        for model in res.models:
-            if not model.model:
-                continue
-            res3 = FullModel(**model.model_dump(), name=model.model)
-            all_models.append(LocalModelListItem(res3))
-            # break
-        all_models.sort(key=_local_model_sort_key(settings.local_model_sort))
-        return all_models
+        return [FullModel(**model.model_dump(), name=model.model) for model in res.models if model.model]
 
     def refresh_models(self) -> list[LocalModelListItem]:
-        """Refresh all local model data."""
-        self.models = self._get_all_model_data()
+        """Refresh all local model data.
+
+        Models are matched to the previous refresh by name. An unchanged model
+        keeps its list item and loaded details; a model whose digest or
+        modification time changed gets fresh data in its existing list item.
+        What changed is stored in ``model_changes``. Cached details of models
+        that are gone or were re-pulled are dropped.
+
+        Returns:
+            The list items of all local models, sorted by ``settings.local_model_sort``.
+        """
+        items: dict[str, LocalModelListItem] = {}
+        changes = LocalModelChanges()
+        for model in self._get_all_model_data():
+            item = self._models_by_name.get(model.name)
+            if item is None:
+                item = LocalModelListItem(model)
+                changes.added.append(model.name)
+            elif item.model.digest != model.digest or item.model.modified_at != model.modified_at:
+                item.model = model
+                changes.updated.append(model.name)
+            items[model.name] = item
+        changes.removed = [name for name in self._models_by_name if name not in items]
+
+        self._models_by_name = items
+        self.models = sorted(items.values(), key=_local_model_sort_key(settings.local_model_sort))
+        self.model_changes = changes
+        if self.models:
+            self.prune_details_cache()
         return self.models
 
     def get_model_select_options(self) -> list[tuple[str, str]]:
@@ -227,12 +313,12 @@ class OllamaDataManager(MessageSink):
     @staticmethod
     def pull_model(model_name: str) -> Iterator[ProgressResponse]:
         """Pull a model."""
-        return ollama.Client(host=settings.ollama_host).pull(model_name, stream=True)  # type: ignore
+        return http_clients.ollama_client().pull(model_name, stream=True)  # type: ignore
 
     @staticmethod
     def push_model(model_name: str) -> Iterator[ProgressResponse]:
         """Push a model."""
-        return ollama.Client(host=settings.ollama_host).push(model_name, stream=True)  # type: ignore
+        return http_clients.ollama_client().push(model_name, stream=True)  # type: ignore
 
     @retry_with_backoff()
     def _ollama_delete_model(self, model_name: str):
@@ -253,13 +339,11 @@ class OllamaDataManager(MessageSink):
         if not ret:
             return False
 
-        for model in self.models:
-            if model.model.name == model_name:
-                # model.remove()
-                self.models.remove(model)
-                return True
-
-        return False
+        item = self._models_by_name.pop(model_name, None)
+        if item is None:
+            return False
+        self.models.remove(item)
+        return True
 
     @staticmethod
     def list_site_cache_files() -> list[str]:
@@ -275,94 +359,82 @@ class OllamaDataManager(MessageSink):
             and f.lower().startswith("site_models-")
         ]
 
-    # pylint: disable=too-many-branches
-    def refresh_site_models(
+    @staticmethod
+    def _site_cache_file(namespace: str) -> Path:
+        """Return the cache file of a site namespace."""
+        return Path(settings.ollama_cache_dir) / f"site_models-{namespace}.json"
+
+    def load_site_cache(self, namespace: str) -> SiteModelData | None:
+        """Load the cached catalog of a site namespace, or None if there is none."""
+        file_name = self._site_cache_file(namespace)
+        if not file_name.exists():
+            return None
+        try:
+            return SiteModelData(**json.loads(file_name.read_bytes()))
+        except (json.JSONDecodeError, ValueError, KeyError, OSError) as e:
+            self.log_it(f"Error loading site models cache: {e}", severity="error")
+            return None
+
+    async def refresh_site_models(
         self,
         namespace: str,
         category: Literal["popular", "featured", "newest"] | None = None,
-        force: bool = True,
-    ) -> list[SiteModelListItem]:
-        """Get list of all available models from Ollama.com."""
+        cached: SiteModelData | None = None,
+    ) -> bool:
+        """Fetch the catalog of a namespace from Ollama.com, revalidating the cached catalog.
 
-        settings.ensure_cache_folder()
+        Args:
+            namespace: The ollama.com namespace.
+            category: Only fetch this category of the ``models`` namespace.
+            cached: The cached catalog to revalidate.
 
-        if not namespace:
-            namespace = "library"
-        namespace = os.path.basename(namespace)
+        Returns:
+            True if the catalog differs from the cached one.
 
-        file_name = Path(settings.ollama_cache_dir) / f"site_models-{namespace}.json"
+        Raises:
+            httpx.HTTPError: If a catalog page could not be fetched.
+        """
+        namespace = os.path.basename(namespace or "library")
+        data = await fetch_catalog(http_clients.async_client(), namespace, cached, category=category)
 
-        if not force and file_name.exists():
-            try:
-                ret: SiteModelData = SiteModelData(**json.loads(file_name.read_bytes()))
-                if ret.last_update and ret.last_update.timestamp() > (ret.last_update.timestamp() - 60 * 60 * 24):
-                    self.site_models = [SiteModelListItem(m) for m in ret.models]
-                    return self.site_models
-            except (json.JSONDecodeError, ValueError, KeyError, OSError) as e:
-                self.log_it(f"Error loading site models cache: {e}", severity="error")
+        if data.models and not settings.no_save:
+            settings.ensure_cache_folder()
+            self._site_cache_file(namespace).write_bytes(json.dumps(data.model_dump(), str, json.OPT_INDENT_2))
+        changed = cached is None or data.models != cached.models
+        if changed:
+            self.site_models = [SiteModelListItem(m) for m in data.models]
+        return changed
 
-        url_base: str = f"https://ollama.com/{namespace}"
-        models: list[SiteModel] = []
+    async def load_site_models(self, namespace: str, force: bool, on_loaded: Callable[[], None]) -> None:
+        """Load the catalog of a namespace, serving the cache while it is revalidated.
 
-        for cat in self.ollama_site_categories:
-            if category and category != cat:
-                continue
-            url = url_base
-            if namespace == "models":
-                url += f"?sort={cat}"
-            response = self._fetch_site_models_page(url)
-            soup = BeautifulSoup(response.content.decode("utf-8"), "html.parser")
-            for card in soup.find_all("li", class_="items-baseline"):
-                meta_data = {
-                    "name": card.find("h2").text.strip(),
-                    "description": card.find("p").text.strip(),
-                    "model_url": card.find("a")["href"],
-                    "url": f"{url}{card.find('a')['href']}",
-                    "num_pulls": "",
-                    "num_tags": "",
-                    "updated": "",
-                }
-
-                pres = card.find_all("span", class_=["flex", "items-center"], recursive=True)
-                pres = [p.text.strip() for p in pres]
-                pres = [p for p in pres if p]
-
-                for p in pres:
-                    if "Pulls" in p:
-                        meta_data["num_pulls"] = p.split("\n")[0].strip()
-                    if "Tags" in p:
-                        meta_data["num_tags"] = p.split("\xa0")[0].strip()
-                    if "Updated" in p:
-                        meta_data["updated"] = p.split("\xa0")[-1].strip()
-                # tags = []
-                tags = card.find_all("span", class_=["text-blue-600"], recursive=True)
-                tags = [p.text.strip() for p in tags]
-                tags = [p for p in tags if p]
-                meta_data["tags"] = tags
-
-                model = SiteModel(**meta_data)
-                # print(model.model_dump_json(indent=4))
-                found = False
-                for m in models:
-                    if m.name == model.name:
-                        found = True
-                        break
-                if not found:
-                    models.append(model)
-
-            if namespace != "models":
-                break
-
-        if len(models) > 0 and not settings.no_save:
-            file_name.write_bytes(
-                json.dumps(
-                    SiteModelData(models=models, last_update=datetime.now(UTC)).model_dump(),
-                    str,
-                    json.OPT_INDENT_2,
-                )
-            )
-        self.site_models = [SiteModelListItem(m) for m in models]
-        return self.site_models
+        A cached catalog is served through ``on_loaded`` straight away. It is then
+        revalidated if it is older than ``SITE_MODELS_MAX_AGE`` or ``force`` is set,
+        and ``on_loaded`` is called again if the catalog changed.
+
+        Args:
+            namespace: The ollama.com namespace.
+            force: Revalidate the cached catalog even if it is fresh.
+            on_loaded: Called whenever ``site_models`` has been updated.
+        """
+        namespace = os.path.basename(namespace or "library")
+        cached = self.load_site_cache(namespace)
+        if cached is not None:
+            self.site_models = [SiteModelListItem(m) for m in cached.models]
+            on_loaded()
+            if not force and is_fresh(cached):
+                return
+
+        try:
+            changed = await self.refresh_site_models(namespace, cached=cached)
+        except httpx.HTTPError as e:
+            self.log_it(f"Error fetching site models for {namespace}: {e}", notify=True, severity="error")
+            changed = cached is None
+            if changed:
+                # Nothing to show for this namespace, so drop the previous namespace's models.
+                self.site_models = []
+        if changed:
+            on_loaded()
 
     @staticmethod
     @retry_with_backoff()
@@ -375,7 +447,7 @@ class OllamaDataManager(MessageSink):
         quantize_level: str | None = None,
     ) -> Iterator[ProgressResponse]:
         """Create a new model."""
-        return ollama.Client(host=settings.ollama_host).create(
+        return http_clients.ollama_client().create(
             model=model_name,
             from_=model_from,
             system=system_prompt,
@@ -389,7 +461,7 @@ class OllamaDataManager(MessageSink):
     @retry_with_backoff()
     def copy_model(src_name: str, dst_name: str) -> StatusResponse:
         """Copy local model to new name"""
-        return ollama.Client(host=settings.ollama_host).copy(source=src_name, destination=dst_name)
+        return http_clients.ollama_client().copy(source=src_name, destination=dst_name)
 
     @staticmethod
     def quantize_model(model_name: str, quantize_level: str = "q4_0") -> str | Container | CancellableStream:
@@ -420,6 +492,10 @@ class OllamaDataManager(MessageSink):
         if os.path.exists(quantized_model_file):
             os.unlink(quantized_model_file)
 
+        import docker.types
+
+        from parllama.docker_utils import start_docker_container
+
         # docker run --rm -v .:/model ollama/quantize -q q4_0 /model
         ret = start_docker_container(
             image="ollama/quantize",
@@ -445,30 +521,47 @@ class OllamaDataManager(MessageSink):
 
         return ret.logs(stream=True)
 
-    @functools.cached_property
+    @property
     def ollama_client(self) -> ollama.Client:
-        """Get the ollama client."""
-        clean_host_url, auth = extract_url_auth(settings.ollama_host)
-        return ollama.Client(host=clean_host_url, auth=auth)
+        """Get the shared ollama client for ``settings.ollama_host``."""
+        return http_clients.ollama_client()
 
-    @functools.cached_property
+    @property
     def ollama_aclient(self) -> ollama.AsyncClient:
-        """Get the async ollama client."""
-        clean_host_url, auth = extract_url_auth(settings.ollama_host)
-        return ollama.AsyncClient(host=clean_host_url, auth=auth)
+        """Get the shared async ollama client for ``settings.ollama_host``."""
+        return self.chat_client()
+
+    def chat_client(self, host: str | None = None) -> ollama.AsyncClient:
+        """Get the shared async ollama client for chat requests to a host.
+
+        Chat generations run on one-shot worker event loops; the client keeps a
+        connection pool per loop and drops the pools of loops that have closed.
+
+        Args:
+            host: Ollama host URL. Defaults to ``settings.ollama_host``.
+
+        Returns:
+            The client for ``host``.
+        """
+        return http_clients.ollama_async_client(host)
 
     def get_model_context_length(self, model_name: str) -> int:
-        """Get the context length of a model."""
+        """Get the context length of a model, or 0 if it is unknown.
+
+        Never calls ``show``: details come from the model or its cache file, which
+        ``enrich_all_models`` fills after each refresh. The length is only known when
+        the modelfile sets ``num_ctx``.
+        """
         model: FullModel | None = self.get_model_by_name(model_name)
         if not model:
             self.log_it("Model not found: " + model_name)
-            return 2048
+            return 0
         if not model.modelinfo:
-            self.log_it("Model info not loaded: " + model_name)
-            self.enrich_model_details(model)
-            if not model.modelinfo:
-                self.log_it("Model load failed: " + model_name)
-                return 2048
+            model_data = self._read_cached_details(model)
+            if model_data is None:
+                self.log_it("Model info not loaded: " + model_name)
+                return 0
+            self._apply_details(model, model_data)
         return model.num_ctx()
 
 
@@ -0,0 +1,129 @@
+"""Direct Ollama chat streaming without LangChain.
+
+When ``settings.ollama_native_chat`` is on, chat sessions using the Ollama
+provider stream replies with ``ollama.AsyncClient.chat`` instead of
+``ChatOllama.astream``. This skips building a LangChain model per request and
+the per-chunk conversion into ``AIMessageChunk``, and reports Ollama's exact
+nanosecond timings instead of the rounded values LangChain passes through.
+
+The helpers here translate a session's request into the native API: LangChain
+message tuples into Ollama messages, the ``LlmConfig`` sampling fields into
+Ollama options (matching what ``ChatOllama`` would send), and the final
+response into ``TokenStats``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+import ollama
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.models.token_stats import TokenStats
+from parllama.settings_manager import settings
+
+_OPTION_FIELDS = (
+    "temperature",
+    "num_predict",
+    "repeat_last_n",
+    "repeat_penalty",
+    "mirostat",
+    "mirostat_eta",
+    "mirostat_tau",
+    "tfs_z",
+    "top_k",
+    "top_p",
+    "seed",
+)
+"""``LlmConfig`` fields sent as Ollama options under the same name."""
+
+
+def uses_native_chat(llm_config: LlmConfig) -> bool:
+    """Return True if chats with this configuration stream through the native Ollama client."""
+    return settings.ollama_native_chat and llm_config.provider == LlmProvider.OLLAMA
+
+
+def ollama_host(llm_config: LlmConfig) -> str:
+    """Return the Ollama host a configuration sends chat requests to."""
+    return llm_config.base_url or settings.ollama_host
+
+
+def ollama_options(llm_config: LlmConfig) -> dict[str, Any]:
+    """Return the Ollama request options for a configuration, omitting unset ones.
+
+    Args:
+        llm_config: The session's LLM configuration.
+
+    Returns:
+        Options as ``ChatOllama`` would send them.
+    """
+    options = {name: getattr(llm_config, name) for name in _OPTION_FIELDS}
+    options["num_ctx"] = llm_config.num_ctx or None
+    return {name: value for name, value in options.items() if value is not None}
+
+
+def to_ollama_messages(chat_history: Sequence[tuple[str, str | list[dict[str, Any]]]]) -> list[dict[str, Any]]:
+    """Convert LangChain native message tuples to Ollama chat messages.
+
+    Text parts of multi-part content are joined and image parts are sent as
+    base64 images, without their data URL prefix.
+
+    Args:
+        chat_history: ``(role, content)`` tuples as built for LangChain.
+
+    Returns:
+        Messages for ``ollama.AsyncClient.chat``.
+    """
+    messages: list[dict[str, Any]] = []
+    for role, content in chat_history:
+        if isinstance(content, str):
+            messages.append({"role": role, "content": content})
+            continue
+        texts: list[str] = []
+        images: list[str] = []
+        for part in content:
+            if part.get("type") == "text":
+                texts.append(part.get("text", ""))
+            elif part.get("type") == "image_url":
+                url = part.get("image_url", {}).get("url", "")
+                images.append(url.partition(",")[2] if url.startswith("data:") else url)
+        message: dict[str, Any] = {"role": role, "content": "\n".join(texts)}
+        if images:
+            message["images"] = images
+        messages.append(message)
+    return messages
+
+
+def token_stats(response: ollama.ChatResponse, ttft: float) -> TokenStats:
+    """Build token stats from the final response of an Ollama chat stream.
+
+    Args:
+        response: The response chunk with ``done`` set.
+        ttft: Time to first token, in seconds.
+
+    Returns:
+        Stats with Ollama's durations; ``eval_duration`` is in seconds like
+        the LangChain path, and ``eval_duration_ns`` keeps the exact value.
+    """
+    eval_duration_ns = response.eval_duration or 0
+    created_at = response.created_at
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return TokenStats(
+        model=response.model or "?",
+        created_at=created_at or datetime.now(),
+        total_duration=response.total_duration or 0,
+        load_duration=response.load_duration or 0,
+        prompt_eval_count=response.prompt_eval_count or 0,
+        prompt_eval_duration=response.prompt_eval_duration or 0,
+        eval_count=response.eval_count or 0,
+        eval_duration=int(eval_duration_ns / 1_000_000_000),
+        input_tokens=0,
+        output_tokens=0,
+        total_tokens=0,
+        time_til_first_token=int(ttft),
+        eval_duration_ns=eval_duration_ns,
+    )
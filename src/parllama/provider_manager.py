@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import litellm
+import httpx
 import orjson as json
-import requests
 from dotenv import load_dotenv
 from par_ai_core.llm_providers import (
     LlmProvider,
@@ -22,15 +24,26 @@ from par_ai_core.llm_providers import (
 from par_ai_core.pricing_lookup import get_api_cost_model_name, get_model_metadata, get_model_mode
 from textual.app import App
 
+from parllama.http_clients import http_clients
 from parllama.message_sink import MessageSink
 from parllama.messages.messages import ProviderModelsChanged, RefreshProviderModelsRequested
 from parllama.ollama_data_manager import ollama_dm
 from parllama.settings_manager import settings
 
-# Silence litellm's stdout banners (e.g. the "Provider List:" notice) that leak
-# through the TUI's alternate-screen buffer and clutter the terminal on exit.
-# litellm is already loaded transitively via the par_ai_core imports above.
-litellm.suppress_debug_info = True
+
+@functools.cache
+def quiet_litellm() -> None:
+    """Import litellm and silence its stdout banners.
+
+    litellm takes over a second to import, so it is loaded on first use rather
+    than at startup. Its banners (e.g. the "Provider List:" notice) leak through
+    the TUI's alternate-screen buffer, so anything that may reach litellm calls
+    this first.
+    """
+    import litellm
+
+    litellm.suppress_debug_info = True
+
 
 openai_model_context_windows = {
     "chatgpt-4o-latest": 128_000,
@@ -58,6 +71,8 @@ class ProviderManager(MessageSink):
     """Manages providers and their models"""
 
     provider_models: dict[LlmProvider, list[str]]
+    provider_fetched_at: dict[LlmProvider, float]
+    provider_etags: dict[LlmProvider, str]
 
     def __init__(self):
         """Initialize the data manager."""
@@ -68,6 +83,8 @@ class ProviderManager(MessageSink):
         for p in llm_provider_types:
             self.provider_models[p] = []
         self.provider_models[LlmProvider.LLAMACPP] = ["default"]
+        self.provider_fetched_at = {}
+        self.provider_etags = {}
         self.cache_file = Path(settings.provider_models_file)
 
     def set_app(self, app: App[Any] | None) -> None:
@@ -79,40 +96,78 @@ class ProviderManager(MessageSink):
         super().set_app(app)
         self.load_models()
 
-    def refresh_models(self):
-        """Refresh model lists from all available configured providers.
+    async def refresh_models(self, providers: list[LlmProvider] | None = None) -> None:
+        """Refresh model lists from the configured providers concurrently.
+
+        Each provider's (blocking) API query runs in its own thread, skipping
+        providers that are disabled or have no API key configured. A provider's
+        list is stored and a ``ProviderModelsChanged`` message posted as soon as
+        that provider answers. A provider that errors or takes longer than
+        ``provider_refresh_timeout`` is logged and keeps its cached list, without
+        holding up the others. Persists the refreshed lists to the cache file when
+        finished.
 
-        Iterates every known provider, skipping ones that are disabled or have no
-        API key configured, queries each provider's API for its current model list,
-        and updates ``self.provider_models`` in place. Errors for an individual
-        provider are logged and do not stop the refresh of the remaining providers.
-        Persists the refreshed lists to the cache file when finished.
+        Args:
+            providers: The providers to refresh, or None for all providers.
         """
         self.log_it("Refreshing provider models")
-        for p in llm_provider_types:
-            self._refresh_one_provider(p)
+        providers = providers or llm_provider_types
+        # A private pool that is not waited on, so a hung provider call cannot hold up the refresh.
+        executor = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="provider_refresh")
+        try:
+            await asyncio.gather(*(self._refresh_provider_async(p, executor) for p in providers))
+        finally:
+            executor.shutdown(wait=False)
         self.save_models()
 
+    async def _refresh_provider_async(self, p: LlmProvider, executor: Executor) -> None:
+        """Refresh and store the model list for a single provider within ``provider_refresh_timeout``.
+
+        Args:
+            p: The provider to refresh.
+            executor: The pool to run the provider's blocking API query in.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            new_list = await asyncio.wait_for(
+                loop.run_in_executor(executor, self._fetch_provider_model_list, p),
+                timeout=settings.provider_refresh_timeout,
+            )
+        except TimeoutError:
+            self.log_it(
+                f"Model refresh for {p.value} timed out after {settings.provider_refresh_timeout}s", severity="warning"
+            )
+            return
+        except Exception as e:  # noqa: BLE001
+            self.log_it(f"Error model refresh {p}: {type(e).__name__}: {e}", severity="error")
+            return
+        if new_list is not None:
+            self._store_provider_models(p, new_list)
+
     def _refresh_one_provider(self, p: LlmProvider) -> None:
         """Refresh and store the model list for a single provider.
 
         Skips providers that are disabled or missing an API key. Errors are
-        logged and swallowed so a single provider failure never aborts a
-        multi-provider refresh. Does not persist the cache — callers call
-        ``save_models`` once after refreshing.
+        logged and swallowed. Does not persist the cache — callers call
+        ``save_models`` after refreshing.
 
         Args:
             p: The provider to refresh.
         """
         try:
             new_list = self._fetch_provider_model_list(p)
-            if new_list is None:
-                return
-            self.provider_models[p] = new_list
-            if self.app:
-                self.app.post_message(ProviderModelsChanged(provider=p))
         except Exception as e:  # noqa: BLE001
             self.log_it(f"Error model refresh {p}: {type(e).__name__}: {e}", severity="error")
+            return
+        if new_list is not None:
+            self._store_provider_models(p, new_list)
+
+    def _store_provider_models(self, p: LlmProvider, new_list: list[str]) -> None:
+        """Store a freshly fetched model list, stamp its fetch time and notify the app."""
+        self.provider_models[p] = new_list
+        self.provider_fetched_at[p] = time.time()
+        if self.app:
+            self.app.post_message(ProviderModelsChanged(provider=p))
 
     def _fetch_provider_model_list(self, p: LlmProvider) -> list[str] | None:
         """Query a single provider's current chat-model list from its API.
@@ -131,18 +186,20 @@ class ProviderManager(MessageSink):
         Raises:
             ValueError: If ``p`` is an unknown provider.
         """
-        if settings.disabled_providers.get(p, False):
-            return None
-        if not is_provider_api_key_set(p):
+        if not self.is_fetchable(p):
             return None
 
         new_list: list[str] = []
+        if p != LlmProvider.OLLAMA:
+            quiet_litellm()
         if p == LlmProvider.OLLAMA:
             new_list = ollama_dm.get_model_names()
         elif p == LlmProvider.LLAMACPP:
             from openai import OpenAI
 
-            models = OpenAI(base_url=settings.provider_base_urls[p] or provider_base_urls[p]).models.list()
+            models = OpenAI(
+                base_url=settings.provider_base_urls[p] or provider_base_urls[p], http_client=http_clients.client()
+            ).models.list()
             data = sorted(models.data, key=lambda m: m.created, reverse=True)
             for m in data:
                 new_list.append(m.id or "default")
@@ -153,6 +210,7 @@ class ProviderManager(MessageSink):
                 OpenAI(
                     base_url=settings.provider_base_urls[p] or provider_base_urls[p],
                     api_key=settings.provider_api_keys[p] or os.environ.get(provider_env_key_names[p]),
+                    http_client=http_clients.client(),
                 )
                 .models.list()
                 .data
@@ -168,7 +226,13 @@ class ProviderManager(MessageSink):
         elif p == LlmProvider.GROQ:
             from groq import Groq
 
-            models = Groq(base_url=settings.provider_base_urls[p] or provider_base_urls[p]).models.list().data
+            models = (
+                Groq(
+                    base_url=settings.provider_base_urls[p] or provider_base_urls[p], http_client=http_clients.client()
+                )
+                .models.list()
+                .data
+            )
             if models:
                 models = [m for m in models if get_model_mode(p, m.id) in ["chat", "unknown"]]
                 data = sorted(models, key=lambda m: m.created, reverse=True)
@@ -177,6 +241,7 @@ class ProviderManager(MessageSink):
         elif p == LlmProvider.ANTHROPIC:
             import anthropic
 
+            # Newer anthropic SDKs only accept their own httpx fork as http_client, so it keeps its own client.
             models = list(anthropic.Anthropic().models.list(limit=50))
             if models:
                 models = [m for m in models if get_model_mode(p, m.id) in ["chat", "unknown"]]
@@ -184,10 +249,17 @@ class ProviderManager(MessageSink):
                 for m in data:
                     new_list.append(m.id)
         elif p == LlmProvider.LITELLM:
-            models = requests.get(
+            etag = self.provider_etags.get(p)
+            response = http_clients.client().get(
                 f"{settings.provider_base_urls[p] or provider_base_urls[p]}/models",
+                headers={"If-None-Match": etag} if etag else None,
                 timeout=settings.provider_model_request_timeout,
-            ).json()["data"]
+            )
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return self.provider_models[p]
+            response.raise_for_status()
+            self.provider_etags[p] = response.headers.get("ETag", "")
+            models = response.json()["data"]
             if models:
                 models = [m for m in models if get_model_mode(p, m["id"]) in ["chat", "unknown"]]
                 data = sorted(models, key=lambda m: m["created"], reverse=True)
@@ -225,6 +297,7 @@ class ProviderManager(MessageSink):
         try:
             if provider == LlmProvider.OLLAMA:
                 return ollama_dm.get_model_context_length(model_name)
+            quiet_litellm()
             metadata = get_model_metadata(provider.value.lower(), model_name)
             return metadata.get("max_input_tokens") or metadata.get("max_tokens") or 0
         except (ValueError, KeyError, ConnectionError, OSError) as e:
@@ -243,23 +316,69 @@ class ProviderManager(MessageSink):
     def save_models(self):
         """Save the current provider model lists to the JSON cache file.
 
-        Overwrites ``self.cache_file`` with the contents of ``self.provider_models``.
+        Overwrites ``self.cache_file`` with each provider's model list, fetch
+        time and ETag.
         """
         self.cache_file.write_bytes(
             json.dumps(
-                {k.value: v for k, v in self.provider_models.items()},
+                {
+                    k.value: {
+                        "models": v,
+                        "fetched_at": self.provider_fetched_at.get(k),
+                        "etag": self.provider_etags.get(k, ""),
+                    }
+                    for k, v in self.provider_models.items()
+                },
                 str,
                 json.OPT_INDENT_2,
             )
         )
 
+    def _read_cache(self) -> None:
+        """Load the provider model lists, fetch times and ETags from the cache file.
+
+        Older cache files map each provider straight to its model list; their
+        providers are treated as fetched when the file was last written.
+        """
+        file_time = self.cache_file.stat().st_mtime
+        for name, entry in json.loads(self.cache_file.read_bytes()).items():
+            p = provider_name_to_enum(name)
+            if isinstance(entry, list):
+                entry = {"models": entry, "fetched_at": file_time}
+            self.provider_models[p] = entry["models"]
+            if entry.get("fetched_at") is not None:
+                self.provider_fetched_at[p] = entry["fetched_at"]
+            if entry.get("etag"):
+                self.provider_etags[p] = entry["etag"]
+        self.provider_models[LlmProvider.LLAMACPP] = ["default"]
+
+    @staticmethod
+    def is_fetchable(provider: LlmProvider) -> bool:
+        """Return whether a provider is enabled and has its API key set, so its model list can be fetched."""
+        return not settings.disabled_providers.get(provider, False) and is_provider_api_key_set(provider)
+
+    def is_cache_expired(self, provider: LlmProvider) -> bool:
+        """Return whether a provider's model list is older than its ``provider_cache_hours``.
+
+        Args:
+            provider: The provider to check.
+
+        Returns:
+            True if the provider's list was never fetched or has expired.
+        """
+        fetched_at = self.provider_fetched_at.get(provider)
+        if fetched_at is None:
+            return True
+        return time.time() - fetched_at > settings.provider_cache_hours.get(provider, 168) * 3600
+
     def load_models(self, refresh: bool = False) -> None:
         """Load provider models from cache and request a background refresh if needed.
 
         Reads the cached provider model lists from disk when available and posts
-        a ``ProviderModelsChanged`` message. If the cache file is missing, any
-        provider's cache has expired, or ``refresh`` is True, a
-        ``RefreshProviderModelsRequested`` message is posted so the app can refresh
+        a ``ProviderModelsChanged`` message. If the cache file is missing or
+        ``refresh`` is True, a refresh of every provider is requested; otherwise
+        a refresh of just the enabled providers with an API key whose cache has
+        expired is requested, if any. The ``RefreshProviderModelsRequested`` message lets the app refresh
         models in a worker without blocking startup.
 
         Args:
@@ -271,29 +390,19 @@ class ProviderManager(MessageSink):
                 self.app.post_message(RefreshProviderModelsRequested(None))
             return
 
-        # Check if any provider's cache has expired, but don't block startup on
-        # network/API refreshes. Load the cached data first and ask the app to
-        # refresh in a worker after the UI is mounted.
-        cache_expired = False
-        cache_age_seconds = time.time() - self.cache_file.stat().st_mtime
-
-        for provider in settings.provider_cache_hours:
-            provider_cache_seconds = settings.provider_cache_hours[provider] * 60 * 60
-            if cache_age_seconds > provider_cache_seconds:
-                self.log_it(
-                    f"Models file is older than {settings.provider_cache_hours[provider]} hours for {provider.value}, requesting refresh"
-                )
-                cache_expired = True
-                break
-
-        provider_models = json.loads(self.cache_file.read_bytes())
-        self.provider_models = {provider_name_to_enum(k): v for k, v in provider_models.items()}
-        self.provider_models[LlmProvider.LLAMACPP] = ["default"]
+        # Load the cached data first and ask the app to refresh expired providers
+        # in a worker after the UI is mounted, so startup never waits on the network.
+        self._read_cache()
+        expired = [p for p in settings.provider_cache_hours if self.is_fetchable(p) and self.is_cache_expired(p)]
+        if expired:
+            self.log_it(f"Provider models expired for {', '.join(p.value for p in expired)}, requesting refresh")
 
         if self.app:
             self.app.post_message(ProviderModelsChanged())
-            if refresh or cache_expired:
+            if refresh:
                 self.app.post_message(RefreshProviderModelsRequested(None))
+            elif expired:
+                self.app.post_message(RefreshProviderModelsRequested(None, providers=expired))
 
     def get_model_select_options(self, provider: LlmProvider) -> list[tuple[str, str]]:
         """Get (label, value) select options for a provider's known models.
@@ -351,10 +460,11 @@ class ProviderManager(MessageSink):
 
         Returns:
             A dict with ``cache_age_hours``, ``cache_expired``, ``cache_size_kb``,
-            ``last_refresh`` (epoch seconds, or None if no cache file), and
-            ``model_count`` for the provider.
+            ``last_refresh`` (epoch seconds, or None if the provider's list was
+            never fetched), and ``model_count`` for the provider.
         """
-        if not self.cache_file.exists():
+        last_refresh = self.provider_fetched_at.get(provider)
+        if last_refresh is None or not self.cache_file.exists():
             return {
                 "cache_age_hours": 0,
                 "cache_expired": True,
@@ -363,17 +473,13 @@ class ProviderManager(MessageSink):
                 "model_count": 0,
             }
 
-        cache_age_seconds = time.time() - self.cache_file.stat().st_mtime
-        cache_age_hours = cache_age_seconds / 3600
-        provider_cache_hours = settings.provider_cache_hours.get(provider, 168)
-        cache_expired = cache_age_seconds > (provider_cache_hours * 3600)
+        cache_age_hours = (time.time() - last_refresh) / 3600
         cache_size_kb = self.cache_file.stat().st_size / 1024
-        last_refresh = self.cache_file.stat().st_mtime
         model_count = len(self.provider_models.get(provider, []))
 
         return {
             "cache_age_hours": round(cache_age_hours, 1),
-            "cache_expired": cache_expired,
+            "cache_expired": self.is_cache_expired(provider),
             "cache_size_kb": round(cache_size_kb, 1),
             "last_refresh": last_refresh,
             "model_count": model_count,
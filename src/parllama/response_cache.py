@@ -0,0 +1,198 @@
+"""Exact-match cache of chat replies for deterministic requests.
+
+When ``settings.response_cache_enabled`` is on, replies generated at a
+temperature no higher than ``settings.response_cache_max_temperature`` are
+stored under ``response_cache`` in the cache directory, keyed by a hash of the
+settings that shape the model's output (provider, model, sampling, context and
+reasoning options) and the exact message history sent. Sending the same
+history with the same settings again replays the stored reply instead of
+calling the provider.
+
+Entries older than ``settings.response_cache_ttl_hours`` are discarded, and
+once the cache exceeds ``settings.response_cache_max_mb`` the least recently
+used entries are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson as json
+from par_ai_core.llm_config import LlmConfig
+
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+_KEY_FIELDS = (
+    "model_name",
+    "temperature",
+    "num_ctx",
+    "max_output_tokens",
+    "num_predict",
+    "repeat_last_n",
+    "repeat_penalty",
+    "mirostat",
+    "mirostat_eta",
+    "mirostat_tau",
+    "tfs_z",
+    "top_k",
+    "top_p",
+    "seed",
+    "format",
+    "extra_body",
+    "reasoning_effort",
+    "reasoning_budget",
+)
+"""``LlmConfig`` fields that affect the generated reply, besides the provider."""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored reply."""
+
+    content: str
+    thinking: str
+    created: float
+    """Unix time the reply was generated."""
+
+
+def response_cache_key(llm_config: LlmConfig, chat_history: Sequence[Any]) -> str:
+    """Return the cache key of a request.
+
+    Args:
+        llm_config: Configuration the request is sent with.
+        chat_history: The LangChain native messages sent to the model.
+
+    Returns:
+        A hex digest of the normalized configuration and the messages.
+    """
+    config = {name: getattr(llm_config, name) for name in _KEY_FIELDS}
+    config["provider"] = llm_config.provider.value
+    payload = json.dumps([config, list(chat_history)], option=json.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ResponseCache:
+    """Disk-backed, size and age bounded store of chat replies."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entries. Defaults to ``response_cache`` under ``settings.cache_dir``.
+        """
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the entries."""
+        return self._cache_dir or Path(settings.cache_dir) / "response_cache"
+
+    @staticmethod
+    def is_cacheable(llm_config: LlmConfig) -> bool:
+        """Return True if replies for this configuration may be cached and replayed."""
+        return settings.response_cache_enabled and llm_config.temperature <= settings.response_cache_max_temperature
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored reply for ``key``, if there is an unexpired one.
+
+        A hit marks the entry as recently used.
+        """
+        file = self.cache_dir / f"{key}.json"
+        with self._lock:
+            try:
+                data = json.loads(file.read_bytes())
+                response = CachedResponse(content=data["content"], thinking=data["thinking"], created=data["created"])
+            except (OSError, ValueError, KeyError, TypeError):
+                self.misses += 1
+                return None
+            if self._expired(response.created):
+                file.unlink(missing_ok=True)
+                self.misses += 1
+                return None
+            try:
+                os.utime(file)
+            except OSError:
+                pass
+            self.hits += 1
+            return response
+
+    def put(self, key: str, content: str, thinking: str = "") -> None:
+        """Store a reply and evict entries beyond the age and size limits."""
+        data = json.dumps({"content": content, "thinking": thinking, "created": time.time()})
+        with self._lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = self.cache_dir / f"{key}.json.tmp"
+                tmp.write_bytes(data)
+                tmp.replace(self.cache_dir / f"{key}.json")
+            except OSError as e:
+                logger.warning(f"Cannot cache response: {e}")
+                return
+            self._evict()
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            for file in self.cache_dir.glob("*.json"):
+                file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _expired(created: float) -> bool:
+        """Return True if an entry created at ``created`` is past its TTL."""
+        ttl_hours = settings.response_cache_ttl_hours
+        return ttl_hours > 0 and time.time() - created > ttl_hours * 3600
+
+    def _evict(self) -> None:
+        """Delete expired entries, then the least recently used beyond the size limit. Caller must hold the lock."""
+        entries: list[tuple[float, int, Path]] = []
+        ttl_hours = settings.response_cache_ttl_hours
+        cutoff = time.time() - ttl_hours * 3600 if ttl_hours > 0 else 0.0
+        for file in self.cache_dir.glob("*.json"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            # An entry is never modified before it is created, so one untouched since the
+            # cutoff has expired; recently hit entries are checked for expiry on lookup.
+            if stat.st_mtime < cutoff:
+                file.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file))
+        limit = int(settings.response_cache_max_mb * 1024 * 1024)
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, file in sorted(entries):
+            if size <= limit:
+                break
+            file.unlink(missing_ok=True)
+            size -= file_size
+
+
+_response_cache: ResponseCache | None = None
+
+
+def _get_response_cache() -> ResponseCache:
+    """Lazily create the ResponseCache singleton on first access."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "response_cache":
+        return _get_response_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
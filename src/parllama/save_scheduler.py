@@ -0,0 +1,225 @@
+"""Write-behind persistence for chat sessions and prompts.
+
+Every setter on a chat container calls ``save()``, so adjusting a few session
+options produces a burst of saves. Containers hand the scheduler a write
+callable that captures their state at the time of the save; the scheduler
+keeps only the newest pending write per container, waits until the container
+has been quiet for ``settings.save_debounce_interval`` seconds (but no longer
+than ``settings.save_max_delay`` after its first pending change) and runs the
+write on a background thread. Pending writes are flushed on shutdown.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+SaveWriter = Callable[[], bool]
+"""Performs the write for one container; returns False if the write failed."""
+
+
+@dataclass
+class _PendingSave:
+    """The newest write scheduled for a container."""
+
+    writer: SaveWriter
+    first_scheduled: float
+    due: float
+
+
+@dataclass(frozen=True)
+class SaveSchedulerStats:
+    """Snapshot of save scheduler activity."""
+
+    queue_depth: int
+    """Number of containers with a pending write."""
+    scheduled: int
+    """Number of saves handed to the scheduler."""
+    coalesced: int
+    """Number of saves replaced by a newer save before being written."""
+    writes: int
+    """Number of writes performed."""
+    failures: int
+    """Number of writes that failed."""
+    avg_latency: float
+    """Average seconds from a container's first pending save to its write completing."""
+    max_latency: float
+    """Longest seconds from a container's first pending save to its write completing."""
+    avg_write_time: float
+    """Average seconds spent performing a write."""
+
+
+class SaveScheduler:
+    """Debounces container saves and writes them on a background thread."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler. The worker thread is started on first use."""
+        self._pending: dict[str, _PendingSave] = {}
+        self._in_flight: set[str] = set()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._scheduled = 0
+        self._coalesced = 0
+        self._writes = 0
+        self._failures = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._total_write_time = 0.0
+
+    def schedule(self, key: str, writer: SaveWriter) -> None:
+        """Schedule ``writer`` as the newest write for ``key``.
+
+        Any write still pending for ``key`` is discarded. When
+        ``settings.save_debounce_interval`` is 0 the write runs immediately on
+        the calling thread.
+
+        Args:
+            key: Unique id of the container being saved.
+            writer: Callable performing the write with state captured at save time.
+        """
+        now = time.monotonic()
+        if settings.save_debounce_interval <= 0:
+            with self._cond:
+                self._scheduled += 1
+                self._wait_idle(key)
+                self._in_flight.add(key)
+            self._write(key, writer, now)
+            return
+
+        with self._cond:
+            self._scheduled += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                first = now
+            else:
+                self._coalesced += 1
+                first = pending.first_scheduled
+            due = min(now + settings.save_debounce_interval, first + max(settings.save_max_delay, 0.0))
+            self._pending[key] = _PendingSave(writer=writer, first_scheduled=first, due=due)
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def cancel(self, key: str) -> None:
+        """Drop any pending write for ``key`` and wait for one in progress to finish."""
+        with self._cond:
+            self._pending.pop(key, None)
+            self._wait_idle(key)
+
+    def flush(self) -> None:
+        """Write everything that is pending now, on the calling thread."""
+        while True:
+            with self._cond:
+                ready = [key for key in self._pending if key not in self._in_flight]
+                if not ready:
+                    # Wait for writes the worker already started, then we are done.
+                    while self._in_flight:
+                        self._cond.wait()
+                    if not self._pending:
+                        return
+                    continue
+                batch = [(key, self._pending.pop(key)) for key in ready]
+                self._in_flight.update(ready)
+            for key, pending in batch:
+                self._write(key, pending.writer, pending.first_scheduled)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of containers with a pending write."""
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> SaveSchedulerStats:
+        """Return a snapshot of scheduler activity."""
+        with self._cond:
+            writes = max(self._writes, 1)
+            return SaveSchedulerStats(
+                queue_depth=len(self._pending),
+                scheduled=self._scheduled,
+                coalesced=self._coalesced,
+                writes=self._writes,
+                failures=self._failures,
+                avg_latency=self._total_latency / writes,
+                max_latency=self._max_latency,
+                avg_write_time=self._total_write_time / writes,
+            )
+
+    def _wait_idle(self, key: str) -> None:
+        """Wait until no write for ``key`` is in progress. Caller must hold the condition."""
+        while key in self._in_flight:
+            self._cond.wait()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if it is not running. Caller must hold the condition."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="save-scheduler", daemon=True)
+            self._thread.start()
+
+    def _next_ready(self) -> tuple[str, _PendingSave] | None:
+        """Block until a pending write is due and claim it. Caller must hold the condition."""
+        while True:
+            candidates = [(p.due, key) for key, p in self._pending.items() if key not in self._in_flight]
+            if not candidates:
+                self._cond.wait()
+                continue
+            due, key = min(candidates)
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._cond.wait(delay)
+                continue
+            self._in_flight.add(key)
+            return key, self._pending.pop(key)
+
+    def _run(self) -> None:
+        """Worker loop writing pending saves as they become due."""
+        while True:
+            with self._cond:
+                key, pending = self._next_ready()  # type: ignore[misc]
+            self._write(key, pending.writer, pending.first_scheduled)
+
+    def _write(self, key: str, writer: SaveWriter, first_scheduled: float) -> None:
+        """Run a claimed write, record its stats and release ``key``."""
+        start = time.monotonic()
+        try:
+            ok = writer()
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Save of {key} failed: {type(e).__name__}: {e}")
+            ok = False
+        end = time.monotonic()
+        with self._cond:
+            self._in_flight.discard(key)
+            self._writes += 1
+            if not ok:
+                self._failures += 1
+            latency = end - first_scheduled
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._total_write_time += end - start
+            self._cond.notify_all()
+
+
+_save_scheduler: SaveScheduler | None = None
+
+
+def _get_save_scheduler() -> SaveScheduler:
+    """Lazily create the SaveScheduler singleton on first access."""
+    global _save_scheduler
+    if _save_scheduler is None:
+        _save_scheduler = SaveScheduler()
+        # The worker is a daemon thread, so make sure nothing pending is lost on exit.
+        atexit.register(_save_scheduler.flush)
+    return _save_scheduler
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "save_scheduler":
+        return _get_save_scheduler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import cast
 
 from rich.console import RenderableType
@@ -14,18 +15,24 @@ from parllama.messages.messages import ModelInteractRequested, PsMessage, Status
 from parllama.settings_manager import TabType, settings
 from parllama.widgets.views.chat_view import ChatView
 from parllama.widgets.views.create_model_view import ModelCreateView
-from parllama.widgets.views.execution_view import ExecutionView
 from parllama.widgets.views.local_model_view import LocalModelView
 from parllama.widgets.views.log_view import LogView
-from parllama.widgets.views.memory_view import MemoryView
-from parllama.widgets.views.model_tools_view import ModelToolsView
-from parllama.widgets.views.options_view import OptionsView
-from parllama.widgets.views.prompt_view import PromptView
-from parllama.widgets.views.rag_view import RagView
-
-# from parllama.widgets.views.secrets_view import SecretsView
 from parllama.widgets.views.site_model_view import SiteModelView
 
+DEFERRED_VIEWS: dict[str, tuple[str, str, str]] = {
+    "Prompts": ("parllama.widgets.views.prompt_view", "PromptView", "prompt_view"),
+    "Tools": ("parllama.widgets.views.model_tools_view", "ModelToolsView", "model_tools"),
+    "Execution": ("parllama.widgets.views.execution_view", "ExecutionView", "execution_view"),
+    "Options": ("parllama.widgets.views.options_view", "OptionsView", "options"),
+    "Memory": ("parllama.widgets.views.memory_view", "MemoryView", "memory_view"),
+    "Stats": ("parllama.widgets.views.stats_view", "StatsView", "stats_view"),
+}
+"""Views built when their tab is first shown, keyed by tab id: (module, class name, widget id).
+
+Views other code talks to directly (local, site, chat, create and log) are
+built up front so messages can always be posted to them.
+"""
+
 
 class MainScreen(Screen[None]):
     """Main screen."""
@@ -37,17 +44,10 @@ class MainScreen(Screen[None]):
     status_bar: Static
     ps_status_bar: Static
     tabbed_content: TabbedContent
-    prompt_view: PromptView
     local_view: LocalModelView
     site_view: SiteModelView
     chat_view: ChatView
-    model_tools_view: ModelToolsView
     create_view: ModelCreateView
-    execution_view: ExecutionView
-    options_view: OptionsView
-    memory_view: MemoryView
-    # secrets_view: SecretsView
-    rag_view: RagView
     log_view: LogView
 
     def __init__(self, **kwargs) -> None:
@@ -60,16 +60,10 @@ class MainScreen(Screen[None]):
         self.local_view = LocalModelView(id="local_models")
         self.site_view = SiteModelView(id="site_models")
         self.chat_view = ChatView(id="chat_view")
-        self.prompt_view = PromptView(id="prompt_view")
         self.create_view = ModelCreateView(id="model_create")
-        self.model_tools_view = ModelToolsView(id="model_tools")
-        self.execution_view = ExecutionView(id="execution_view")
-        self.memory_view = MemoryView(id="memory_view")
-        # self.secrets_view = SecretsView(id="secrets")
-        self.options_view = OptionsView(id="options")
-
-        self.rag_view = RagView(id="rag")
         self.log_view = LogView()
+        self.composed_views: set[str] = set()
+        """Ids of the deferred view tabs whose view has been mounted."""
 
     async def on_mount(self) -> None:
         """Mount the Main screen."""
@@ -100,18 +94,12 @@ class MainScreen(Screen[None]):
                 yield self.site_view
             with TabPane("Chat", id="Chat"):
                 yield self.chat_view
-            with TabPane("Prompts", id="Prompts"):
-                yield self.prompt_view
-            with TabPane("Tools", id="Tools"):
-                yield self.model_tools_view
+            for tab_id in ("Prompts", "Tools"):
+                yield TabPane(tab_id, id=tab_id)
             with TabPane("Create", id="Create"):
                 yield self.create_view
-            with TabPane("Execution", id="Execution"):
-                yield self.execution_view
-            with TabPane("Options", id="Options"):
-                yield self.options_view
-            with TabPane("Memory", id="Memory"):
-                yield self.memory_view
+            for tab_id in ("Execution", "Options", "Memory", "Stats"):
+                yield TabPane(tab_id, id=tab_id)
             # with TabPane("Secrets", id="Secrets"):
             #     yield self.secrets_view
             # with TabPane("Rag", id="Rag"):
@@ -126,9 +114,20 @@ class MainScreen(Screen[None]):
         # self.notify(f"tab activated: {msg.tab.label.plain}")
         settings.last_tab = cast(TabType, msg.tab.label.plain)
         settings.save()
+        if msg.pane.id:
+            self.compose_deferred_view(msg.pane.id)
 
         self.log_view.richlog.write(f"Tab activated: {msg.tab.label.plain}")
 
+    def compose_deferred_view(self, tab_id: str) -> None:
+        """Import, build and mount the view of a deferred tab unless it is already mounted."""
+        if tab_id not in DEFERRED_VIEWS or tab_id in self.composed_views:
+            return
+        self.composed_views.add(tab_id)
+        module_name, class_name, widget_id = DEFERRED_VIEWS[tab_id]
+        view_class = getattr(importlib.import_module(module_name), class_name)
+        self.query_one(f"#{tab_id}", TabPane).mount(view_class(id=widget_id))
+
     @on(StatusMessage)
     def on_status_message(self, msg: StatusMessage) -> None:
         """Status message event"""
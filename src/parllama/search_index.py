@@ -0,0 +1,362 @@
+"""Full-text search over chat session and custom prompt messages.
+
+Message content is kept in an SQLite FTS5 index in the cache directory, so
+searching never needs the sessions themselves to be loaded. Each indexed
+message also records a digest of its content; re-indexing a session or prompt
+after it changes only rewrites the messages whose digest changed. Every
+indexed container records the ``last_updated`` value it was indexed at, which
+lets startup synchronization skip containers that have not changed since.
+
+All writes run on a single background thread; searches run on the caller's
+thread and return ranked hits with highlighted snippets.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
+from parllama.session_journal import SessionJournal
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_FILE = "search_index.db"
+"""Name of the search database inside ``settings.cache_dir``."""
+
+SNIPPET_START = "\x02"
+"""Marks the start of a matched term in a search hit snippet."""
+SNIPPET_END = "\x03"
+"""Marks the end of a matched term in a search hit snippet."""
+
+ContainerKind = Literal["session", "prompt"]
+IndexedMessage = tuple[str, str, str]
+"""``(message_id, role, content)`` of a message to index."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS containers (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    rowid INTEGER PRIMARY KEY,
+    container_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_container ON entries (container_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS fts USING fts5 (content, tokenize = 'unicode61 remove_diacritics 2');
+"""
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A message matching a search query."""
+
+    kind: ContainerKind
+    container_id: str
+    container_name: str
+    message_id: str
+    role: str
+    snippet: str
+    """Excerpt around the match with terms wrapped in ``SNIPPET_START`` / ``SNIPPET_END``."""
+    score: float
+    """BM25 relevance; lower is better."""
+
+
+def match_expression(query: str) -> str | None:
+    """Convert free text into an FTS5 match expression.
+
+    Every word must match; the last word is treated as a prefix so results
+    update while the user is still typing.
+
+    Returns:
+        The match expression, or None if the query has no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return None
+    terms = [f'"{t}"' for t in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _digest(role: str, content: str) -> str:
+    """Return a short stable digest of a message's indexed fields."""
+    return hashlib.blake2b(f"{role}\0{content}".encode(), digest_size=8).hexdigest()
+
+
+def message_rows(messages: Iterable[tuple[str, str, str | None]]) -> list[IndexedMessage]:
+    """Return ``(message_id, role, content)`` rows to index, making repeated message ids unique."""
+    rows: list[IndexedMessage] = []
+    seen: dict[str, int] = {}
+    for message_id, role, content in messages:
+        mid = message_id
+        if mid in seen:
+            seen[message_id] += 1
+            mid = f"{message_id}#{seen[message_id]}"
+        else:
+            seen[mid] = 0
+        rows.append((mid, role, content or ""))
+    return rows
+
+
+class SearchIndex:
+    """Incremental full-text index of session and prompt messages."""
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Initialize the index. The database is opened on first use.
+
+        Args:
+            db_path: Database location; defaults to ``SEARCH_INDEX_FILE`` in ``settings.cache_dir``.
+        """
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._available = True
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-index")
+
+    @property
+    def path(self) -> Path:
+        """Location of the search database."""
+        return self._db_path or Path(settings.cache_dir) / SEARCH_INDEX_FILE
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Open the database on first use. Caller must hold the lock."""
+        if self._conn is None and self._available:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            except sqlite3.Error as e:
+                # e.g. an SQLite build without FTS5; search is simply unavailable.
+                logger.error(f"Search index unavailable: {e}")
+                self._available = False
+        return self._conn
+
+    def close(self) -> None:
+        """Wait for queued updates and close the database."""
+        self._executor.submit(lambda: None).result()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def index_container(
+        self,
+        kind: ContainerKind,
+        container_id: str,
+        name: str,
+        last_updated: str,
+        messages: Iterable[IndexedMessage],
+    ) -> int:
+        """Bring the index for one session or prompt up to date.
+
+        Args:
+            kind: Whether the container is a session or a prompt.
+            container_id: Id of the session or prompt.
+            name: Current name of the container.
+            last_updated: The container's ``last_updated`` timestamp, as an ISO string.
+            messages: The container's messages, as returned by :func:`message_rows`.
+
+        Returns:
+            The number of messages that were added, changed or removed.
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            with conn:
+                conn.execute(
+                    "INSERT INTO containers (id, kind, name, last_updated) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET kind = excluded.kind, name = excluded.name, "
+                    "last_updated = excluded.last_updated",
+                    (container_id, kind, name, last_updated),
+                )
+                existing: dict[str, tuple[int, str]] = {
+                    mid: (rowid, digest)
+                    for rowid, mid, digest in conn.execute(
+                        "SELECT rowid, message_id, digest FROM entries WHERE container_id = ?", (container_id,)
+                    )
+                }
+                changed = 0
+                for mid, role, content in messages:
+                    digest = _digest(role, content)
+                    old = existing.pop(mid, None)
+                    if old is not None and old[1] == digest:
+                        continue
+                    changed += 1
+                    if old is not None:
+                        conn.execute("DELETE FROM fts WHERE rowid = ?", (old[0],))
+                        conn.execute("UPDATE entries SET role = ?, digest = ? WHERE rowid = ?", (role, digest, old[0]))
+                        rowid = old[0]
+                    else:
+                        cur = conn.execute(
+                            "INSERT INTO entries (container_id, message_id, role, digest) VALUES (?, ?, ?, ?)",
+                            (container_id, mid, role, digest),
+                        )
+                        rowid = cur.lastrowid
+                    conn.execute("INSERT INTO fts (rowid, content) VALUES (?, ?)", (rowid, content))
+                for rowid, _ in existing.values():
+                    changed += 1
+                    conn.execute("DELETE FROM fts WHERE rowid = ?", (rowid,))
+                    conn.execute("DELETE FROM entries WHERE rowid = ?", (rowid,))
+            return changed
+
+    def remove_container(self, container_id: str) -> None:
+        """Remove a session or prompt and all its messages from the index."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "DELETE FROM fts WHERE rowid IN (SELECT rowid FROM entries WHERE container_id = ?)",
+                    (container_id,),
+                )
+                conn.execute("DELETE FROM entries WHERE container_id = ?", (container_id,))
+                conn.execute("DELETE FROM containers WHERE id = ?", (container_id,))
+
+    def indexed_versions(self) -> dict[str, str]:
+        """Return the ``last_updated`` value each container was indexed at."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            return dict(conn.execute("SELECT id, last_updated FROM containers").fetchall())
+
+    def search(self, query: str, limit: int = 50) -> list[SearchHit]:
+        """Return the messages best matching ``query``.
+
+        Args:
+            query: Free text; every word must match and the last word may be a prefix.
+            limit: Maximum number of hits to return.
+
+        Returns:
+            Hits ordered from most to least relevant.
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return []
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(
+                    "SELECT c.kind, e.container_id, c.name, e.message_id, e.role, "
+                    "snippet(fts, 0, ?, ?, '…', 16), bm25(fts) AS score "
+                    "FROM fts JOIN entries e ON e.rowid = fts.rowid JOIN containers c ON c.id = e.container_id "
+                    "WHERE fts MATCH ? ORDER BY score LIMIT ?",
+                    (SNIPPET_START, SNIPPET_END, expression, limit),
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Search failed for {query!r}: {e}")
+                return []
+        return [SearchHit(*row) for row in rows]
+
+    def queue_container(self, kind: ContainerKind, container: Any) -> Future[int]:
+        """Re-index a loaded session or prompt on the background thread.
+
+        The message list is captured on the calling thread; reading the
+        message fields and updating the database happen in the background.
+        """
+        messages: list[ParllamaChatMessage] = list(container.messages)
+        args = (kind, container.id, container.name, container.last_updated.isoformat())
+        return self._executor.submit(
+            lambda: self.index_container(*args, message_rows((m.id, m.role, m.content) for m in messages))
+        )
+
+    def queue_remove(self, container_id: str) -> Future[None]:
+        """Remove a session or prompt from the index on the background thread."""
+        return self._executor.submit(self.remove_container, container_id)
+
+    def queue_sync(self, containers: Iterable[tuple[ContainerKind, str, str, str]]) -> Future[int]:
+        """Reconcile the index with the sessions and prompts on disk on the background thread.
+
+        Containers whose ``last_updated`` differs from the indexed value are
+        read from their files and re-indexed; containers that no longer exist
+        are removed.
+
+        Args:
+            containers: ``(kind, id, name, last_updated)`` of every known session and prompt.
+
+        Returns:
+            A future resolving to the number of containers that were re-indexed.
+        """
+        return self._executor.submit(self.sync, list(containers))
+
+    def sync(self, containers: Sequence[tuple[ContainerKind, str, str, str]]) -> int:
+        """Synchronously reconcile the index; see :meth:`queue_sync`."""
+        indexed = self.indexed_versions()
+        reindexed = 0
+        for kind, container_id, name, last_updated in containers:
+            if indexed.pop(container_id, None) == last_updated:
+                continue
+            rows = self._read_messages(kind, container_id)
+            if rows is None:
+                continue
+            self.index_container(kind, container_id, name, last_updated, rows)
+            reindexed += 1
+        for container_id in indexed:
+            self.remove_container(container_id)
+        return reindexed
+
+    @staticmethod
+    def _read_messages(kind: ContainerKind, container_id: str) -> list[IndexedMessage] | None:
+        """Read a container's messages from disk without loading the container."""
+        directory = settings.chat_dir if kind == "session" else settings.prompt_dir
+        secure_ops = SecureFileOperations(
+            max_file_size_mb=settings.max_json_size_mb,
+            allowed_extensions=settings.allowed_json_extensions,
+            validate_content=settings.validate_file_content,
+            sanitize_filenames=settings.sanitize_filenames,
+        )
+        try:
+            data = secure_ops.read_json_file(Path(directory) / f"{container_id}.json")
+        except SecureFileOpsError as e:
+            logger.warning(f"Cannot index {kind} {container_id}: {e}")
+            return None
+        for m in data.get("messages") or []:
+            # convert old format, as ChatSession.load does
+            if "message_id" in m:
+                m["id"] = "message_id"
+                del m["message_id"]
+        if kind == "session":
+            data = SessionJournal(container_id).replay(data, repair=False)
+        return message_rows((m.get("id", ""), m.get("role", ""), m.get("content")) for m in data.get("messages") or [])
+
+
+_search_index: SearchIndex | None = None
+
+
+def _get_search_index() -> SearchIndex:
+    """Lazily create the SearchIndex singleton on first access."""
+    global _search_index
+    if _search_index is None:
+        _search_index = SearchIndex()
+    return _search_index
+
+
+def __getattr__(name: str):  # type: ignore[misc]
+    """Module-level __getattr__ for lazy singleton initialization."""
+    if name == "search_index":
+        return _get_search_index()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -184,6 +184,64 @@ class SecureFileOperations:
             logger.error(f"Failed to write text file {file_path}: {e}")
             raise SecureFileOpsError(f"Failed to write file: {e}", file_path) from e
 
+    def append_text_file(
+        self,
+        file_path: Path,
+        content: str,
+        encoding: str = "utf-8",
+        create_dirs: bool = True,
+        sync: bool = True,
+    ) -> int:
+        """Safely append text to a file, creating it if needed.
+
+        Intended for append-only logs where rewriting the whole file on every
+        change would be wasteful. A torn final write can only ever affect the
+        appended tail, so readers of such logs should tolerate a truncated
+        last line.
+
+        Args:
+            file_path: Path of the file to append to
+            content: Content to append
+            encoding: File encoding to use
+            create_dirs: Whether to create parent directories
+            sync: Whether to fsync the file after appending
+
+        Returns:
+            Size of the file in bytes after the append
+
+        Raises:
+            SecureFileOpsError: If appending fails
+        """
+        try:
+            # Sanitize filename if requested
+            if self.sanitize_filenames:
+                safe_name = sanitize_filename(file_path.name)
+                file_path = file_path.parent / safe_name
+
+            # Create parent directories if requested
+            if create_dirs:
+                self._ensure_directory_exists(file_path.parent)
+
+            # Validate parent directory
+            validate_directory_path(file_path.parent, must_exist=True, must_be_writable=True)
+
+            with file_path.open("a", encoding=encoding) as f:
+                f.write(content)
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())  # Ensure data is written to disk
+                size = f.tell()
+
+            logger.debug(f"Successfully appended to text file: {file_path}")
+            return size
+
+        except FileValidationError as e:
+            logger.error(f"Directory validation failed for {file_path.parent}: {e}")
+            raise SecureFileOpsError(f"Directory validation failed: {e}", file_path) from e
+        except OSError as e:
+            logger.error(f"Failed to append to text file {file_path}: {e}")
+            raise SecureFileOpsError(f"Failed to append to file: {e}", file_path) from e
+
     def write_json_file(
         self,
         file_path: Path,
@@ -0,0 +1,136 @@
+"""Persistent metadata index of saved chat sessions.
+
+The session list only needs a handful of fields per session, but every session
+file also holds its full message history. The index keeps those fields, plus
+the size and modification time of each session's snapshot and journal files,
+in a single ``session_index.json`` in the chat directory. Entries whose file
+stamp no longer matches the files on disk (because the session was saved or
+edited outside the app since the index was written) are simply treated as
+missing, so the index repairs itself one session at a time.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
+from parllama.session_journal import JOURNAL_SUFFIX
+from parllama.settings_manager import settings
+
+if TYPE_CHECKING:
+    from parllama.chat_session import ChatSession
+
+logger = logging.getLogger(__name__)
+
+SESSION_INDEX_FILE = "session_index.json"
+"""Name of the index file inside ``settings.chat_dir``."""
+
+SESSION_INDEX_VERSION = 1
+"""Bumped whenever the entry layout changes; older indexes are discarded."""
+
+FileStamp = list[int]
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    """Return ``(mtime_ns, size)`` for a file, or zeros if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+def session_file_stamp(session_id: str) -> FileStamp:
+    """Return the modification time and size of a session's snapshot and journal files."""
+    chat_dir = Path(settings.chat_dir)
+    return [*_stat(chat_dir / f"{session_id}.json"), *_stat(chat_dir / f"{session_id}{JOURNAL_SUFFIX}")]
+
+
+class SessionIndex:
+    """Metadata for every saved chat session, keyed by session id."""
+
+    _entries: dict[str, dict[str, Any]]
+    _dirty: bool
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries = {}
+        self._dirty = False
+        self._secure_ops = SecureFileOperations(
+            max_file_size_mb=settings.max_json_size_mb,
+            allowed_extensions=settings.allowed_json_extensions,
+            validate_content=settings.validate_file_content,
+            sanitize_filenames=settings.sanitize_filenames,
+        )
+
+    @property
+    def path(self) -> Path:
+        """Path of the index file."""
+        return Path(settings.chat_dir) / SESSION_INDEX_FILE
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the index has changes that have not been written yet."""
+        return self._dirty
+
+    def __len__(self) -> int:
+        """Get the number of indexed sessions"""
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Load the index from disk, starting empty if it is missing, unreadable or outdated."""
+        self._entries = {}
+        self._dirty = False
+        if not self.path.exists():
+            return
+        try:
+            data = self._secure_ops.read_json_file(self.path)
+        except SecureFileOpsError as e:
+            logger.warning(f"Discarding unreadable session index: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != SESSION_INDEX_VERSION:
+            return
+        self._entries = data.get("sessions") or {}
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """Return the entry for a session if it still matches the session's files on disk."""
+        entry = self._entries.get(session_id)
+        if entry is None or entry.get("stamp") != session_file_stamp(session_id):
+            return None
+        return entry
+
+    def update(self, session: ChatSession) -> None:
+        """Record the current metadata of a saved session."""
+        entry = session.index_entry()
+        entry["stamp"] = session_file_stamp(session.id)
+        if self._entries.get(session.id) != entry:
+            self._entries[session.id] = entry
+            self._dirty = True
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session from the index."""
+        if self._entries.pop(session_id, None) is not None:
+            self._dirty = True
+
+    def retain(self, session_ids: set[str]) -> None:
+        """Drop every entry whose session is not in ``session_ids``."""
+        for session_id in set(self._entries) - session_ids:
+            self.remove(session_id)
+
+    def save(self) -> None:
+        """Write the index to disk if it has changed."""
+        if not self._dirty:
+            return
+        try:
+            self._secure_ops.write_json_file(
+                self.path,
+                {"version": SESSION_INDEX_VERSION, "sessions": self._entries},
+                atomic=True,
+                create_dirs=True,
+            )
+            self._dirty = False
+        except SecureFileOpsError as e:
+            logger.error(f"Failed to write session index: {e}")
@@ -0,0 +1,343 @@
+"""Append-only journal storage for chat sessions.
+
+A chat session is persisted as a snapshot file, ``<id>.json`` (the original
+full-session format), plus an append-only journal, ``<id>.jsonl``, holding the
+changes made since that snapshot was written. Each save appends only the
+messages that were added, edited or deleted together with a small metadata
+record, so save cost tracks the size of the change rather than the size of
+the session. Once the journal grows past ``settings.session_journal_max_records``
+(or past the size of the snapshot itself) it is folded back into the snapshot
+on a background thread.
+
+Journal records are single JSON objects, one per line, each carrying a
+monotonically increasing ``seq``. The snapshot stores the ``journal_seq`` it
+already includes, so replay skips records that were compacted but not yet
+trimmed from the journal (e.g. after a crash mid-compaction).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import orjson as json
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.secure_file_ops import SecureFileOperations, SecureFileOpsError
+from parllama.settings_manager import settings
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".jsonl"
+"""File suffix of session journal files."""
+
+_META_PREFIX = b'{"op":"meta"'
+"""Serialized prefix of metadata records, used to skip parsing message records."""
+
+# A single worker keeps compactions ordered and off the UI / generation threads.
+_compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-journal")
+
+MessageFingerprint = tuple[Any, ...]
+
+
+def _fingerprint(msg: ParllamaChatMessage) -> MessageFingerprint:
+    """Return a cheap change-detection key for a message.
+
+    Unchanged fields keep referencing the same string objects, so comparing
+    fingerprints is effectively an identity check per field rather than a
+    full content comparison.
+    """
+    return (
+        msg.role,
+        msg.content,
+        msg.thinking,
+        tuple(msg.images) if msg.images else None,
+        tuple(msg.tool_calls) if msg.tool_calls else None,
+    )
+
+
+def _dumps(record: dict[str, Any]) -> bytes:
+    """Serialize a journal record to a single newline-terminated line."""
+    return json.dumps(record, str, json.OPT_APPEND_NEWLINE)
+
+
+class SessionJournal:
+    """Tracks the persisted state of one chat session and appends changes to its journal."""
+
+    session_id: str
+    seq: int
+    """Sequence number of the last record written to (or replayed from) the journal."""
+    record_count: int
+    """Number of records in the journal that are not yet folded into the snapshot."""
+
+    def __init__(self, session_id: str) -> None:
+        """Initialize the journal for a session.
+
+        Args:
+            session_id: Id of the session the journal belongs to.
+        """
+        self.session_id = session_id
+        self.seq = 0
+        self.record_count = 0
+        self._journal_size = 0
+        self._snapshot_size = 0
+        self._persisted: dict[str, MessageFingerprint] = {}
+        self._order: list[str] = []
+        self._lock = threading.Lock()
+        self._compaction: Future[None] | None = None
+        self._secure_ops = SecureFileOperations(
+            max_file_size_mb=settings.max_json_size_mb,
+            allowed_extensions=[JOURNAL_SUFFIX],
+            validate_content=settings.validate_file_content,
+            sanitize_filenames=settings.sanitize_filenames,
+        )
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Path of the session snapshot file."""
+        return Path(settings.chat_dir) / f"{self.session_id}.json"
+
+    @property
+    def journal_path(self) -> Path:
+        """Path of the session journal file."""
+        return Path(settings.chat_dir) / f"{self.session_id}{JOURNAL_SUFFIX}"
+
+    @property
+    def has_snapshot(self) -> bool:
+        """Check if a snapshot has been written for this session."""
+        return self.snapshot_path.exists()
+
+    def reset(self, messages: Sequence[ParllamaChatMessage]) -> None:
+        """Record ``messages`` as the state that is currently persisted on disk."""
+        with self._lock:
+            self._persisted = {m.id: _fingerprint(m) for m in messages}
+            self._order = [m.id for m in messages]
+
+    def _read_records(self) -> list[bytes]:
+        """Read raw journal lines, returning an empty list if there is no journal."""
+        if not self.journal_path.exists():
+            return []
+        try:
+            self._secure_ops.validator.validate_file_path(self.journal_path)
+            return self.journal_path.read_bytes().splitlines()
+        except (OSError, SecureFileOpsError, ValueError) as e:
+            logger.error(f"Failed to read session journal {self.journal_path}: {e}")
+            return []
+
+    def replay(self, data: dict[str, Any], repair: bool = True) -> dict[str, Any]:
+        """Apply journal records on top of snapshot ``data``.
+
+        Args:
+            data: Session data as read from the snapshot file.
+            repair: Rewrite the journal without a torn tail record. Only the session
+                that owns the journal may repair it; other readers can see an append
+                that is still in progress as torn.
+
+        Returns:
+            The session data with all newer journal records applied, in the same
+            shape as the snapshot so callers can load it unchanged.
+        """
+        base_seq: int = data.get("journal_seq", 0)
+        messages: dict[str, dict[str, Any]] = {m["id"]: m for m in data.get("messages") or [] if "id" in m}
+        order: list[str] = [m["id"] for m in data.get("messages") or [] if "id" in m]
+        self.seq = base_seq
+        self.record_count = 0
+        self._snapshot_size = self.snapshot_path.stat().st_size if self.snapshot_path.exists() else 0
+        self._journal_size = 0
+        torn = False
+
+        for line in self._read_records():
+            self._journal_size += len(line) + 1
+            try:
+                record: dict[str, Any] = json.loads(line)
+            except json.JSONDecodeError:
+                # Only the tail can be torn by an interrupted append; ignore it.
+                logger.warning(f"Skipping malformed record in session journal {self.journal_path}")
+                torn = True
+                continue
+            seq = record.get("seq", 0)
+            if seq <= base_seq:
+                continue
+            self.seq = max(self.seq, seq)
+            self.record_count += 1
+            op = record.get("op")
+            if op == "meta":
+                data.update(record["data"])
+            elif op == "put":
+                msg = record["data"]
+                if msg["id"] not in messages:
+                    order.append(msg["id"])
+                messages[msg["id"]] = msg
+            elif op == "del":
+                if messages.pop(record["id"], None) is not None:
+                    order.remove(record["id"])
+            elif op == "order":
+                order = [mid for mid in record["ids"] if mid in messages]
+
+        if torn and repair:
+            # Drop the torn record so later appends start on a clean line.
+            self._trim(base_seq)
+        data["messages"] = [messages[mid] for mid in order]
+        return data
+
+    def latest_meta(self) -> dict[str, Any] | None:
+        """Return the most recent metadata record in the journal without replaying messages.
+
+        Only lines that start with the metadata record prefix are parsed, so this
+        stays cheap even when the journal holds large message records.
+        """
+        meta: dict[str, Any] | None = None
+        for line in self._read_records():
+            if not line.startswith(_META_PREFIX):
+                continue
+            try:
+                meta = json.loads(line)["data"]
+            except (json.JSONDecodeError, KeyError):
+                continue
+        return meta
+
+    def _diff(self, messages: Sequence[ParllamaChatMessage]) -> list[dict[str, Any]]:
+        """Build put/del/order records describing how ``messages`` differ from the persisted state."""
+        records: list[dict[str, Any]] = []
+        current_ids = [m.id for m in messages]
+        current = set(current_ids)
+
+        for mid in self._order:
+            if mid not in current:
+                records.append({"op": "del", "id": mid})
+                del self._persisted[mid]
+
+        # Order as it will be after replaying the deletes above and appending new ids.
+        expected = [mid for mid in self._order if mid in current]
+        expected.extend(mid for mid in current_ids if mid not in self._persisted)
+
+        for msg in messages:
+            fingerprint = _fingerprint(msg)
+            if self._persisted.get(msg.id) != fingerprint:
+                records.append({"op": "put", "data": msg.to_dict()})
+                self._persisted[msg.id] = fingerprint
+
+        if expected != current_ids:
+            records.append({"op": "order", "ids": current_ids})
+        self._order = current_ids
+        return records
+
+    def append_changes(self, messages: Sequence[ParllamaChatMessage], meta: dict[str, Any]) -> bool:
+        """Append records for every message change plus the current metadata.
+
+        Args:
+            messages: The session's current messages.
+            meta: Session metadata (everything in the snapshot except messages).
+
+        Returns:
+            True if the journal has grown enough that it should be compacted.
+
+        Raises:
+            SecureFileOpsError: If the journal could not be written.
+        """
+        with self._lock:
+            records = self._diff(messages)
+            records.append({"op": "meta", "data": meta})
+            lines = bytearray()
+            for record in records:
+                self.seq += 1
+                # "op" first so metadata records can be found by prefix in latest_meta().
+                lines += _dumps({"op": record.pop("op"), "seq": self.seq, **record})
+            self._journal_size = self._secure_ops.append_text_file(self.journal_path, lines.decode("utf-8"))
+            self.record_count += len(records)
+            return self.needs_compaction
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Check if the journal should be folded into the snapshot."""
+        if self._compaction is not None and not self._compaction.done():
+            return False
+        return self.record_count >= settings.session_journal_max_records or self._journal_size > max(
+            self._snapshot_size, 64 * 1024
+        )
+
+    def _stamp(self, snapshot: dict[str, Any]) -> int:
+        """Record the journal position ``snapshot`` was captured at."""
+        with self._lock:
+            snapshot["journal_seq"] = self.seq
+            return self.seq
+
+    def _write_snapshot(self, snapshot: dict[str, Any], secure_ops: SecureFileOperations) -> None:
+        """Write a stamped snapshot and drop the journal records it includes."""
+        # The atomic temp-file + rename already guarantees the old snapshot survives a
+        # failed write, so no separate backup copy is taken here.
+        secure_ops.write_json_file(self.snapshot_path, snapshot, atomic=True, create_dirs=True, indent=2)
+        self._trim(snapshot["journal_seq"])
+        self._snapshot_size = self.snapshot_path.stat().st_size
+
+    def write_snapshot(self, snapshot: dict[str, Any], secure_ops: SecureFileOperations) -> None:
+        """Synchronously write a full snapshot and drop the journal records it includes.
+
+        Args:
+            snapshot: Full session data, as produced by ``ChatSession`` for its snapshot file.
+            secure_ops: The session's secure file operations used for the snapshot write.
+
+        Raises:
+            SecureFileOpsError: If the snapshot could not be written.
+        """
+        self._stamp(snapshot)
+        self._write_snapshot(snapshot, secure_ops)
+
+    def compact(self, snapshot: dict[str, Any], secure_ops: SecureFileOperations) -> Future[None]:
+        """Write a snapshot and trim the journal on the background compaction thread.
+
+        The snapshot is stamped with the current journal position on the calling
+        thread, so records appended while compaction runs are kept in the journal.
+
+        Args:
+            snapshot: Full session data captured on the calling thread.
+            secure_ops: The session's secure file operations used for the snapshot write.
+
+        Returns:
+            A future that completes once compaction has finished.
+        """
+        self._stamp(snapshot)
+
+        def _run() -> None:
+            try:
+                self._write_snapshot(snapshot, secure_ops)
+            except (OSError, SecureFileOpsError) as e:
+                logger.error(f"Failed to compact session journal {self.journal_path}: {e}")
+
+        self._compaction = _compaction_executor.submit(_run)
+        return self._compaction
+
+    def _trim(self, upto_seq: int) -> None:
+        """Remove journal records with ``seq <= upto_seq`` that are now part of the snapshot."""
+        with self._lock:
+            lines = self._read_records()
+            keep: list[bytes] = []
+            for line in lines:
+                try:
+                    if json.loads(line).get("seq", 0) > upto_seq:
+                        keep.append(line)
+                except json.JSONDecodeError:
+                    continue
+            if keep:
+                content = b"\n".join(keep) + b"\n"
+                self._secure_ops.write_text_file(self.journal_path, content.decode("utf-8"), atomic=True)
+            else:
+                self.journal_path.unlink(missing_ok=True)
+            self.record_count = len(keep)
+            self._journal_size = sum(len(line) + 1 for line in keep)
+
+    def delete(self) -> None:
+        """Remove the journal file."""
+        with self._lock:
+            self.journal_path.unlink(missing_ok=True)
+            self.record_count = 0
+            self._journal_size = 0
+
+
+def flush_compactions() -> None:
+    """Block until every queued journal compaction has finished."""
+    _compaction_executor.submit(lambda: None).result()
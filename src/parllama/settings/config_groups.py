@@ -64,6 +64,10 @@ class OllamaConfig(BaseModel):
     site_models_namespace: str = ""
     local_model_sort: str = "size_desc"
     site_model_sort: str = "name_asc"
+    ollama_warmup_enabled: bool = True
+    ollama_keep_alive: str = ""
+    ollama_native_chat: bool = False
+    ollama_details_concurrency: int = 4
 
 
 class UIConfig(BaseModel):
@@ -94,6 +98,23 @@ class ChatConfig(BaseModel):
     close_session_config_on_submit: bool = True
     save_chat_input_history: bool = False
     chat_input_history_length: int = 100
+    session_journal_max_records: int = 200
+    chat_render_margin: int = 40
+    context_trim_policy: str = "none"
+    context_budget_tokens: int = 0
+    context_reserve_tokens: int = 1024
+    image_max_dimension: int = 2048
+    image_cache_max_mb: float = 64.0
+    image_cache_persist: bool = True
+    generation_provider_limit: int = 0
+    generation_provider_limits: dict[str, int] = {}
+    generation_host_limit: int = 0
+    telemetry_enabled: bool = True
+    telemetry_retention_days: int = 90
+    response_cache_enabled: bool = False
+    response_cache_max_temperature: float = 0.0
+    response_cache_max_mb: float = 64.0
+    response_cache_ttl_hours: int = 168
 
 
 class ExecutionConfig(BaseModel):
@@ -147,6 +168,9 @@ class TimerConfig(BaseModel):
     job_queue_put_timeout: float = 0.1
     job_queue_get_timeout: float = 1.0
     job_queue_max_size: int = 150
+    save_debounce_interval: float = 0.5
+    save_max_delay: float = 5.0
+    chat_stream_frame_interval: float = 0.033
 
 
 class HttpConfig(BaseModel):
@@ -154,10 +178,14 @@ class HttpConfig(BaseModel):
 
     http_request_timeout: float = 30.0
     provider_model_request_timeout: float = 5.0
+    provider_refresh_timeout: float = 15.0
     update_check_timeout: float = 5.0
     image_fetch_timeout: float = 10.0
     image_fetch_max_attempts: int = 2
     image_fetch_base_delay: float = 1.0
+    http2_enabled: bool = False
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
 
 
 class FileValidationConfig(BaseModel):
@@ -20,7 +20,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-import requests
+import httpx
 from par_ai_core.llm_config import LlmMode, ReasoningEffort
 from par_ai_core.llm_providers import (
     LangChainConfig,
@@ -559,6 +559,62 @@ class Settings(BaseModel):
         """Set the sort order for the local models list."""
         self.ollama.local_model_sort = value
 
+    @property
+    def ollama_warmup_enabled(self) -> bool:
+        """Get whether a session's Ollama model is preloaded when the session becomes active.
+
+        Returns:
+            True if Ollama models are warmed up in the background.
+        """
+        return self.ollama.ollama_warmup_enabled
+
+    @ollama_warmup_enabled.setter
+    def ollama_warmup_enabled(self, value: bool) -> None:
+        """Set whether a session's Ollama model is preloaded when the session becomes active."""
+        self.ollama.ollama_warmup_enabled = value
+
+    @property
+    def ollama_keep_alive(self) -> str:
+        """Get how long Ollama keeps chat models loaded after a request.
+
+        Returns:
+            An Ollama duration such as ``"30m"``, or ``""`` for the server default.
+        """
+        return self.ollama.ollama_keep_alive
+
+    @ollama_keep_alive.setter
+    def ollama_keep_alive(self, value: str) -> None:
+        """Set how long Ollama keeps chat models loaded after a request."""
+        self.ollama.ollama_keep_alive = value
+
+    @property
+    def ollama_native_chat(self) -> bool:
+        """Get whether Ollama chat sessions stream through the native Ollama client.
+
+        Returns:
+            True if Ollama chats bypass LangChain and use ``ollama.AsyncClient`` directly.
+        """
+        return self.ollama.ollama_native_chat
+
+    @ollama_native_chat.setter
+    def ollama_native_chat(self, value: bool) -> None:
+        """Set whether Ollama chat sessions stream through the native Ollama client."""
+        self.ollama.ollama_native_chat = value
+
+    @property
+    def ollama_details_concurrency(self) -> int:
+        """Get how many model detail requests run at once when enriching local models.
+
+        Returns:
+            Maximum number of concurrent Ollama ``show`` requests.
+        """
+        return self.ollama.ollama_details_concurrency
+
+    @ollama_details_concurrency.setter
+    def ollama_details_concurrency(self, value: int) -> None:
+        """Set how many model detail requests run at once when enriching local models."""
+        self.ollama.ollama_details_concurrency = value
+
     @property
     def site_model_sort(self) -> str:
         """Get the sort order for the site models list.
@@ -769,6 +825,244 @@ class Settings(BaseModel):
         """Set the maximum number of retained chat input history entries."""
         self.chat.chat_input_history_length = value
 
+    @property
+    def session_journal_max_records(self) -> int:
+        """Get the number of journal records after which a session is compacted.
+
+        Returns:
+            Maximum number of records kept in a session journal before compaction.
+        """
+        return self.chat.session_journal_max_records
+
+    @session_journal_max_records.setter
+    def session_journal_max_records(self, value: int) -> None:
+        """Set the number of journal records after which a session is compacted."""
+        self.chat.session_journal_max_records = value
+
+    @property
+    def chat_render_margin(self) -> int:
+        """Get the number of rows rendered above and below the visible chat messages.
+
+        Returns:
+            Rows beyond the viewport in which message widgets stay mounted.
+        """
+        return self.chat.chat_render_margin
+
+    @chat_render_margin.setter
+    def chat_render_margin(self, value: int) -> None:
+        """Set the number of rows rendered above and below the visible chat messages."""
+        self.chat.chat_render_margin = value
+
+    @property
+    def context_trim_policy(self) -> str:
+        """Get how history is trimmed to fit the context budget.
+
+        Returns:
+            One of "none", "drop_oldest" or "summarize_oldest".
+        """
+        return self.chat.context_trim_policy
+
+    @context_trim_policy.setter
+    def context_trim_policy(self, value: str) -> None:
+        """Set how history is trimmed to fit the context budget."""
+        self.chat.context_trim_policy = value
+
+    @property
+    def context_budget_tokens(self) -> int:
+        """Get the prompt token budget for chat generation.
+
+        Returns:
+            Maximum prompt tokens, or 0 to derive it from the session's context size.
+        """
+        return self.chat.context_budget_tokens
+
+    @context_budget_tokens.setter
+    def context_budget_tokens(self, value: int) -> None:
+        """Set the prompt token budget for chat generation."""
+        self.chat.context_budget_tokens = value
+
+    @property
+    def context_reserve_tokens(self) -> int:
+        """Get the tokens held back for the response when deriving the context budget.
+
+        Returns:
+            Tokens subtracted from the session's context size.
+        """
+        return self.chat.context_reserve_tokens
+
+    @context_reserve_tokens.setter
+    def context_reserve_tokens(self, value: int) -> None:
+        """Set the tokens held back for the response when deriving the context budget."""
+        self.chat.context_reserve_tokens = value
+
+    @property
+    def image_max_dimension(self) -> int:
+        """Get the longest side, in pixels, that chat images are downscaled to.
+
+        Returns:
+            Maximum image width or height sent to the LLM, or 0 to never downscale.
+        """
+        return self.chat.image_max_dimension
+
+    @image_max_dimension.setter
+    def image_max_dimension(self, value: int) -> None:
+        """Set the longest side, in pixels, that chat images are downscaled to."""
+        self.chat.image_max_dimension = value
+
+    @property
+    def image_cache_max_mb(self) -> float:
+        """Get the size limit of the encoded image cache, in memory and on disk.
+
+        Returns:
+            Maximum megabytes of encoded images kept in memory, and of prepared images stored on disk.
+        """
+        return self.chat.image_cache_max_mb
+
+    @image_cache_max_mb.setter
+    def image_cache_max_mb(self, value: float) -> None:
+        """Set the size limit of the encoded image cache, in memory and on disk."""
+        self.chat.image_cache_max_mb = value
+
+    @property
+    def image_cache_persist(self) -> bool:
+        """Get whether encoded images are also cached on disk.
+
+        Returns:
+            True if prepared images are stored under the cache directory.
+        """
+        return self.chat.image_cache_persist
+
+    @image_cache_persist.setter
+    def image_cache_persist(self, value: bool) -> None:
+        """Set whether encoded images are also cached on disk."""
+        self.chat.image_cache_persist = value
+
+    @property
+    def generation_provider_limit(self) -> int:
+        """Get the default number of concurrent generations per provider.
+
+        Returns:
+            Maximum concurrent chat generations against one provider, 0 for no limit.
+        """
+        return self.chat.generation_provider_limit
+
+    @generation_provider_limit.setter
+    def generation_provider_limit(self, value: int) -> None:
+        """Set the default number of concurrent generations per provider."""
+        self.chat.generation_provider_limit = value
+
+    @property
+    def generation_provider_limits(self) -> dict[str, int]:
+        """Get per-provider overrides of the concurrent generation limit.
+
+        Returns:
+            Maximum concurrent chat generations keyed by provider name, 0 for no limit.
+        """
+        return self.chat.generation_provider_limits
+
+    @generation_provider_limits.setter
+    def generation_provider_limits(self, value: dict[str, int]) -> None:
+        """Set per-provider overrides of the concurrent generation limit."""
+        self.chat.generation_provider_limits = value
+
+    @property
+    def generation_host_limit(self) -> int:
+        """Get the number of concurrent generations per host.
+
+        Returns:
+            Maximum concurrent chat generations against one host, 0 for no limit.
+        """
+        return self.chat.generation_host_limit
+
+    @generation_host_limit.setter
+    def generation_host_limit(self, value: int) -> None:
+        """Set the number of concurrent generations per host."""
+        self.chat.generation_host_limit = value
+
+    @property
+    def telemetry_enabled(self) -> bool:
+        """Get whether completed generations are recorded in the telemetry store.
+
+        Returns:
+            True if per-generation latency and throughput are recorded.
+        """
+        return self.chat.telemetry_enabled
+
+    @telemetry_enabled.setter
+    def telemetry_enabled(self, value: bool) -> None:
+        """Set whether completed generations are recorded in the telemetry store."""
+        self.chat.telemetry_enabled = value
+
+    @property
+    def telemetry_retention_days(self) -> int:
+        """Get how long generation telemetry is kept.
+
+        Returns:
+            Age in days after which telemetry records are pruned, 0 to keep them forever.
+        """
+        return self.chat.telemetry_retention_days
+
+    @telemetry_retention_days.setter
+    def telemetry_retention_days(self, value: int) -> None:
+        """Set how long generation telemetry is kept."""
+        self.chat.telemetry_retention_days = value
+
+    @property
+    def response_cache_enabled(self) -> bool:
+        """Get whether deterministic chat replies are cached and replayed.
+
+        Returns:
+            True if replies to repeated requests are replayed from the response cache.
+        """
+        return self.chat.response_cache_enabled
+
+    @response_cache_enabled.setter
+    def response_cache_enabled(self, value: bool) -> None:
+        """Set whether deterministic chat replies are cached and replayed."""
+        self.chat.response_cache_enabled = value
+
+    @property
+    def response_cache_max_temperature(self) -> float:
+        """Get the highest temperature whose replies are cached.
+
+        Returns:
+            Requests at or below this temperature are cached.
+        """
+        return self.chat.response_cache_max_temperature
+
+    @response_cache_max_temperature.setter
+    def response_cache_max_temperature(self, value: float) -> None:
+        """Set the highest temperature whose replies are cached."""
+        self.chat.response_cache_max_temperature = value
+
+    @property
+    def response_cache_max_mb(self) -> float:
+        """Get the size limit of the response cache.
+
+        Returns:
+            Maximum size of the response cache on disk in megabytes.
+        """
+        return self.chat.response_cache_max_mb
+
+    @response_cache_max_mb.setter
+    def response_cache_max_mb(self, value: float) -> None:
+        """Set the size limit of the response cache."""
+        self.chat.response_cache_max_mb = value
+
+    @property
+    def response_cache_ttl_hours(self) -> int:
+        """Get how long cached replies stay valid.
+
+        Returns:
+            Age in hours after which a cached reply is discarded, 0 to keep it until evicted.
+        """
+        return self.chat.response_cache_ttl_hours
+
+    @response_cache_ttl_hours.setter
+    def response_cache_ttl_hours(self, value: int) -> None:
+        """Set how long cached replies stay valid."""
+        self.chat.response_cache_ttl_hours = value
+
     # --- ExecutionConfig delegation -------------------------------------------
 
     @property
@@ -1017,6 +1311,30 @@ class Settings(BaseModel):
     def job_queue_max_size(self, value: int) -> None:
         self.timer.job_queue_max_size = value
 
+    @property
+    def save_debounce_interval(self) -> float:
+        return self.timer.save_debounce_interval
+
+    @save_debounce_interval.setter
+    def save_debounce_interval(self, value: float) -> None:
+        self.timer.save_debounce_interval = value
+
+    @property
+    def save_max_delay(self) -> float:
+        return self.timer.save_max_delay
+
+    @save_max_delay.setter
+    def save_max_delay(self, value: float) -> None:
+        self.timer.save_max_delay = value
+
+    @property
+    def chat_stream_frame_interval(self) -> float:
+        return self.timer.chat_stream_frame_interval
+
+    @chat_stream_frame_interval.setter
+    def chat_stream_frame_interval(self, value: float) -> None:
+        self.timer.chat_stream_frame_interval = value
+
     # --- HttpConfig delegation ------------------------------------------------
 
     @property
@@ -1035,6 +1353,38 @@ class Settings(BaseModel):
     def provider_model_request_timeout(self, value: float) -> None:
         self.http.provider_model_request_timeout = value
 
+    @property
+    def provider_refresh_timeout(self) -> float:
+        return self.http.provider_refresh_timeout
+
+    @provider_refresh_timeout.setter
+    def provider_refresh_timeout(self, value: float) -> None:
+        self.http.provider_refresh_timeout = value
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.http.http2_enabled
+
+    @http2_enabled.setter
+    def http2_enabled(self, value: bool) -> None:
+        self.http.http2_enabled = value
+
+    @property
+    def http_max_keepalive_connections(self) -> int:
+        return self.http.http_max_keepalive_connections
+
+    @http_max_keepalive_connections.setter
+    def http_max_keepalive_connections(self, value: int) -> None:
+        self.http.http_max_keepalive_connections = value
+
+    @property
+    def http_keepalive_expiry(self) -> float:
+        return self.http.http_keepalive_expiry
+
+    @http_keepalive_expiry.setter
+    def http_keepalive_expiry(self, value: float) -> None:
+        self.http.http_keepalive_expiry = value
+
     @property
     def update_check_timeout(self) -> float:
         return self.http.update_check_timeout
@@ -1261,6 +1611,72 @@ def apply_cli_args(settings_obj: Settings, args: Namespace) -> None:
         settings_obj.ollama_ps_poll_interval = args.ps_poll
 
 
+def _apply_chat_performance_data(settings_obj: Settings, data: dict) -> None:
+    """Apply the chat persistence, rendering, context and generation settings from settings.json."""
+    settings_obj.session_journal_max_records = max(
+        1, data.get("session_journal_max_records", settings_obj.session_journal_max_records)
+    )
+    settings_obj.chat_render_margin = max(0, data.get("chat_render_margin", settings_obj.chat_render_margin))
+    context_trim_policy = data.get("context_trim_policy", settings_obj.context_trim_policy)
+    if context_trim_policy in ("none", "drop_oldest", "summarize_oldest"):
+        settings_obj.context_trim_policy = context_trim_policy
+    settings_obj.context_budget_tokens = max(0, data.get("context_budget_tokens", settings_obj.context_budget_tokens))
+    settings_obj.context_reserve_tokens = max(
+        0, data.get("context_reserve_tokens", settings_obj.context_reserve_tokens)
+    )
+    settings_obj.image_max_dimension = max(0, data.get("image_max_dimension", settings_obj.image_max_dimension))
+    settings_obj.image_cache_max_mb = max(1.0, data.get("image_cache_max_mb", settings_obj.image_cache_max_mb))
+    settings_obj.image_cache_persist = data.get("image_cache_persist", settings_obj.image_cache_persist)
+    settings_obj.generation_provider_limit = max(
+        0, data.get("generation_provider_limit", settings_obj.generation_provider_limit)
+    )
+    settings_obj.generation_provider_limits = {
+        str(k): max(0, v) for k, v in (data.get("generation_provider_limits") or {}).items() if isinstance(v, int)
+    }
+    settings_obj.generation_host_limit = max(0, data.get("generation_host_limit", settings_obj.generation_host_limit))
+    settings_obj.telemetry_enabled = data.get("telemetry_enabled", settings_obj.telemetry_enabled)
+    settings_obj.telemetry_retention_days = max(
+        0, data.get("telemetry_retention_days", settings_obj.telemetry_retention_days)
+    )
+    settings_obj.response_cache_enabled = data.get("response_cache_enabled", settings_obj.response_cache_enabled)
+    settings_obj.response_cache_max_temperature = data.get(
+        "response_cache_max_temperature", settings_obj.response_cache_max_temperature
+    )
+    settings_obj.response_cache_max_mb = max(1.0, data.get("response_cache_max_mb", settings_obj.response_cache_max_mb))
+    settings_obj.response_cache_ttl_hours = max(
+        0, data.get("response_cache_ttl_hours", settings_obj.response_cache_ttl_hours)
+    )
+
+
+def _apply_http_data(settings_obj: Settings, data: dict) -> None:
+    """Apply the HTTP timeout, image fetch retry and connection pool settings from settings.json."""
+    # HTTP timeout settings
+    settings_obj.http_request_timeout = max(1.0, data.get("http_request_timeout", settings_obj.http_request_timeout))
+    settings_obj.provider_model_request_timeout = max(
+        1.0, data.get("provider_model_request_timeout", settings_obj.provider_model_request_timeout)
+    )
+    settings_obj.provider_refresh_timeout = max(
+        1.0, data.get("provider_refresh_timeout", settings_obj.provider_refresh_timeout)
+    )
+    settings_obj.update_check_timeout = max(1.0, data.get("update_check_timeout", settings_obj.update_check_timeout))
+    settings_obj.image_fetch_timeout = max(1.0, data.get("image_fetch_timeout", settings_obj.image_fetch_timeout))
+
+    # Image fetch retry settings
+    settings_obj.image_fetch_max_attempts = max(
+        1, data.get("image_fetch_max_attempts", settings_obj.image_fetch_max_attempts)
+    )
+    settings_obj.image_fetch_base_delay = max(
+        0.1, data.get("image_fetch_base_delay", settings_obj.image_fetch_base_delay)
+    )
+
+    # HTTP connection pool settings
+    settings_obj.http2_enabled = data.get("http2_enabled", settings_obj.http2_enabled)
+    settings_obj.http_max_keepalive_connections = max(
+        1, data.get("http_max_keepalive_connections", settings_obj.http_max_keepalive_connections)
+    )
+    settings_obj.http_keepalive_expiry = max(0.0, data.get("http_keepalive_expiry", settings_obj.http_keepalive_expiry))
+
+
 def _apply_flat_data_to_settings(settings_obj: Settings, data: dict) -> None:
     """Apply a flat dictionary (from settings.json) to the Settings object.
 
@@ -1374,6 +1790,12 @@ def _apply_flat_data_to_settings(settings_obj: Settings, data: dict) -> None:
     )
     settings_obj.local_model_sort = data.get("local_model_sort", settings_obj.local_model_sort)
     settings_obj.site_model_sort = data.get("site_model_sort", settings_obj.site_model_sort)
+    settings_obj.ollama_warmup_enabled = data.get("ollama_warmup_enabled", settings_obj.ollama_warmup_enabled)
+    settings_obj.ollama_keep_alive = str(data.get("ollama_keep_alive", settings_obj.ollama_keep_alive)).strip()
+    settings_obj.ollama_native_chat = data.get("ollama_native_chat", settings_obj.ollama_native_chat)
+    settings_obj.ollama_details_concurrency = max(
+        1, data.get("ollama_details_concurrency", settings_obj.ollama_details_concurrency)
+    )
 
     # Chat settings
     settings_obj.auto_name_session = data.get("auto_name_session", settings_obj.auto_name_session)
@@ -1418,6 +1840,7 @@ def _apply_flat_data_to_settings(settings_obj: Settings, data: dict) -> None:
     settings_obj.chat_input_history_length = data.get(
         "chat_input_history_length", settings_obj.chat_input_history_length
     )
+    _apply_chat_performance_data(settings_obj, data)
 
     # Network retry settings
     settings_obj.max_retry_attempts = max(1, data.get("max_retry_attempts", settings_obj.max_retry_attempts))
@@ -1439,23 +1862,16 @@ def _apply_flat_data_to_settings(settings_obj: Settings, data: dict) -> None:
         0.01, data.get("job_queue_get_timeout", settings_obj.job_queue_get_timeout)
     )
     settings_obj.job_queue_max_size = max(10, data.get("job_queue_max_size", settings_obj.job_queue_max_size))
-
-    # HTTP timeout settings
-    settings_obj.http_request_timeout = max(1.0, data.get("http_request_timeout", settings_obj.http_request_timeout))
-    settings_obj.provider_model_request_timeout = max(
-        1.0, data.get("provider_model_request_timeout", settings_obj.provider_model_request_timeout)
+    settings_obj.save_debounce_interval = max(
+        0.0, data.get("save_debounce_interval", settings_obj.save_debounce_interval)
     )
-    settings_obj.update_check_timeout = max(1.0, data.get("update_check_timeout", settings_obj.update_check_timeout))
-    settings_obj.image_fetch_timeout = max(1.0, data.get("image_fetch_timeout", settings_obj.image_fetch_timeout))
-
-    # Image fetch retry settings
-    settings_obj.image_fetch_max_attempts = max(
-        1, data.get("image_fetch_max_attempts", settings_obj.image_fetch_max_attempts)
-    )
-    settings_obj.image_fetch_base_delay = max(
-        0.1, data.get("image_fetch_base_delay", settings_obj.image_fetch_base_delay)
+    settings_obj.save_max_delay = max(0.0, data.get("save_max_delay", settings_obj.save_max_delay))
+    settings_obj.chat_stream_frame_interval = max(
+        0.0, data.get("chat_stream_frame_interval", settings_obj.chat_stream_frame_interval)
     )
 
+    _apply_http_data(settings_obj, data)
+
     # Provider disable settings (with legacy migration)
     saved_disabled_providers = data.get("disabled_providers") or {}
     disabled_providers: dict[LlmProvider, bool] = {}
@@ -1547,8 +1963,9 @@ def __getattr__(name: str):  # type: ignore[misc]
 # -- Module-level helper functions (use _get_settings() for lazy access) ---------
 
 
-def _fetch_image_with_retry(url: str, headers: dict) -> requests.Response:
+def _fetch_image_with_retry(url: str, headers: dict) -> httpx.Response:
     """Fetch image with retry logic."""
+    from parllama.http_clients import http_clients
     from parllama.retry_utils import create_retry_config, retry_with_backoff
 
     _s = _get_settings()
@@ -1557,7 +1974,7 @@ def _fetch_image_with_retry(url: str, headers: dict) -> requests.Response:
         config=create_retry_config(max_attempts=_s.image_fetch_max_attempts, base_delay=_s.image_fetch_base_delay)
     )
     def _fetch():
-        return requests.get(url, headers=headers, timeout=_s.image_fetch_timeout)
+        return http_clients.client().get(url, headers=headers, timeout=_s.image_fetch_timeout)
 
     return _fetch()
 
@@ -1608,7 +2025,7 @@ def fetch_and_cache_image(image_path: str | Path) -> tuple[Path, bytes]:
                                 cache_file.unlink()
                             raise FileNotFoundError(f"Downloaded image failed validation: {e}") from e
 
-                except (requests.RequestException, OSError, FileValidationError) as e:
+                except (httpx.HTTPError, OSError, FileValidationError) as e:
                     raise FileNotFoundError(f"Failed to fetch image: {e}") from e
             else:
                 # Validate cached image if validation is enabled
@@ -0,0 +1,150 @@
+"""Fetches the ollama.com model catalog.
+
+Catalog pages are fetched concurrently over one async HTTP client. Each page's
+``ETag`` and ``Last-Modified`` headers are kept with the cached catalog and
+sent back as ``If-None-Match`` / ``If-Modified-Since``, so a page that has not
+changed costs a ``304 Not Modified`` and no parsing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from parllama.models.ollama_data import SiteModel, SiteModelData, SitePage
+from parllama.retry_utils import async_retry_with_backoff, create_retry_config
+
+SITE_URL = "https://ollama.com"
+SITE_CATEGORIES: tuple[str, ...] = ("popular", "featured", "newest")
+SITE_MODELS_MAX_AGE = timedelta(hours=24)
+"""How long a cached catalog is served without revalidating it."""
+
+
+def catalog_urls(namespace: str, category: str | None = None, base_url: str = SITE_URL) -> list[str]:
+    """Return the catalog page URLs of a namespace.
+
+    The ``models`` namespace has one page per category; any other namespace has a single page.
+
+    Args:
+        namespace: The ollama.com namespace, e.g. ``library``, ``models`` or a user name.
+        category: Only fetch this category of the ``models`` namespace.
+        base_url: The site to fetch from.
+    """
+    url = f"{base_url}/{namespace}"
+    if namespace != "models":
+        return [url]
+    return [f"{url}?sort={cat}" for cat in SITE_CATEGORIES if not category or category == cat]
+
+
+def is_fresh(data: SiteModelData, now: datetime | None = None) -> bool:
+    """Return whether a cached catalog is younger than ``SITE_MODELS_MAX_AGE``."""
+    return (now or datetime.now(UTC)) - data.last_update < SITE_MODELS_MAX_AGE
+
+
+def parse_catalog_page(html: str, url: str) -> list[SiteModel]:
+    """Parse the model cards of a catalog page."""
+    from bs4 import BeautifulSoup, Tag
+    from bs4.filter import SoupStrainer
+
+    # Only the model cards are parsed into a tree; the rest of the page is skipped.
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("li", class_="items-baseline"))
+    models: list[SiteModel] = []
+    for card in soup.find_all("li", class_="items-baseline"):
+        name = card.find("h2")
+        link = card.find("a")
+        if name is None or not isinstance(link, Tag):
+            continue
+        description = card.find("p")
+        num_pulls = num_tags = updated = ""
+        pres = card.find_all("span", class_=["flex", "items-center"], recursive=True)
+        for p in [p.text.strip() for p in pres]:
+            if "Pulls" in p:
+                num_pulls = p.split("\n")[0].strip()
+            if "Tags" in p:
+                num_tags = p.split("\xa0")[0].strip()
+            if "Updated" in p:
+                updated = p.split("\xa0")[-1].strip()
+        tags = card.find_all("span", class_=["text-blue-600"], recursive=True)
+        models.append(
+            SiteModel(
+                name=name.text.strip(),
+                description=description.text.strip() if description is not None else "",
+                url=f"{url}{link.get('href', '')}",
+                num_pulls=num_pulls,
+                num_tags=num_tags,
+                tags=[t for t in (t.text.strip() for t in tags) if t],
+                updated=updated,
+            )
+        )
+    return models
+
+
+def merge_pages(pages: list[SitePage]) -> list[SiteModel]:
+    """Return the models of all pages, keeping the first of each name."""
+    merged: dict[str, SiteModel] = {}
+    for page in pages:
+        for model in page.models:
+            merged.setdefault(model.name, model)
+    return list(merged.values())
+
+
+@async_retry_with_backoff(config=create_retry_config(max_attempts=2, base_delay=1.0))
+async def _get_page(client: httpx.AsyncClient, url: str, cached: SitePage | None) -> httpx.Response:
+    """GET a catalog page, conditional on the cached page's validators."""
+    headers = {"User-Agent": "Mozilla/5.0"}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    response = await client.get(url, headers=headers)
+    if response.status_code != httpx.codes.NOT_MODIFIED:
+        response.raise_for_status()
+    return response
+
+
+async def _fetch_page(client: httpx.AsyncClient, url: str, cached: SitePage | None) -> SitePage:
+    """Return a catalog page, reusing the cached page when the server reports it unchanged."""
+    response = await _get_page(client, url, cached)
+    if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+        return cached
+    models = await asyncio.to_thread(parse_catalog_page, response.text, url)
+    return SitePage(
+        models=models,
+        etag=response.headers.get("ETag", ""),
+        last_modified=response.headers.get("Last-Modified", ""),
+    )
+
+
+async def fetch_catalog(
+    client: httpx.AsyncClient,
+    namespace: str,
+    cached: SiteModelData | None = None,
+    *,
+    category: str | None = None,
+    base_url: str = SITE_URL,
+) -> SiteModelData:
+    """Fetch the catalog pages of a namespace concurrently.
+
+    Args:
+        client: The HTTP client to fetch with.
+        namespace: The ollama.com namespace.
+        cached: The cached catalog whose validators are sent and whose pages are reused when unchanged.
+        category: Only fetch this category of the ``models`` namespace.
+        base_url: The site to fetch from.
+
+    Returns:
+        The catalog, stamped with the current time.
+
+    Raises:
+        httpx.HTTPError: If a page could not be fetched.
+    """
+    urls = catalog_urls(namespace, category, base_url)
+    cached_pages = cached.pages if cached else {}
+    pages = await asyncio.gather(*(_fetch_page(client, url, cached_pages.get(url)) for url in urls))
+    return SiteModelData(
+        models=merge_pages(pages),
+        last_update=datetime.now(UTC),
+        pages=dict(zip(urls, pages, strict=True)),
+    )
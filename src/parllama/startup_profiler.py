@@ -0,0 +1,51 @@
+"""Per-phase startup timings reported by ``--profile-startup``."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+HEAVY_MODULES = ("litellm", "langchain_core", "bs4", "docker", "openai", "anthropic")
+"""Slow-to-import dependencies that should stay off the startup path where possible."""
+
+
+class StartupProfiler:
+    """Records how long each startup phase takes.
+
+    Each call to ``mark`` records the time since the previous mark, starting
+    from when this module was imported. ``finish`` records the last phase and
+    notes which heavy dependencies had been imported by then.
+    """
+
+    def __init__(self) -> None:
+        """Start timing from now."""
+        self.phases: list[tuple[str, float]] = []
+        self.loaded_modules: list[str] | None = None
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as ``phase``."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def finish(self, phase: str) -> None:
+        """Record the final phase and the heavy dependencies imported so far. Later calls are ignored."""
+        if self.loaded_modules is not None:
+            return
+        self.mark(phase)
+        self.loaded_modules = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    def report(self) -> str:
+        """Return the phase timings as a table."""
+        total = sum(duration for _, duration in self.phases)
+        lines = ["Startup profile:"]
+        for phase, duration in self.phases:
+            lines.append(f"  {phase:<24} {duration * 1000:9.1f}ms")
+        lines.append(f"  {'total':<24} {total * 1000:9.1f}ms")
+        if self.loaded_modules is not None:
+            lines.append(f"  heavy modules loaded: {', '.join(self.loaded_modules) or 'none'}")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler()
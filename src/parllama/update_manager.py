@@ -6,10 +6,10 @@ import logging
 from datetime import UTC, datetime
 
 import httpx
-import requests
 from semver import Version
 
 from parllama import __version__
+from parllama.http_clients import http_clients
 from parllama.message_sink import MessageSink
 from parllama.settings_manager import settings
 
@@ -31,11 +31,10 @@ class UpdateManager(MessageSink):
         self.log_it("Checking for updates...")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.url, follow_redirects=True, timeout=settings.update_check_timeout)
-                data = response.json()
+            response = await http_clients.async_client().get(self.url, timeout=settings.update_check_timeout)
+            data = response.json()
             return Version.parse(data["info"]["version"])
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ValueError("Could not fetch version info") from e
 
     async def check_for_updates(self, force: bool = False) -> None:
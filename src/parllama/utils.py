@@ -24,6 +24,7 @@ TabType: TypeAlias = Literal[
     "Execution",
     "Options",
     "Memory",
+    "Stats",
     #    "Secrets",
     # "Rag",
     "Logs",
@@ -38,6 +39,7 @@ valid_tabs: list[TabType] = [
     "Execution",
     "Options",
     "Memory",
+    "Stats",
     #    "Secrets",
     # "Rag",
     "Logs",
@@ -243,6 +245,40 @@ def get_args(argv: list[str] | None = None) -> Namespace:
         action="store_true",
     )
 
+    parser.add_argument(
+        "--profile-startup",
+        help="Print how long each startup phase took after the app exits",
+        default=False,
+        action="store_true",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    batch = subparsers.add_parser(
+        "batch",
+        help="Run prompts from a JSONL file against one or more models without the UI",
+        description="Run prompts from a JSONL file against one or more models without the UI.",
+    )
+    batch.add_argument(
+        "input",
+        help='JSONL file with one prompt per line: {"prompt": ..., "system": ...} or {"prompt_id": ...}',
+    )
+    batch.add_argument("-o", "--output", help="JSONL file to write results to. Defaults to stdout")
+    batch.add_argument(
+        "--model",
+        dest="batch_models",
+        action="append",
+        metavar="PROVIDER:MODEL",
+        help="Model to run each prompt against. Repeat for several. Defaults to the last used model",
+    )
+    batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum number of requests in flight. Defaults to 4",
+    )
+    batch.add_argument("--temperature", type=float, help="Sampling temperature. Defaults to the last used temperature")
+
     # Finally, parse the command line.
     return parser.parse_args(argv)
 
@@ -2,11 +2,74 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from textual.app import ComposeResult
 from textual.containers import VerticalScroll
+from textual.events import Resize
+from textual.widget import Widget
+
+from parllama.settings_manager import settings
+
+if TYPE_CHECKING:
+    from parllama.chat_message import ParllamaChatMessage
+    from parllama.chat_session import ChatSession
+    from parllama.widgets.chat_message_widget import ChatMessageWidget
+
+MESSAGE_CHROME_HEIGHT = 4
+"""Rows a message widget adds around its text: border, markdown padding and margin."""
+MESSAGE_CHROME_WIDTH = 6
+"""Columns a message widget takes from the list width: border, padding and scrollbar."""
+IMAGE_HEIGHT = 12
+"""Rows taken by a message's image preview."""
+
+
+def estimate_message_height(msg: ParllamaChatMessage, width: int) -> int:
+    """Estimate the rows a message widget occupies before it has been rendered.
+
+    Args:
+        msg: The message.
+        width: Width of the message list in columns.
+
+    Returns:
+        Estimated height in rows, including the widget's border and margin.
+    """
+    text_width = max(10, width - MESSAGE_CHROME_WIDTH)
+    rows = MESSAGE_CHROME_HEIGHT
+    for text in (msg.thinking, msg.content):
+        if text:
+            rows += sum(len(line) // text_width + 1 for line in text.splitlines())
+    if msg.images:
+        rows += IMAGE_HEIGHT
+    return rows
+
+
+class MessageSpacer(Widget):
+    """Blank space standing in for message widgets that are not mounted."""
+
+    DEFAULT_CSS = """
+    MessageSpacer {
+        width: 1fr;
+        height: 0;
+    }
+    """
 
 
 class ChatMessageList(VerticalScroll, can_focus=False, can_focus_children=True):
-    """Chat message list widget."""
+    """Virtualized list of a chat session's messages.
+
+    Only messages within ``settings.chat_render_margin`` rows of the viewport
+    have a mounted ``ChatMessageWidget``. The messages above and below that
+    window are represented by two spacers sized from the messages' measured
+    heights, or an estimate for messages not yet rendered at the current width.
+    Scrolling or resizing moves the window, mounting the widgets that come into
+    range and removing the ones that leave it.
+
+    Mounted message widgets register themselves in ``message_widgets`` so
+    streamed updates can find their widget without a DOM query.
+    """
 
     DEFAULT_CSS = """
     ChatMessageList {
@@ -14,6 +77,227 @@ class ChatMessageList(VerticalScroll, can_focus=False, can_focus_children=True):
     }
     """
 
+    messages: list[ParllamaChatMessage]
+    """All messages shown in the list, in display order."""
+    message_widgets: dict[str, ChatMessageWidget]
+    """Mounted message widgets by message id."""
+
     def __init__(self, **kwargs) -> None:
         """Initialise the view."""
         super().__init__(**kwargs)
+        self.session: ChatSession | None = None
+        self.messages = []
+        self.message_widgets = {}
+        self._heights: dict[str, int] = {}
+        self._estimates: dict[str, tuple[tuple[int, int, int, int, bool], int]] = {}
+        self._heights_width = 0
+        self._streaming: set[str] = set()
+        self._window = (0, 0)
+        self._follow_end = True
+        self._adjusting_scroll = False
+        self._refresh_pending = False
+        self._lock = asyncio.Lock()
+        self._top_spacer = MessageSpacer(id="top_spacer")
+        self._bottom_spacer = MessageSpacer(id="bottom_spacer")
+
+    def compose(self) -> ComposeResult:
+        """Compose the spacers the message widgets are mounted between."""
+        yield self._top_spacer
+        yield self._bottom_spacer
+
+    @property
+    def window(self) -> tuple[int, int]:
+        """Start and end index of the messages with a mounted widget."""
+        return self._window
+
+    def has_message(self, message_id: str) -> bool:
+        """Return True if the list contains the message, mounted or not."""
+        return self._index_of(message_id) is not None
+
+    async def set_messages(self, session: ChatSession, messages: Iterable[ParllamaChatMessage]) -> None:
+        """Replace the list's messages and show the newest ones.
+
+        Args:
+            session: Session the messages belong to.
+            messages: Messages to show, in display order.
+        """
+        async with self._lock:
+            await self._remove_widgets(list(self.message_widgets))
+            self.session = session
+            self.messages = list(messages)
+            self._heights.clear()
+            self._estimates.clear()
+            self._streaming.clear()
+            self._window = (0, 0)
+            self._follow_end = True
+            await self._update_window()
+
+    async def update_message(self, msg: ParllamaChatMessage, is_final: bool) -> ChatMessageWidget | None:
+        """Add a message to the list or re-render it after it changed.
+
+        System messages are added at the top of the list, others at the bottom.
+
+        Args:
+            msg: The new or changed message.
+            is_final: False while the message is still being streamed.
+
+        Returns:
+            The message's widget, or None if it is outside the rendered window.
+        """
+        async with self._lock:
+            if is_final or msg.role == "system":
+                self._streaming.discard(msg.id)
+            else:
+                self._streaming.add(msg.id)
+            widget = self.message_widgets.get(msg.id)
+            if widget is not None:
+                widget.is_final = msg.id not in self._streaming
+                await widget.update()
+                return widget
+            if self._index_of(msg.id) is None:
+                self.messages.insert(0 if msg.role == "system" else len(self.messages), msg)
+            else:
+                self._heights.pop(msg.id, None)
+            await self._update_window()
+            return self.message_widgets.get(msg.id)
+
+    async def remove_message(self, message_id: str) -> None:
+        """Remove a message and its widget, if mounted, from the list."""
+        async with self._lock:
+            index = self._index_of(message_id)
+            if index is None:
+                return
+            del self.messages[index]
+            self._heights.pop(message_id, None)
+            self._estimates.pop(message_id, None)
+            self._streaming.discard(message_id)
+            await self._remove_widgets([message_id])
+            await self._update_window()
+
+    def refresh_window(self) -> None:
+        """Schedule moving the rendered window to the current scroll position."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_after_refresh(self._refresh_window)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Follow new messages while scrolled to the end and move the rendered window."""
+        super().watch_scroll_y(old_value, new_value)
+        if new_value >= self.max_scroll_y:
+            self._follow_end = True
+        elif new_value < old_value and not self._adjusting_scroll:
+            self._follow_end = False
+        self.refresh_window()
+
+    def on_resize(self, event: Resize) -> None:
+        """Re-measure messages after the width changed and refill the viewport."""
+        self.refresh_window()
+
+    async def _refresh_window(self) -> None:
+        """Move the rendered window unless the list is being torn down."""
+        self._refresh_pending = False
+        if not self.is_attached:
+            return
+        async with self._lock:
+            await self._update_window()
+
+    def _index_of(self, message_id: str) -> int | None:
+        """Return the position of a message in the list."""
+        return next((i for i, m in enumerate(self.messages) if m.id == message_id), None)
+
+    def _measure(self) -> int:
+        """Record the heights of rendered message widgets.
+
+        Returns:
+            The width heights are measured at.
+        """
+        width = self.scrollable_content_region.width or self.app.size.width
+        if width != self._heights_width:
+            # Text wraps differently at the new width, so every cached height is stale.
+            self._heights.clear()
+            self._estimates.clear()
+            self._heights_width = width
+        for message_id, widget in self.message_widgets.items():
+            if widget.outer_size.height:
+                self._heights[message_id] = widget.outer_size.height + widget.styles.margin.height
+        return width
+
+    def _estimate(self, msg: ParllamaChatMessage, width: int) -> int:
+        """Return the estimated height of a message, cached until its text or the width changes."""
+        fingerprint = (len(msg.thinking), hash(msg.thinking), len(msg.content), hash(msg.content), bool(msg.images))
+        cached = self._estimates.get(msg.id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        height = estimate_message_height(msg, width)
+        self._estimates[msg.id] = (fingerprint, height)
+        return height
+
+    async def _update_window(self) -> None:
+        """Mount the widgets for messages near the viewport and drop the others."""
+        width = self._measure()
+        heights = [self._heights.get(m.id) or self._estimate(m, width) for m in self.messages]
+        viewport = self.scrollable_content_region.height or self.app.size.height
+        top = max(0, sum(heights) - viewport) if self._follow_end else round(self.scroll_y)
+        low = top - settings.chat_render_margin
+        high = top + viewport + settings.chat_render_margin
+        start = end = 0
+        offset = 0
+        for index, height in enumerate(heights):
+            if offset + height <= low:
+                start = index + 1
+            if offset < high:
+                end = index + 1
+            offset += height
+        end = max(start, end)
+        self._window = (start, end)
+
+        wanted = {m.id for m in self.messages[start:end]}
+        await self._remove_widgets([message_id for message_id in self.message_widgets if message_id not in wanted])
+        kept = [i for i in range(start, end) if self.messages[i].id in self.message_widgets]
+        first_kept = kept[0] if kept else end
+        last_kept = kept[-1] + 1 if kept else end
+        self._top_spacer.styles.height = sum(heights[:start])
+        self._bottom_spacer.styles.height = sum(heights[end:])
+        if first_kept > start:
+            before = self.message_widgets[self.messages[first_kept].id] if kept else self._bottom_spacer
+            prepended = self.messages[start:first_kept]
+            await self.mount_all([self._make_widget(m) for m in prepended], before=before)
+            if kept and not self._follow_end:
+                self.call_after_refresh(
+                    self._keep_scroll_position, [m.id for m in prepended], sum(heights[start:first_kept])
+                )
+        if last_kept < end:
+            await self.mount_all(
+                [self._make_widget(m) for m in self.messages[last_kept:end]], before=self._bottom_spacer
+            )
+        if self._follow_end:
+            self.scroll_end(animate=False)
+
+    def _keep_scroll_position(self, message_ids: list[str], expected_height: int) -> None:
+        """Compensate for widgets mounted above the viewport rendering taller or shorter than estimated."""
+        actual_height = 0
+        for message_id in message_ids:
+            widget = self.message_widgets.get(message_id)
+            if widget is None:
+                return
+            actual_height += widget.outer_size.height + widget.styles.margin.height
+        if actual_height == expected_height or self._follow_end:
+            return
+        self._adjusting_scroll = True
+        try:
+            self.scroll_to(y=self.scroll_y + actual_height - expected_height, animate=False, immediate=True)
+        finally:
+            self._adjusting_scroll = False
+
+    def _make_widget(self, msg: ParllamaChatMessage) -> ChatMessageWidget:
+        """Create the widget for a message."""
+        from parllama.widgets.chat_message_widget import ChatMessageWidget
+
+        assert self.session is not None
+        return ChatMessageWidget.mk_msg_widget(msg=msg, session=self.session, is_final=msg.id not in self._streaming)
+
+    async def _remove_widgets(self, message_ids: list[str]) -> None:
+        """Unmount the widgets of the given messages."""
+        widgets = [w for message_id in message_ids if (w := self.message_widgets.pop(message_id, None)) is not None]
+        if widgets:
+            await self.remove_children(widgets)
@@ -18,14 +18,11 @@ from textual.timer import Timer
 from textual.widgets import Markdown, Static, TextArea
 
 from parllama.chat_manager import ChatSession
-from parllama.chat_message import (
-    ParllamaChatMessage,
-    image_to_base64,
-    try_get_image_type,
-)
+from parllama.chat_message import ParllamaChatMessage
+from parllama.image_cache import image_cache
 from parllama.messages.messages import ChatContinueRequested, ExecuteMessageRequested, SendToClipboard
 from parllama.models.ollama_data import MessageRoles
-from parllama.settings_manager import fetch_and_cache_image
+from parllama.widgets.chat_message_list import ChatMessageList
 from parllama.widgets.par_markdown import ParMarkdown, ParMarkdownFence
 
 
@@ -99,24 +96,29 @@ class ChatMessageWidget(Vertical, can_focus=True):
         super().__init__(id=f"cm_{msg.id}", **kwargs)
         self.session = session
         self.msg = msg
-        self.markdown = ParMarkdown(self.markdown_raw if is_final else "")
         self.is_final = is_final
+        self._rendered_markdown = self.markdown_raw if is_final else ""
+        self.markdown = ParMarkdown(self._rendered_markdown)
         self.border_title = self.msg.role
+        self.border_subtitle = "cached" if self.msg.cached else ""
         self.fence_num: int = -1
         self._last_render_ts: float = 0.0
         self._pending_render_timer: Timer | None = None
+        self._message_list: ChatMessageList | None = None
         # if self.msg.images:
         #     self.border_subtitle = f"Image: {str(self.msg.images[0])}"
 
     async def on_mount(self):
         """Set up the widget once the DOM is ready."""
+        if isinstance(self.parent, ChatMessageList):
+            self._message_list = self.parent
+            self.parent.message_widgets[self.msg.id] = self
         # await self.update()
         if self.msg.images:
             try:
                 image = self.msg.images[0]
-                image_type = try_get_image_type(image)
                 if not image.startswith("data:"):
-                    image = image_to_base64(fetch_and_cache_image(image)[1], image_type)
+                    image = image_cache.encode(image)
                     self.msg.images[0] = image
                 png_bytes = base64.b64decode(image.split(",", maxsplit=2)[1])
                 image = Image.open(io.BytesIO(png_bytes))
@@ -168,11 +170,11 @@ class ChatMessageWidget(Vertical, can_focus=True):
     async def update(self) -> None:
         """Update the rendered markdown, throttling intermediate streaming frames.
 
-        During streaming (``is_final`` is False) ``ParMarkdown`` re-parses the
-        entire message on every chunk, which is O(n^2) work over a long
-        response. Intermediate renders are coalesced to at most one per
-        ``update_delay`` seconds; the final render (``is_final`` True) is always
-        performed immediately so the completed message is never left stale.
+        Intermediate renders during streaming (``is_final`` is False) are
+        coalesced to at most one per ``update_delay`` seconds; the final render
+        (``is_final`` True) is always performed immediately so the completed
+        message is never left stale. See ``_render_now`` for how each render
+        avoids re-parsing the whole message.
         """
         if self.is_final:
             self._cancel_pending_render()
@@ -188,10 +190,25 @@ class ChatMessageWidget(Vertical, can_focus=True):
             self._pending_render_timer = self.set_timer(self.update_delay - elapsed, self._render_now)
 
     async def _render_now(self) -> None:
-        """Render the current markdown content immediately."""
+        """Render the current markdown content immediately.
+
+        While the text only grows, just the new text is handed to the markdown
+        widget: completed blocks stay mounted untouched and only the last, still
+        open block is re-parsed and updated in place. Any other change (an edit,
+        or the thinking section being reformatted once the message completes)
+        re-renders the whole message.
+        """
         self._pending_render_timer = None
         self._last_render_ts = time.monotonic()
-        await self.markdown.update(self.markdown_raw)
+        self.border_subtitle = "cached" if self.msg.cached else ""
+        markdown = self.markdown_raw
+        rendered = self._rendered_markdown
+        self._rendered_markdown = markdown
+        if rendered and markdown.startswith(rendered):
+            if len(markdown) > len(rendered):
+                await self.markdown.append(markdown[len(rendered) :])
+        else:
+            await self.markdown.update(markdown)
 
     def _cancel_pending_render(self) -> None:
         """Cancel any scheduled trailing streaming render."""
@@ -283,6 +300,11 @@ class ChatMessageWidget(Vertical, can_focus=True):
         # Post message to request execution
         self.app.post_message(ExecuteMessageRequested(widget=self, message_id=self.msg.id, content=content))
 
+    def on_unmount(self) -> None:
+        """Remove the widget from its message list's registry."""
+        if self._message_list is not None and self._message_list.message_widgets.get(self.msg.id) is self:
+            del self._message_list.message_widgets[self.msg.id]
+
     @on(Mount)
     @on(Unmount)
     @on(Show)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
+
 from textual.binding import Binding
 from textual.containers import Grid
 from textual.reactive import Reactive
@@ -225,6 +227,37 @@ class LocalModelGridList(Grid, can_focus=False):
                 item.remove()
                 return
 
+    async def sync_items(self, items: Sequence[LocalModelListItem], updated: Collection[str] = ()) -> None:
+        """Show ``items`` in order, touching only the cards that changed.
+
+        Cards not in ``items`` are removed, new ones are mounted in place and the
+        rest are moved only if their position changed, so the selection and
+        scroll position survive a refresh.
+
+        Args:
+            items: The list items to show, in display order.
+            updated: Names of models whose card content must be re-rendered.
+        """
+        wanted = {id(item) for item in items}
+        stale = [child for child in self.children if id(child) not in wanted]
+        if self.selected is not None and id(self.selected) not in wanted:
+            self.selected = None
+        if stale:
+            await self.remove_children(stale)
+        if not self.children:
+            await self.mount_all(items)
+            return
+        for index, item in enumerate(items):
+            if item.parent is not self:
+                if index < len(self.children):
+                    await self.mount(item, before=index)
+                else:
+                    await self.mount(item)
+            elif self.children[index] is not item:
+                self.move_child(item, before=index)
+            if item.model.name in updated:
+                item.refresh_fields()
+
     def set_item_loading(self, model_name: str, loading: bool) -> None:
         """Set item loading state."""
         for item in self.query(LocalModelListItem):
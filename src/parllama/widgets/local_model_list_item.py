@@ -50,16 +50,28 @@ class LocalModelListItem(Widget, can_focus=True):
         if value and hasattr(self.parent, "selected"):
             self.parent.selected = self if value else None  # type: ignore
 
+    def _expires(self) -> str:
+        """Return the model's expiry for display."""
+        exp = str(self.model.expires_at)
+        if exp in ["None", "0001-01-01 00:00:00+00:00"]:
+            exp = "Never"
+        return exp
+
     def compose(self) -> ComposeResult:
         """Compose the list item."""
         self.border_title = self.model.name
         with Vertical():
             # yield FieldSet("Name", Static(self.model.name, message_id="name"))
             yield FieldSet("Modified", Static(str(self.model.modified_at), id="modified_at"))
-            exp = str(self.model.expires_at)
-            if exp in ["None", "0001-01-01 00:00:00+00:00"]:
-                exp = "Never"
-            yield FieldSet("Expires", Static(exp, id="expires_at"))
+            yield FieldSet("Expires", Static(self._expires(), id="expires_at"))
             yield FieldSet("Size", Static(humanize.naturalsize(self.model.size), id="size"))
             yield Static("Digest:")
             yield Static(self.model.digest, id="digest")
+
+    def refresh_fields(self) -> None:
+        """Show the current model data after ``model`` was replaced."""
+        self.border_title = self.model.name
+        self.query_one("#modified_at", Static).update(str(self.model.modified_at))
+        self.query_one("#expires_at", Static).update(self._expires())
+        self.query_one("#size", Static).update(humanize.naturalsize(self.model.size))
+        self.query_one("#digest", Static).update(self.model.digest)
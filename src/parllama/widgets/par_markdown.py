@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from contextlib import suppress
 from typing import Self
 
 import clipman
@@ -10,6 +11,9 @@ from markdown_it.token import Token
 from rich.syntax import Syntax
 from textual import events, on
 from textual.app import ComposeResult
+from textual.await_complete import AwaitComplete
+from textual.content import Content
+from textual.css.query import NoMatches
 from textual.message import Message
 from textual.widgets import Markdown, Static
 from textual.widgets._markdown import MarkdownFence
@@ -122,6 +126,11 @@ class ParMarkdownFence(MarkdownFence):
         self.border_title = token.info.capitalize()
         self.btn = FenceCopyButton(id="copy")
 
+    @classmethod
+    def highlight(cls, code: str, language: str, ansi: bool = False, dark: bool = False) -> Content:
+        """Skip the base class highlighting, fences are rendered by ``_block``."""
+        return Content(code)
+
     def _block(self) -> Syntax:
         return Syntax(
             self.code,
@@ -134,9 +143,22 @@ class ParMarkdownFence(MarkdownFence):
     def compose(self) -> ComposeResult:
         # Sanitize the lexer name to ensure it's a valid CSS class name
         lexer_class = sanitize_class_name(self.lexer) if self.lexer else ""
-        yield Static(self._block(), expand=True, shrink=False, classes=lexer_class)
+        yield Static(self._block(), expand=True, shrink=False, classes=lexer_class, id="fence-code")
         yield self.btn
 
+    async def _update_from_block(self, block: MarkdownBlock) -> None:
+        """Update this fence in place from a re-parse of the same, still growing, fence."""
+        if not isinstance(block, ParMarkdownFence):
+            await super()._update_from_block(block)
+            return
+        self._copy_context(block)
+        self.set_class(self.lexer in ["thinking", "think"], "thinking")
+        self.border_title = self.lexer.capitalize()
+        with suppress(NoMatches):
+            code = self.query_one("#fence-code", Static)
+            code.set_classes(sanitize_class_name(self.lexer) if self.lexer else "")
+            code.update(self._block())
+
     @on(FenceCopyButton.Pressed, "#copy")
     def on_copy_pressed(self, event: FenceCopyButton.Pressed) -> None:
         """Copy the code to the clipboard."""
@@ -182,6 +204,29 @@ class ParMarkdown(Markdown):
     }
     """
 
+    def update(self, markdown: str) -> AwaitComplete:
+        """Replace the document, then let ``append`` continue from its last block.
+
+        Textual's ``append`` re-parses from the start of the last top-level block,
+        but after a full ``update`` it only knows the last line. Recording where
+        the last block starts lets streamed text appended after an update extend
+        that block in place.
+
+        Args:
+            markdown: A string containing Markdown.
+
+        Returns:
+            An optionally awaitable object that completes once the blocks are mounted.
+        """
+        updated = super().update(markdown)
+
+        async def await_update() -> None:
+            await updated
+            blocks = self.query_children(MarkdownBlock)
+            self._last_parsed_line = blocks.last().source_range[0] if blocks else 0
+
+        return AwaitComplete(await_update())
+
     def get_block_class(self, block_name: str) -> type[MarkdownBlock]:
         """Get the block widget class.
 
@@ -0,0 +1,52 @@
+"""Message search result list item"""
+
+from __future__ import annotations
+
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.widgets import Label
+
+from parllama.search_index import SNIPPET_END, SNIPPET_START, SearchHit
+from parllama.widgets.dbl_click_list_item import DblClickListItem
+
+
+def snippet_text(snippet: str) -> Text:
+    """Render a search snippet with its matched terms highlighted."""
+    text = Text()
+    for i, part in enumerate(snippet.replace("\n", " ").split(SNIPPET_START)):
+        if i == 0:
+            text.append(part)
+            continue
+        match, _, rest = part.partition(SNIPPET_END)
+        text.append(match, style="bold reverse")
+        text.append(rest)
+    return text
+
+
+class SearchResultItem(DblClickListItem, can_focus=False, can_focus_children=True):
+    """Message search result list item"""
+
+    DEFAULT_CSS = """
+    SearchResultItem {
+      height: auto;
+      max-height: 5;
+      width: 1fr;
+      padding-left: 1;
+      padding-right: 1;
+    }
+    """
+    hit: SearchHit
+
+    def __init__(self, hit: SearchHit, **kwargs) -> None:
+        """Initialise the view."""
+        super().__init__(**kwargs)
+        self.hit = hit
+
+    def compose(self) -> ComposeResult:
+        """Compose the content of the view."""
+        with Vertical():
+            yield Label(
+                Text.assemble((self.hit.container_name, "bold"), " ", (f"{self.hit.kind} / {self.hit.role}", "dim"))
+            )
+            yield Label(snippet_text(self.hit.snippet))
@@ -22,6 +22,7 @@ from parllama.messages.messages import (
     UnRegisterForUpdates,
     UpdateChatStatus,
 )
+from parllama.model_warmer import model_warmer
 from parllama.settings_manager import settings
 from parllama.widgets.input_blur_submit import InputBlurSubmit
 from parllama.widgets.provider_model_select import ProviderModelSelect
@@ -271,6 +272,7 @@ SessionConfig {
         self.session.llm_config.base_url = settings.provider_base_urls[event.provider]
         self.session.llm_provider_name = event.provider
         self.session.llm_model_name = event.model_name
+        model_warmer.warm(self.session.llm_config)
         self.post_message(UpdateChatStatus())
 
     @on(Select.Changed, "#reasoning_effort")
@@ -5,21 +5,25 @@ from __future__ import annotations
 from functools import partial
 from typing import cast
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
-from textual.widgets import ListView, Rule, Static
+from textual.widgets import Input, ListView, Rule, Static
 
 from parllama.chat_manager import chat_manager
 from parllama.messages.messages import (
     DeleteSession,
+    PromptSelected,
     RegisterForUpdates,
     SessionListChanged,
     SessionSelected,
     UnRegisterForUpdates,
 )
+from parllama.search_index import SearchHit, search_index
 from parllama.widgets.dbl_click_list_item import DblClickListItem
+from parllama.widgets.filter_input import FilterInput
+from parllama.widgets.search_result_item import SearchResultItem
 from parllama.widgets.session_list_item import SessionListItem
 
 
@@ -51,11 +55,16 @@ class SessionList(Vertical, can_focus=False, can_focus_children=True):
         ),
     ]
     list_view: ListView
+    search_input: FilterInput
+    results_view: ListView
 
     def __init__(self, **kwargs) -> None:
         """Initialise the view."""
         super().__init__(**kwargs)
         self.list_view = ListView(initial_index=None)
+        self.search_input = FilterInput(id="session_search", placeholder="Search messages")
+        self.results_view = ListView(initial_index=None, id="search_results")
+        self.results_view.display = False
         self._refresh_scheduled = False
         self._selected_session_id: str | None = None
 
@@ -70,14 +79,43 @@ class SessionList(Vertical, can_focus=False, can_focus_children=True):
     def compose(self) -> ComposeResult:
         """Compose the content of the view."""
         yield Static("Sessions")
+        yield self.search_input
         yield Rule()
 
         with self.list_view:
             for s in chat_manager.sorted_sessions:
                 yield SessionListItem(s)
+        yield self.results_view
+
+    @on(Input.Changed, "#session_search")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Search session and prompt messages as the query changes."""
+        event.stop()
+        self.search_messages(event.value)
+
+    @work(exclusive=True, thread=True, group="session_search")
+    def search_messages(self, query: str) -> None:
+        """Run a message search off the UI thread."""
+        hits = search_index.search(query) if query.strip() else None
+        self.app.call_from_thread(self.show_search_results, query, hits)
+
+    async def show_search_results(self, query: str, hits: list[SearchHit] | None) -> None:
+        """Show search hits in place of the session list, or restore it when the query is cleared."""
+        if query != self.search_input.value:
+            return  # a newer search is on its way
+        if hits is None:
+            self.results_view.display = False
+            self.list_view.display = True
+            return
+        await self.results_view.clear()
+        await self.results_view.extend(SearchResultItem(hit) for hit in hits)
+        self.list_view.display = False
+        self.results_view.display = True
 
     def action_delete_item(self) -> None:
         """Handle delete item action."""
+        if self.results_view.display:
+            return
         selected_item: SessionListItem = cast(SessionListItem, self.list_view.highlighted_child)
         if not selected_item:
             return
@@ -128,9 +166,26 @@ class SessionList(Vertical, can_focus=False, can_focus_children=True):
                 return True
         return False
 
+    def _load_search_hit(self, new_tab: bool) -> None:
+        """Open the highlighted search hit, or the best hit if none is highlighted."""
+        selected = self.results_view.highlighted_child
+        if not isinstance(selected, SearchResultItem):
+            selected = next(iter(self.results_view.query(SearchResultItem)), None)
+        if selected is None:
+            return
+        hit = selected.hit
+        if hit.kind == "prompt":
+            self.app.post_message(PromptSelected(prompt_id=hit.container_id))
+        else:
+            self.app.post_message(SessionSelected(hit.container_id, new_tab=new_tab))
+        self.display = False
+
     @on(DblClickListItem.DoubleClicked)
     def action_load_item(self) -> None:
         """Handle list view selected event."""
+        if self.results_view.display:
+            self._load_search_hit(new_tab=False)
+            return
         selected_item: SessionListItem = cast(SessionListItem, self.list_view.highlighted_child)
         if not selected_item:
             return
@@ -139,6 +194,9 @@ class SessionList(Vertical, can_focus=False, can_focus_children=True):
 
     def action_load_item_new(self) -> None:
         """Handle list view selected event."""
+        if self.results_view.display:
+            self._load_search_hit(new_tab=True)
+            return
         selected_item: SessionListItem = cast(SessionListItem, self.list_view.highlighted_child)
         if not selected_item:
             return
@@ -40,5 +40,6 @@ class SessionListItem(DblClickListItem, can_focus=False, can_focus_children=True
                 Text.assemble(
                     "Last updated: ",
                     self.session.last_updated.strftime("%Y-%m-%d %H:%M:%S"),
+                    f"  Messages: {self.session.message_count}",
                 )
             )
@@ -20,6 +20,7 @@ from textual.widgets import Static, TabbedContent, TabPane
 
 from parllama.chat_manager import ChatSession, chat_manager
 from parllama.chat_message import ParllamaChatMessage
+from parllama.generation_scheduler import generation_scheduler
 from parllama.llm_session_helpers import llm_summarize_session
 from parllama.messages.messages import (
     ChatContinueRequested,
@@ -34,6 +35,7 @@ from parllama.messages.messages import (
     UpdateChatStatus,
     UpdateTabLabel,
 )
+from parllama.model_warmer import model_warmer
 from parllama.models.ollama_data import FullModel, MessageRoles
 from parllama.ollama_data_manager import ollama_dm
 from parllama.provider_manager import provider_manager
@@ -90,6 +92,7 @@ class ChatTab(TabPane):
         )
 
         self.session_status_bar = Static("", id="SessionStatusBar")
+        self._queue_status_shown = False
 
     @property
     def session(self) -> ChatSession:
@@ -113,19 +116,18 @@ class ChatTab(TabPane):
         yield self.session_config
         with Vertical(id="main"):
             yield self.session_status_bar
-            with self.vs:
-                yield from [
-                    ChatMessageWidget.mk_msg_widget(msg=m, session=self.session, is_final=True)
-                    for m in self.session.messages
-                ]
+            yield self.vs
 
     async def on_mount(self) -> None:
         """Set up the dialog once the DOM is ready."""
+        await self.vs.set_messages(self.session, self.session.messages)
         self.notify_tab_label_changed()
+        self.set_interval(1.0, self._update_queue_status)
 
     def _on_show(self, event: Show) -> None:
         """Handle show event"""
         self._watch_busy(self.busy)
+        self._activate_session()
         with self.screen.prevent(TabbedContent.TabActivated):
             self.user_input.focus()
         self.set_timer(0.1, self.update_session_select)
@@ -147,7 +149,8 @@ class ChatTab(TabPane):
         """Start new session"""
         # self.notify("New session")
         await self.session_config.action_new_session(session_name)
-        await self.vs.remove_children(ChatMessageWidget)
+        self._activate_session()
+        await self.vs.set_messages(self.session, [])
         self.update_control_states()
         self.on_update_chat_status()
         self.notify_tab_label_changed()
@@ -172,10 +175,9 @@ class ChatTab(TabPane):
             self.notify("Chat session id mismatch", severity="error")
             return
 
-        for w in cast(list[ChatMessageWidget], self.query(f"#cm_{event.message_id}")):
-            await w.remove()
+        if self.vs.has_message(event.message_id):
+            await self.vs.remove_message(event.message_id)
             self.on_update_chat_status()
-            break
 
     @on(ChatMessage)
     async def on_chat_message(self, event: ChatMessage) -> None:
@@ -189,25 +191,18 @@ class ChatTab(TabPane):
             self.notify("Chat message not found", severity="error")
             return
 
-        msg_widget: ChatMessageWidget | None = None
-        for w in cast(list[ChatMessageWidget], self.query(f"#cm_{msg.id}")):
-            msg_widget = w
-            w.is_final = event.is_final or w.role == "system"
-            await w.update()
-            break
-        if not msg_widget:
-            msg_widget = ChatMessageWidget.mk_msg_widget(msg=msg, session=self.session, is_final=event.is_final)
-            if msg.role == "system":
-                await self.vs.mount(msg_widget, before=0)
-            else:
-                await self.vs.mount(msg_widget)
-        msg_widget.loading = (len(msg_widget.msg.thinking or "") + len(msg_widget.msg.content or "")) == 0
+        is_new = not self.vs.has_message(msg.id)
+        msg_widget = await self.vs.update_message(msg, event.is_final)
+        if msg_widget is not None:
+            msg_widget.loading = (len(msg.thinking or "") + len(msg.content or "")) == 0
 
         if self.user_input.child_has_focus:
             self.set_timer(0.1, self.scroll_to_bottom)
 
         # chat_manager.notify_sessions_changed()
-        self.on_update_chat_status()
+        # The status bar looks up model metadata, so skip it for intermediate streamed chunks.
+        if is_new or event.is_final:
+            self.on_update_chat_status()
 
     def scroll_to_bottom(self, animate: bool = True) -> None:
         """Scroll to the bottom of the chat window."""
@@ -315,13 +310,8 @@ class ChatTab(TabPane):
 
         if not await self.session_config.load_session(session_id):
             return
-        await self.vs.remove_children(ChatMessageWidget)
-        await self.vs.mount(
-            *[
-                ChatMessageWidget.mk_msg_widget(msg=m, session=self.session, is_final=True)
-                for m in self.session.messages
-            ]
-        )
+        self._activate_session()
+        await self.vs.set_messages(self.session, self.session.messages)
         self.set_timer(0.25, partial(self.scroll_to_bottom, False))
         self.update_control_states()
         self.notify_tab_label_changed()
@@ -347,13 +337,7 @@ class ChatTab(TabPane):
                         tool_calls=m.tool_calls,
                     )
                 )
-        await self.vs.remove_children(ChatMessageWidget)
-        await self.vs.mount(
-            *[
-                ChatMessageWidget.mk_msg_widget(msg=m, session=self.session, is_final=True)
-                for m in self.session.messages
-            ]
-        )
+        await self.vs.set_messages(self.session, self.session.messages)
 
         self.set_timer(0.25, partial(self.scroll_to_bottom, False))
         self.session_config.display = False
@@ -406,29 +390,47 @@ class ChatTab(TabPane):
             str_ellipsis(self.session.llm_model_name, 25, ""),
             " : CTX Len: ",
             humanize.intcomma(int(self.session.context_length / 3)),
-            " / ",
-            humanize.intcomma(
-                self.session.llm_config.num_ctx
-                or (
-                    provider_manager.get_model_context_length(
-                        self.session.llm_provider_name, self.session.llm_model_name
-                    )
-                )
-            ),
         ]
+        max_context_length = self.session.llm_config.num_ctx or provider_manager.get_model_context_length(
+            self.session.llm_provider_name, self.session.llm_model_name
+        )
+        if max_context_length:
+            parts.append(f" / {humanize.intcomma(max_context_length)}")
 
         stats = self.session.stats
         if stats:
             if stats.eval_count:
-                parts.append(f" | Res Tkns / Sec: {stats.eval_count / (stats.eval_duration or 1):.1f}")
+                parts.append(f" | Res Tkns / Sec: {stats.eval_rate:.1f}")
+
+        context_stats = self.session.context_stats
+        if context_stats and context_stats.trimmed_messages:
+            verb = "Summarized" if context_stats.summarized else "Trimmed"
+            parts.append(f" | {verb}: {context_stats.trimmed_messages} msgs")
 
         total_cost = self.session.total_cost
         if total_cost > 0:
             parts.append(f" | Cost: ${total_cost:.4f}")
 
+        queue_status = generation_scheduler.status(self.session.id)
+        self._queue_status_shown = queue_status is not None
+        if queue_status:
+            parts.append(
+                f" | Queued: {queue_status.position} of {queue_status.waiting}, waiting {queue_status.wait_time:.0f}s"
+            )
+
         self.session_status_bar.update(Text.assemble(*parts))
         self.update_control_states()
 
+    def _activate_session(self) -> None:
+        """Give this tab's generations priority and preload its model."""
+        generation_scheduler.focus(self.session.id)
+        model_warmer.warm(self.session.llm_config)
+
+    def _update_queue_status(self) -> None:
+        """Refresh the status bar while this tab's generation is waiting for a slot."""
+        if self._queue_status_shown or generation_scheduler.status(self.session.id) is not None:
+            self.on_update_chat_status()
+
     async def action_delete_msg(self) -> None:
         """Handle the delete message action."""
         ret = self.vs.query("ChatMessageWidget:focus")
@@ -436,7 +438,7 @@ class ChatTab(TabPane):
             return
         msg: ChatMessageWidget = cast(ChatMessageWidget, ret[0])
         del self.session[msg.msg.id]
-        await msg.remove()
+        await self.vs.remove_message(msg.msg.id)
         self.session.save()
         self.on_update_chat_status()
         if len(self.session) == 0:
@@ -25,6 +25,7 @@ from textual.widgets import Button, ContentSwitcher, Select, TabbedContent
 from parllama.chat_manager import ChatSession, chat_manager
 from parllama.chat_message import ParllamaChatMessage
 from parllama.dialogs.information import InformationDialog
+from parllama.dialogs.model_compare_dialog import ModelCompareDialog
 from parllama.messages.messages import (
     ChangeTab,
     ChatContinueRequested,
@@ -46,6 +47,7 @@ from parllama.messages.messages import (
     UpdateChatControlStates,
     UpdateTabLabel,
 )
+from parllama.model_comparison import ModelComparison
 from parllama.provider_manager import provider_manager
 from parllama.settings_manager import settings
 from parllama.widgets.session_config import SessionConfig
@@ -72,6 +74,7 @@ valid_commands: list[str] = [
     "/session.system_prompt",
     "/session.clear_system_prompt",
     "/session.to_prompt",
+    "/session.compare ",
     "/history.clear",
     "/add.image",
     "/prompt.load ",
@@ -375,6 +378,7 @@ Chat Commands:
 /session.system_prompt [system_prompt] - Set system prompt in current tab
 /session.clear_system_prompt - Remove system prompt in current tab
 /session.to_prompt submit_on_load [prompt_name] - Copy current session to new custom prompt. submit_on_load = {0|1}
+/session.compare provider:model[, provider:model...] - Answer the last user message with the current and listed models side by side
 /prompt.load prompt_name - Load a custom prompt using current tabs model and temperature
 /add.image image_path_or_url prompt (required) - Add an image via path or url to the active chat session
 /history.clear - Clear chat input history
@@ -550,6 +554,34 @@ Chat Commands:
             )
         )
 
+    async def _cmd_session_compare_arg(self, raw_arg: str, cmd_arg: str) -> None:
+        llm_configs = [self.session.llm_config.clone()]
+        for spec in raw_arg.split(","):
+            provider_part, sep, model_part = spec.strip().partition(":")
+            provider_name = get_provider_name_fuzzy(provider_part.strip())
+            if not sep or not provider_name:
+                self.notify(
+                    f"Expected provider:model, got '{spec.strip()}'. Usage: /session.compare provider:model[, ...]",
+                    severity="error",
+                )
+                return
+            provider = provider_name_to_enum(provider_name)
+            model_name = provider_manager.get_model_name_fuzzy(provider, model_part.strip())
+            if not model_name:
+                self.notify(f"Model {model_part.strip()} not found for {provider_name}", severity="error")
+                return
+            llm_config = self.session.llm_config.clone()
+            llm_config.provider = provider
+            llm_config.model_name = model_name
+            llm_config.base_url = settings.provider_base_urls[provider]
+            llm_configs.append(llm_config)
+        try:
+            comparison = ModelComparison(self.session.messages, llm_configs)
+        except ValueError as e:
+            self.notify(str(e), severity="error")
+            return
+        await self.app.push_screen(ModelCompareDialog(comparison))
+
     async def _cmd_prompt_load_arg(self, raw_arg: str, cmd_arg: str) -> None:
         v = cmd_arg.strip()
         prompt = chat_manager.get_prompt_by_name(v)
@@ -626,6 +658,7 @@ Chat Commands:
         "session.name": _cmd_session_name_arg,
         "session.to_prompt": _cmd_session_to_prompt_arg,
         "session.system_prompt": _cmd_session_system_prompt_arg,
+        "session.compare": _cmd_session_compare_arg,
         "prompt.load": _cmd_prompt_load_arg,
         "add.image": _cmd_add_image_arg,
         "remember": _cmd_remember_arg,
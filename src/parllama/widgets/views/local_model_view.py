@@ -11,7 +11,6 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.events import Focus, Show
 from textual.screen import ScreenResultCallbackType
-from textual.widget import Widget
 from textual.widgets import Input, Select, TabbedContent
 
 from parllama.dialogs.input_dialog import InputDialog
@@ -188,23 +187,11 @@ class LocalModelView(Container):
         self.post_message(LocalModelPushRequested(widget=self, model_name=model_name))
 
     @on(LocalModelListLoaded)
-    def on_model_data_loaded(self, event: LocalModelListLoaded) -> None:
-        """Rebuild model grid."""
+    async def on_model_data_loaded(self, event: LocalModelListLoaded) -> None:
+        """Patch the model grid with the refreshed models."""
 
         event.stop()
-
-        # model_name: str = ""
-        # if self.grid.selected:
-        #     model_name = self.grid.selected.model.name
-
-        to_remove: list[Widget] = []
-        for child in self.grid.children:
-            if isinstance(child, LocalModelListItem):
-                to_remove.append(child)
-        for child in to_remove:
-            child.remove()
-
-        self.grid.mount(*ollama_dm.models)
+        await self.grid.sync_items(ollama_dm.models, event.changes.updated if event.changes else ())
         self.grid.loading = False
         if self.search_input.value:
             self.grid.filter(self.search_input.value)
@@ -0,0 +1,161 @@
+"""Widget for viewing generation latency and throughput telemetry."""
+
+from __future__ import annotations
+
+import time
+
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.events import Show
+from textual.widgets import Button, DataTable, Label, Select
+
+from parllama.generation_telemetry import LatencySummary, SummaryPeriod, generation_telemetry
+from parllama.http_clients import HostStats, http_clients
+
+PERIOD_OPTIONS: list[tuple[str, SummaryPeriod]] = [("Per day", "day"), ("Per week", "week"), ("All time", "all")]
+RANGE_OPTIONS: list[tuple[str, int]] = [("Last 7 days", 7), ("Last 30 days", 30), ("Last 90 days", 90), ("All", 0)]
+
+STATS_COLUMNS = (
+    "Provider",
+    "Model",
+    "Host",
+    "Period",
+    "Runs",
+    "TTFT p50",
+    "TTFT p95",
+    "Latency p50",
+    "Latency p95",
+    "Tok/s p50",
+    "Tok/s p95",
+    "Tok/s change",
+)
+
+HTTP_COLUMNS = ("Host", "Requests", "Errors", "Avg", "Max")
+
+
+def stats_rows(summaries: list[LatencySummary]) -> list[tuple[str, ...]]:
+    """Format summaries as table rows.
+
+    The last column is the change in p50 throughput from the previous period
+    of the same model on the same host, which makes regressions easy to spot.
+    """
+    rows: list[tuple[str, ...]] = []
+    previous: LatencySummary | None = None
+    for s in summaries:
+        change = ""
+        if (
+            previous is not None
+            and (previous.provider, previous.model, previous.host) == (s.provider, s.model, s.host)
+            and previous.tokens_per_second_p50 > 0
+        ):
+            change = f"{(s.tokens_per_second_p50 / previous.tokens_per_second_p50 - 1) * 100:+.0f}%"
+        rows.append(
+            (
+                s.provider,
+                s.model,
+                s.host,
+                s.period,
+                str(s.count),
+                f"{s.ttft_p50:.2f}s",
+                f"{s.ttft_p95:.2f}s",
+                f"{s.latency_p50:.2f}s",
+                f"{s.latency_p95:.2f}s",
+                f"{s.tokens_per_second_p50:.1f}",
+                f"{s.tokens_per_second_p95:.1f}",
+                change,
+            )
+        )
+        previous = s
+    return rows
+
+
+def http_rows(hosts: list[HostStats]) -> list[tuple[str, ...]]:
+    """Format per-host HTTP request metrics as table rows."""
+    return [
+        (h.host, str(h.requests), str(h.errors), f"{h.avg_time * 1000:.0f}ms", f"{h.max_time * 1000:.0f}ms")
+        for h in hosts
+    ]
+
+
+class StatsView(Vertical):
+    """Widget for viewing per-model generation latency and throughput over time."""
+
+    DEFAULT_CSS = """
+    StatsView {
+        #tool_bar {
+            height: 3;
+            background: $surface-darken-1;
+            Label {
+                margin-top: 1;
+                background: transparent;
+            }
+            Select {
+                width: 20;
+            }
+        }
+        #stats_table {
+            height: 1fr;
+            border: solid $primary;
+        }
+        #http_table {
+            height: auto;
+            max-height: 12;
+            border: solid $primary;
+            border-title-align: left;
+        }
+    }
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """Initialise the view."""
+        super().__init__(**kwargs)
+        self.period_select = Select[SummaryPeriod](PERIOD_OPTIONS, value="day", allow_blank=False, id="period")
+        self.range_select = Select[int](RANGE_OPTIONS, value=30, allow_blank=False, id="range")
+        self.table = DataTable(id="stats_table", cursor_type="row", zebra_stripes=True)
+        self.http_table = DataTable(id="http_table", cursor_type="row", zebra_stripes=True)
+        self.http_table.border_title = "HTTP (this session)"
+
+    def compose(self) -> ComposeResult:
+        """Compose the content of the view."""
+        with Horizontal(id="tool_bar"):
+            yield Label("Group: ")
+            yield self.period_select
+            yield Label("Range: ")
+            yield self.range_select
+            yield Button("Refresh", id="refresh", variant="primary")
+        yield self.table
+        yield self.http_table
+
+    def on_mount(self) -> None:
+        """Set up the table columns."""
+        self.table.add_columns(*STATS_COLUMNS)
+        self.http_table.add_columns(*HTTP_COLUMNS)
+
+    def _on_show(self, event: Show) -> None:
+        """Reload the stats when the tab is shown."""
+        self.screen.sub_title = "Stats"  # pylint: disable=attribute-defined-outside-init
+        self.load_stats()
+
+    @on(Select.Changed)
+    @on(Button.Pressed, "#refresh")
+    def on_options_changed(self) -> None:
+        """Reload the stats with the selected grouping and range."""
+        self.load_stats()
+
+    @work(thread=True, exclusive=True, group="stats")
+    def load_stats(self) -> None:
+        """Summarize the telemetry off the UI thread."""
+        days = self.range_select.value if isinstance(self.range_select.value, int) else 0
+        since = time.time() - days * 86400 if days else None
+        period: SummaryPeriod = self.period_select.value if isinstance(self.period_select.value, str) else "day"
+        rows = stats_rows(generation_telemetry.summary(period, since))
+        self.app.call_from_thread(self.show_stats, rows, http_rows(http_clients.host_stats()))
+
+    def show_stats(self, rows: list[tuple[str, ...]], http: list[tuple[str, ...]]) -> None:
+        """Replace the table contents."""
+        self.table.clear()
+        self.table.add_rows(rows)
+        self.border_subtitle = "" if rows else "No generations recorded yet"
+        self.http_table.clear()
+        self.http_table.add_rows(http)
@@ -55,3 +55,32 @@ def test_session_router_forwards_chat_message_to_chat_view() -> None:
     assert forwarded.parent_id == "p1"
     assert forwarded.message_id == "m1"
     assert forwarded.is_final is True
+
+
+def test_session_router_coalesces_streamed_chunks_per_frame() -> None:
+    """Intermediate chunk updates are forwarded once per message when the frame timer fires."""
+    app = MagicMock()
+    router = SessionEventRouter(app)
+    for _ in range(5):
+        router.chat_message(ChatMessage(parent_id="p1", message_id="m1"))
+    router.chat_message(ChatMessage(parent_id="p1", message_id="m2"))
+
+    app.main_screen.chat_view.post_message.assert_not_called()
+    app.set_timer.assert_called_once()
+    flush = app.set_timer.call_args[0][1]
+    flush()
+
+    forwarded = [c[0][0] for c in app.main_screen.chat_view.post_message.call_args_list]
+    assert [(f.message_id, f.is_final) for f in forwarded] == [("m1", False), ("m2", False)]
+
+
+def test_session_router_final_chunk_replaces_pending_update() -> None:
+    """A final update is forwarded immediately and supersedes the pending chunk update."""
+    app = MagicMock()
+    router = SessionEventRouter(app)
+    router.chat_message(ChatMessage(parent_id="p1", message_id="m1"))
+    router.chat_message(ChatMessage(parent_id="p1", message_id="m1", is_final=True))
+    app.set_timer.call_args[0][1]()
+
+    forwarded = [c[0][0] for c in app.main_screen.chat_view.post_message.call_args_list]
+    assert [(f.message_id, f.is_final) for f in forwarded] == [("m1", True)]
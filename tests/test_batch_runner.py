@@ -0,0 +1,133 @@
+"""Tests for the headless batch runner."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import orjson as json
+import pytest
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.batch_runner import BatchRunner, load_batch_items, parse_model_spec, run_batch
+from parllama.settings_manager import settings
+from parllama.utils import get_args
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def quiet_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", False)
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+    monkeypatch.setattr(settings, "ollama_native_chat", False)
+
+
+class EchoChatModel:
+    """Chat model replying with the model name and the last message."""
+
+    def __init__(self, model_name: str) -> None:
+        self.name = model_name
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        for chunk in (self.name, ": ", messages[-1][1]):
+            yield AIMessageChunk(content=chunk)
+
+
+def _write_jsonl(path: Path, *lines: dict[str, Any]) -> Path:
+    path.write_text("\n".join(json.dumps(line).decode() for line in lines) + "\n\n", encoding="utf-8")
+    return path
+
+
+def test_items_are_read_from_prompts_and_custom_prompts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inline prompts get an optional system message; custom prompts are sent with their saved messages."""
+    monkeypatch.setattr(settings, "prompt_dir", tmp_path)
+    saved = {
+        "id": "p1",
+        "name": "Pirate",
+        "last_updated": "2026-01-01T00:00:00",
+        "messages": [{"role": "system", "content": "Talk like a pirate"}, {"role": "user", "content": "Greet me"}],
+    }
+    (tmp_path / "p1.json").write_bytes(json.dumps(saved))
+    path = _write_jsonl(
+        tmp_path / "in.jsonl",
+        {"id": "q", "system": "Be terse", "prompt": "2 + 2?"},
+        {"prompt_id": "p1"},
+    )
+
+    items = load_batch_items(path)
+
+    assert [item.id for item in items] == ["q", "2"]
+    assert [(m.role, m.content) for m in items[0].messages] == [("system", "Be terse"), ("user", "2 + 2?")]
+    assert [m.content for m in items[1].messages] == ["Talk like a pirate", "Greet me"]
+
+    with pytest.raises(ValueError, match="not found"):
+        load_batch_items(_write_jsonl(tmp_path / "bad.jsonl", {"prompt_id": "missing"}))
+    with pytest.raises(ValueError, match="no user message"):
+        load_batch_items(_write_jsonl(tmp_path / "bad.jsonl", {"system": "only"}))
+
+
+def test_model_specs_and_cli_arguments() -> None:
+    config = parse_model_spec("ollama:llama3.2:1b", temperature=0.0)
+    assert (config.provider, config.model_name, config.temperature) == (LlmProvider.OLLAMA, "llama3.2:1b", 0.0)
+    with pytest.raises(ValueError):
+        parse_model_spec("llama3.2")
+
+    args = get_args(["batch", "in.jsonl", "--model", "ollama:a", "--model", "openai:b", "-w", "8"])
+    assert (args.command, args.input, args.batch_models, args.workers) == (
+        "batch",
+        "in.jsonl",
+        ["ollama:a", "openai:b"],
+        8,
+    )
+    assert get_args([]).command is None
+
+
+@pytest.mark.anyio
+async def test_every_prompt_runs_against_every_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each prompt and model pair yields one result, with no more requests in flight than workers."""
+    in_flight = peak = 0
+
+    class CountingModel(EchoChatModel):
+        async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            async for chunk in super().astream(messages, config):
+                yield chunk
+            in_flight -= 1
+
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: CountingModel(self.model_name))
+    items = load_batch_items(_write_jsonl(tmp_path / "in.jsonl", *({"prompt": f"q{i}"} for i in range(3))))
+    configs = [parse_model_spec("ollama:a"), parse_model_spec("openai:b")]
+    streamed: list[str] = []
+
+    results, summary = await BatchRunner(items, configs, workers=2).run(lambda r: streamed.append(r.id))
+
+    assert sorted((r.id, r.model, r.content) for r in results) == [
+        (str(i + 1), model, f"{model}: q{i}") for i in range(3) for model in ("a", "b")
+    ]
+    assert all(r.state == "done" for r in results)
+    assert len(streamed) == 6 and peak <= 2
+    assert (summary.requests, summary.failed, summary.output_tokens) == (6, 0, 18)
+
+
+def test_run_batch_writes_jsonl_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: Any) -> None:
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: EchoChatModel(self.model_name))
+    monkeypatch.setattr("parllama.batch_runner._load_environment", lambda: None)
+    source = _write_jsonl(tmp_path / "in.jsonl", {"id": "x", "prompt": "hello"})
+    output = tmp_path / "out.jsonl"
+    args = get_args(["batch", str(source), "-o", str(output), "--model", "ollama:a"])
+
+    assert run_batch(args) == 0
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [(r["id"], r["model"], r["state"], r["content"]) for r in records] == [("x", "a", "done", "a: hello")]
+    assert "1 requests (0 failed)" in capsys.readouterr().err
@@ -0,0 +1,53 @@
+"""Tests for the benchmark harness."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from benchmarks import suite  # noqa: F401  # registers the benchmarks
+from benchmarks.__main__ import BASELINE_FILE
+from benchmarks.harness import (
+    REGISTRY,
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+    time_rounds,
+)
+
+
+def _result(name: str, median: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, rounds=3, median=median, minimum=median, maximum=median)
+
+
+def test_time_rounds_excludes_warmup_and_setup() -> None:
+    calls: list[str] = []
+
+    durations = time_rounds(lambda: calls.append("run"), 3, setup=lambda: calls.append("setup"), warmup=1)
+
+    assert len(durations) == 3
+    assert calls == ["setup", "run"] * 4
+
+
+def test_slowdowns_beyond_tolerance_are_regressions(tmp_path: Path) -> None:
+    """Medians are compared with the baseline; benchmarks without one never regress."""
+    path = tmp_path / "baseline.json"
+    save_baseline(path, [_result("fast", 0.010), _result("slow", 0.100)])
+    save_baseline(path, [_result("slow", 0.200)])
+    assert load_baseline(path) == {"fast": 0.010, "slow": 0.200}
+
+    comparisons = compare(
+        [_result("fast", 0.014), _result("slow", 0.240), _result("new", 1.0)], load_baseline(path), 0.25
+    )
+
+    assert [(c.name, c.regressed) for c in comparisons] == [("fast", True), ("slow", False), ("new", False)]
+    assert comparisons[1].change is not None and round(comparisons[1].change, 2) == 0.2
+
+
+def test_every_benchmark_has_a_baseline(tmp_path: Path) -> None:
+    """The stored baseline covers the whole suite, and a benchmark runs in quick mode."""
+    assert set(REGISTRY) <= set(load_baseline(BASELINE_FILE))
+
+    (result,) = run_benchmarks([REGISTRY["event_bus_broadcast_chat_message"]], tmp_path, quick=True)
+    assert result.rounds == 1 and result.median > 0
@@ -0,0 +1,162 @@
+"""Tests for the virtualized ChatMessageList."""
+
+from __future__ import annotations
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+from textual.app import App, ComposeResult
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.settings_manager import settings
+from parllama.widgets import chat_message_list
+from parllama.widgets.chat_message_list import ChatMessageList
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> ChatSession:
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "chat_render_margin", 10)
+    messages = [
+        ParllamaChatMessage(role="user" if i % 2 == 0 else "assistant", content=f"message {i}\n\nline two")
+        for i in range(100)
+    ]
+    return ChatSession(
+        name="Long",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2"),
+        messages=messages,
+    )
+
+
+class MessageListTestApp(App[None]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.message_list = ChatMessageList()
+
+    def compose(self) -> ComposeResult:
+        yield self.message_list
+
+
+def _mounted(message_list: ChatMessageList) -> list[str]:
+    """Ids of the messages with a mounted widget, in display order."""
+    return [m.id for m in message_list.messages if m.id in message_list.message_widgets]
+
+
+@pytest.mark.anyio
+async def test_only_messages_near_the_viewport_are_mounted(session: ChatSession) -> None:
+    """Opening a long session mounts the newest messages and spaces out the rest."""
+    app = MessageListTestApp()
+
+    async with app.run_test(size=(80, 24)) as pilot:
+        await app.message_list.set_messages(session, session.messages)
+        await pilot.pause()
+        await pilot.pause()
+
+        mounted = _mounted(app.message_list)
+        assert 0 < len(mounted) < 30
+        assert mounted[-1] == session.messages[-1].id
+        assert app.message_list.window == (100 - len(mounted), 100)
+        assert app.message_list.is_vertical_scroll_end
+
+
+@pytest.mark.anyio
+async def test_scrolling_moves_the_rendered_window(session: ChatSession) -> None:
+    """Scrolling to the top mounts the oldest messages and releases the newest."""
+    app = MessageListTestApp()
+
+    async with app.run_test(size=(80, 24)) as pilot:
+        await app.message_list.set_messages(session, session.messages)
+        await pilot.pause()
+        await pilot.pause()
+        newest = session.messages[-1].id
+
+        app.message_list.scroll_home(animate=False, immediate=True)
+        await pilot.pause()
+        await pilot.pause()
+
+        mounted = _mounted(app.message_list)
+        assert mounted[0] == session.messages[0].id
+        assert newest not in mounted
+        assert newest in app.message_list._heights
+
+
+@pytest.mark.anyio
+async def test_height_estimates_are_cached_until_content_changes(
+    session: ChatSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Moving the window does not re-estimate unchanged messages that have not been measured."""
+    estimated: list[str] = []
+    original = chat_message_list.estimate_message_height
+
+    def counting(msg: ParllamaChatMessage, width: int) -> int:
+        estimated.append(msg.id)
+        return original(msg, width)
+
+    monkeypatch.setattr(chat_message_list, "estimate_message_height", counting)
+    app = MessageListTestApp()
+
+    async with app.run_test(size=(80, 24)) as pilot:
+        await app.message_list.set_messages(session, session.messages)
+        await pilot.pause()
+        await pilot.pause()
+        first = session.messages[0]
+        count = estimated.count(first.id)
+
+        await app.message_list._refresh_window()
+        assert estimated.count(first.id) == count
+
+        first.content += " edited"
+        await app.message_list._refresh_window()
+        assert estimated.count(first.id) == count + 1
+
+
+@pytest.mark.anyio
+async def test_messages_are_added_and_removed(session: ChatSession) -> None:
+    """New messages are mounted while following the end; removed ones are unmounted."""
+    app = MessageListTestApp()
+
+    async with app.run_test(size=(80, 24)) as pilot:
+        await app.message_list.set_messages(session, session.messages[:3])
+        reply = ParllamaChatMessage(role="assistant", content="streaming")
+
+        widget = await app.message_list.update_message(reply, is_final=False)
+        await pilot.pause()
+
+        assert widget is not None and not widget.is_final
+        assert app.message_list.message_widgets[reply.id] is widget
+        assert await app.message_list.update_message(reply, is_final=True) is widget
+        assert widget.is_final
+
+        await app.message_list.remove_message(reply.id)
+        assert not app.message_list.has_message(reply.id)
+        assert reply.id not in app.message_list.message_widgets
+
+
+@pytest.mark.anyio
+async def test_message_widgets_are_registered_while_mounted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mounted message widgets can be looked up by message id until they are removed."""
+    from parllama.widgets.chat_message_widget import ChatMessageWidget
+
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    msg = ParllamaChatMessage(role="user", content="hello")
+    session = ChatSession(
+        name="Registry",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2"),
+        messages=[msg],
+    )
+
+    app = MessageListTestApp()
+    async with app.run_test() as pilot:
+        widget = ChatMessageWidget.mk_msg_widget(msg=msg, session=session, is_final=True)
+        await app.message_list.mount(widget)
+        assert app.message_list.message_widgets == {msg.id: widget}
+
+        await widget.remove()
+        await pilot.pause()
+        assert app.message_list.message_widgets == {}
@@ -0,0 +1,153 @@
+"""Tests for async streaming and cancellation in ChatSession generation."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.settings_manager import settings
+
+
+class FakeChatModel:
+    """Chat model whose async stream yields ``chunks`` and then optionally stalls."""
+
+    name = "fake"
+
+    def __init__(self, chunks: list[str], stall: bool = False) -> None:
+        self.chunks = chunks
+        self.stall = stall
+        self.cancelled = False
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        for chunk in self.chunks:
+            yield AIMessageChunk(content=chunk)
+        if self.stall:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> ChatSession:
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", False)
+    return ChatSession(
+        name="Streaming",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5),
+        messages=[],
+    )
+
+
+def _use_model(monkeypatch: pytest.MonkeyPatch, model: FakeChatModel) -> None:
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: model)
+
+
+@pytest.mark.anyio
+async def test_send_chat_streams_reply_asynchronously(session: ChatSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunks from the async stream are assembled into the assistant reply."""
+    _use_model(monkeypatch, FakeChatModel(["Hello", ", ", "world"]))
+
+    assert await session.send_chat("hi") is True
+
+    assert [m.role for m in session.messages] == ["user", "assistant"]
+    assert session.messages[-1].content == "Hello, world"
+    assert not session.is_generating
+
+
+@pytest.mark.anyio
+async def test_stop_generation_cancels_a_stalled_request(session: ChatSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Abort takes effect immediately, even when no further chunk ever arrives."""
+    model = FakeChatModel(["Partial"], stall=True)
+    _use_model(monkeypatch, model)
+    stopper = threading.Timer(0.1, session.stop_generation)
+    stopper.start()
+    start = time.monotonic()
+
+    result = await session.send_chat("hi")
+
+    assert result is False
+    assert time.monotonic() - start < 2
+    assert model.cancelled
+    assert session.messages[-1].content == "Partial" + ChatSession.ABORT_SUFFIX
+    assert not session.abort_pending
+
+
+@pytest.mark.anyio
+async def test_stop_generation_cancels_a_pending_context_summary(
+    session: ChatSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Summarizing trimmed history runs asynchronously in the generation task and can be stopped."""
+
+    class SummarizingModel(FakeChatModel):
+        async def ainvoke(self, messages: list[Any], config: Any = None) -> AIMessageChunk:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+            return AIMessageChunk(content="summary")
+
+    model = SummarizingModel(["Reply"])
+    _use_model(monkeypatch, model)
+    monkeypatch.setattr(settings, "context_trim_policy", "summarize_oldest")
+    monkeypatch.setattr(settings, "context_budget_tokens", 1)
+    session.add_message(ParllamaChatMessage(role="user", content="old question"))
+    session.add_message(ParllamaChatMessage(role="assistant", content="old answer"))
+    stopper = threading.Timer(0.1, session.stop_generation)
+    stopper.start()
+    start = time.monotonic()
+
+    result = await session.send_chat("hi")
+
+    assert result is False
+    assert time.monotonic() - start < 2
+    assert model.cancelled
+    assert session.messages[-1].content == ChatSession.ABORT_SUFFIX
+
+
+@pytest.mark.anyio
+async def test_stop_after_reply_finished_does_not_abort_next_generation(
+    session: ChatSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A stop that arrives after the stream ended is not carried over to the next request."""
+    _use_model(monkeypatch, FakeChatModel(["Done"]))
+    await session.send_chat("first")
+    session.stop_generation()
+
+    assert not session.abort_pending
+    assert await session.send_chat("second") is True
+    assert session.messages[-1].content == "Done"
+
+
+@pytest.mark.anyio
+async def test_stream_errors_are_appended_to_the_reply(session: ChatSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provider errors raised mid-stream end up in the assistant message."""
+
+    class FailingModel(FakeChatModel):
+        async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+            yield AIMessageChunk(content="Start")
+            raise ConnectionError("connection reset")
+
+    _use_model(monkeypatch, FailingModel([]))
+
+    await session.send_chat("hi")
+
+    assert session.messages[-1].content == "Start\n\nconnection reset"
@@ -0,0 +1,185 @@
+"""Tests for token-budgeted context assembly."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Sequence
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama import context_window
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.context_window import MESSAGE_OVERHEAD_TOKENS, SUMMARY_PREFIX, ContextWindow
+from parllama.settings_manager import settings
+
+
+@pytest.fixture(autouse=True)
+def char_tokenizer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Count 4 characters per token so budgets are predictable."""
+    monkeypatch.setattr(context_window, "_encoding", None)
+    monkeypatch.setattr(context_window, "_encoding_loaded", True)
+
+
+def _msg(id: str, role: str, tokens: int) -> ParllamaChatMessage:
+    """A message costing ``tokens`` text tokens plus the per-message overhead."""
+    return ParllamaChatMessage(id=id, role=role, content="abcd" * tokens)  # type: ignore[arg-type]
+
+
+def _conversation(tokens: int = 10) -> list[ParllamaChatMessage]:
+    return [
+        _msg("sys", "system", tokens),
+        _msg("u1", "user", tokens),
+        _msg("a1", "assistant", tokens),
+        _msg("u2", "user", tokens),
+        _msg("a2", "assistant", tokens),
+        _msg("u3", "user", tokens),
+    ]
+
+
+COST = 10 + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_history_within_budget_is_sent_unchanged() -> None:
+    """Nothing is trimmed when the whole history fits."""
+    messages = _conversation()
+
+    result = asyncio.run(ContextWindow().fit(messages, budget=COST * 6))
+
+    assert result.messages == messages
+    assert result.stats.trimmed_messages == 0
+    assert result.stats.prompt_tokens == COST * 6
+
+
+def test_drop_oldest_keeps_system_prompt_and_newest_messages() -> None:
+    """The oldest history is dropped while system messages stay pinned."""
+    result = asyncio.run(ContextWindow().fit(_conversation(), budget=COST * 4, policy="drop_oldest"))
+
+    assert [m.id for m in result.messages] == ["sys", "u2", "a2", "u3"]
+    assert result.stats.trimmed_messages == 2
+    assert result.stats.trimmed_tokens == COST * 2
+    assert result.stats.prompt_tokens == COST * 4
+    assert not result.stats.summarized
+
+
+def test_kept_history_does_not_start_with_an_orphaned_reply() -> None:
+    """A reply whose prompting message was dropped is dropped too."""
+    result = asyncio.run(ContextWindow().fit(_conversation(), budget=COST * 3, policy="drop_oldest"))
+
+    assert [m.id for m in result.messages] == ["sys", "u3"]
+
+
+def test_newest_message_is_sent_even_if_over_budget() -> None:
+    """The message being answered is never trimmed."""
+    result = asyncio.run(ContextWindow().fit(_conversation(), budget=1, policy="drop_oldest"))
+
+    assert [m.id for m in result.messages] == ["sys", "u3"]
+
+
+def test_none_policy_sends_everything() -> None:
+    """Trimming can be disabled."""
+    result = asyncio.run(ContextWindow().fit(_conversation(), budget=1, policy="none"))
+
+    assert len(result.messages) == 6
+    assert result.stats.trimmed_messages == 0
+
+
+def test_summarize_oldest_replaces_trimmed_history_and_extends_cached_summary() -> None:
+    """Trimmed messages become a summary that is reused and extended incrementally."""
+    calls: list[tuple[str, list[str]]] = []
+
+    async def summarizer(previous: str, messages: Sequence[ParllamaChatMessage]) -> str:
+        calls.append((previous, [m.id for m in messages]))
+        return f"summary {len(calls)}"
+
+    window = ContextWindow()
+    messages = _conversation(300)
+    budget = (300 + MESSAGE_OVERHEAD_TOKENS) * 4 + context_window.SUMMARY_TOKEN_RESERVE
+
+    first = asyncio.run(window.fit(messages, budget=budget, policy="summarize_oldest", summarizer=summarizer))
+    again = asyncio.run(window.fit(messages, budget=budget, policy="summarize_oldest", summarizer=summarizer))
+    messages += [_msg("a3", "assistant", 300), _msg("u4", "user", 300)]
+    extended = asyncio.run(window.fit(messages, budget=budget, policy="summarize_oldest", summarizer=summarizer))
+
+    assert [m.id for m in first.messages] == ["sys", "context-summary", "u2", "a2", "u3"]
+    assert first.stats.trimmed_messages == 2
+    assert first.messages[1].content == SUMMARY_PREFIX + "summary 1"
+    assert first.stats.summarized
+    assert again.messages[1].content == SUMMARY_PREFIX + "summary 1"
+    assert extended.messages[1].content == SUMMARY_PREFIX + "summary 2"
+    assert calls == [("", ["u1", "a1"]), ("summary 1", ["u2", "a2"])]
+
+
+def test_failed_summary_falls_back_to_dropping() -> None:
+    """A summarizer error falls back to drop_oldest within the full budget."""
+
+    async def summarizer(previous: str, messages: Sequence[ParllamaChatMessage]) -> str:
+        raise ConnectionError("offline")
+
+    window = ContextWindow()
+    result = asyncio.run(window.fit(_conversation(), budget=COST * 4, policy="summarize_oldest", summarizer=summarizer))
+
+    assert [m.id for m in result.messages] == ["sys", "u2", "a2", "u3"]
+    assert not result.stats.summarized
+
+
+def test_token_counts_are_cached_until_content_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Messages are only re-tokenized after their content changes."""
+    counted: list[str] = []
+    original = context_window.count_text_tokens
+
+    def counting(text: str) -> int:
+        counted.append(text)
+        return original(text)
+
+    monkeypatch.setattr(context_window, "count_text_tokens", counting)
+    window = ContextWindow()
+    messages = _conversation()
+
+    asyncio.run(window.fit(messages, budget=0))
+    asyncio.run(window.fit(messages, budget=0))
+    messages[-1].content += " more"
+    asyncio.run(window.fit(messages, budget=0))
+
+    assert len(counted) == 7
+
+
+def test_encoding_is_loaded_off_the_calling_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The first fit loads the tiktoken encoding in a worker thread, not on the event loop's thread."""
+    loaded_on: list[threading.Thread] = []
+
+    def get_encoding() -> None:
+        if not context_window._encoding_loaded:
+            loaded_on.append(threading.current_thread())
+            monkeypatch.setattr(context_window, "_encoding_loaded", True)
+
+    monkeypatch.setattr(context_window, "_encoding_loaded", False)
+    monkeypatch.setattr(context_window, "_get_encoding", get_encoding)
+    window = ContextWindow()
+
+    asyncio.run(window.fit(_conversation(), budget=0))
+    asyncio.run(window.fit(_conversation(), budget=0))
+
+    assert len(loaded_on) == 1
+    assert loaded_on[0] is not threading.current_thread()
+
+
+def test_session_records_context_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The session sends the fitted history and reports what was trimmed."""
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_trim_policy", "drop_oldest")
+    monkeypatch.setattr(settings, "context_budget_tokens", COST * 4)
+    session = ChatSession(
+        name="Long",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5),
+        messages=_conversation(),
+    )
+
+    history = asyncio.run(session._build_chat_history())
+
+    assert [role for role, _ in history] == ["system", "user", "assistant", "user"]
+    assert session.context_stats is not None
+    assert session.context_stats.trimmed_messages == 2
@@ -0,0 +1,128 @@
+"""Tests for the cross-session generation scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.generation_scheduler import GenerationScheduler, generation_host
+from parllama.settings_manager import settings
+
+OLLAMA = LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", base_url="http://gpu-box:11434")
+OPENAI = LlmConfig(provider=LlmProvider.OPENAI, model_name="gpt-4o")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "generation_provider_limit", 1)
+    monkeypatch.setattr(settings, "generation_provider_limits", {})
+    monkeypatch.setattr(settings, "generation_host_limit", 0)
+
+
+async def _generate(scheduler: GenerationScheduler, session_id: str, config: LlmConfig, order: list[str]) -> None:
+    async with scheduler.slot(session_id, config):
+        order.append(session_id)
+        await asyncio.sleep(0.01)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_generation_host_uses_base_url_netloc() -> None:
+    """Requests are grouped by the host they are sent to."""
+    assert generation_host(OLLAMA) == "gpu-box:11434"
+    assert generation_host(LlmConfig(provider=LlmProvider.BEDROCK, model_name="m")) == "Bedrock"
+
+
+@pytest.mark.anyio
+async def test_provider_cap_queues_requests_with_position() -> None:
+    """Requests beyond the provider cap wait and report their queue position."""
+    scheduler = GenerationScheduler()
+    order: list[str] = []
+
+    async with scheduler.slot("a", OLLAMA):
+        waiting = asyncio.create_task(_generate(scheduler, "b", OLLAMA, order))
+        await _settle()
+
+        status = scheduler.status("b")
+        assert order == []
+        assert status is not None and (status.position, status.waiting) == (1, 1)
+        assert scheduler.status("a") is None
+
+    await waiting
+    assert order == ["b"]
+    assert scheduler.status("b") is None
+
+
+@pytest.mark.anyio
+async def test_other_providers_are_not_held_up() -> None:
+    """A saturated provider does not block requests for another one."""
+    scheduler = GenerationScheduler()
+    order: list[str] = []
+
+    async with scheduler.slot("a", OLLAMA):
+        queued = asyncio.create_task(_generate(scheduler, "b", OLLAMA, order))
+        other = asyncio.create_task(_generate(scheduler, "c", OPENAI, order))
+        await other
+        assert order == ["c"]
+    await queued
+
+
+@pytest.mark.anyio
+async def test_host_cap_applies_across_providers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Providers that share a host share the host's cap."""
+    monkeypatch.setattr(settings, "generation_provider_limit", 0)
+    monkeypatch.setattr(settings, "generation_host_limit", 1)
+    scheduler = GenerationScheduler()
+    litellm = LlmConfig(provider=LlmProvider.LITELLM, model_name="m", base_url="http://gpu-box:11434/v1")
+
+    async with scheduler.slot("a", OLLAMA):
+        queued = asyncio.create_task(_generate(scheduler, "b", litellm, []))
+        await _settle()
+        assert scheduler.status("b") is not None
+    await queued
+
+
+@pytest.mark.anyio
+async def test_focused_session_goes_first_then_least_recently_served() -> None:
+    """The focused tab jumps the queue; otherwise sessions are interleaved fairly."""
+    scheduler = GenerationScheduler()
+    order: list[str] = []
+    async with scheduler.slot("b", OLLAMA):
+        pass
+
+    async with scheduler.slot("a", OLLAMA):
+        tasks = [asyncio.create_task(_generate(scheduler, s, OLLAMA, order)) for s in ("b", "c", "d")]
+        await _settle()
+        scheduler.focus("d")
+
+    await asyncio.gather(*tasks)
+    assert order == ["d", "c", "b"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_request_leaves_the_queue() -> None:
+    """Stopping a queued generation removes it without consuming a slot."""
+    scheduler = GenerationScheduler()
+    order: list[str] = []
+
+    async with scheduler.slot("a", OLLAMA):
+        cancelled = asyncio.create_task(_generate(scheduler, "b", OLLAMA, order))
+        await _settle()
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.status("b") is None
+
+    await _generate(scheduler, "c", OLLAMA, order)
+    assert order == ["c"]
@@ -0,0 +1,146 @@
+"""Tests for the generation latency and throughput telemetry store."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama import chat_session as chat_session_module
+from parllama.chat_session import ChatSession
+from parllama.generation_telemetry import GenerationRecord, GenerationTelemetry, percentile
+from parllama.models.token_stats import GenerationTiming, TokenStats
+from parllama.settings_manager import settings
+from parllama.widgets.views.stats_view import stats_rows
+
+OLLAMA = LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", base_url="http://gpu-box:11434")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def telemetry(tmp_path: Path) -> Iterator[GenerationTelemetry]:
+    """A telemetry store backed by a temporary database."""
+    store = GenerationTelemetry(db_path=tmp_path / "telemetry.db")
+    yield store
+    store.close()
+
+
+def _record(timestamp: float, latency: float, tokens_per_second: float, model: str = "llama3.2") -> GenerationRecord:
+    return GenerationRecord(
+        timestamp=timestamp,
+        provider="Ollama",
+        model=model,
+        host="gpu-box:11434",
+        prompt_tokens=100,
+        output_tokens=50,
+        ttft=latency / 4,
+        latency=latency,
+        tokens_per_second=tokens_per_second,
+        load_duration=0.0,
+    )
+
+
+def test_percentile_interpolates() -> None:
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([0.0, 10.0], 95) == pytest.approx(9.5)
+
+
+def test_record_from_generation_prefers_provider_usage() -> None:
+    """Reported token counts and load time are used; throughput excludes the time to first token."""
+    stats = TokenStats(
+        model="llama3.2",
+        created_at=datetime.now(),
+        total_duration=0,
+        load_duration=1_500_000_000,
+        prompt_eval_count=120,
+        prompt_eval_duration=0,
+        eval_count=40,
+        eval_duration=0,
+        input_tokens=0,
+        output_tokens=0,
+        total_tokens=0,
+        time_til_first_token=0,
+    )
+    record = GenerationRecord.from_generation(OLLAMA, GenerationTiming(ttft=1.0, latency=3.0, chunks=35), stats)
+
+    assert (record.provider, record.model, record.host) == ("Ollama", "llama3.2", "gpu-box:11434")
+    assert (record.prompt_tokens, record.output_tokens) == (120, 40)
+    assert record.tokens_per_second == 20.0
+    assert record.load_duration == 1.5
+
+    without_usage = GenerationRecord.from_generation(OLLAMA, GenerationTiming(ttft=1.0, latency=3.0, chunks=35), None)
+    assert without_usage.output_tokens == 35
+
+
+def test_summary_groups_by_model_and_day(telemetry: GenerationTelemetry) -> None:
+    """Percentiles are computed per model, host and period, oldest period first."""
+    day = 86400
+    now = time.time()
+    for latency in (1.0, 2.0, 3.0):
+        telemetry.record(_record(now - day, latency, 30.0))
+    telemetry.record(_record(now, 4.0, 15.0))
+    telemetry.record(_record(now, 1.0, 90.0, model="qwen3"))
+
+    summaries = telemetry.summary("day")
+
+    assert [(s.model, s.count) for s in summaries] == [("llama3.2", 3), ("llama3.2", 1), ("qwen3", 1)]
+    assert summaries[0].latency_p50 == 2.0
+    assert summaries[0].latency_p95 == pytest.approx(2.9)
+    assert [s.count for s in telemetry.summary("all")] == [4, 1]
+    assert [s.count for s in telemetry.summary("day", since=now - 60)] == [1, 1]
+    assert [row[-1] for row in stats_rows(summaries)] == ["", "-50%", ""]
+
+
+def test_old_records_are_pruned_on_open(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Records older than the retention period are removed when the store is opened."""
+    path = tmp_path / "telemetry.db"
+    store = GenerationTelemetry(db_path=path)
+    store.record(_record(time.time() - 40 * 86400, 1.0, 10.0))
+    store.record(_record(time.time(), 1.0, 10.0))
+    store.close()
+
+    monkeypatch.setattr(settings, "telemetry_retention_days", 30)
+    reopened = GenerationTelemetry(db_path=path)
+    assert len(reopened.records()) == 1
+    reopened.close()
+
+
+class FakeChatModel:
+    """Chat model whose async stream yields a few chunks."""
+
+    name = "fake"
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        for chunk in ("Hello", " there"):
+            yield AIMessageChunk(content=chunk)
+
+
+@pytest.mark.anyio
+async def test_completed_generation_is_recorded(
+    telemetry: GenerationTelemetry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each completed reply adds one record to the telemetry store."""
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", True)
+    monkeypatch.setattr(chat_session_module, "generation_telemetry", telemetry)
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: FakeChatModel())
+    session = ChatSession(name="Telemetry", llm_config=OLLAMA.clone(), messages=[])
+
+    assert await session.send_chat("hi") is True
+    telemetry.close()
+
+    records = telemetry.records()
+    assert [(r.model, r.host, r.output_tokens) for r in records] == [("llama3.2", "gpu-box:11434", 2)]
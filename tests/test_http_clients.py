@@ -0,0 +1,101 @@
+"""Tests for the shared, pooled HTTP clients, run against a local HTTP stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import orjson as json
+import pytest
+
+from parllama import http_clients as http_clients_module
+from parllama.http_clients import HttpClients
+from parllama.ollama_data_manager import api_model_ps
+from parllama.settings_manager import settings
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.client_ports.add(self.client_address[1])  # type: ignore[attr-defined]
+        status = 500 if self.path == "/fail" else 200
+        body = json.dumps({"models": []})
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.client_ports = set()  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_requests_reuse_one_connection_and_are_counted_per_host(server: ThreadingHTTPServer) -> None:
+    clients = HttpClients()
+    for path in ("/a", "/b", "/fail"):
+        clients.client().get(_url(server) + path)
+    with pytest.raises(httpx.ConnectError):
+        clients.client().get("http://127.0.0.1:1/")
+    clients.close()
+
+    assert len(server.client_ports) == 1  # type: ignore[attr-defined]
+    stats = {s.host: s for s in clients.host_stats()}
+    host = f"127.0.0.1:{server.server_address[1]}"
+    assert (stats[host].requests, stats[host].errors) == (3, 1)
+    assert stats[host].max_time >= stats[host].avg_time > 0
+    assert (stats["127.0.0.1:1"].requests, stats["127.0.0.1:1"].errors) == (1, 1)
+
+
+def test_ollama_ps_polls_reuse_the_shared_connection(
+    server: ThreadingHTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clients = HttpClients()
+    monkeypatch.setattr(http_clients_module.http_clients, "client", clients.client)
+    monkeypatch.setattr(settings, "ollama_host", _url(server))
+
+    for _ in range(3):
+        assert api_model_ps().models == []
+
+    assert len(server.client_ports) == 1  # type: ignore[attr-defined]
+    assert clients.host_stats()[0].requests == 3
+    clients.close()
+
+
+def test_async_clients_are_shared_and_pool_connections_per_loop(server: ThreadingHTTPServer) -> None:
+    clients = HttpClients()
+
+    assert clients.ollama_client("http://a:11434") is clients.ollama_client("http://a:11434")
+    assert clients.ollama_async_client("http://a:11434") is clients.ollama_async_client("http://a:11434")
+    assert clients.async_client() is clients.async_client()
+
+    async def call() -> None:
+        await clients.async_client().get(_url(server) + "/a")
+        await clients.async_client().get(_url(server) + "/b")
+
+    asyncio.run(call())
+    assert len(server.client_ports) == 1  # type: ignore[attr-defined]
+
+    # A new loop gets its own pool, and the pool of the closed loop is dropped.
+    asyncio.run(call())
+    assert len(server.client_ports) == 2  # type: ignore[attr-defined]
+    assert sum(len(pools._pools) for pools in clients._loop_pools) == 1
+    assert clients.host_stats()[0].requests == 4
+    clients.close()
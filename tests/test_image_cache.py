@@ -0,0 +1,143 @@
+"""Tests for the encoded chat image cache."""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from parllama import image_cache as image_cache_module
+from parllama.chat_message import ParllamaChatMessage, image_to_base64
+from parllama.image_cache import ImageCache
+from parllama.settings_manager import settings
+
+
+@pytest.fixture
+def fetches(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every image read that misses the cache."""
+    calls: list[str] = []
+    original = image_cache_module.fetch_and_cache_image
+
+    def fetch(image_path: str | Path) -> tuple[Path, bytes]:
+        calls.append(str(image_path))
+        return original(image_path)
+
+    monkeypatch.setattr(image_cache_module, "fetch_and_cache_image", fetch)
+    monkeypatch.setattr(settings, "image_max_dimension", 64)
+    monkeypatch.setattr(settings, "image_cache_max_mb", 64.0)
+    monkeypatch.setattr(settings, "image_cache_persist", True)
+    return calls
+
+
+def _png(path: Path, size: tuple[int, int], color: str = "red") -> Path:
+    Image.new("RGB", size, color).save(path, "PNG")
+    return path
+
+
+def _size(data_url: str) -> tuple[int, int]:
+    with Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1]))) as img:
+        return img.size
+
+
+def test_repeat_encodes_are_served_from_memory(fetches: list[str], tmp_path: Path) -> None:
+    """An unchanged file is read and encoded only once."""
+    image = _png(tmp_path / "shot.png", (32, 32))
+    cache = ImageCache(cache_dir=tmp_path / "encoded")
+
+    first = cache.encode(str(image))
+    second = cache.encode(str(image))
+
+    assert first == second
+    assert first.startswith("data:image/png;base64,")
+    assert fetches == [str(image)]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_encoded_again(fetches: list[str], tmp_path: Path) -> None:
+    """The cache key follows the file's modification time and size."""
+    image = _png(tmp_path / "shot.png", (32, 32))
+    cache = ImageCache(cache_dir=tmp_path / "encoded")
+    first = cache.encode(str(image))
+
+    _png(image, (48, 16), "blue")
+    os.utime(image, ns=(1, 1))
+    second = cache.encode(str(image))
+
+    assert first != second
+    assert _size(second) == (48, 16)
+    assert len(fetches) == 2
+
+
+def test_oversized_images_are_downscaled_once(fetches: list[str], tmp_path: Path) -> None:
+    """Images beyond image_max_dimension are shrunk, keeping the aspect ratio."""
+    image = _png(tmp_path / "big.png", (256, 128))
+    cache = ImageCache(cache_dir=tmp_path / "encoded")
+
+    assert _size(cache.encode(str(image))) == (64, 32)
+
+
+def test_persisted_entries_survive_a_new_cache(fetches: list[str], tmp_path: Path) -> None:
+    """A fresh cache reuses the prepared image stored on disk."""
+    image = _png(tmp_path / "big.png", (256, 128))
+    encoded = ImageCache(cache_dir=tmp_path / "encoded").encode(str(image))
+
+    reloaded = ImageCache(cache_dir=tmp_path / "encoded").encode(str(image))
+
+    assert reloaded == encoded
+    assert fetches == [str(image)]
+
+
+def test_least_recently_used_entries_are_evicted(
+    fetches: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The in-memory cache stays within image_cache_max_mb."""
+    monkeypatch.setattr(settings, "image_cache_persist", False)
+    images = [_png(tmp_path / f"{i}.png", (32, 32), color) for i, color in enumerate(("red", "green", "blue"))]
+    cache = ImageCache(cache_dir=tmp_path / "encoded")
+    entry_size = len(cache.encode(str(images[0])))
+    monkeypatch.setattr(settings, "image_cache_max_mb", (entry_size * 2.5) / (1024 * 1024))
+
+    cache.encode(str(images[1]))
+    cache.encode(str(images[0]))
+    cache.encode(str(images[2]))
+    cache.encode(str(images[0]))
+    cache.encode(str(images[1]))
+
+    assert fetches == [str(images[0]), str(images[1]), str(images[2]), str(images[1])]
+
+
+def test_message_sends_downscaled_copy_of_stored_data_url(fetches: list[str]) -> None:
+    """Oversized images already stored in a session are shrunk when sent."""
+    out = io.BytesIO()
+    Image.new("RGB", (200, 100), "red").save(out, "PNG")
+    data_url = image_to_base64(out.getvalue(), "png")
+    msg = ParllamaChatMessage(role="user", content="look", images=[data_url])
+
+    _, content = msg.to_langchain_native()
+
+    assert msg.images == [data_url]
+    assert isinstance(content, list)
+    assert _size(content[1]["image_url"]["url"]) == (64, 32)
+
+
+def test_persisted_entries_are_evicted_beyond_the_size_limit(
+    fetches: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The on-disk cache stays within image_cache_max_mb, dropping the least recently used image."""
+    images = [_png(tmp_path / f"{i}.png", (32, 32), color) for i, color in enumerate(("red", "green", "blue"))]
+    cache = ImageCache(cache_dir=tmp_path / "encoded")
+    cache.encode(str(images[0]))
+    (entry,) = (tmp_path / "encoded").iterdir()
+    os.utime(entry, (1, 1))
+    monkeypatch.setattr(settings, "image_cache_max_mb", (entry.stat().st_size * 2.5) / (1024 * 1024))
+
+    cache.encode(str(images[1]))
+    cache.encode(str(images[2]))
+
+    persisted = list((tmp_path / "encoded").iterdir())
+    assert len(persisted) == 2
+    assert entry not in persisted
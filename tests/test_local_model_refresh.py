@@ -0,0 +1,92 @@
+"""Tests for diff-based local model refreshes."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from parllama.models.ollama_data import FullModel, LocalModelChanges
+from parllama.ollama_data_manager import OllamaDataManager
+from parllama.settings_manager import settings
+from parllama.widgets.local_model_grid_list import LocalModelGridList
+
+MODIFIED = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _model(name: str, digest: str, size: int = 1) -> FullModel:
+    details = {
+        "parent_model": "",
+        "format": "gguf",
+        "family": "llama",
+        "families": ["llama"],
+        "parameter_size": "3B",
+        "quantization_level": "Q4_K_M",
+    }
+    return FullModel(name=name, model=name, modified_at=MODIFIED, size=size, digest=digest, details=details)
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> OllamaDataManager:
+    monkeypatch.setattr(settings, "ollama_cache_dir", tmp_path)
+    monkeypatch.setattr(settings, "local_model_sort", "name_asc")
+    return OllamaDataManager()
+
+
+def _refresh(manager: OllamaDataManager, models: list[FullModel]) -> None:
+    manager._get_all_model_data = lambda: models  # type: ignore[method-assign]
+    manager.refresh_models()
+
+
+def test_refresh_reports_changes_and_reuses_unchanged_items(manager: OllamaDataManager) -> None:
+    _refresh(manager, [_model("a", "1"), _model("b", "2"), _model("c", "3")])
+    assert manager.model_changes == LocalModelChanges(added=["a", "b", "c"])
+    item_a, item_b, _ = manager.models
+
+    _refresh(manager, [_model("a", "1"), _model("b", "22"), _model("d", "4")])
+
+    assert manager.model_changes == LocalModelChanges(added=["d"], removed=["c"], updated=["b"])
+    assert [item.model.name for item in manager.models] == ["a", "b", "d"]
+    assert manager.models[0] is item_a
+    assert manager.models[1] is item_b and item_b.model.digest == "22"
+    assert manager.get_model_by_name("c") is None
+    assert manager.get_model_by_name("d") is manager.models[2].model
+
+
+class GridApp(App[None]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.grid = LocalModelGridList()
+
+    def compose(self) -> ComposeResult:
+        yield self.grid
+
+
+@pytest.mark.anyio
+async def test_grid_patches_changed_cards_and_keeps_the_selection(manager: OllamaDataManager) -> None:
+    app = GridApp()
+    async with app.run_test() as pilot:
+        _refresh(manager, [_model("a", "1"), _model("b", "2"), _model("c", "3")])
+        await app.grid.sync_items(manager.models)
+        await pilot.pause()
+        card_a, card_b, card_c = app.grid.children
+        app.grid.selected = card_b  # type: ignore[assignment]
+
+        _refresh(manager, [_model("0", "9"), _model("a", "1"), _model("b", "22"), _model("d", "4")])
+        await app.grid.sync_items(manager.models, manager.model_changes.updated)
+        await pilot.pause()
+
+        cards = list(app.grid.children)
+        assert [card.model.name for card in cards] == ["0", "a", "b", "d"]  # type: ignore[attr-defined]
+        assert cards[1] is card_a and cards[2] is card_b
+        assert card_c.parent is None
+        assert app.grid.selected is card_b
+        assert str(card_b.query_one("#digest", Static).render()) == "22"
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from threading import Thread
+from typing import Any
 
 from textual.message import Message
 
@@ -107,6 +109,35 @@ def test_message_sink_can_emit_from_worker_thread_using_post_message() -> None:
     assert app.messages == [message]
 
 
+@dataclass
+class ThreadedApp(RecordingApp):
+    """App test double that records calls routed through call_from_thread."""
+
+    running: bool = True
+    routed: list[Callable[..., Any]] = field(default_factory=list)
+
+    def call_from_thread(self, callback: Callable[..., Any], *args: Any) -> Any:
+        """Run ``callback`` as the app's thread would, or fail like an app that is not running."""
+        if not self.running:
+            raise RuntimeError("App is not running")
+        self.routed.append(callback)
+        return callback(*args)
+
+
+def test_log_it_from_thread_runs_on_the_app_thread() -> None:
+    """Background threads log through call_from_thread, falling back to posting when the app is not running."""
+    app = ThreadedApp()
+    sink = MessageSink(id="sink")
+    sink.set_app(app)  # type: ignore[arg-type]
+
+    assert sink.log_it_from_thread("save failed", notify=True, severity="error") is True
+    app.running = False
+    assert sink.log_it_from_thread("save failed at exit", notify=True, severity="error") is True
+
+    assert app.routed == [sink.log_it]
+    assert [m.msg for m in app.messages if isinstance(m, LogIt)] == ["save failed", "save failed at exit"]
+
+
 def test_message_sink_does_not_implement_custom_bus_dispatch_or_bubbling() -> None:
     """The replacement helper must not recreate custom bus behavior."""
     sink = MessageSink(id="sink")
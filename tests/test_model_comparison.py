@@ -0,0 +1,125 @@
+"""Tests for comparing one chat history across several models."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.model_comparison import ModelComparison
+from parllama.settings_manager import settings
+
+
+class FakeChatModel:
+    """Chat model whose async stream yields ``chunks``, optionally failing afterwards."""
+
+    name = "fake"
+
+    def __init__(self, chunks: list[str], fail: bool = False) -> None:
+        self.chunks = chunks
+        self.fail = fail
+        self.received: list[Any] = []
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        self.received = messages
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield AIMessageChunk(content=chunk)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", False)
+
+
+def _use_models(monkeypatch: pytest.MonkeyPatch, models: dict[str, FakeChatModel]) -> None:
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: models[self.model_name])
+
+
+def _config(model_name: str) -> LlmConfig:
+    return LlmConfig(provider=LlmProvider.OLLAMA, model_name=model_name)
+
+
+HISTORY = [
+    ParllamaChatMessage(role="user", content="What is 2 + 2?"),
+    ParllamaChatMessage(role="assistant", content="4"),
+    ParllamaChatMessage(role="user", content="And 3 + 3?"),
+    ParllamaChatMessage(role="assistant", content="6"),
+]
+
+
+@pytest.mark.anyio
+async def test_all_models_answer_the_last_user_message(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each model streams its own reply and the history after the last user message is left out."""
+    models = {"a": FakeChatModel(["Six", "."]), "b": FakeChatModel(["6"])}
+    _use_models(monkeypatch, models)
+    comparison = ModelComparison(HISTORY, [_config("a"), _config("b")])
+
+    results = await comparison.run()
+
+    assert [run.reply.content for run in comparison.runs if run.reply] == ["Six.", "6"]
+    assert [m[1] for m in models["a"].received] == ["What is 2 + 2?", "4", "And 3 + 3?"]
+    assert [(r.model, r.state) for r in results] == [("a", "done"), ("b", "done")]
+    assert results[0].output_tokens == 2
+    assert results[0].latency >= results[0].ttft > 0
+    assert not comparison.is_running
+    assert len(HISTORY) == 4
+
+
+@pytest.mark.anyio
+async def test_stream_error_marks_run_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A model that errors is reported as failed without affecting the others."""
+    _use_models(monkeypatch, {"ok": FakeChatModel(["fine"]), "bad": FakeChatModel(["par"], fail=True)})
+    comparison = ModelComparison(HISTORY, [_config("ok"), _config("bad")])
+
+    results = await comparison.run()
+
+    assert [r.state for r in results] == ["done", "failed"]
+
+
+@pytest.mark.anyio
+async def test_results_export_as_markdown_and_csv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The results table has a row per model in both export formats."""
+    _use_models(monkeypatch, {"a": FakeChatModel(["x"])})
+    comparison = ModelComparison(HISTORY, [_config("a")])
+    await comparison.run()
+
+    markdown = comparison.to_markdown().splitlines()
+    assert markdown[0].startswith("| Provider | Model | State |")
+    assert markdown[2].startswith("| Ollama | a | done |")
+    csv_lines = comparison.to_csv().splitlines()
+    assert csv_lines[0].split(",")[:3] == ["Provider", "Model", "State"]
+    assert csv_lines[1].split(",")[:3] == ["Ollama", "a", "done"]
+
+
+def test_history_without_user_message_is_rejected() -> None:
+    """There is nothing to compare without a user message."""
+    with pytest.raises(ValueError):
+        ModelComparison([ParllamaChatMessage(role="system", content="Be terse")], [_config("a")])
+    with pytest.raises(ValueError):
+        ModelComparison(HISTORY, [])
+
+
+def test_scratch_sessions_are_not_saved(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comparison sessions never reach the session store."""
+    monkeypatch.setattr(settings, "no_save_chat", False)
+    session = ChatSession(name="Scratch", llm_config=_config("a"), messages=[HISTORY[0].clone()], persist=False)
+    session.is_dirty = True
+
+    assert session.save() is False
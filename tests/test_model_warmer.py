@@ -0,0 +1,102 @@
+"""Tests for background Ollama model warm-up."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.model_warmer import ModelWarmer, apply_keep_alive
+from parllama.models.ollama_ps import OllamaPsModel, OllamaPsModelDetails, OllamaPsResponse
+from parllama.settings_manager import settings
+
+HOST = "http://localhost:11434"
+
+
+class FakeClient:
+    """Ollama client recording generate calls."""
+
+    def __init__(self) -> None:
+        self.generated: list[dict[str, Any]] = []
+
+    def generate(self, **kwargs: Any) -> None:
+        self.generated.append(kwargs)
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
+    fake = FakeClient()
+    monkeypatch.setattr(settings, "ollama_host", HOST)
+    monkeypatch.setattr(settings, "ollama_warmup_enabled", True)
+    monkeypatch.setattr(settings, "ollama_keep_alive", "30m")
+    monkeypatch.setattr(settings, "ollama_ps_poll_interval", 3)
+    monkeypatch.setattr(ModelWarmer, "_client", staticmethod(lambda host: fake))
+    return fake
+
+
+def _ps(name: str, expires_in: timedelta) -> OllamaPsResponse:
+    details = OllamaPsModelDetails(
+        parent_model="", format="gguf", family="llama", families=None, parameter_size="3B", quantization_level="Q4"
+    )
+    model = OllamaPsModel(
+        name=name,
+        model=name,
+        size=1,
+        digest="d",
+        details=details,
+        expires_at=datetime.now(UTC) + expires_in,
+        size_vram=1,
+    )
+    return OllamaPsResponse(models=[model])
+
+
+def _config(model_name: str = "llama3.2", provider: LlmProvider = LlmProvider.OLLAMA) -> LlmConfig:
+    return LlmConfig(provider=provider, model_name=model_name)
+
+
+def test_cold_model_is_loaded_with_keep_alive(client: FakeClient) -> None:
+    """A model missing from the ps snapshot is loaded with an empty prompt and the configured keep-alive."""
+    warmer = ModelWarmer()
+    warmer.update_running(OllamaPsResponse())
+
+    future = warmer.warm(_config())
+
+    assert future is not None and future.result() is True
+    assert client.generated == [{"model": "llama3.2", "prompt": "", "keep_alive": "30m"}]
+
+
+def test_loaded_model_is_not_reloaded(client: FakeClient) -> None:
+    """A model ps reports loaded is skipped unless its keep-alive is about to run out."""
+    warmer = ModelWarmer()
+    warmer.update_running(_ps("llama3.2:latest", timedelta(minutes=10)))
+
+    future = warmer.warm(_config())
+    assert future is not None and future.result() is False
+    assert client.generated == []
+
+    warmer.update_running(_ps("llama3.2:latest", timedelta(seconds=10)))
+    future = warmer.warm(_config())
+    assert future is not None and future.result() is True
+
+
+def test_non_ollama_and_disabled_are_ignored(client: FakeClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    warmer = ModelWarmer()
+    assert warmer.warm(_config("gpt-4o", LlmProvider.OPENAI)) is None
+    monkeypatch.setattr(settings, "ollama_warmup_enabled", False)
+    assert warmer.warm(_config()) is None
+
+
+def test_keep_alive_is_applied_to_ollama_chat_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chat requests carry the keep-alive policy so they do not reset it to the server default."""
+
+    class Model:
+        keep_alive: str | None = None
+
+    monkeypatch.setattr(settings, "ollama_keep_alive", "2h")
+    assert apply_keep_alive(Model(), _config()).keep_alive == "2h"  # type: ignore[arg-type]
+    assert apply_keep_alive(Model(), _config("gpt-4o", LlmProvider.OPENAI)).keep_alive is None  # type: ignore[arg-type]
+    monkeypatch.setattr(settings, "ollama_keep_alive", "")
+    assert apply_keep_alive(Model(), _config()).keep_alive is None  # type: ignore[arg-type]
@@ -0,0 +1,149 @@
+"""Tests for the digest-keyed model details cache and bulk enrichment in OllamaDataManager."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from parllama.models.ollama_data import FullModel
+from parllama.ollama_data_manager import OllamaDataManager
+from parllama.settings_manager import settings
+
+
+def _model(name: str, digest: str) -> FullModel:
+    details = {
+        "parent_model": "",
+        "format": "gguf",
+        "family": "llama",
+        "families": ["llama"],
+        "parameter_size": "3B",
+        "quantization_level": "Q4_K_M",
+    }
+    return FullModel(name=name, model=name, modified_at=datetime.now(UTC), size=1, digest=digest, details=details)
+
+
+def _manager(models: list[FullModel]) -> OllamaDataManager:
+    """Return a data manager whose last refresh listed ``models``."""
+    dm = OllamaDataManager()
+    dm._get_all_model_data = lambda: models  # type: ignore[method-assign]
+    dm.refresh_models()
+    return dm
+
+
+def _show_output(num_ctx: int) -> dict[str, Any]:
+    return {
+        "modelfile": f"FROM llama\nPARAMETER num_ctx {num_ctx}\n",
+        "template": "{{ .Prompt }}",
+        "details": {
+            "parent_model": "",
+            "format": "gguf",
+            "family": "llama",
+            "families": ["llama"],
+            "parameter_size": "3B",
+            "quantization_level": "Q4_K_M",
+        },
+        "modelinfo": {"general.architecture": "llama", "llama.context_length": 131072},
+    }
+
+
+class ShowResponse:
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+
+    def model_dump(self) -> dict[str, Any]:
+        return self.data
+
+
+class FakeAsyncClient:
+    """Records how many ``show`` calls run at once."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def show(self, model: str) -> ShowResponse:
+        self.calls.append(model)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return ShowResponse(_show_output(8192))
+
+
+MODELS = [_model(f"model{i}:latest", f"sha256:{i:064x}") for i in range(5)]
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> OllamaDataManager:
+    monkeypatch.setattr(settings, "ollama_cache_dir", tmp_path)
+    return _manager([model.model_copy() for model in MODELS])
+
+
+def test_bulk_enrichment_fetches_missing_details_concurrently_and_caches_them(
+    manager: OllamaDataManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = FakeAsyncClient()
+    monkeypatch.setattr(OllamaDataManager, "ollama_aclient", property(lambda self: client))
+    monkeypatch.setattr(settings, "ollama_details_concurrency", 2)
+
+    assert asyncio.run(manager.enrich_all_models()) == 5
+    assert client.max_in_flight == 2
+    assert client.max_in_flight == 2
+    assert all(item.model.num_ctx() == 8192 for item in manager.models)
+    assert len(list(tmp_path.glob("model_details-*.json"))) == 5
+
+    # A new session lists the same digests and is enriched from the cache.
+    restarted = _manager([model.model_copy() for model in MODELS])
+    assert asyncio.run(restarted.enrich_all_models()) == 0
+    assert len(client.calls) == 5
+    assert all(item.model.modelinfo for item in restarted.models)
+
+
+def test_context_length_never_calls_show_and_stale_details_are_pruned(
+    manager: OllamaDataManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def show(model_name: str) -> None:
+        raise AssertionError("show must not be called")
+
+    monkeypatch.setattr(manager, "_ollama_show_model", show)
+    first = manager.models[0].model
+
+    assert manager.get_model_context_length(first.name) == 0
+
+    manager._store_details(_model(first.name, first.digest), _show_output(16384))
+    assert manager.get_model_context_length(first.name) == 16384
+
+    # The tag is re-pulled with a new digest, and an old name-keyed cache file is lying around.
+    (tmp_path / "model_details-model0latest.json").write_text("{}")
+    manager._get_all_model_data = lambda: [_model(first.name, "sha256:" + "f" * 64)]  # type: ignore[method-assign]
+    manager.refresh_models()
+
+    assert list(tmp_path.glob("model_details-*.json")) == []
+    assert manager.get_model_context_length(first.name) == 0
+
+
+def test_context_length_is_unknown_without_num_ctx(manager: OllamaDataManager) -> None:
+    first = manager.models[0].model
+    details = _show_output(0)
+    details["modelfile"] = "FROM llama\n"
+
+    manager._store_details(_model(first.name, first.digest), details)
+
+    assert manager.get_model_context_length(first.name) == 0
+
+
+def test_num_ctx_is_cached_until_the_modelfile_changes() -> None:
+    model = _model("llama3.2:latest", "sha256:" + "a" * 64)
+    model.modelfile = "FROM llama\n"
+
+    assert model.num_ctx() == 0
+    assert model.num_ctx() == 0
+
+    OllamaDataManager._apply_details(model, _show_output(8192))
+
+    assert model.num_ctx() == 8192
@@ -0,0 +1,126 @@
+"""Tests for streaming Ollama chats with the native client."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+
+import ollama
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_session import ChatSession
+from parllama.ollama_data_manager import OllamaDataManager
+from parllama.ollama_native_chat import ollama_options, to_ollama_messages
+from parllama.settings_manager import settings
+
+CONFIG = LlmConfig(provider=LlmProvider.OLLAMA, model_name="qwen3", base_url="http://gpu-box:11434", temperature=0.2)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class FakeAsyncClient:
+    """Ollama async client streaming a canned reply."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+
+    async def chat(self, **kwargs: Any) -> AsyncIterator[ollama.ChatResponse]:
+        self.requests.append(kwargs)
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[ollama.ChatResponse]:
+        parts = [("Adding", ""), ("", "2 + 2"), ("", " = 4")]
+        for thinking, content in parts:
+            yield ollama.ChatResponse(
+                model="qwen3",
+                message=ollama.Message(role="assistant", content=content, thinking=thinking or None),
+            )
+        yield ollama.ChatResponse(
+            model="qwen3",
+            created_at="2026-10-16T12:00:00.123456789Z",
+            done=True,
+            message=ollama.Message(role="assistant", content=""),
+            total_duration=2_000_000_000,
+            load_duration=250_000_000,
+            prompt_eval_count=12,
+            prompt_eval_duration=100_000_000,
+            eval_count=6,
+            eval_duration=1_500_000_000,
+        )
+
+
+def test_messages_and_options_are_converted() -> None:
+    """Multi-part content keeps its text and sends images as bare base64; unset options are omitted."""
+    history = [
+        ("system", "Be terse"),
+        (
+            "user",
+            [
+                {"type": "text", "text": "What is this?"},
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64,QUJD"}},
+            ],
+        ),
+    ]
+
+    assert to_ollama_messages(history) == [
+        {"role": "system", "content": "Be terse"},
+        {"role": "user", "content": "What is this?", "images": ["QUJD"]},
+    ]
+    config = CONFIG.clone()
+    config.num_ctx = 8192
+    config.seed = 7
+    options = ollama_options(config)
+    assert (options["temperature"], options["num_ctx"], options["seed"]) == (0.2, 8192, 7)
+    assert all(value is not None for value in options.values())
+
+
+@pytest.mark.anyio
+async def test_native_stream_bypasses_langchain(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replies stream from the Ollama client with thinking split out and Ollama's exact timings kept."""
+    monkeypatch.setattr(settings, "ollama_native_chat", True)
+    monkeypatch.setattr(settings, "ollama_keep_alive", "30m")
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", False)
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+    client = FakeAsyncClient()
+    hosts: list[str | None] = []
+
+    def chat_client(self: OllamaDataManager, host: str | None = None) -> FakeAsyncClient:
+        hosts.append(host)
+        return client
+
+    def build_chat_model(self: LlmConfig) -> None:
+        raise AssertionError("LangChain model built for a native Ollama chat")
+
+    monkeypatch.setattr(OllamaDataManager, "chat_client", chat_client)
+    monkeypatch.setattr(LlmConfig, "build_chat_model", build_chat_model)
+    session = ChatSession(name="Native", llm_config=CONFIG.clone(), messages=[])
+
+    assert await session.send_chat("What is 2 + 2?") is True
+
+    reply = session.messages[-1]
+    assert (reply.content, reply.thinking) == ("2 + 2 = 4", "Adding")
+    assert hosts == ["http://gpu-box:11434"]
+    request = client.requests[0]
+    assert (request["model"], request["stream"], request["keep_alive"]) == ("qwen3", True, "30m")
+    assert request["messages"][-1] == {"role": "user", "content": "What is 2 + 2?"}
+    stats = session.stats
+    assert stats is not None
+    assert (stats.eval_count, stats.eval_duration_ns, stats.load_duration) == (6, 1_500_000_000, 250_000_000)
+    assert stats.eval_rate == 4.0
+    assert stats.created_at == datetime(2026, 10, 16, 12, 0, 0, 123456, tzinfo=UTC)
+
+
+def test_chat_clients_are_shared_per_host() -> None:
+    """Chats to one host reuse its client, whichever worker loop they run on."""
+    manager = OllamaDataManager()
+
+    assert manager.chat_client("http://a:11434") is manager.chat_client("http://a:11434")
+    assert manager.chat_client("http://a:11434") is not manager.chat_client("http://b:11434")
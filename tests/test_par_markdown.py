@@ -55,3 +55,38 @@ class TestSanitizeClassName:
         assert sanitize_class_name("a//b") == "a--b"
         assert sanitize_class_name("test!!!test") == "test---test"
         assert sanitize_class_name("foo|||bar") == "foo---bar"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_appended_markdown_keeps_completed_blocks_and_grows_open_fence() -> None:
+    """Streaming appends update the trailing fence in place without rebuilding earlier blocks."""
+    from textual.app import App, ComposeResult
+    from textual.widgets import Static
+    from textual.widgets.markdown import MarkdownBlock
+
+    from parllama.widgets.par_markdown import ParMarkdown, ParMarkdownFence
+
+    class MarkdownTestApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield ParMarkdown()
+
+    app = MarkdownTestApp()
+    async with app.run_test() as pilot:
+        markdown = app.query_one(ParMarkdown)
+        await markdown.update("Intro paragraph.\n\n```python\nx = 1\n")
+        await pilot.pause()
+        first_blocks = list(markdown.query_children(MarkdownBlock))
+        fence = markdown.query_one(ParMarkdownFence)
+
+        await markdown.append("y = 2\n")
+        await pilot.pause()
+
+        assert list(markdown.query_children(MarkdownBlock)) == first_blocks
+        assert markdown.query_one(ParMarkdownFence) is fence
+        assert fence.code == "x = 1\ny = 2"
+        assert "y = 2" in str(fence.query_one("#fence-code", Static).content.code)  # type: ignore[attr-defined]
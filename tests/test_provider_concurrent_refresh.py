@@ -0,0 +1,144 @@
+"""Tests for concurrent provider model refreshes and per-provider cache timestamps."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import orjson as json
+import pytest
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.messages.messages import ProviderModelsChanged, RefreshProviderModelsRequested
+from parllama.provider_manager import ProviderManager
+from parllama.settings_manager import settings
+
+
+class RecordingApp:
+    def __init__(self) -> None:
+        self.messages: list[object] = []
+
+    def post_message(self, message: object) -> bool:
+        self.messages.append(message)
+        return True
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> ProviderManager:
+    manager = ProviderManager()
+    manager.cache_file = tmp_path / "provider_models.json"
+    manager.app = RecordingApp()  # type: ignore[assignment]
+    return manager
+
+
+def _changed(manager: ProviderManager) -> list[LlmProvider | None]:
+    return [m.provider for m in manager.app.messages if isinstance(m, ProviderModelsChanged)]  # type: ignore[union-attr]
+
+
+def test_providers_refresh_concurrently_and_publish_as_each_finishes(
+    manager: ProviderManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    delays = {LlmProvider.OPENAI: 0.3, LlmProvider.GROQ: 0.1, LlmProvider.ANTHROPIC: 2.0}
+    manager.provider_models[LlmProvider.ANTHROPIC] = ["claude-cached"]
+
+    def fetch(p: LlmProvider) -> list[str]:
+        time.sleep(delays[p])
+        return [f"{p.value}-model"]
+
+    monkeypatch.setattr(manager, "_fetch_provider_model_list", fetch)
+    monkeypatch.setattr(settings, "provider_refresh_timeout", 0.5)
+
+    start = time.perf_counter()
+    asyncio.run(manager.refresh_models(list(delays)))
+
+    assert time.perf_counter() - start < 1.0
+    assert _changed(manager) == [LlmProvider.GROQ, LlmProvider.OPENAI]
+    assert manager.provider_models[LlmProvider.ANTHROPIC] == ["claude-cached"]
+    assert set(manager.provider_fetched_at) == {LlmProvider.GROQ, LlmProvider.OPENAI}
+    saved = json.loads(manager.cache_file.read_bytes())
+    assert saved[LlmProvider.GROQ.value]["models"] == ["Groq-model"]
+    assert saved[LlmProvider.ANTHROPIC.value]["fetched_at"] is None
+
+
+def test_only_expired_providers_are_refreshed_on_load(
+    manager: ProviderManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(settings.provider_cache_hours, LlmProvider.GROQ, 24)
+    monkeypatch.setitem(settings.disabled_providers, LlmProvider.GROQ, False)
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    now = time.time()
+    cache = {provider.value: {"models": [], "fetched_at": now} for provider in settings.provider_cache_hours} | {
+        LlmProvider.OPENAI.value: {"models": ["gpt-5.1"], "fetched_at": now - 3600, "etag": ""},
+        LlmProvider.GROQ.value: {"models": ["llama"], "fetched_at": now - 25 * 3600, "etag": ""},
+    }
+    manager.cache_file.write_bytes(json.dumps(cache))
+
+    manager.load_models()
+
+    requests = [m for m in manager.app.messages if isinstance(m, RefreshProviderModelsRequested)]  # type: ignore[union-attr]
+    assert [r.providers for r in requests] == [[LlmProvider.GROQ]]
+    assert manager.provider_models[LlmProvider.OPENAI] == ["gpt-5.1"]
+    assert manager.get_cache_info(LlmProvider.OPENAI)["cache_age_hours"] == 1.0
+    assert manager.get_cache_info(LlmProvider.GROQ)["cache_expired"] is True
+
+
+def test_legacy_cache_uses_the_file_time_for_every_provider(manager: ProviderManager) -> None:
+    manager.cache_file.write_bytes(json.dumps({LlmProvider.OPENAI.value: ["gpt-5.1"]}))
+
+    manager.load_models()
+
+    assert manager.provider_models[LlmProvider.OPENAI] == ["gpt-5.1"]
+    assert manager.provider_fetched_at[LlmProvider.OPENAI] == manager.cache_file.stat().st_mtime
+    assert not manager.is_cache_expired(LlmProvider.OPENAI)
+    assert manager.is_cache_expired(LlmProvider.GROQ)
+
+
+class ModelsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.if_none_match.append(self.headers.get("If-None-Match"))  # type: ignore[attr-defined]
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"data": [{"id": "proxy-model", "created": 1}]})
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def litellm_proxy(monkeypatch: pytest.MonkeyPatch) -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ModelsHandler)
+    server.if_none_match = []  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setitem(
+        settings.provider_base_urls, LlmProvider.LITELLM, f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    monkeypatch.setitem(settings.disabled_providers, LlmProvider.LITELLM, False)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_litellm_model_list_is_revalidated_with_its_etag(
+    manager: ProviderManager, litellm_proxy: ThreadingHTTPServer
+) -> None:
+    asyncio.run(manager.refresh_models([LlmProvider.LITELLM]))
+    manager.save_models()
+
+    restarted = ProviderManager()
+    restarted.cache_file = manager.cache_file
+    restarted.load_models()
+    asyncio.run(restarted.refresh_models([LlmProvider.LITELLM]))
+
+    assert litellm_proxy.if_none_match == [None, '"v1"']  # type: ignore[attr-defined]
+    assert restarted.provider_models[LlmProvider.LITELLM] == ["proxy-model"]
@@ -5,11 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import orjson as json
-
+import pytest
 from par_ai_core.llm_providers import LlmProvider
 
 from parllama.messages.messages import RefreshProviderModelsRequested
 from parllama.provider_manager import ProviderManager
+from parllama.settings_manager import settings
 
 
 class RecordingApp:
@@ -50,3 +51,33 @@ def test_app_mount_does_not_unconditionally_request_provider_refresh() -> None:
     app_source = Path("src/parllama/app.py").read_text(encoding="utf-8")
 
     assert "self.post_message(RefreshProviderModelsRequested(None))" not in app_source
+
+
+def test_load_models_ignores_expired_providers_that_cannot_be_fetched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Disabled or keyless providers never get a fetch time, so they must not count as expired."""
+    monkeypatch.setattr(settings, "disabled_providers", {LlmProvider.GROQ: True})
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    monkeypatch.setattr(
+        settings, "provider_cache_hours", {LlmProvider.OLLAMA: 168, LlmProvider.OPENAI: 168, LlmProvider.GROQ: 168}
+    )
+    cache_file = tmp_path / "provider_models.json"
+    cache_file.write_bytes(
+        json.dumps(
+            {
+                LlmProvider.OLLAMA.value: {"models": [], "fetched_at": 0},
+                LlmProvider.OPENAI.value: {"models": [], "fetched_at": None},
+                LlmProvider.GROQ.value: {"models": [], "fetched_at": None},
+            }
+        )
+    )
+    manager = ProviderManager()
+    manager.cache_file = cache_file
+    app = RecordingApp()
+    manager.app = app  # type: ignore[assignment]
+
+    manager.load_models()
+
+    requests = [m for m in app.messages if isinstance(m, RefreshProviderModelsRequested)]
+    assert [r.providers for r in requests] == [[LlmProvider.OLLAMA]]
@@ -0,0 +1,122 @@
+"""Tests for the exact-match response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama import chat_session as chat_session_module
+from parllama.chat_session import ChatSession
+from parllama.response_cache import ResponseCache, response_cache_key
+from parllama.settings_manager import settings
+
+CONFIG = LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.0)
+HISTORY = [("system", "Be terse"), ("user", "What is 2 + 2?")]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ResponseCache:
+    """An enabled response cache in a temporary directory."""
+    monkeypatch.setattr(settings, "response_cache_enabled", True)
+    monkeypatch.setattr(settings, "response_cache_max_temperature", 0.0)
+    monkeypatch.setattr(settings, "response_cache_ttl_hours", 24)
+    monkeypatch.setattr(settings, "response_cache_max_mb", 64.0)
+    return ResponseCache(cache_dir=tmp_path / "responses")
+
+
+def test_key_covers_config_and_history() -> None:
+    """Equal requests share a key; any change to the output-shaping settings or messages does not."""
+    key = response_cache_key(CONFIG, HISTORY)
+
+    assert response_cache_key(CONFIG.clone(), list(HISTORY)) == key
+    assert response_cache_key(CONFIG, [*HISTORY[:1], ("user", "What is 3 + 3?")]) != key
+    for name, value in (("temperature", 0.5), ("num_ctx", 8192), ("model_name", "qwen3"), ("seed", 7)):
+        changed = CONFIG.clone()
+        setattr(changed, name, value)
+        assert response_cache_key(changed, HISTORY) != key
+    assert (
+        response_cache_key(LlmConfig(provider=LlmProvider.OPENAI, model_name="llama3.2", temperature=0.0), HISTORY)
+        != key
+    )
+
+
+def test_only_low_temperature_requests_are_cacheable(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert cache.is_cacheable(CONFIG)
+    assert not cache.is_cacheable(LlmConfig(provider=LlmProvider.OLLAMA, model_name="m", temperature=0.7))
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+    assert not cache.is_cacheable(CONFIG)
+
+
+def test_entries_expire(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stored replies are returned until they outlive the TTL."""
+    cache.put("k", "4", "adding")
+    hit = cache.get("k")
+    assert hit is not None and (hit.content, hit.thinking) == ("4", "adding")
+
+    monkeypatch.setattr(time, "time", lambda: hit.created + 25 * 3600)
+    assert cache.get("k") is None
+    assert not (cache.cache_dir / "k.json").exists()
+
+
+def test_least_recently_used_entries_are_evicted(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Beyond the size limit the entries used longest ago are dropped first."""
+    monkeypatch.setattr(settings, "response_cache_max_mb", 2.5 * 1024 / (1024 * 1024))
+    now = time.time()
+    for index, key in enumerate(("a", "b")):
+        cache.put(key, "x" * 1000)
+        os.utime(cache.cache_dir / f"{key}.json", (now - 100 + index, now - 100 + index))
+    assert cache.get("a") is not None
+
+    cache.put("c", "x" * 1000)
+
+    assert sorted(p.stem for p in cache.cache_dir.glob("*.json")) == ["a", "c"]
+
+
+class CountingChatModel:
+    """Chat model that counts how often it is asked to stream."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def astream(self, messages: list[Any], config: Any = None) -> AsyncIterator[AIMessageChunk]:
+        self.calls += 1
+        for chunk in ("The answer ", "is ", "4."):
+            yield AIMessageChunk(content=chunk)
+
+
+@pytest.mark.anyio
+async def test_repeated_request_is_replayed_from_cache(cache: ResponseCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second identical request streams the cached reply without calling the model."""
+    monkeypatch.setattr(settings, "no_save_chat", True)
+    monkeypatch.setattr(settings, "context_budget_tokens", 100_000)
+    monkeypatch.setattr(settings, "telemetry_enabled", False)
+    monkeypatch.setattr(chat_session_module, "response_cache", cache)
+    monkeypatch.setattr(ChatSession, "RESPONSE_REPLAY_DURATION", 0.0)
+    model = CountingChatModel()
+    monkeypatch.setattr(LlmConfig, "build_chat_model", lambda self: model)
+
+    first = ChatSession(name="First", llm_config=CONFIG.clone(), messages=[])
+    assert await first.send_chat("What is 2 + 2?") is True
+    second = ChatSession(name="Second", llm_config=CONFIG.clone(), messages=[])
+    assert await second.send_chat("What is 2 + 2?") is True
+
+    assert model.calls == 1
+    assert not first.messages[-1].cached
+    assert second.messages[-1].cached
+    assert second.messages[-1].content == "The answer is 4."
+    assert second.messages[-1].to_dict()["cached"] is True
@@ -0,0 +1,132 @@
+"""Tests for the write-behind save scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.save_scheduler import SaveScheduler, save_scheduler
+from parllama.settings_manager import settings
+
+
+@pytest.fixture
+def debounce(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a short debounce so background writes happen quickly."""
+    monkeypatch.setattr(settings, "save_debounce_interval", 0.05)
+    monkeypatch.setattr(settings, "save_max_delay", 5.0)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_burst_of_saves_is_coalesced_into_one_background_write(debounce: None) -> None:
+    """Only the newest pending write per key runs, on the worker thread."""
+    scheduler = SaveScheduler()
+    written: list[tuple[int, str]] = []
+
+    for i in range(5):
+        scheduler.schedule("a", lambda i=i: written.append((i, threading.current_thread().name)) or True)
+
+    assert _wait_for(lambda: scheduler.stats().writes == 1)
+    assert written == [(4, "save-scheduler")]
+    stats = scheduler.stats()
+    assert stats.scheduled == 5
+    assert stats.coalesced == 4
+    assert stats.queue_depth == 0
+
+
+def test_flush_writes_pending_saves_immediately(monkeypatch: pytest.MonkeyPatch) -> None:
+    """flush() writes everything pending without waiting for the debounce interval."""
+    monkeypatch.setattr(settings, "save_debounce_interval", 60.0)
+    monkeypatch.setattr(settings, "save_max_delay", 60.0)
+    scheduler = SaveScheduler()
+    written: list[str] = []
+    scheduler.schedule("a", lambda: written.append("a") or True)
+    scheduler.schedule("b", lambda: written.append("b") or True)
+    assert scheduler.queue_depth == 2
+
+    scheduler.flush()
+
+    assert sorted(written) == ["a", "b"]
+    assert scheduler.queue_depth == 0
+
+
+def test_cancel_drops_pending_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cancelled key is never written."""
+    monkeypatch.setattr(settings, "save_debounce_interval", 60.0)
+    scheduler = SaveScheduler()
+    written: list[str] = []
+    scheduler.schedule("a", lambda: written.append("a") or True)
+
+    scheduler.cancel("a")
+    scheduler.flush()
+
+    assert written == []
+
+
+def test_failed_writes_are_counted(debounce: None) -> None:
+    """Writers that fail or raise are recorded as failures."""
+    scheduler = SaveScheduler()
+
+    def boom() -> bool:
+        raise OSError("disk full")
+
+    scheduler.schedule("a", lambda: False)
+    scheduler.schedule("b", boom)
+    scheduler.flush()
+
+    stats = scheduler.stats()
+    assert stats.writes == 2
+    assert stats.failures == 2
+
+
+def test_zero_debounce_writes_on_calling_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A zero debounce interval disables write-behind."""
+    monkeypatch.setattr(settings, "save_debounce_interval", 0.0)
+    scheduler = SaveScheduler()
+    threads: list[str] = []
+
+    scheduler.schedule("a", lambda: threads.append(threading.current_thread().name) or True)
+
+    assert threads == [threading.current_thread().name]
+
+
+def test_session_setting_changes_are_written_once(
+    debounce: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Several session option changes in a row produce a single write of the final state."""
+    monkeypatch.setattr(settings, "chat_dir", tmp_path)
+    monkeypatch.setattr(settings, "no_save_chat", False)
+    monkeypatch.setattr(settings, "save_debounce_interval", 60.0)
+    session = ChatSession(
+        name="Session",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5),
+        messages=[],
+    )
+    session.add_message(ParllamaChatMessage(role="user", content="hello"))
+    writes = save_scheduler.stats().writes
+
+    session.temperature = 0.7
+    session.num_ctx = 4096
+    session.temperature = 0.9
+    assert not (tmp_path / f"{session.id}.json").exists()
+    save_scheduler.flush()
+
+    assert save_scheduler.stats().writes == writes + 1
+    loaded = ChatSession.load_from_file(f"{session.id}.json")
+    assert loaded is not None
+    assert loaded.temperature == 0.9
+    assert loaded.num_ctx == 4096
@@ -0,0 +1,97 @@
+"""Tests for the message full-text search index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.search_index import SNIPPET_END, SNIPPET_START, SearchIndex, match_expression
+from parllama.settings_manager import settings
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SearchIndex:
+    """A search index backed by a temporary database."""
+    search_index = SearchIndex(db_path=tmp_path / "search.db")
+    yield search_index
+    search_index.close()
+
+
+def test_match_expression_quotes_words_and_prefixes_last() -> None:
+    """User text becomes an all-words match with a prefix on the last word."""
+    assert match_expression('kafka "consumer" lag') == '"kafka" "consumer" "lag"*'
+    assert match_expression("  ?! ") is None
+
+
+def test_search_returns_ranked_hits_with_snippets(index: SearchIndex) -> None:
+    """Hits carry container metadata and a snippet with the match highlighted."""
+    index.index_container(
+        "session",
+        "s1",
+        "Rust chat",
+        "2026-01-01T00:00:00+00:00",
+        [("m1", "user", "How do lifetimes work in Rust?"), ("m2", "assistant", "Lifetimes describe borrows.")],
+    )
+    index.index_container("prompt", "p1", "Poems", "2026-01-01T00:00:00+00:00", [("m1", "system", "Write poems")])
+
+    hits = index.search("lifetim")
+
+    assert {(h.kind, h.container_id, h.container_name, h.message_id) for h in hits} == {
+        ("session", "s1", "Rust chat", "m1"),
+        ("session", "s1", "Rust chat", "m2"),
+    }
+    assert all(f"{SNIPPET_START}lifetimes{SNIPPET_END}" in h.snippet.lower() for h in hits)
+    assert [h.container_id for h in index.search("poems")] == ["p1"]
+
+
+def test_reindex_only_rewrites_changed_messages(index: SearchIndex) -> None:
+    """Re-indexing a container touches only added, edited or removed messages."""
+    rows = [("m1", "user", "alpha"), ("m2", "assistant", "beta"), ("m3", "user", "gamma")]
+    assert index.index_container("session", "s1", "S", "t1", rows) == 3
+
+    changed = index.index_container("session", "s1", "S", "t2", [rows[0], ("m2", "assistant", "delta")])
+
+    assert changed == 2
+    assert index.search("beta") == []
+    assert index.search("gamma") == []
+    assert [h.message_id for h in index.search("delta")] == ["m2"]
+    assert index.indexed_versions() == {"s1": "t2"}
+
+
+def test_remove_container_drops_its_messages(index: SearchIndex) -> None:
+    """Removed containers no longer produce hits."""
+    index.index_container("session", "s1", "S", "t1", [("m1", "user", "needle")])
+
+    index.remove_container("s1")
+
+    assert index.search("needle") == []
+    assert index.indexed_versions() == {}
+
+
+def test_sync_indexes_changed_sessions_from_disk(
+    index: SearchIndex, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Sync reads only new or changed sessions from disk and drops vanished ones."""
+    monkeypatch.setattr(settings, "chat_dir", tmp_path)
+    monkeypatch.setattr(settings, "no_save_chat", False)
+    monkeypatch.setattr(settings, "save_debounce_interval", 0.0)
+    session = ChatSession(
+        name="Saved",
+        llm_config=LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5),
+        messages=[],
+    )
+    session.add_message(ParllamaChatMessage(role="user", content="journaled question"))
+    session.add_message(ParllamaChatMessage(role="assistant", content="journaled answer"))
+    index.index_container("session", "gone", "Gone", "t1", [("m1", "user", "stale")])
+    containers = [("session", session.id, session.name, session.last_updated.isoformat())]
+
+    assert index.sync(containers) == 1
+    assert index.sync(containers) == 0
+
+    assert {h.role for h in index.search("journaled")} == {"user", "assistant"}
+    assert index.search("stale") == []
@@ -43,6 +43,18 @@ class TestWriteReadRoundtrip:
 
         assert ops.read_text_file(file_path) == "non-atomic content"
 
+    def test_append_text_file_appends_and_returns_size(self, tmp_path):
+        """Appending creates the file, preserves earlier content, and reports the new size."""
+        ops = SecureFileOperations()
+        file_path = tmp_path / "log.jsonl"
+
+        first = ops.append_text_file(file_path, "one\n")
+        second = ops.append_text_file(file_path, "two\n", sync=False)
+
+        assert file_path.read_text(encoding="utf-8") == "one\ntwo\n"
+        assert first == 4
+        assert second == 8
+
     def test_write_json_file_result_is_valid_json_on_disk(self, tmp_path):
         """The bytes written to disk are valid, parseable JSON."""
         ops = SecureFileOperations()
@@ -0,0 +1,127 @@
+"""Tests for the chat session metadata index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import orjson as json
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_manager import ChatManager
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.session_index import SESSION_INDEX_FILE
+from parllama.settings_manager import settings
+
+
+@pytest.fixture
+def chat_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point chat storage at a temporary directory with immediate saving enabled."""
+    chat_dir = tmp_path / "chats"
+    chat_dir.mkdir()
+    monkeypatch.setattr(settings, "chat_dir", chat_dir)
+    monkeypatch.setattr(settings, "no_save_chat", False)
+    monkeypatch.setattr(settings, "save_debounce_interval", 0.0)
+    return chat_dir
+
+
+def _llm_config() -> LlmConfig:
+    return LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5)
+
+
+def _saved_session(name: str, reply: bool = True) -> ChatSession:
+    session = ChatSession(name=name, llm_config=_llm_config(), messages=[])
+    session.add_message(ParllamaChatMessage(role="user", content="hello"))
+    if reply:
+        session.add_message(ParllamaChatMessage(role="assistant", content="hi"))
+    return session
+
+
+def _forbid_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("session file was parsed")
+
+    monkeypatch.setattr(ChatSession, "from_json", staticmethod(fail))
+
+
+def test_load_sessions_writes_index(chat_dir: Path) -> None:
+    """Loading sessions records their metadata in the index file."""
+    session = _saved_session("Indexed")
+
+    ChatManager().load_sessions()
+
+    index = json.loads((chat_dir / SESSION_INDEX_FILE).read_bytes())
+    entry = index["sessions"][session.id]
+    assert entry["name"] == "Indexed"
+    assert entry["message_count"] == 2
+
+
+def test_second_load_uses_index_without_parsing(chat_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sessions whose files are unchanged are built from the index alone."""
+    session = _saved_session("Indexed")
+    ChatManager().load_sessions()
+    _forbid_parsing(monkeypatch)
+
+    manager = ChatManager()
+    manager.load_sessions()
+
+    loaded = manager.get_session(session.id)
+    assert loaded is not None
+    assert loaded.name == "Indexed"
+    assert loaded.llm_model_name == "llama3.2"
+    assert loaded.message_count == 2
+    loaded.load()
+    assert [m.content for m in loaded.messages] == ["hello", "hi"]
+
+
+def test_externally_changed_session_is_reindexed(chat_dir: Path) -> None:
+    """A session file edited outside the app is re-parsed and its entry refreshed."""
+    session = _saved_session("Before", reply=False)
+    ChatManager().load_sessions()
+    path = chat_dir / f"{session.id}.json"
+    data = json.loads(path.read_bytes())
+    data["name"] = "After"
+    path.write_bytes(json.dumps(data))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+    manager = ChatManager()
+    manager.load_sessions()
+
+    assert manager.get_session(session.id).name == "After"  # type: ignore[union-attr]
+    index = json.loads((chat_dir / SESSION_INDEX_FILE).read_bytes())
+    assert index["sessions"][session.id]["name"] == "After"
+
+
+def test_removed_session_files_are_dropped_from_index(chat_dir: Path) -> None:
+    """Entries for sessions whose files disappeared are removed."""
+    kept = _saved_session("Kept")
+    removed = _saved_session("Removed")
+    ChatManager().load_sessions()
+    (chat_dir / f"{removed.id}.json").unlink()
+
+    manager = ChatManager()
+    manager.load_sessions()
+
+    assert manager.session_ids == [kept.id]
+    index = json.loads((chat_dir / SESSION_INDEX_FILE).read_bytes())
+    assert list(index["sessions"]) == [kept.id]
+
+
+def test_save_session_index_covers_changes_made_while_running(chat_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sessions saved during a run are served from the index on the next startup."""
+    _saved_session("Original")
+    manager = ChatManager()
+    manager.load_sessions()
+    session = manager.sessions[0]
+    session.load()
+    session.name = "Renamed"
+
+    manager.save_session_index()
+    _forbid_parsing(monkeypatch)
+    restarted = ChatManager()
+    restarted.load_sessions()
+
+    assert restarted.get_session(session.id).name == "Renamed"  # type: ignore[union-attr]
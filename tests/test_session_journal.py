@@ -0,0 +1,151 @@
+"""Tests for journaled chat session persistence."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson as json
+import pytest
+from par_ai_core.llm_config import LlmConfig
+from par_ai_core.llm_providers import LlmProvider
+
+from parllama.chat_message import ParllamaChatMessage
+from parllama.chat_session import ChatSession
+from parllama.session_journal import JOURNAL_SUFFIX, SessionJournal, flush_compactions
+from parllama.settings_manager import settings
+
+
+@pytest.fixture
+def chat_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point chat storage at a temporary directory with immediate saving enabled."""
+    chat_dir = tmp_path / "chats"
+    chat_dir.mkdir()
+    monkeypatch.setattr(settings, "chat_dir", chat_dir)
+    monkeypatch.setattr(settings, "no_save_chat", False)
+    monkeypatch.setattr(settings, "save_debounce_interval", 0.0)
+    return chat_dir
+
+
+def _llm_config() -> LlmConfig:
+    return LlmConfig(provider=LlmProvider.OLLAMA, model_name="llama3.2", temperature=0.5)
+
+
+def _new_session() -> ChatSession:
+    """Create a session whose first message has already been saved as a snapshot."""
+    session = ChatSession(name="Session", llm_config=_llm_config(), messages=[])
+    session.add_message(ParllamaChatMessage(role="user", content="hello"))
+    return session
+
+
+def _journal_records(chat_dir: Path, session_id: str) -> list[dict]:
+    path = chat_dir / f"{session_id}{JOURNAL_SUFFIX}"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def _reload(session_id: str) -> ChatSession:
+    session = ChatSession.load_from_file(f"{session_id}.json")
+    assert session is not None
+    session.load()
+    return session
+
+
+def test_first_save_writes_snapshot_without_journal(chat_dir: Path) -> None:
+    """The first save writes the full snapshot file and no journal."""
+    session = _new_session()
+
+    assert (chat_dir / f"{session.id}.json").exists()
+    assert _journal_records(chat_dir, session.id) == []
+
+
+def test_later_saves_append_only_changed_messages(chat_dir: Path) -> None:
+    """Saves after the first append put records for new messages plus a metadata record."""
+    session = _new_session()
+    snapshot_before = (chat_dir / f"{session.id}.json").read_bytes()
+
+    reply = ParllamaChatMessage(role="assistant", content="hi there")
+    session.add_message(reply)
+
+    records = _journal_records(chat_dir, session.id)
+    assert [r["op"] for r in records] == ["put", "meta"]
+    assert records[0]["data"]["id"] == reply.id
+    assert [r["seq"] for r in records] == [1, 2]
+    assert (chat_dir / f"{session.id}.json").read_bytes() == snapshot_before
+
+
+def test_load_replays_edits_deletes_and_reordering(chat_dir: Path) -> None:
+    """Loading a session applies journaled edits, deletions and prepended messages."""
+    session = _new_session()
+    reply = ParllamaChatMessage(role="assistant", content="first draft")
+    session.add_message(reply)
+
+    reply.content = "final answer"
+    session.add_message(ParllamaChatMessage(role="user", content="again"))
+    session.name = "Renamed"
+    session.system_prompt = ParllamaChatMessage(role="system", content="be brief")
+    del session[session.messages[-1].id]
+
+    loaded = _reload(session.id)
+
+    assert loaded.name == "Renamed"
+    assert [(m.role, m.content) for m in loaded.messages] == [
+        ("system", "be brief"),
+        ("user", "hello"),
+        ("assistant", "final answer"),
+    ]
+
+
+def test_compaction_folds_journal_into_snapshot(chat_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reaching the record limit rewrites the snapshot and trims the journal."""
+    monkeypatch.setattr(settings, "session_journal_max_records", 4)
+    session = _new_session()
+
+    for i in range(3):
+        session.add_message(ParllamaChatMessage(role="assistant", content=f"reply {i}"))
+    flush_compactions()
+
+    snapshot = json.loads((chat_dir / f"{session.id}.json").read_bytes())
+    assert snapshot["journal_seq"] == 4
+    assert all(r["seq"] > 4 for r in _journal_records(chat_dir, session.id))
+    assert [m.content for m in _reload(session.id).messages] == ["hello", "reply 0", "reply 1", "reply 2"]
+
+
+def test_metadata_only_load_sees_journaled_name(chat_dir: Path) -> None:
+    """Session listings pick up names changed after the snapshot was written."""
+    session = _new_session()
+    session.name = "Journaled Name"
+
+    listed = ChatSession.load_from_file(f"{session.id}.json")
+
+    assert listed is not None
+    assert listed.name == "Journaled Name"
+
+
+def test_torn_journal_tail_is_ignored(chat_dir: Path) -> None:
+    """A partially written last record does not prevent the session from loading."""
+    session = _new_session()
+    session.add_message(ParllamaChatMessage(role="assistant", content="kept"))
+    with (chat_dir / f"{session.id}{JOURNAL_SUFFIX}").open("ab") as f:
+        f.write(b'{"op":"put","seq":9,"data":{"id":')
+
+    loaded = _reload(session.id)
+    loaded.add_message(ParllamaChatMessage(role="user", content="after"))
+
+    assert [m.content for m in loaded.messages] == ["hello", "kept", "after"]
+    assert [m.content for m in _reload(session.id).messages] == ["hello", "kept", "after"]
+
+
+def test_read_only_replay_leaves_an_in_progress_append_alone(chat_dir: Path) -> None:
+    """Readers other than the owning session never rewrite the journal."""
+    session = _new_session()
+    session.add_message(ParllamaChatMessage(role="assistant", content="kept"))
+    journal_path = chat_dir / f"{session.id}{JOURNAL_SUFFIX}"
+    with journal_path.open("ab") as f:
+        f.write(b'{"op":"put","seq":9,"data":{"id":')
+    before = journal_path.read_bytes()
+
+    data = SessionJournal(session.id).replay(json.loads((chat_dir / f"{session.id}.json").read_bytes()), repair=False)
+
+    assert [m["content"] for m in data["messages"]] == ["hello", "kept"]
+    assert journal_path.read_bytes() == before
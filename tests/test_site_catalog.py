@@ -0,0 +1,183 @@
+"""Tests for the ollama.com catalog fetcher, run against a local HTTP stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from parllama import ollama_data_manager as odm
+from parllama.models.ollama_data import SiteModelData
+from parllama.ollama_data_manager import OllamaDataManager
+from parllama.settings_manager import settings
+from parllama.site_catalog import catalog_urls, fetch_catalog
+
+PAGES = {
+    "/models?sort=popular": ["llama3", "qwen3"],
+    "/models?sort=featured": ["qwen3", "gemma3"],
+    "/models?sort=newest": ["gemma3", "phi4"],
+    "/library": ["llama3"],
+}
+
+
+def _card(name: str) -> str:
+    return (
+        f'<li class="items-baseline"><a href="/library/{name}"><h2>{name}</h2><p>{name} model</p>'
+        '<span class="text-blue-600">tools</span>'
+        '<span class="flex items-center">1.2M\nPulls</span>'
+        '<span class="flex items-center">8\xa0Tags</span>'
+        '<span class="flex items-center">Updated\xa02 weeks ago</span></a></li>'
+    )
+
+
+class CatalogSite(ThreadingHTTPServer):
+    """Serves catalog pages with ETags, answering ``304`` to a matching ``If-None-Match``."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), CatalogHandler)
+        self.version = 1
+        self.delay = 0.0
+        self.requests: list[tuple[str, str | None]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    server: CatalogSite
+
+    def do_GET(self) -> None:  # noqa: N802
+        site = self.server
+        with site.lock:
+            site.requests.append((self.path, self.headers.get("If-None-Match")))
+            site.in_flight += 1
+            site.max_in_flight = max(site.max_in_flight, site.in_flight)
+        time.sleep(site.delay)
+        with site.lock:
+            site.in_flight -= 1
+
+        names = PAGES.get(self.path)
+        if names is None:
+            self.send_error(404)
+            return
+        etag = f'"{self.path}-v{site.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        if site.version > 1:
+            names = [*names, f"new-v{site.version}"]
+        body = f"<html><body><ul>{''.join(_card(name) for name in names)}</ul></body></html>".encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def site() -> Iterator[CatalogSite]:
+    server = CatalogSite()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+async def _fetch(site: CatalogSite, namespace: str, cached: SiteModelData | None = None) -> SiteModelData:
+    async with httpx.AsyncClient() as client:
+        return await fetch_catalog(client, namespace, cached, base_url=site.url)
+
+
+def test_categories_are_fetched_concurrently_and_deduped(site: CatalogSite) -> None:
+    site.delay = 0.2
+
+    data = asyncio.run(_fetch(site, "models"))
+
+    assert site.max_in_flight == 3
+    assert [m.name for m in data.models] == ["llama3", "qwen3", "gemma3", "phi4"]
+    llama = data.models[0]
+    assert llama.url == f"{site.url}/models?sort=popular/library/llama3"
+    assert (llama.num_pulls, llama.num_tags, llama.updated, llama.tags) == ("1.2M", "8", "2 weeks ago", ["tools"])
+    assert list(data.pages) == catalog_urls("models", base_url=site.url)
+
+
+def test_unchanged_pages_are_revalidated_with_their_etag(site: CatalogSite) -> None:
+    first = asyncio.run(_fetch(site, "models"))
+    site.requests.clear()
+
+    second = asyncio.run(_fetch(site, "models", first))
+
+    assert sorted(site.requests) == sorted((path, f'"{path}-v1"') for path in PAGES if path.startswith("/models"))
+    assert second.models == first.models
+    assert second.last_update > first.last_update
+
+
+@pytest.fixture
+def manager(site: CatalogSite, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> OllamaDataManager:
+    monkeypatch.setattr(settings, "ollama_cache_dir", tmp_path)
+    monkeypatch.setattr(settings, "no_save", False)
+    fetch = odm.fetch_catalog
+    monkeypatch.setattr(odm, "fetch_catalog", lambda *args, **kwargs: fetch(*args, **kwargs, base_url=site.url))
+    return OllamaDataManager()
+
+
+def _loaded_names(manager: OllamaDataManager, force: bool = False) -> list[list[str]]:
+    loads: list[list[str]] = []
+    asyncio.run(
+        manager.load_site_models("library", force, lambda: loads.append([i.model.name for i in manager.site_models]))
+    )
+    return loads
+
+
+def test_cached_catalog_is_served_and_revalidated_once_stale(
+    manager: OllamaDataManager, site: CatalogSite, tmp_path: Path
+) -> None:
+    assert _loaded_names(manager) == [["llama3"]]
+    assert (tmp_path / "site_models-library.json").exists()
+
+    # A fresh cache is served without touching the network.
+    site.requests.clear()
+    assert _loaded_names(manager) == [["llama3"]]
+    assert site.requests == []
+
+    # A stale cache is served first, then replaced by the changed catalog.
+    cached = manager.load_site_cache("library")
+    assert cached is not None
+    cached.last_update = datetime.now(UTC) - timedelta(days=2)
+    (tmp_path / "site_models-library.json").write_text(cached.model_dump_json())
+    site.version = 2
+
+    assert _loaded_names(manager) == [["llama3"], ["llama3", "new-v2"]]
+    assert site.requests == [("/library", '"/library-v1"')]
+
+    # Forcing an unchanged catalog only serves the cache.
+    assert _loaded_names(manager, force=True) == [["llama3", "new-v2"]]
+
+
+def test_failed_fetch_without_cache_clears_the_previous_namespace(manager: OllamaDataManager) -> None:
+    assert _loaded_names(manager) == [["llama3"]]
+
+    loads: list[list[str]] = []
+    asyncio.run(
+        manager.load_site_models("missing", False, lambda: loads.append([i.model.name for i in manager.site_models]))
+    )
+
+    assert loads == [[]]
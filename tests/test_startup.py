@@ -0,0 +1,80 @@
+"""Tests for the startup path: deferred imports, deferred tab views and the startup profiler."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from textual.app import App
+
+from parllama.screens.main_screen import DEFERRED_VIEWS, MainScreen
+from parllama.settings_manager import settings
+from parllama.startup_profiler import StartupProfiler
+from parllama.theme_manager import theme_manager
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class MainScreenHostApp(App[None]):
+    """Pushes the real MainScreen, wiring the theme manager as ParLlamaApp does."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        theme_manager.set_app(self)
+
+    async def on_mount(self) -> None:
+        self.main_screen = MainScreen()
+        await self.push_screen(self.main_screen)
+
+
+def test_importing_the_app_defers_heavy_dependencies() -> None:
+    """litellm and docker are imported on first use, not when the app module loads."""
+    code = "import sys, parllama.app; print(*sorted({'litellm', 'docker'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.anyio
+async def test_deferred_views_are_mounted_once_when_their_tab_is_first_shown(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "no_save", True)
+    monkeypatch.setattr(settings, "show_first_run", False)
+    monkeypatch.setattr(settings, "use_last_tab_on_startup", False)
+    monkeypatch.setattr(settings, "starting_tab", "Prompts")
+    # A bare host app does not register parllama's custom themes.
+    monkeypatch.setattr(settings, "theme_name", "textual-dark")
+
+    app = MainScreenHostApp()
+    async with app.run_test(size=(140, 50)) as pilot:
+        await pilot.pause()
+        screen = app.main_screen
+        assert screen.composed_views == {"Prompts"}
+        assert [w.id for w in screen.query("#Memory > *")] == []
+
+        screen.change_tab("Memory")
+        await pilot.pause()
+        screen.change_tab("Prompts")
+        await pilot.pause()
+        screen.change_tab("Memory")
+        await pilot.pause()
+
+        assert screen.composed_views == {"Prompts", "Memory"}
+        assert [w.id for w in screen.query("#Memory > *")] == [DEFERRED_VIEWS["Memory"][2]]
+        assert [w.id for w in screen.query("#Prompts > *")] == [DEFERRED_VIEWS["Prompts"][2]]
+
+
+def test_startup_profiler_reports_each_phase() -> None:
+    profiler = StartupProfiler()
+    profiler.mark("settings")
+    profiler.finish("first paint")
+    profiler.finish("ignored")
+
+    report = profiler.report()
+
+    assert [phase for phase, _ in profiler.phases] == ["settings", "first paint"]
+    assert "settings" in report and "total" in report and "heavy modules loaded:" in report
+    assert "ignored" not in report